@@ -0,0 +1,178 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE VIRTUAL TABLE IF NOT EXISTS "chapter_fts" USING fts5("title", "body", tokenize='trigram');
+CREATE VIRTUAL TABLE IF NOT EXISTS "outline_node_fts" USING fts5("title", "body", tokenize='trigram');
+CREATE VIRTUAL TABLE IF NOT EXISTS "character_fts" USING fts5("title", "body", tokenize='trigram');
+CREATE TRIGGER IF NOT EXISTS "trg_search_chapter_insert" AFTER INSERT ON "chapters"
+BEGIN
+    INSERT INTO "chapter_fts" ("rowid", "title", "body")
+    VALUES (NEW."id", NEW."title", CASE WHEN typeof(NEW."content") = 'text' THEN NEW."content" ELSE '' END);
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_search_chapter_title" AFTER UPDATE OF "title" ON "chapters"
+BEGIN
+    UPDATE "chapter_fts" SET "title" = NEW."title" WHERE "rowid" = NEW."id";
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_search_chapter_delete" AFTER DELETE ON "chapters"
+BEGIN
+    DELETE FROM "chapter_fts" WHERE "rowid" = OLD."id";
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_search_outline_node_insert" AFTER INSERT ON "outline_nodes"
+BEGIN
+    INSERT INTO "outline_node_fts" ("rowid", "title", "body") VALUES (NEW."id", NEW."title", COALESCE(NEW."description", ''));
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_search_outline_node_update" AFTER UPDATE OF "title", "description" ON "outline_nodes"
+BEGIN
+    UPDATE "outline_node_fts" SET "title" = NEW."title", "body" = COALESCE(NEW."description", '') WHERE "rowid" = NEW."id";
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_search_outline_node_delete" AFTER DELETE ON "outline_nodes"
+BEGIN
+    DELETE FROM "outline_node_fts" WHERE "rowid" = OLD."id";
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_search_character_insert" AFTER INSERT ON "characters"
+BEGIN
+    INSERT INTO "character_fts" ("rowid", "title", "body") VALUES (NEW."id", NEW."name", COALESCE(NEW."notes", ''));
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_search_character_update" AFTER UPDATE OF "name", "notes" ON "characters"
+BEGIN
+    UPDATE "character_fts" SET "title" = NEW."name", "body" = COALESCE(NEW."notes", '') WHERE "rowid" = NEW."id";
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_search_character_delete" AFTER DELETE ON "characters"
+BEGIN
+    DELETE FROM "character_fts" WHERE "rowid" = OLD."id";
+END;
+-- 为已有数据建立索引（压缩存储的章节正文由 scripts/rebuild_search_index.py 补建）
+INSERT INTO "chapter_fts" ("rowid", "title", "body")
+SELECT "id", "title", CASE WHEN typeof("content") = 'text' THEN "content" ELSE '' END FROM "chapters";
+INSERT INTO "outline_node_fts" ("rowid", "title", "body")
+SELECT "id", "title", COALESCE("description", '') FROM "outline_nodes";
+INSERT INTO "character_fts" ("rowid", "title", "body")
+SELECT "id", "name", COALESCE("notes", '') FROM "characters";"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TRIGGER IF EXISTS "trg_search_chapter_insert";
+DROP TRIGGER IF EXISTS "trg_search_chapter_title";
+DROP TRIGGER IF EXISTS "trg_search_chapter_delete";
+DROP TRIGGER IF EXISTS "trg_search_outline_node_insert";
+DROP TRIGGER IF EXISTS "trg_search_outline_node_update";
+DROP TRIGGER IF EXISTS "trg_search_outline_node_delete";
+DROP TRIGGER IF EXISTS "trg_search_character_insert";
+DROP TRIGGER IF EXISTS "trg_search_character_update";
+DROP TRIGGER IF EXISTS "trg_search_character_delete";
+DROP TABLE IF EXISTS "chapter_fts";
+DROP TABLE IF EXISTS "outline_node_fts";
+DROP TABLE IF EXISTS "character_fts";"""
+
+
+MODELS_STATE = (
+    "eNrtXWtz2ziy/Ssqf3JqkzHfj9TdW2U7nol3Ezvl2PfubJJSgSRocyOTWpJKxrOV/75o8A"
+    "W+ZEIvUgrzwRWRaEo8ABrdpxuN/xw9Bg6eRb/cRTg8ej35z5GPHjH5T+n6y8kRms+Lq3Ah"
+    "RtaMNlyQFvQKsqI4RHZMLrpoFmFyycGRHXrz2At8aPp5oauS8XmhSbL+eWEYmgFyTmATQc"
+    "+/rzfRkCR+Xqi6YUHDhe/9e4GncXCP4wf6cz99IZc938F/4Cj7OP86dT08c0pv4znwAHp9"
+    "Gj/N6bVLP/6VNoTfYE3tYLZ49IvG86f4IfDz1p4fw9V77OMQxRgeH4cLeEl/MZulYGTvnf"
+    "zSoknyExkZB7toMQOoQHo5UpdvqiilMnbgA+Lkl0X0Ze/hG19JoqIrhqwpBmlCf1V+Rf+R"
+    "vGqBQyJI0bi6PfpB76MYJS0opAWG0NH0/zUkzx9Q2AwlK1MBlPz0KqAZfNtGlAwpRXA6ov"
+    "qI/pjOsH8fP5CPqrAEwv87vTl/e3pzrAov4NkBmQzJFLlK70j0FqBcoPqAogfsTOcoir4H"
+    "ocMDboPoZjDOLhQgFxP6OZRVCQnkr2VrFGVMcNcMJbuiG4K4Cu6iZHQAnrRqRZ7eK0OPH5"
+    "E34wE8F+h7KJsCAmAtazUwhS6jmLRqB1OojWPfs7/yagdWZiVIU8A2MnA1TVYJpqYrDEMx"
+    "hMGMC8ys/e5UANXuR01YGqYjkb+SLq2CpdQFS6kdS6mGpRdNiWHifWsA9CwguCG/xRJg5S"
+    "rAWkRwW8jmiqA2RiUX1KpEVKnm2kTRao5sdcN4CaZn19fv4CGPUfTvGb1weVsB9+792QXR"
+    "CRRz0siLMWs0FEijb8R8CHnGbSHRuwpQTRlWKsF2727erTRyVbXL0FXV9rEL98qQ2iGG15"
+    "+iuA7rG3In9h5xM7RlyQq8Tir6S/af3VsKokX+knZkGKsuGdKm6iodYSdv5lz7s6d0BCxB"
+    "/fby/cXH29P3H0oj/M3p7QXcoQrq8aly9VirdFD+kMn/X96+ncDHyT+vry4orkEU34f0G4"
+    "t2t/88gt+EFnEw9YPvU+QwC3x2NYOr1N2LubNid5clh9bdmuYq0NGW8BN3N/3x4KW6Xxkf"
+    "Cy5YyP76HYXOtHSnGBYRjmMCUdSwgqWSv/79Bs8QBbze/Yw7/zF50s6nu6jLxCYQVIV1xb"
+    "jWruIqC2UgBW1Y1m89So/VK8hH9/Rd4LvhmxqwamFGGCiXEyRTtvu4iRLLAmvf1XAn0oRt"
+    "/iyB8ik34r7ip6Mvh8unFKgMhU8BwDnspLR5/x4+O75MVcKDcUG/odmiwcK/xX+0DMxcYF"
+    "igqoJsr23T317847a0BGbQHb8//ceL0jL47vrqt6w5A/X5u+uz0RQdTdHRFD1cU7TU22Cn"
+    "cC3sjMTzq/uQ7ctNLPU1q76MbB3WX4MQe/f+3/ETRfeS/CLk23i58X4IVju5HKLvuVXJDi"
+    "Py0uRVccIunZ9+PD99c3H0o90/2qb9fxV8w7MPYfAvTE31mgNQur/UA/Ch5XSeNO3sAqi2"
+    "4IJhALrKNHQTIim4ZtNXHIFuQj9PJDW72Lu1H3sxH5+fC/RvnJYGkiHocMU0VqP2u3H7y8"
+    "j9mt3P/l4O678i1jv7XEJZtmEau12DUbt2BAgsIddozgX6J/kZDanbutWsSntzYqP4acbl"
+    "xOYC/SMrmmQAK65qw2C2qbIYqidLbK14EfGM4EJihxFWJ0RufPScttAlCwKCwmq5FZsPt4"
+    "40wUgTjDTBgdIE5EVj7Dd09XnwOCffEmGnfbFihAdlCKiioUKOmmUOc7mC/D4C46IJ91bv"
+    "qyy0O4ZGaETbUiGhV9XJZNKxQ5FH4i4jMYwvhkLi+E5XArVRdiVsNzmWWd+sQLofdO0HNI"
+    "8po9NgX/3t4/VVi2ooi1UgvfPJu35yPDt+OZl5UfxlaybX/7gL3wZkJ9bCm8WeH/0CX/i/"
+    "jVaYjrAAiW6GdPmG2gctee3cWgRwWq5FqgqjoujhAVUtsojwNIM5eopi/MiZD9f8gB0mxr"
+    "WSZWxmnOLqbsZWFh0E3p5rJcpnSBlzjzhGwBrxzBVWZkgTBb62eaKooiJn6l+TIcrpuoIB"
+    "b5h4iaSFC8sxuWoOdvI0h0fOvPs9iZAw7svK20tMSZJlXRJkzVAVXVcNIV8v6reWLRxnl7"
+    "/BZCh1RkskpUt+VLCIZ56PidVK3nu9JKnr5FFX5FOf4ZbCw18zSaphcV4TofPkKYeIDkRl"
+    "NoFP8pxd72GQFNh8Y6uYBej46u7du8QugQ0OMgIk4f+qDc2LZP0XA87GYydlQzCuMmfbY3"
+    "E1PdEpFGdKOlgOlpTbEoJlslG1yasJLGSimLFxxMyABU83lKYo3TrP++zDQgrmjiYL5L6C"
+    "BZP2pZT91THSYSkVoadlXT/+BgsSfkEeKYmmNEnMouNUFzCXU5eY/KLjCNO1/UW3cOGnoz"
+    "S6mS12KCRufvYhiDyK5ZcDyidUsGxx5b9tOb4I4zkBg2cDFis0gCQ4ZioUoZlkJCdD+CQd"
+    "syfp8BwG373Psd2S+hlju1tamEso57HdE/JBUQ1Ygg1xmMRjrru7q2dWpG/SURHsbDnUZB"
+    "MWSGy4wBAoTpZtC36o8MpCEXZ43M9Ns2ZeNMV/zBF5Q4d/kyIrObBtisQYValzLyRQ312y"
+    "8coNOfwbpGPG2OUYuxxjlwcauyy5JV2Xs5Ir03ugR5K1sjkBShVa/5USqWbtZk/rWdkf7I"
+    "p12YkcVE45L+G05ZzyeZF4vGZaeTWPed8ZvWp6eXlQNWeY15XEBoDl45H3Qkt0xpxVmrxJ"
+    "/Swf680c8qRd8vl73Q9NXP+uqP7NppIWeqGNLAUogd/ELmXjIKiFdLQRFLdJZGeANpDYDN"
+    "btBDYbwem0k5yJgFf5ZUmBjxiwXspXcz8DOGrVAmpDFVAlDK9ZGg0FGzqbd0X7DRKHBWCt"
+    "DdfWWaaeaJLKoJBkoW1orEZZZ3kN/uLRIgIjV73FSoKLJgzv7i7ftLhai0YY4fIvILXL4m"
+    "vwfZnuSYLoCjZg07YpgpMlYBjzrqhmdzfCb1AWT078JtYjoi9/OFx0SUsMj4vuNfN1tRyd"
+    "xlycJQrYoGypm93VdMne0BDeTj2Css7urpbrgkNwNouYfCltzQXNosqunnSR2D9ZPaYjbx"
+    "LNb8Sa4wuxMBK7w1F8TpfokmJkOqMYruU2mgXBL82iNqTsGBlTaYgYkhUME/c5rvd+V1g5"
+    "siIi2vLEJusT+N/OCfKmxS8a94qN8ZYx3jLGW7YXb6m48BwrXINk77GX3ZBSYyBmDMSMgZ"
+    "iqDtjrcEy/bHa1GxpUa6kvPl7cTiBjvK+6S0XyfDNFXmTWLyXJmUT+LjR5kQX/TIWl5obV"
+    "pOzmBPvjYgr89Srw8QvIkjLscjUHBYtylsRfLqTPSWqTe5+OYkxsfzLM6YWR095e/jXv2R"
+    "cbPRVnrdxUZkDDuTirH4KxFdbVQpFnTz3fDXh2SJal9mSPpE6dRcqfKC4WwZHX3GHuhgRV"
+    "fx8GC9/h6xVWaj96xRBsG/w7jbLiikoDPtYwe2VOFrzARzMvfuLplorYfvSLJoAhlewd1i"
+    "VYPlV3A1n0W+kXZHkEXA9zFUQoCe3LXHEhTi+ZFiQGGEJyZZh94gdxU3+0R/BygQEUWtOh"
+    "zAF2IC5kQpxUs7Exlgwf+d2R3x353V3m0/fELe7fnvmNl7Bi3HqO4lVlqf6x1zViT2vYFD"
+    "IuRdN19xjWNlulh2JA17iq+pJuc3eyvXxZDqBEbpuaprz4uZngwykhsS5lnA3wDfRBzjTe"
+    "Ms883LnRtUcqKoSbOWYOOE1zz6MpiqZRsAhtvKGqK2zTnRoJtLN4Dz/tlMtfAiupQbjnYL"
+    "ElCzcG2U7iEjliy+ITLKwd4hTTvINXCVgkAaakvl3n4EWzUC2QIdP92wpUokliFaoMhFh6"
+    "JX/GS1Yllb8ILOX8GHDmS9kSHzJNWVJdurJgBAVvLMWs8qCNB9glqmNaQJloprRQZ+nyl1"
+    "q4pEk4iZu0iY/xk63ET7Lxz13DpibYf0SleZAf0zxrStxYCEp/6IJFZ5N1QpllO7mTjPwX"
+    "wziEnHxX8vDuo5sV2V3iiPpcPxSq5Vh8JQo9uW0HUs6mtHQM/KgSYIsg34EHb1ZmWGDn1B"
+    "PNIXGHCbkXTS3P8cKkRhea8Re0qYkPrcZwsxE0FrIZifeReB+J960T7y0+T1cTrVm6/zTf"
+    "1QiULR0PsSK4LdL9g7sO4bJl5rw6IDdJ3+43CVilX1umbgdmvDIs9xnibVCHNZ67eRoP6Y"
+    "DaeoRiGSHJhjG6EJIZ0b9GBjUELLizqatCQEiWCi0wZUVMAzhFw7Jwxi+yzyuol5cVTtPF"
+    "Fq004pbNSd5s65EOHNOp6/qfGcUDTKc+EAaqpCsGzkDZBJL7IHziGc+szKDAViVBS1Trca"
+    "Y1QG2eEOUhQlHl9IMq2+SD5sh4UHz2z76Z4JiW6oI9fi6slknULcmkViWpiMPRYkaGDeE+"
+    "jt4bNyGMmxDGTQjjJoRxE0LXPhlJ+pGkH0n6AyLpVzq7cO+PnRtGqupWs/8+hMHjPL7Bdh"
+    "A6TTxb6f5Sim1OW05D2rQzu6bJjpClXhsWOFeldLuGM4efFSoTc12KCzDHmTLrD82XqxTT"
+    "rdxlBLHvzIOU3mKbHRCZVoDMebjq9iruRrxhrB2cXNsZz5UPq937IkrPa+nOIBabOYoCxk"
+    "m5GVMQej0qJDlJfJroRR5SsiY4gBLG+Rnjde07THaSTnR+7CtiA0A+VxL7gnxp+E4fUPTA"
+    "VXm0Ubp3rnjZBCiXm1YVG1QQFuxVuGFN6cANpyZlEzcMt1onAndnNMn23xVLZsSwu4JazT"
+    "z45wK9g664ECVJoIeQ9Onlsgh4F3jFTmFAcUkYUKyHAVkrvCvIrMwAylZZLi18QQ+8BqA/"
+    "XNK66W5xCAh3wFVVuwRcVbU94Ar36ju1AZRF2LQrdRagJXu1GbkK4C4I7trNx5KZ7c5SZV"
+    "tK6qevvba+ub47e3cx+XBzcX758TIlWXMah94s5zrfXJy+22setbPNPtKoOY3KQaxtkwa6"
+    "Db5i/y4iN9upoFqbpXRQDK2nC2jOxwnRrykvOKZIMyGeI4Y6Se6IHRppn5H2GWmfn5H2Sd"
+    "0lqv8iPnzLcgPYt1DxrlIF29082jS2NrIfiILlxrYm1/cxPYruQMxIcug5SHKW/psk+w4P"
+    "9uSgFbobnRv6JtkB7BpRIUtak0SBpQx6RzoOYjTjB7kqNgDVIcjWAMZtFHM5p5nAil7p5h"
+    "SE4cAhuvlRiwZN8TdL+weI+nDzJK2kghWc9QWZjaa+odPtNuHD7pj02ugoHlmvkfUaCZmR"
+    "kOlxE9zpfI7Jf2HH4rJtcEyzjhvhUC6x0pnbxH6CwjO6jDgOGeF7AGyRK1E39JBFYjWj8p"
+    "MSO9owkJXZzqpso6atc8l1tk1yZCOYKC9B0cti5cewj3MkKTsEWdWpD6/T2l902ihYSP5a"
+    "+ZmQdCKpSZxKtYTWSl/Zqa35gd3LKnuNlbt2RDI9Yp96LbznwdbkevY1m0d7Twb5mBf+M+"
+    "WFlxUb5xnWgynewVQOLladnubParU7hle0o3nxH0TRjnT8baaQxLyPSh1rDNiuZSTKk/T5"
+    "Mh0HUZ9jnUHLAexgC3MwAeBgNlvMnwkSJ226B4lp+3WDxJqt6An7yBskZiVZmo2l31RbcJ"
+    "MV/iS/ZEL2SFqxQ1ARrY5gFPxbo8V/T/yuxQyF6aZQa2F/TQpfs3HKUrwtJ8Vy3ubLskB1"
+    "8xc0xKxbGh6QX1H061DC1xXMuzJ2FbEBlARhZoxum1KSRPV68hAswhMHPa3C2hkdODujlb"
+    "EzaoUR8pnVFeVCYgAAM2VRNQMOxwJldHd7nqiX15Pfyb9X79+/evNm8vbt5IT5vBI3rXWh"
+    "prV2ZlprzD0eWqLGKpnGP1umxuboh3qihlA+cEVTwURlTwruL3djjFWNsaqDiVWFmLxrFH"
+    "MTmDW5njUIi3ffBOYeJncJY2bXmNl1gJldwpjWtWulMeZ0bSanaxB5WWPRnrFoz05o46SE"
+    "zNkssNoLzNC7XcrLWKThGsVl2N3BnYvLsEKtzDC77diiJzPpEIZJC0/K0F536UZDptDzEp"
+    "K4a01m3i3da23j3iAtWwD28e3pK0nV+tyi3c7V2mQk2lwVbjOBAZzXxow6YotCfVtDEF9P"
+    "QvT95M+ZZ538GcXOAEhaqHnIXZqgJNT/YVblCa7T05OM4nTI4dYkgJHfUJ7N81H41IJ8Kl"
+    "E9u+opLarfcYivDbMi4DrA6x9V1VDi8uz324vTWjWUrGW++BOUzy6vTm9+byidSRv/qA23"
+    "cuEU70/Mc9xN2nwA2Ryy6WZZj6ZKy2ljpI0pZmOK2SGnaN9FOPwYozg6B6KUWm0167bWZq"
+    "mNS4NfETRPyNe0cman1GymKE4yVBRXtbOKRcnGoOQvuO6kjUY3DDWYwOkQWsMkbY36nXn3"
+    "uwv8rW6arhz2MyVJlnVJkDVDVXRdNYRcm9VvLVNrZ5e/gWYrTarn8wqyuB8v4V+TG0zIsF"
+    "eiKU1x40WzJtc3JcrslOgPzWARw8mzRI87mBvSZuG+mX4TauTr2JIydCH61z/L/D0rtdJd"
+    "91YEB0AzZ15UslglRAurFoq7k79MKvuKyoLm8DT4yMGOHOzutxPConSDv3lR0ktNWwlLTZ"
+    "7bRkgXuTBtvdIWQsWFqUysUrozz6Dl11zpmW2DzUKwVVDTBSEbdAqm/9c1sSyhuI6TU7AW"
+    "nANEFIWSHZ2nixrdOQ/ms+EaMk1OMjOSoe05mmSgjI5o+17DdYzMT1awzB5hlLdJqQx6wl"
+    "R6ArdDdZ0rSFSV2fQt6SZIUzMh31jCKj35SCq+E36Xrqpm9luS7ZLt7yrYFX5Kh6TOZsK6"
+    "4w7Gb8RvgQ7/Mp4ruKuU4gzy7jAyEgMgkCyXlmCEQZ1mSlianFFKuqQY2YQhk13vx7r66j"
+    "Wdx9VOUGftBxAHYCJORD3S05wE9/Uk8tE8egjiSZt+mJxMiOaP0aRNLQ0geDAGaHYQoDmE"
+    "GAGrUTQJwGaXV02B8Z1wZuBuwKlWGyqi02NEAVw6bm+7LNS3l814cwWXOYYWxtDCeKrZRp"
+    "3zvIgm3b1IfApQkKJJU1voMViVaiZc5MpBufRjhYNxM/7ebcbvh3Y6xaFnPzSxTemdpSQT"
+    "Kto8xyxl8G80jrlntEQ7BkMhI9qdsnY2YtduWXcUt7+DC6YGB4hp8/0EcCubDck3xrjJ+W"
+    "k/GZoR6etc6PVg3cVZz71GNX78F11GH94="
+)
@@ -0,0 +1,137 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "novel_projects" ADD "outline_version" INT NOT NULL DEFAULT 0 /* 大纲版本号 */;
+CREATE TRIGGER IF NOT EXISTS "trg_outline_version_insert" AFTER INSERT ON "outline_nodes"
+BEGIN
+    UPDATE "novel_projects" SET "outline_version" = "outline_version" + 1 WHERE "id" = NEW."project_id";
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_outline_version_update" AFTER UPDATE OF "parent_id", "node_type", "title", "description", "position", "project_id" ON "outline_nodes"
+BEGIN
+    UPDATE "novel_projects" SET "outline_version" = "outline_version" + 1 WHERE "id" = OLD."project_id";
+    UPDATE "novel_projects" SET "outline_version" = "outline_version" + 1 WHERE "id" = NEW."project_id";
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_outline_version_delete" AFTER DELETE ON "outline_nodes"
+BEGIN
+    UPDATE "novel_projects" SET "outline_version" = "outline_version" + 1 WHERE "id" = OLD."project_id";
+END;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TRIGGER IF EXISTS "trg_outline_version_insert";
+DROP TRIGGER IF EXISTS "trg_outline_version_update";
+DROP TRIGGER IF EXISTS "trg_outline_version_delete";
+ALTER TABLE "novel_projects" DROP COLUMN "outline_version";"""
+
+
+MODELS_STATE = (
+    "eNrtXWtz2ziy/Ssqf3JqkzHfj9TdW2U7nol3Ezvl2PfubJJSgSRocyOTWpJKxrOV/75o8A"
+    "W+ZEIvUgrzwRWRaEo8ABrdpxuN/xw9Bg6eRb/cRTg8ej35z5GPHjH5T+n6y8kRms+Lq3Ah"
+    "RtaMNlyQFvQKsqI4RHZMLrpoFmFyycGRHXrz2At8aPp5oauS8XmhSbL+eWEYmgFyTmATQc"
+    "+/rzfRkCR+Xqi6YUHDhe/9e4GncXCP4wf6cz99IZc938F/4Cj7OP86dT08c0pv4znwAHp9"
+    "Gj/N6bVLP/6VNoTfYE3tYLZ49IvG86f4IfDz1p4fw9V77OMQxRgeH4cLeEl/MZulYGTvnf"
+    "zSoknyExkZB7toMQOoQHo5UpdvqiilMnbgA+Lkl0X0Ze/hG19JoqIrhqwpBmlCf1V+Rf+R"
+    "vGqBQyJI0bi6PfpB76MYJS0opAWG0NH0/zUkzx9Q2AwlK1MBlPz0KqAZfNtGlAwpRXA6ov"
+    "qI/pjOsH8fP5CPqrAEwv87vTl/e3pzrAov4NkBmQzJFLlK70j0FqBcoPqAogfsTOcoir4H"
+    "ocMDboPoZjDOLhQgFxP6OZRVCQnkr2VrFGVMcNcMJbuiG4K4Cu6iZHQAnrRqRZ7eK0OPH5"
+    "E34wE8F+h7KJsCAmAtazUwhS6jmLRqB1OojWPfs7/yagdWZiVIU8A2MnA1TVYJpqYrDEMx"
+    "hMGMC8ys/e5UANXuR01YGqYjkb+SLq2CpdQFS6kdS6mGpRdNiWHifWsA9CwguCG/xRJg5S"
+    "rAWkRwW8jmiqA2RiUX1KpEVKnm2kTRao5sdcN4CaZn19fv4CGPUfTvGb1weVsB9+792QXR"
+    "CRRz0siLMWs0FEijb8R8CHnGbSHRuwpQTRlWKsF2727erTRyVbXL0FXV9rEL98qQ2iGG15"
+    "+iuA7rG3In9h5xM7RlyQq8Tir6S/af3VsKokX+knZkGKsuGdKm6iodYSdv5lz7s6d0BCxB"
+    "/fby/cXH29P3H0oj/M3p7QXcoQrq8aly9VirdFD+kMn/X96+ncDHyT+vry4orkEU34f0G4"
+    "t2t/88gt+EFnEw9YPvU+QwC3x2NYOr1N2LubNid5clh9bdmuYq0NGW8BN3N/3x4KW6Xxkf"
+    "Cy5YyP76HYXOtHSnGBYRjmMCUdSwgqWSv/79Bs8QBbze/Yw7/zF50s6nu6jLxCYQVIV1xb"
+    "jWruIqC2UgBW1Y1m89So/VK8hH9/Rd4LvhmxqwamFGGCiXEyRTtvu4iRLLAmvf1XAn0oRt"
+    "/iyB8ik34r7ip6Mvh8unFKgMhU8BwDnspLR5/x4+O75MVcKDcUG/odmiwcK/xX+0DMxcYF"
+    "igqoJsr23T317847a0BGbQHb8//ceL0jL47vrqt6w5A/X5u+uz0RQdTdHRFD1cU7TU22Cn"
+    "cC3sjMTzq/uQ7ctNLPU1q76MbB3WX4MQe/f+3/ETRfeS/CLk23i58X4IVju5HKLvuVXJDi"
+    "Py0uRVccIunZ9+PD99c3H0o90/2qb9fxV8w7MPYfAvTE31mgNQur/UA/Ch5XSeNO3sAqi2"
+    "4IJhALrKNHQTIim4ZtNXHIFuQj9PJDW72Lu1H3sxH5+fC/RvnJYGkiHocMU0VqP2u3H7y8"
+    "j9mt3P/l4O678i1jv7XEJZtmEau12DUbt2BAgsIddozgX6J/kZDanbutWsSntzYqP4acbl"
+    "xOYC/SMrmmQAK65qw2C2qbIYqidLbK14EfGM4EJihxFWJ0RufPScttAlCwKCwmq5FZsPt4"
+    "40wUgTjDTBgdIE5EVj7Dd09XnwOCffEmGnfbFihAdlCKiioUKOmmUOc7mC/D4C46IJ91bv"
+    "qyy0O4ZGaETbUiGhV9XJZNKxQ5FH4i4jMYwvhkLi+E5XArVRdiVsNzmWWd+sQLofdO0HNI"
+    "8po9NgX/3t4/VVi2ooi1UgvfPJu35yPDt+OZl5UfxlaybX/7gL3wZkJ9bCm8WeH/0CX/i/"
+    "jVaYjrAAiW6GdPmG2gctee3cWgRwWq5FqgqjoujhAVUtsojwNIM5eopi/MiZD9f8gB0mxr"
+    "WSZWxmnOLqbsZWFh0E3p5rJcpnSBlzjzhGwBrxzBVWZkgTBb62eaKooiJn6l+TIcrpuoIB"
+    "b5h4iaSFC8sxuWoOc/IEi3jm+Xj6DYdRI9PUumQ0SPa9GJuSDjPBglkhKcDq6xL0gezq/S"
+    "warcGnM+9+T+JPjHO48uYdU5JkWZcEWTNURddVQ8iBrd9ahvDZ5W8Acmmot8SpumSfZUPY"
+    "D8h7r5eCdp086op86jOYVfAna6agNZg+ayJ0njzlENGBmNcm8Emes+sdIpICW5tsFbMAHV"
+    "/dvXuXWH2wfURGgCT8X7WhebEV4sWAcx3ZSdkQ6qzM2fZIZ01PdAp0MqtRaqkJlsnGLCev"
+    "JmAmiGLGdRIjDswJ3VCaYqDrPO+zD2YKGJOaLJD7ChZM2pdS9lfHSAdDRYSelnX9+BssSP"
+    "gFeaQkmtIkMTqPU13AXE4JB/KLjiNMLacX3YKxn47S2HG22KEQ+/mHIPIoll8OKFtTwbLF"
+    "lV245egtjOcEDJ7tbazQAFIMmalQBL6SkZwM4ZN0zJ6kw3MY0YR9jpyX1M8YOd/SwlxCOY"
+    "+cn5APimrAEmyIw6R1c93dXT2zIn17kYpgZ8uhJpuwQGLDBf5FcbJcZvDyhVcWirDD49xv"
+    "2r30oin+Y47IGzr8W0BZyYFtAiXGqEqpEyGB+u6SjQZviE7ZINk1RobHyPAYGT7QyHDJLe"
+    "m6nJVcmd7DaJKslc0JUKrQ+q+UpjZrN3taz8r+YFesy07koDL2eQmnLWfsz4u07jWT9qtZ"
+    "4vvO6FWT98uDqjl/v64kNgAsH4+8F1qiM+as0uTdMsHysd7MIU/aJZ+/1/3QxPXviurfbK"
+    "JuoRfayFKAEvhN7FI2DoJaSEcbQXGbRHYGaAOJzWDdTmCzEZxO+/SZ/IIqvywp8BED1kv5"
+    "au5nAEetWkBtqAKqJDlolkYD7YbOZrXRfoO0bAFYa8O1dZapJ5qkMigkWWgbGqtR1lnWiL"
+    "94tIjAyFVvsU7jognDu7vLNy2u1qIRRrj8C0jtsrQdfF+me5IguoIN2BJviuBkCRjGvCuq"
+    "2d2N8BuUxZMTv4n1iOjLHw4XXdISw+Oie80rXi0DqjHTaYkCNihb6mZ3k5ybjQzh7VR7KO"
+    "vs7mq5LjgEZ7OIyZeSAl3QLJD4lHSR2D9ZPSZ7bxJN/ny9XvL0xOd0STVPL9MobBvNguCX"
+    "ZlEbUnaMjKk0RAzJCoaJ+xzXe7/nrhxZERFteWKT9Qn8b+cEedPiF4078cZ4yxhvGeMt24"
+    "u3VFz4FTLSGcneYy+7IaXGQMwYiBkDMVUdsNfhmH7Z7Go3NKjWUl98vLidQMZ4X1WtiuT5"
+    "Zoq8yKxfSpIzifxdaPIiC/6Z+lXNDatJ2c0J9sfFFPjrVeDjF5AlZdjlWhkKFuUsib98TA"
+    "EnqU3ufTqKMbH9yTCnF0ZOe3v517wni2z0zKG1clOZAQ2nDq1+xMhWWFcLRZ499Xw34Nl/"
+    "Wpbakx2oOnUWKX+iuFgER15zh7nXFFT9fRgsfIevV1ip/egVQ7Bt8O80yoorKg34WMPslT"
+    "lZ8AIfzbz4iadbKmL70S+aAIZUsjNbl2D5VN0NZNFvpV+Q5RFwPcxVbqIktC9zxYU4vWRa"
+    "kBhgCMmVYfaJH8RN/dEewcsFBlDGTociEtiBuJAJcVLNxsZYkH3kd0d+d+R3d5lP3xO3uH"
+    "975jdeIIxx6zlKg5Wl+sde14g9rWFTyLgUTdfdY1jbbJUeOQJd46rqS7rN3cn28mU5gBK5"
+    "bWqa8uLnZoIPp4TEupRxNsA30Ac503jLPPNw50bXHqmoEG7mmDk+Ns09j6YomkbBIrTxhq"
+    "qusE13aiTQzuI9WrZTLn8JrKTC456DxRaE3BhkO4lL5Igti0+wsHaIU0zzDl4lYJEEmJLq"
+    "gZ2DF81CtUCGTPdvK1CJJolVqDIQYumV/BkvWZVU/iKwlPND1pkvZUt8yDRlSXXpyoIRFL"
+    "yxFLPKgzYeD5iojmkBZaKZ0jKopctfauGSJuEkbtImPsZPthI/ycY/dw2bmmD/EZXmQX5M"
+    "86wpcWMhKP2hCxadTdYJZZbt5E4y8l8M44h38l3Jw7uPblZkd4kj6nP9UKiWY/GVKPTkth"
+    "1IOZvS0jHwg2CALYJ8Bx68WZlhgZ1TTzSHxB0m5F40tTzHC5MaXWjGX9CmJj60Cs7NRtBY"
+    "yGYk3kfifSTet068t/g8XU20Zun+03xXI1C2dPjGiuC2SPcP7jqEy5aZ8+qA3CR9u98kYJ"
+    "V+bZm6HZjxyrDcZ4i3QR3WeO7maTyk43/rEYplhCQbxuhCSGZE/xoZ1BCw4M6mrgoBIVkq"
+    "tMCUFTEN4BQNy8IZv8g+r6BeXlY4TRdbtNKIWzYnebOtRzpwTKeu639mFA8wnfpAGKiSrh"
+    "g4A2UTSO6D8IlnPLMygwJblQQtUa3HmdYAtXlClIcIRZXTD6pskw+aI+NB8dk/+2aCY1qq"
+    "C/b4ubBaJlG3JJNalaQiDkeLGRk2hPs4em/chDBuQhg3IYybEMZNCF37ZCTpR5J+JOkPiK"
+    "Rf6ezCvT92bhipqlvN/vsQBo/z+AbbQeg08Wyl+0sptjltOQ1p087smiY7QpZ6bVjgXJXS"
+    "7RpOdH5WqEzMdSkuwBxnyqw/NF+uUky3cpcRxL4zD1J6i212QGRaATLn4arbq7gb8Yaxdn"
+    "BybWc8Vz6sdu+LKD2vpTuDWGzmKAoYJ+VmTEHo9aiQ5Jz2aaIXeUjJmuAAShjnJ7jXte8w"
+    "2Uk60fmxr4gNAPlcSewL8qXhO31A0QNX5dFG6d654mUToFxuWlVsUEFYsFfhhjWlAzecmp"
+    "RN3DDcap0I3J3RJNt/VyyZEcPuCmo18+CfC/QOuuJClCSBHkLSp5fLIuBd4BU7hQHFJWFA"
+    "sR4GZK3wriCzMgMoW2W5tPAFPfAagP5wSeumu8UhINwBV1XtEnBV1faAK9yr79QGUBZh06"
+    "7UWYCW7NVm5CqAuyC4azcfS2a2O0uVbSmpn7722vrm+u7s3cXkw83F+eXHy5RkzWkcerOc"
+    "63xzcfpur3nUzjb7SKPmNCoHsbZNGug2+Ir9u4jcbKeCam2W0kExtJ4uoDkfJ0S/przgmC"
+    "LNhHiOGOokuSN2aKR9RtpnpH1+RtondZeo/ov48C3LDWDfQsW7ShVsd/No09jayH4gCpYb"
+    "25pc38f0KLoDMSPJoecgyVn6b5LsOzzYk4NW6G50buibZAewa0SFLGlNEgWWMugd6TiI0Y"
+    "wf5KrYAFSHIFsDGLdRzOWcZgIreqWbUxCGA4fo5kctGjTF3yztHyDqw82TtJIKVnDWF2Q2"
+    "mvqGTrfbhA+7Y9Jro6N4ZL1G1mskZEZCpsdNcKfzOSb/hR2Ly7bBMc06boRDucRKZ24T+w"
+    "kKz+gy4jhkhO8BsEWuRN3QQxaJ1YzKT0rsaMNAVmY7q7KNmrbOJdfZNsmRjWCivARFL4uV"
+    "H8M+zpGk7BBkVac+vE5rf9Fpo2Ah+WvlZ0LSiaQmcSrVElorfWWntuYHdi+r7DVW7toRyf"
+    "SIfeq18J4HW5Pr2ddsHu09GeRjXvjPlBdeVmycZ1gPpngHUzm4WHV6mj+r1e4YXtGO5sV/"
+    "EEU70vG3mUIS8z4qdawxYLuWkShP0ufLdBxEfY51Bi0HsIMtzMEEgIPZbDF/JkictOkeJK"
+    "bt1w0Sa7aiJ+wjb5CYlWRpNpZ+U23BTVb4k/ySCdkjacUOQUW0OoJR8G+NFv898bsWMxSm"
+    "m0Kthf01KXzNxilL8bacFMt5my/LAtXNX9AQs25peEB+RdGvQwlfVzDvythVxAZQEoSZMb"
+    "ptSkkS1evJQ7AITxz0tAprZ3Tg7IxWxs6oFUbIZ1ZXlAuJAQDMlEXVDDgcC5TR3e15ol5e"
+    "T34n/169f//qzZvJ27eTE+bzSty01oWa1tqZaa0x93hoiRqrZBr/bJkam6Mf6okaQvnAFU"
+    "0FE5U9Kbi/3I0xVjXGqg4mVhVi8q5RzE1g1uR61iAs3n0TmHuY3CWMmV1jZtcBZnYJY1rX"
+    "rpXGmNO1mZyuQeRljUV7xqI9O6GNkxIyZ7PAai8wQ+92KS9jkYZrFJdhdwd3Li7DCrUyw+"
+    "y2Y4uezKRDGCYtPClDe92lGw2ZQs9LSOKuNZl5t3SvtY17g7RsAdjHt6evJFXrc4t2O1dr"
+    "k5Foc1W4zQQGcF4bM+qILQr1bQ1BfD0J0feTP2eedfJnFDsDIGmh5iF3aYKSUP+HWZUnuE"
+    "5PTzKK0yGHW5MARn5DeTbPR+FTC/KpRPXsqqe0qH7HIb42zIqA6wCvf1RVQ4nLs99vL05r"
+    "1VCylvniT1A+u7w6vfm9oXQmbfyjNtzKhVO8PzHPcTdp8wFkc8imm2U9miotp42RNqaYjS"
+    "lmh5yifRfh8GOM4ugciFJqtdWs21qbpTYuDX5F0DwhX9PKmZ1Ss5miOMlQUVzVzioWJRuD"
+    "kr/gupM2Gt0w1GACp0NoDZO0Nep35t3vLvC3umm6ctjPlCRZ1iVB1gxV0XXVEHJtVr+1TK"
+    "2dXf4Gmq00qZ7PK8jifryEf01uMCHDXommNMWNF82aXN+UKLNToj80g0UMJ88SPe5gbkib"
+    "hftm+k2oka9jS8rQhehf/yzz96zUSnfdWxEcAM2ceVHJYpUQLaxaKO5O/jKp7CsqC5rD0+"
+    "AjBztysLvfTgiL0g3+5kVJLzVtJSw1eW4bIV3kwrT1SlsIFRemMrFK6c48g5Zfc6Vntg02"
+    "C8FWQU0XhGzQKZj+X9fEsoTiOk5OwVpwDhBRFEp2dJ4uanTnPJjPhmvINDnJzEiGtudoko"
+    "EyOqLtew3XMTI/WcEye4RR3ialMugJU+kJ3A7Vda4gUVVm07ekmyBNzYR8Ywmr9OQjqfhO"
+    "+F26qprZb0m2S7a/q2BX+CkdkjqbCeuOOxi/Eb8FOvzLeK7grlKKM8i7w8hIDIBAslxagh"
+    "EGdZopYWlyRinpkmJkE4ZMdr0f6+qr13QeVztBnbUfQByAiTgR9UhPcxLc15PIR/PoIYgn"
+    "bfphcjIhmj9Gkza1NIDgwRig2UGA5hBiBKxG0SQAm11eNQXGd8KZgbsBp1ptqIhOjxEFcO"
+    "m4ve2yUN9eNuPNFVzmGFoYQwvjqWYbdc7zIpp09yLxKUBBiiZNbaHHYFWqmXCRKwfl0o8V"
+    "DsbN+Hu3Gb8f2ukUh5790MQ2pXeWkkyoaPMcs5TBv9E45p7REu0YDIWMaHfK2tmIXbtl3V"
+    "Hc/g4umBocIKbN9xPArWw2JN8Y4ybnp/1kaEakr3Oh14N1F2c99xrV+PFfgzqN6A=="
+)
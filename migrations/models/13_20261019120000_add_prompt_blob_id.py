@@ -0,0 +1,145 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE "_prompt_blobs_new" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL /* 内容ID（全文索引的 rowid） */,
+    "hash" VARCHAR(64) NOT NULL UNIQUE /* 内容SHA-256 */,
+    "codec" VARCHAR(8) NOT NULL /* 压缩编码: raw/zlib/zstd */,
+    "dict_hash" VARCHAR(64) /* 压缩字典的内容哈希 */,
+    "data" BLOB NOT NULL /* 压缩后的内容 */,
+    "size" INT NOT NULL /* 原文长度 */,
+    "created_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP /* 创建时间 */
+) /* 提示词内容表 */;
+        INSERT INTO "_prompt_blobs_new" ("id", "hash", "codec", "dict_hash", "data", "size", "created_at")
+    SELECT "rowid", "hash", "codec", "dict_hash", "data", "size", "created_at" FROM "prompt_blobs" ORDER BY "rowid";
+        DROP TABLE "prompt_blobs";
+        ALTER TABLE "_prompt_blobs_new" RENAME TO "prompt_blobs";"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE "_prompt_blobs_old" (
+    "hash" VARCHAR(64) NOT NULL PRIMARY KEY /* 内容SHA-256 */,
+    "codec" VARCHAR(8) NOT NULL /* 压缩编码: raw/zlib/zstd */,
+    "dict_hash" VARCHAR(64) /* 压缩字典的内容哈希 */,
+    "data" BLOB NOT NULL /* 压缩后的内容 */,
+    "size" INT NOT NULL /* 原文长度 */,
+    "created_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP /* 创建时间 */
+) /* 提示词内容表 */;
+        INSERT INTO "_prompt_blobs_old" ("rowid", "hash", "codec", "dict_hash", "data", "size", "created_at")
+    SELECT "id", "hash", "codec", "dict_hash", "data", "size", "created_at" FROM "prompt_blobs" ORDER BY "id";
+        DROP TABLE "prompt_blobs";
+        ALTER TABLE "_prompt_blobs_old" RENAME TO "prompt_blobs";"""
+
+
+MODELS_STATE = (
+    "eNrtXWtz2ziy/Ssqf3JqkzHfj9TdW2U7nol3Ezvl2PfubJJSgSRocyOTWpJKxrOV/75o8A"
+    "W+ZEIvUgrzwRWRaEo8ABqN043u/xw9Bg6eRb/cRTg8ej35z5GPHjH5T+n6y8kRms+Lq3Ah"
+    "RtaMNlyQFvQKsqI4RHZMLrpoFmFyycGRHXrz2At8aPp5oauS8XmhSbL+eWEYmgFyTmATQc"
+    "+/rzfRkCR+Xqi6YUHDhe/9e4GncXCP4wf6cz99IZc938F/4Cj7OP86dT08c0pv4znwAHp9"
+    "Gj/N6bVLP/6VNoTfYE3tYLZ49IvG86f4IfDz1p4fw9V77OMQxRgeH4cLeEl/MZulYGTvnf"
+    "zSoknyExkZB7toMQOoQHo5UpdvqiilMnbgA+Lkl0X0Ze/hG19JoqIrhqwpBmlCf1V+Rf+R"
+    "vGqBQyJI0bi6PfpB76MYJS0opAWG0NH0/zUkzx9Q2AwlK1MBlPz0KqAZfNtGlAwpRXA6ov"
+    "qI/pjOsH8fP5CPqrAEwv87vTl/e3pzrAov4NkBmQzJFLlK70j0FqBcoPqAogfsTOcoir4H"
+    "ocMDboPoZjDOLhQgFxP6OZRVCQnkr2VrFGVMcNcMJbuiG4K4Cu6iZHQAnrRqRZ7eK0OPH5"
+    "E34wE8F+h7KJsCAmAtazUwhS6jmLRqB1OojWPfs7/yagdWZiVIU8A2MnA1TVYJpqYrDEMx"
+    "hMGMC8ys/e5UANXuR01YGqYjkb+SLq2CpdQFS6kdS6mGpRdNiWHifWsA9CwguCG/xRJg5S"
+    "rAWkRwW8jmiqA2RiUX1KpEVKnm2kTRao5sdcN4CaZn19fv4CGPUfTvGb1weVsB9+792QXR"
+    "CRRz0siLMWs0FEijb8R8CHnGbSHRuwpQTRlWKsF2727erTRyVbXL0FXV9rEL98qQ2iGG15"
+    "+iuA7rG3In9h5xM7RlyQq8Tir6S/af3VsKokX+knZkGKsuGdKm6iodYSdv5lz7s6d0BCxB"
+    "/fby/cXH29P3H0oj/M3p7QXcoQrq8aly9VirdFD+kMn/X96+ncDHyT+vry4orkEU34f0G4"
+    "t2t/88gt+EFnEw9YPvU+QwC3x2NYOr1N2LubNid5clh9bdmuYq0NGW8BN3N/3xsEt1vzJ7"
+    "LLhgIfvrdxQ609KdYlhEOI4JRFHDCpZK/vr3GzxDFPB69zPb+Y/Jk3Y+3UVdJjaBoCrsVo"
+    "xr7SquslAGUtCGZf3Wo/RYvYJ8dE/fBb4bvqkBqxZmhIFyOUEyZbuPmyixLLD2XQ13Ik3Y"
+    "5s8SKJ9yI+4rfjr6crh8SoHKUPgUAJzDTkqb97/DZ8eXqUp4MFvQb2i2aLDwb/EfLQMzFx"
+    "gWqKog22vb9LcX/7gtLYEZdMfvT//xorQMvru++i1rzkB9/u76bDRFR1N0NEUP1xQt9TbY"
+    "KVwLOyPx/Oo+ZPtyE0t9zaovI1uH9dcgxN69/3f8RNG9JL8I+TZebrwfgtVOLofoe25Vss"
+    "OIvDR5VZywS+enH89P31wc/WjfH23T/r8KvuHZhzD4F6amem0DULq/dAfgQ8vpPGnaeQug"
+    "2oILhgHoKtPQTfCk4JpNX9kIdBP6eTyp2cXerf3Yi/n4/Fygf+O0NJAMQYcrprEatd+N21"
+    "9G7tfsfvb3clj/FbHe2ecSyrIN09jt6oza9UaAwBJyjeZcoH+Sn9GQuq1bzaq0t01sFD/N"
+    "uDaxuUD/yIomGcCKq9owmG2qLIa6kyW2VryIeEZwIbFDD6sTIjc+ek5b6JIFDkFhtdiKzb"
+    "tbR5pgpAlGmuBAaQLyojH2G7r6PHick2+JsNO+WDHCgzIEVNFQIUbNMoe5XEF8H4Fx0YR7"
+    "6+6rLLQ7hkZoRNtSIaBX1clk0rFDkUfiLj0xzF4MhWTjO10J1EbZlbDd5Fhm92YF0v2gaz"
+    "+geUwZnQb76m8fr69aVENZrALpnU/e9ZPj2fHLycyL4i9bM7n+x134NiA7sRbeLPb86Bf4"
+    "wv9ttMJ0hAUIdDOkyzfUPmiJa+fWIoDTci1SVRgVRQ8PqGqRRYSnGczRUxTjR854uOYH7D"
+    "AwrpUsYyPjFFd3M7ay6CDY7blWonyGFDH3iGMErBHPXGFlhjRR4GubJ4oqKnKm/jUZvJyu"
+    "KxjwhskukbRwYTkmV81hTp5gEc88H0+/4TBqZJpal4wGyb4XY1PSYSZYMCskBVh9XYI+kF"
+    "29n0Wj1fl05t3vif+J2RyufHjHlCRZ1iVB1gxV0XXVEHJg67eWIXx2+RuAXBrqLX6qLtFn"
+    "2RD2A/Le64WgXSePuiKf+nRmFfzJmiFoDabPmgidJ085RHTA57UJfJLn7PqEiKTA0SZbxS"
+    "xAx1d3794lVh8cH5ERIAn/V21oXhyFeDHgWEd2Uja4Oitztt3TWdMTnRydzGqUWmqCZbI+"
+    "y8mrCZgJophxncSIA3NCN5QmH+g6z/vsg5kCxqQmC+S+ggWT9qWU/dUx0sFQEaGnZV0//g"
+    "YLEn5BHimJpjRJjM7jVBcwl1PCgfyi4whTy+lFN2fsp6PUd5wtdijEfv4hiDyK5ZcDitZU"
+    "sGxxRRdu2XsL4zkBg+d4Gys0gBBDZioUjq9kJCdD+CQdsyfp8ByGN2GfPecl9TN6zre0MJ"
+    "dQzj3nJ+SDohqwBBviMGndXHd3V8+sSN+7SEWws+VQk01YILHhAv+iOFksM+zyhVcWirDD"
+    "s7nf9PbSi6b4jzkib+jwHwFlJQd2CJQYoyqlToQE6rtL1hu8ITplg2TX6BkePcOjZ/hAPc"
+    "OlbUnX5ay0lendjSbJWtmcAKUKrf9KaWqzdrOn9ay8H+yKdXkTOaiIfV7CacsR+/MirHvN"
+    "oP1qlPi+M3rV4P3yoGqO368riQ0Ay8cj74WW6Iw5qzR5j0ywfKw3c8iTdsnn73U/NHH9u6"
+    "L6NxuoW+iFNrIUoAR+E7uUjQOnFtLRRlDcJpGdAdpAYjNYtxPYrAen0zl9Jr6gyi9LCnzE"
+    "gPVSvpr7GcBRqxZQG6qAKkEOmqVRR7uhs1FttN8gLFsA1tpwbZ1l6okmqQwKSRbahsZqlH"
+    "UWNeIvHi0iMHLVW8zTuGjC8O7u8k3LVmvRCCNc/gWkdpnaDr4v0z2JE13BBhyJN0XYZAkY"
+    "xrwrqtndjfAblMWTk30TuyOiL384XHRJSwyPi+41rni1CKjGSKclCtigbKmb3U1ibjYyhL"
+    "eT7aGss7ur5brgEDabhU++FBTogmaBwKeki8T+yeox2HuTaPLH6/USpyc+p0uqcXqZRmHb"
+    "aBY4vzSL2pCyY2RMpSFiCFYwTNznuN77M3dlz4qIaMsTm6xPsP92TpA3LX7ReBJv9LeM/p"
+    "bR37I9f0tlC79CRDoj2bvvZTek1OiIGR0xoyOmqgP22h3TL5td7YYG1Vrqi48XtxOIGO8r"
+    "q1URPN9MkReR9UtJciaQvwtNXkTBP5O/qrlhNSi7OcD+uJgCf70KfPwCoqQMu5wrQ8GinA"
+    "Xxl8sUcJLa5N6noxgT258Mc3ph5LS3F3/NW1lkozWH1opNZQY0VB1avcTIVlhXC0WePfV8"
+    "N+A5f1qW2pMTqDrdLFL+RHGxCBt5zR3mWVNQ9fdhsPAdvl5hpfajVwzBtmF/p1FWXFGpw8"
+    "caZq/MyYIX+GjmxU883VIR249+0QQwpJKT2boEy6fqbiCKfiv9giyPgOthrnQTJaF9mSsu"
+    "+Okl04LAAENIrgyzT/wgbuqPdg9eLjCANHY6JJHADviFTPCTajY2xoTsI7878rsjv7vLeP"
+    "qeuMX9OzO/8QRhzLaeIzVYWap/7HWN2NMaNoWMS9F03T2Gtc1WackR6BpXVV/SY+5OdpYv"
+    "iwGUyG1T05QXPzcTfDgpJNaljLMBvoE+yJnGW+aZhzs3uvZIRYVwM8dM+dg09jyaomgaBY"
+    "vQxhvKusI23amRQDuLt7Rsp1j+ElhJhsc9B4tNCLkxyHbil8gRW+afYGHt4KeY5h28isMi"
+    "cTAl2QM7Oy+ahWqODJme31YgE03iq1BlIMTSK/kzXrIqqfxFYCnnRdaZL2VTfMg0ZEl16c"
+    "qCESS8sRSzyoM2lgdMVMe0gDLRTGka1NLlLzV3SZNw4jdpEx/9J1vxn2TjnzuHTU2wf49K"
+    "8yA/pnHWlLixEKT+0AWLzibrhDLLdnInGfkvhlHinXxX8vDuo5sV2V3giPpcPxSq5Vh8JQ"
+    "o9bdsOJJ1NaekYeCEYYIsg3oEHb1ZmWGDn1BONIXGHCbkXTS3P8cIkRxea8Se0qYkPLYNz"
+    "sxE0JrIZifeReB+J960T7y17nq4mWrN0/2G+qxEoWyq+sSK4LdL9g7sO4bJl5rw6IDdJ3+"
+    "43CVilX1umbgdmvDIs9xnibVCHNZ67eRoPqfxv3UOxjJBk3RhdCMmM6F8jghocFtzR1FUh"
+    "ICRLiRaYtCKmAZyiYVk44xfZ5xXUy8sKp+lii2YaccvmJG+09UgHjuHUdf3PjOIBhlMfCA"
+    "NV0hUDZ6BsAsl9ED7xjGdWZlBgq5KgJar1ONMaoDZPiPIQIaly+kGVbfJBc2Q8KD77Zz9M"
+    "cExTdcEZPxdWy8TrlkRSq5JU+OFoMiPDBncfR++NhxDGQwjjIYTxEMJ4CKFrn4wk/UjSjy"
+    "T9AZH0K9Uu3Puyc8MIVd1q9N+HMHicxzfYDkKniWcr3V9Ksc1py2lIm3Zm1zTZEbLQa8OC"
+    "zVUp3K6hovOzQmVirktyAaacKbP+0Hi5SjLdyl1GEPvOPEjpLbbZAZFpBcicxVW3l3E34n"
+    "Vj7aBybWc8Vy5Wu/dJlJ7X0p1BLA5zFAmMk3QzpiD0WiokqdM+TfQiDylZExxACuO8gntd"
+    "+w6TnaQTnR/7itgAkM+VxL4gXxq+0wcUPXBlHm2U7p0rXjYByummVcUGFYQFexVuWFM6cM"
+    "OpSdnEDcOt1onA3RlNsv13xZIZMeyuoFYzD/65QO+gKy54SRLowSV9ernMA94FXrGTG1Bc"
+    "4gYU625A1grvCjIrM4C0VZZLE1/QgtcA9IdLmjfdLYqAcDtcVbWLw1VV2x2ucK9+UhtAWY"
+    "RNp1JnAVpyVpuRqwDuguCut/lYMrPTWapsS0n+9LXX1jfXd2fvLiYfbi7OLz9epiRrTuPQ"
+    "m+VY55uL03d7zaN2ttlHGjWnUTmItW3SQLfBV+zfReRmOxVUa7OUDoqh9XQBzfk4Ifo15Q"
+    "XHFGkkxHPEUCfJHbFDI+0z0j4j7fMz0j7pdonqv4gP37LcAM4tVHZXqYLtbh5tGlsb2Q9E"
+    "wXJjW5Pru0yPojvgM5IcWgdJzsJ/k2Df4cGeFFqhp9G5oW+SHcCpERWipDVJFFjKoHek4y"
+    "BGM36Qq2IDUB2CbA1g3EYx1+Y0E1hxV7o5BWE4UEQ3L7Vo0BB/s3R+gKgPNw/SSjJYQa0v"
+    "iGw09Q1Vt9vEHnbHpNdGR/HIeo2s10jIjIRMj4fgTudzTP4LJxaXHYNjmnU8CIdyiZVqbh"
+    "P7CRLP6DLiKDLC9wA4IleibmiRRWI1o/KTEjvaMJCV2c6qbKOmo3PJdbZNUrIRTJSXoOhl"
+    "sfJj2Mc5kpQVQVZ1uofXae4vOm0ULCR/rbwmJJ1IauKnUi2hNdNXVrU1L9i9LLPXmLlrRy"
+    "TTI/bproW3HmxNrue9ZvNo78kgH+PCf6a48LJi46xhPZjkHUzm4GLV6Wn+rJa7Y3hJO5oX"
+    "/0Ek7UjH32YSScz7yNSxxoDtmkaiPEmfT9NxEPk51hm0HMAONjEH4wAOZrPF/BkncdKmu5"
+    "OYtl/XSazZip6wj7xOYlaSpdlY+k21BTdZ4U/ySyZEj6QZOwQV0ewIRsG/NVr892TftZih"
+    "MD0Uai3sr0nia9ZPWfK35aRYztt8Weaobv6CBp91S8MD2lcU/ToU93UF866MXUVsAClBmB"
+    "mj26aUBFG9njwEi/DEQU+rsHZGB87OaGXsjFpihHxmdUW5kBgAwExaVM2A4ligjO5uzxP1"
+    "8nryO/n36v37V2/eTN6+nZwwn1fiprUu1LTWzkxrjbHHQwvUWCXS+GeL1Ngc/VAP1BDKBV"
+    "c0FUxUtlJwf7Ebo69q9FUdjK8qxORdo5ibwKzJ9axBWLz7JjD3MLhLGCO7xsiuA4zsEsaw"
+    "rl0rjTGmazMxXYOIyxqT9oxJe3ZCGycpZM5mgdWeYIbe7ZJexiIN10guw54O7pxchhVqZY"
+    "bZY8cWrcykgxsmTTwpQ3vdpQcNmUTPS0jiw83JXEDFHN2gVVeTuBk2zgbMpkkYfPec3dMC"
+    "7QQu7zH6tY7ObwX5j29PX0mqNoxj8TaZ7TZXFuFMYAA18ZiZTex9yCFsCOLrSYi+n/w586"
+    "yTP6PYGQARDnkludM/lIT6LxhWVqI6rVBlFBU4h5v3ARRJQwo8z0fhUwvyqUS1PthTWrig"
+    "4xBfG2ZFwHWA1y8H1pBG9Oz324vTWsaZrGVuYBGUzy6vTm9+b0hPShv/qA23cnIa70/MU1"
+    "IobT6AiBnZdLMV0lRpynKMtDGMbwzjO+Qw+LsIhx9jFEfnQEZTy7i2g6i1WbqPoA7GCJon"
+    "BHeanbRT+DuTeCgZKoqr2llWqOTwVfIX6BHSRqOHshq2GekQWsPsb/Wsnnn3u3Ourm6Kru"
+    "xaNSVJlnVJkDVDVXRdNYRcm9VvLVNrZ5e/gWYrTarnTf/Mt8rrVKnJDcYt2yuZl4YR8qJZ"
+    "k+ubdmZOo/SHZrCIobov0eMO5oa0Wbhvb4oJdQh0bEkZuuBh7Z/J/56ls+mueyuCA6Dys1"
+    "1UslglPAyrFoq7k79MKme3yoLm8DT4yHOPPPfuj2zConSDv3lR0ktNxzVLTZ47qkkXuTBt"
+    "vdIxTcWFqUysUnr60aAp7lzpmaOZzUJwHFPTBSEbdAqm/9c1sSyhuI6T09wW1FoiikLJyh"
+    "PqokazE4D5bLiGTAPAzIxkaHuOJhkooyPavtdwHSPbJytYZstE5W1SKoNW8UqrnDtU17mC"
+    "RFWZTd+SHjQ1NRNiuiWs0upSUvGd8Lt0VTWz35IcSW1/V8Gu8FM6BM42OwU6nhL9RvYt0O"
+    "FfxtqNu2L9M8i7w8hIDIBAslya5hIGdRqNYmly7nSRFCObMGSy6/1YV1+9pppn7QR11n4A"
+    "fgDGq0fUI62YJbivJ5GP5tFDEE/a9MPkZEI0f4wmbWppAM6D0UGzAwfNIfgIWI2iSQA2u7"
+    "xqCozvhDOD7QZUDttQoqIePQqwpePebZeF+t5lM7u5gsscXQuja2GsHLfRzXke7UJPiJI9"
+    "BShI0aThQ7TUWCVjDBe5clBb+jGLxJjwYO8SHvRDO53i0LMfmtim9M5SkgkVbZ5jljL4N+"
+    "rH3DNaoh2DoZAR7ZuydjZi19uy7ihu/5QcTA0OENPm+wngVg50km+McdPmp736NiPSV+3t"
+    "9WDdRT3tXr0aP/4LvGj7lA=="
+)
@@ -0,0 +1,104 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "character_appearances" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL /* 主键 */,
+    "mention_count" INT NOT NULL DEFAULT 0 /* 提及次数 */,
+    "created_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP /* 创建时间 */,
+    "chapter_id" INT NOT NULL REFERENCES "chapters" ("id") ON DELETE CASCADE /* 所属章节 */,
+    "character_id" INT NOT NULL REFERENCES "characters" ("id") ON DELETE CASCADE /* 出场角色 */,
+    CONSTRAINT "uid_character_a_chapter_1b8961" UNIQUE ("chapter_id", "character_id")
+) /* 章节出场角色模型 */;
+        CREATE INDEX IF NOT EXISTS "idx_character_a_charact_637da2" ON "character_appearances" ("character_id");"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "character_appearances";"""
+
+
+MODELS_STATE = (
+    "eNrtXftv2zgS/leC/JQAbaP343B7QF7dzW2aFGlyt9i2MCiJSnS1Ja8ktw0W/d+PQ1kS9X"
+    "JEvyS7+iWIKY5sfaSGM9/MkH8fTgIHj6M3DxEOD/9x8PehjyaY/FNof3VwiKbTvBUaYmSN"
+    "accZ6UFbkBXFIbJj0uiicYRJk4MjO/SmsRf40PXTTFcl49NMk2T908wwNAPknMAmgp7/WO"
+    "2iIUn8NFN1w4KOM9/7a4ZHcfCI4yf6cz9+Js2e7+DvOEo/Tr+MXA+PncLTeA7cgLaP4ucp"
+    "bbvy47e0I/wGa2QH49nEzztPn+OnwM96e34MrY/YxyGKMdw+DmfwkP5sPJ6DkT538kvzLs"
+    "lPZGQc7KLZGKAC6cVIXV2UUZrL2IEPiJNfFtGHfYRvfC2Jiq4YsqYYpAv9VVmL/iN51ByH"
+    "RJCicXN/+INeRzFKelBIcwxhoOn/FSTPn1BYDyUrUwKU/PQyoCl8m0aUTClFcFqiOkHfR2"
+    "PsP8ZP5KMqLIDwP6d357+d3h2pwjHcOyAvQ/KK3MyvSPQSoJyj+oSiJ+yMpiiKvgWhwwNu"
+    "jeh6ME4bcpDzF/ollFUJCeSvZWsUZUxw1wwlbdENQVwGd1EyWgBPejUiT68VoccT5I15AM"
+    "8Eup7KpoAAWMtaDkyhzSwmvZrBFCrz2PfsL7zagZVZCtI5YGuZuJomqwRT0xX6oRjCYMwF"
+    "Ztp/eyqAavfDOiwN05HIX0mXlsFSaoOl1IylVMHSi0bEMPG+1gB6FhDckN9gCbByJWAtIr"
+    "gpZDNFUJmjkgtqVSKqVHNtomg1R7baYbwA07Pb22u4ySSK/hrThqv7ErgP784uiU6gmJNO"
+    "XoxZoyFHGn0l5kPIM29zic5VgGrKsFIJtvtwd73UzFXVNlNXVZvnLlwrQmqHGB5/hOIqrB"
+    "fkSuxNcD20RckSvM5c9E36z/YtBdEif0k/Mo1Vl0xpU3WVlrCTJ3Nu/fHzfAYsQP3+6t3l"
+    "h/vTd+8LM/zi9P4SrlAFNXkutR5ppQHKbnLw36v73w7g48GftzeXFNcgih9D+o15v/s/D+"
+    "E3oVkcjPzg2wg5zAKftqZwFYZ7NnWWHO6iZN+GW9NcBQbaEn7i4aY/HrxU9wvjY0GDhewv"
+    "31DojApX8mkR4TgmEEU1K9hc8u3vd3iMKODV4Wfc+Q/Jnbb+uou6TGwCQVVYV4xr7cpbWS"
+    "gDKWjCsnppIk3KLchHj/RZ4Lvhm2qwamBGGCgXEyQjdvi4iRLLAmvf1XAr0oTt/iKB8jEz"
+    "4r7g58PP+8un5Kj0hU8BwDnspHn37j18dn6ZqoR744J+ReNZjYV/j783TMxMoF+gqoJsr2"
+    "zT31/+cV9YAlPojt6d/nFcWAavb29+TbszUJ9f354Npuhgig6m6P6aooXRBjuFa2FnJF5e"
+    "3ftsX65jqa9Y9UVkq7C+DULsPfq/42eK7hX5Rci38WLjfR+sdtIcom+ZVclOI/LQ5FFxwi"
+    "6dn344P724PPzR7B9t0v6/Cb7i8fsw+B+mpnrFAShcX+gB+NBzNE26tnYBVFtwwTAAXWUa"
+    "ugmRFFyx6UuOQDuhnyeSmjZ2bu3HXszH52cC3RunhYlkCDq0mMZy1H47bn8RuV+x+9nfy2"
+    "H9l8Q6Z58LKMs2vMZu22DUth0BAkvINZszge5JfkZD6rZu1avSzpzYKH4eczmxmUD3yIom"
+    "mcCKq9owmW2qLPrqyRJbK55FPDM4l9hihNUJkRsfvqQtdMmCgKCwXG7F+sOtA00w0AQDTb"
+    "CnNAF50Bj7Mc8SxYj0avlXRUOFzDTL7OciBVl9BMZZHdqNPldRaHu8jFCLtqVCGq+qk1dI"
+    "xw5FHonbjL8wHhgKibs7WgrUWtmlsF3nXGY9shzpbtC1n9A0pjxOjVX17w+3Nw2qoShWgv"
+    "TBJ8/60fHs+NXB2IvizxsztP7pznwbkD2wZt449vzoDXzhv2ptLx1hAdLbDOnqgloFDdns"
+    "3FoEcFqsRcoKo6Te4QZlLTKL8CiFOXqOYjzhzIKrv8EW0+EaKTI2H05xdTflKPMBAh/PtR"
+    "Ll06c8uQmOEXBFPO8KK9OnFwW+tv5FUUVFTtW/JkNs03UFA54w8Q1JDxeWY9Jq9vblqQ+K"
+    "nHmPOxIXYZyWpYtKTEmSZV0SZM1QFV1XDSFbL6qXFi0cZ1e/wstQGIyG+EmbrKhgFo89Hx"
+    "NblTz3aqlRt8mtbsinLoMsuV+/YmpUzeK8IkLnyV32ER2IxawDn+Q+265ckBQoubFVzAJ0"
+    "dPNwfZ3YJVDWICNAEv5Xbeiep+gf9zgHj30pa0JwpXe2OQJX0ROtAnCmpIPlYEmZLSFYJh"
+    "tLO3h9AAuZKKYcHDEzYMHTDaUuNrfK/T75sJCCuaPJArmuYMGkYymlf3WMdFhKRRhpWdeP"
+    "vsKChI/JLSXRlA4Ss+horguY5rlLTH7RUYTp2n7cLkj48XAe00wXOxQSNz/9EEQexfLzHm"
+    "URKli2uLLeNhxVhPmcgMFTdsUK9SD1jXkV8oBMMpOTKXwyn7Mn8+nZD5Z7lyO6BfUzRHQ3"
+    "tDAXUM4iuifkg6IasAQbYj+Jx0x3t1fPrEjXpKMi2OlyqMkmLJDYcIEhUJw0xxb8UOG1hS"
+    "Ls8Lif62bNvGiEv08ReUKHvzSRlexZcSIxRlXq3AsJ1A9XbJRyTQ7/GumYIWI5RCyHiOWe"
+    "RiwLbknb5azgynQe6JFkrWhOgFKF3r9QItWsXOxoPSv6g22xLjqRvcok5yWcNpxJPs3TjV"
+    "dMJi9nL+86o1dOKi9Oqvq88qqSWAOwfDzyTmiJ1pizSpM3lZ/lY72xQ+60TT5/p8ehjuvf"
+    "FtW/3gTSXC80kaUAJfCb2KVsHAS1kI7WguImiewU0BoSm8G6mcBmIzit6seZCHiZX5YU+I"
+    "gB64V8Nfc9gKNWLaA2VAGVwvCapdFQsKGzeVd03CBdWADW2nBtnWXqiSYpTQpJFpqmxnKU"
+    "dZrX4M8mFhEYuOoN7h84q8Pw4eHqosHVmtXCCM1vQGqbW67B96W6JwmiK9iAUm1TBCdLwD"
+    "DnXVFNr66F36Asnpz4TaxHRB9+f7jogpboHxfdQb7rcpk5tRk4C9SuQTlSN72q6ZK9pom7"
+    "mb0Hipq6vTKuCvbBxcwj8YVkNRf0iSq7ejJEYvcU9ZCEvE40d77uqMjii4j2PLGDyRR8Pe"
+    "cEeaP8Fw3VSAO3P3D7A7e/OW6/5C5yLFE1kp3z/NshQAbSfyD9B9K/rAN2mvrvljktD0ON"
+    "ai2MxYfL+wPITu5qZ588Ubuejs2zuBcSskzSeBtKNs+4fmEPn/qO5QTg+mTuo/wV+OUm8P"
+    "ExZOQYdnG/AAWLcpowXtyqnZNAJdc+HsaY2P5kmtOGgT/dXK4v7+kKaz13ZaU8SGZCw8kr"
+    "yx+zsBGGz0KRZ4883w14qvGKUjtSj6dTZ5EyfYqLRXDkNbeflXeg6h/DYOY7fKPCSu3GqB"
+    "iCbYN/p1EuVlFpcMHq56hMyYIX+Gjsxc88w1IS241x0QQwpJI6VV2C5VN115CxvZFxQZZH"
+    "wPUwV/F9QWhX3hUXYsKSaUEQ2hCSln6OiR/EdePRHDfKBHqwlZcOJfXYgWiECTE5zcbGsC"
+    "n1wO8O/O7A724zd7sjbnH36rPXvl0S49ZzbJRUlOoee10j9rSGTSHlUjRdd49gbbNVeuwC"
+    "DI2rqq9oSbWT1o2l+WYSuWxqmnL8czPB+7NdwaqUcTrB1zAGGdN4z9xzf9+NtiNSUiHczD"
+    "FzhOY8zzkaoWgUBbPQxmva4YPtulUjgQ4W7/GarfLGC2Al+93tOFjs9nhrg2wrcYkMsUXx"
+    "CRbWFnGKUTbAywQskgBTspda6+BFvVAlkCHTWmEFdj1JYhWqDITYvCW7xytWJRW/CCzl7K"
+    "Bp5kvZ7SRkmrKkunRlwQg2V7EUs8yD1h6RlqiOUQ5lopnmm0IWmj9XwiV1wkncpEl8iJ9s"
+    "JH6Szn/u/VIqgj04Zb12kh/R7F5K3FgItpnQBYu+TdYJZZbt5Eoy84/7ccw1+a7k5u1nNy"
+    "uyvcQR9aVxyFXLkfhaFDpy2/Zk65TC0tHzwzCALYJ8Bx68WZl+gZ1RTzSHxO0n5F40sjzH"
+    "C5P9oNCYf/OUinjf9rOtN4KGTVMG4n0g3gfifePEe4PP09ZEq5fuPs13OQJlQ0cRLAlug3"
+    "T34K5CuGyYOS9PyHXSt7tNApbp14ZXtwUzXpqWuwzxJqjDCs9d/xr36QjUaoRiESHJhjHa"
+    "EJIp0b9CBjUELLizqctCQEgWivqZLSxMAzjF+enslF9k75dTL69KnKaLLbqrhVs0J3mzrQ"
+    "c6cEinrup/Zhb3MJ16Txiogq7oOQNlE0geg/CZZz6zMr0CW5UELVGtR6nWALV5QpSHCBv4"
+    "zj+osk0+aI6Me8Vn/+zFBEd0Wyio8XNhtUyibkkmtSpJeRyObpxj2BDu4xi9oQhhKEIYih"
+    "CGIoShCKHtmAwk/UDSDyT9HpH0S52Tt/NHnPUjVXWj2X/vw2Ayje+wHYROHc9WuL6QYpvS"
+    "nqOQdm3NrmmyI6Sp14YFzlUh3a7mfNsXhYrEXJvNBZijM5n1h+bLlTZuZa7uEUuWo8d5Qu"
+    "fmtm2NeONTWzj+tDWeS594uvO7I72sfluDmFdp5LvgJvvImILQ6XkTyXHUo0Th8bCNFcEe"
+    "7IObHVRdVav9pB3pi86PfUmsB8hnSmJXkKeLPg/bmwl0TvUWzmnXDOX0alEArw2JK7aKYo"
+    "gLohhiNYqBfWcaeHWb3jaDzMr0YNcdy6V1+/RsWAD6/RXdbNjN98vnjhepapt4kao2x4vg"
+    "WrXQFECZhXVFdeMALSg1ZeRKgLsguG0vBUtmWlyiyraUbDq8sga5uH04u748eH93eX714W"
+    "rOEWVeKL1YTNW8uzy93mkaqLVlMrBAGQvEwQts0ou9D75g/yEiF5s92Uqfhd5sDL1HM+jO"
+    "59LSrykuOKZIA7kv+bWtJAfndnBuB+d2cG43CS7QeFT/RXz4FuV6kHZd8qrmCra9ebRubO"
+    "cHFtCqTl58a2V7kH2tQrahJokCe9RL50jHQYzG/CCXxXowhwXZ6hzNLTv+awVw8PwHz39w"
+    "SgentMM6htPpFJN/oehkUSUD061lLQPKJJY6opMs3bB3gC4jjn3i+W4AVQ4F99Wy6UEAEi"
+    "reibRAFNdAVmq2qbKN6qofkna2j2bR0DxZHV+BopfF0o9hb+dIUnpmoqpTP0an27fQ10bB"
+    "QvLXyo6noy+SmnD0qiU0btaSHveWne+5aHOWYfOVLTnaE+xTg5n3ILmKXMdnydXP9o58mC"
+    "G172dK7SsqNs7DL3tTf81s/pivOh29P8uVX/ev7rp+8e9F3XXjafTL1AJPuyi2XmHCtq0E"
+    "Lr6kL1da70WJ9SqTlgPY3tZWn+LQs5/q3JD5lYWeB8r7vORqpANQRfXnqT9uxmDLdvBXHE"
+    "a1hbHN3BIj0jG11B7FzXNH8GpwgDjvvpsAboTmbDzXvrlUq/lc+60Vaq0G6zaKrzqlvH78"
+    "HxNPAuo="
+)
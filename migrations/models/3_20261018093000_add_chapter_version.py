@@ -0,0 +1,97 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "chapters" ADD "version" INT NOT NULL DEFAULT 1 /* 正文版本号（正文每次变更自增） */;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "chapters" DROP COLUMN "version";"""
+
+
+MODELS_STATE = (
+    "eNrtXftv2zgS/leC/JQAbaP343B7QF7dzW2aFGlyt9i2MCiJSnS1Ja8ktw0W/d+PQ1kS9X"
+    "JEvyS7+iWIKY5sfaSGM9/MkH8fTgIHj6M3DxEOD/9x8PehjyaY/FNof3VwiKbTvBUaYmSN"
+    "accZ6UFbkBXFIbJj0uiicYRJk4MjO/SmsRf40PXTTFcl49NMk2T908wwNAPknMAmgp7/WO"
+    "2iIUn8NFN1w4KOM9/7a4ZHcfCI4yf6cz9+Js2e7+DvOEo/Tr+MXA+PncLTeA7cgLaP4ucp"
+    "bbvy47e0I/wGa2QH49nEzztPn+OnwM96e34MrY/YxyGKMdw+DmfwkP5sPJ6DkT538kvzLs"
+    "lPZGQc7KLZGKAC6cVIXV2UUZrL2IEPiJNfFtGHfYRvfC2Jiq4YsqYYpAv9VVmL/iN51ByH"
+    "RJCicXN/+INeRzFKelBIcwxhoOn/FSTPn1BYDyUrUwKU/PQyoCl8m0aUTClFcFqiOkHfR2"
+    "PsP8ZP5KMqLIDwP6d357+d3h2pwjHcOyAvQ/KK3MyvSPQSoJyj+oSiJ+yMpiiKvgWhwwNu"
+    "jeh6ME4bcpDzF/ollFUJCeSvZWsUZUxw1wwlbdENQVwGd1EyWgBPejUiT68VoccT5I15AM"
+    "8Eup7KpoAAWMtaDkyhzSwmvZrBFCrz2PfsL7zagZVZCtI5YGuZuJomqwRT0xX6oRjCYMwF"
+    "Ztp/eyqAavfDOiwN05HIX0mXlsFSaoOl1IylVMHSi0bEMPG+1gB6FhDckN9gCbByJWAtIr"
+    "gpZDNFUJmjkgtqVSKqVHNtomg1R7baYbwA07Pb22u4ySSK/hrThqv7ErgP784uiU6gmJNO"
+    "XoxZoyFHGn0l5kPIM29zic5VgGrKsFIJtvtwd73UzFXVNlNXVZvnLlwrQmqHGB5/hOIqrB"
+    "fkSuxNcD20RckSvM5c9E36z/YtBdEif0k/Mo1Vl0xpU3WVlrCTJ3Nu/fHzfAYsQP3+6t3l"
+    "h/vTd+8LM/zi9P4SrlAFNXkutR5ppQHKbnLw36v73w7g48GftzeXFNcgih9D+o15v/s/D+"
+    "E3oVkcjPzg2wg5zAKftqZwFYZ7NnWWHO6iZN+GW9NcBQbaEn7i4aY/HrxU9wvjY0GDhewv"
+    "31DojApX8mkR4TgmEEU1K9hc8u3vd3iMKODV4Wfc+Q/Jnbb+uou6TGwCQVVYV4xr7cpbWS"
+    "gDKWjCsnppIk3KLchHj/RZ4Lvhm2qwamBGGCgXEyQjdvi4iRLLAmvf1XAr0oTt/iKB8jEz"
+    "4r7g58PP+8un5Kj0hU8BwDnspHn37j18dn6ZqoR744J+ReNZjYV/j783TMxMoF+gqoJsr2"
+    "zT31/+cV9YAlPojt6d/nFcWAavb29+TbszUJ9f354Npuhgig6m6P6aooXRBjuFa2FnJF5e"
+    "3ftsX65jqa9Y9UVkq7C+DULsPfq/42eK7hX5Rci38WLjfR+sdtIcom+ZVclOI/LQ5FFxwi"
+    "6dn344P724PPzR7B9t0v6/Cb7i8fsw+B+mpnrFAShcX+gB+NBzNE26tnYBVFtwwTAAXWUa"
+    "ugmRFFyx6UuOQDuhnyeSmjZ2bu3HXszH52cC3RunhYlkCDq0mMZy1H47bn8RuV+x+9nfy2"
+    "H9l8Q6Z58LKMs2vMZu22DUth0BAkvINZszge5JfkZD6rZu1avSzpzYKH4eczmxmUD3yIom"
+    "mcCKq9owmW2qLPrqyRJbK55FPDM4l9hihNUJkRsfvqQtdMmCgKCwXG7F+sOtA00w0AQDTb"
+    "CnNAF50Bj7Mc8SxYj0avlXRUOFzDTL7OciBVl9BMZZHdqNPldRaHu8jFCLtqVCGq+qk1dI"
+    "xw5FHonbjL8wHhgKibs7WgrUWtmlsF3nXGY9shzpbtC1n9A0pjxOjVX17w+3Nw2qoShWgv"
+    "TBJ8/60fHs+NXB2IvizxsztP7pznwbkD2wZt449vzoDXzhv2ptLx1hAdLbDOnqgloFDdns"
+    "3FoEcFqsRcoKo6Te4QZlLTKL8CiFOXqOYjzhzIKrv8EW0+EaKTI2H05xdTflKPMBAh/PtR"
+    "Ll06c8uQmOEXBFPO8KK9OnFwW+tv5FUUVFTtW/JkNs03UFA54w8Q1JDxeWY9Jq9vblqQ+K"
+    "nHmPOxIXYZyWpYtKTEmSZV0SZM1QFV1XDSFbL6qXFi0cZ1e/wstQGIyG+EmbrKhgFo89Hx"
+    "NblTz3aqlRt8mtbsinLoMsuV+/YmpUzeK8IkLnyV32ER2IxawDn+Q+265ckBQoubFVzAJ0"
+    "dPNwfZ3YJVDWICNAEv5Xbeiep+gf9zgHj30pa0JwpXe2OQJX0ROtAnCmpIPlYEmZLSFYJh"
+    "tLO3h9AAuZKKYcHDEzYMHTDaUuNrfK/T75sJCCuaPJArmuYMGkYymlf3WMdFhKRRhpWdeP"
+    "vsKChI/JLSXRlA4Ss+horguY5rlLTH7RUYTp2n7cLkj48XAe00wXOxQSNz/9EEQexfLzHm"
+    "URKli2uLLeNhxVhPmcgMFTdsUK9SD1jXkV8oBMMpOTKXwyn7Mn8+nZD5Z7lyO6BfUzRHQ3"
+    "tDAXUM4iuifkg6IasAQbYj+Jx0x3t1fPrEjXpKMi2OlyqMkmLJDYcIEhUJw0xxb8UOG1hS"
+    "Ls8Lif62bNvGiEv08ReUKHvzSRlexZcSIxRlXq3AsJ1A9XbJRyTQ7/GumYIWI5RCyHiOWe"
+    "RiwLbknb5azgynQe6JFkrWhOgFKF3r9QItWsXOxoPSv6g22xLjqRvcok5yWcNpxJPs3TjV"
+    "dMJi9nL+86o1dOKi9Oqvq88qqSWAOwfDzyTmiJ1pizSpM3lZ/lY72xQ+60TT5/p8ehjuvf"
+    "FtW/3gTSXC80kaUAJfCb2KVsHAS1kI7WguImiewU0BoSm8G6mcBmIzit6seZCHiZX5YU+I"
+    "gB64V8Nfc9gKNWLaA2VAGVwvCapdFQsKGzeVd03CBdWADW2nBtnWXqiSYpTQpJFpqmxnKU"
+    "dZrX4M8mFhEYuOoN7h84q8Pw4eHqosHVmtXCCM1vQGqbW67B96W6JwmiK9iAUm1TBCdLwD"
+    "DnXVFNr66F36Asnpz4TaxHRB9+f7jogpboHxfdQb7rcpk5tRk4C9SuQTlSN72q6ZK9pom7"
+    "mb0Hipq6vTKuCvbBxcwj8YVkNRf0iSq7ejJEYvcU9ZCEvE40vxIbji+wwkhsD0fxJV2iS4"
+    "qR6ox8uhb7aBaEvDSLWo6yY6T8pCFiSFEwTNzlvN75CrBiPEVEtOeJHUym4HU7J8gb5b9o"
+    "qAsboixDlGWIsmwuylJy3DlWuBrJziMu26GihvDLEH4Zwi9lHbDTQZhuOezyMNSo1sJYfL"
+    "i8P4A88a72WMpT5uuJ8TyffiE1zqTvtyHH89z3F3ZTqu9YTsWuT6s/yl+BX24CHx9DbpRh"
+    "F3duULAop6n7xU3zOalscu3jYYyJ7U+mOW0YmOzNZV3znnOx1hNwVspIZSY0nIGz/IEXG+"
+    "FaLRR59sjz3YCnLrIotSOVkTp1Fil/orhYBEdec/tZAwmq/jEMZr7DNyqs1G6MiiHYNvh3"
+    "GmXFFZWGeax+jsqULHiBj8Ze/MwzLCWx3RgXTQBDKqkY1iVYPlV3DbnzGxkXZHkEXA9zbY"
+    "NQENqVd8WF6LxkWpAOYAhJSz/HxA/iuvFojuBlAj3YVE2HzQ2wA3EhE6Kjmo2NYXvwgd8d"
+    "+N2B391mFn1H3OLuVcqvfeMqxq3n2LKqKNU99rpG7GkNm0LKpWi67h7B2mar9AAMGBpXVV"
+    "/R4nYnreBLM/8kctnUNOX452aC92fjiFUp43SCr2EMMqbxnrnn/r4bbUekpEK4mWPmMNN5"
+    "xnk0QtEoCmahjde01wrbdatGAh0s3oNOW2XwF8BKdh7ccbDYjQrXBtlW4hIZYoviEyysLe"
+    "IUo2yAlwlYJAGmZFe71sGLeqFKIEOmVdsK7D+TxCpUGQixeUt2j1esSip+EVjK2ZHfzJey"
+    "G3vINGVJdenKghFsc2MpZpkHrT2sLlEdoxzKRDPNt+csNH+uhEvqhJO4SZP4ED/ZSPwknf"
+    "/cO9dUBHtw3n3tJD+iedaUuLEQbPihCxZ9m6wTyizbyZVk5h/348Bx8l3JzdvPblZke4kj"
+    "6kvjkKuWI/G1KHTktu3JJjaFpaPnx5IAWwT5Djx4szL9AjujnmgOidtPyL1oZHmOFyY7c6"
+    "Ex/zY2FfG+7SxcbwQN29cMxPtAvA/E+8aJ9wafp62JVi/dfZrvcgTKhg6FWBLcBunuwV2F"
+    "cNkwc16ekOukb3ebBCzTrw2vbgtmvDQtdxniTVCHFZ67/jXu02G01QjFIkKSDWO0ISRTon"
+    "+FDGoIWHBnU5eFgJAsbK/AbCZiGsApGpaFU36RvV9OvbwqcZoutuj+Im7RnOTNth7owCGd"
+    "uqr/mVncw3TqPWGgCrqi5wyUTSB5DMJnnvnMyvQKbFUStES1HqVaA9TmCVEeImylPP+gyj"
+    "b5oDky7hWf/bMXExzRDbqgxs+F1TKJuiWZ1Kok5XE4uoWRYUO4j2P0hiKEoQhhKEIYihCG"
+    "IoS2YzKQ9ANJP5D0e0TSL3Vi4c4fNtePVNWNZv+9D4PJNL7DdhA6dTxb4fpCim1Ke45C2r"
+    "U1u6bJjpCmXhsWOFeFdLuak4ZfFCoSc202F2AOMWXWH5ovV9pCl7m6RyxZjh7nWamb20A3"
+    "4o1PbeEg2tZ4Ln327M7vjvSy+m0NYl6lke9HnOwjYwpCpyd/JAeDjxKFx8M2VgR7sCNxdm"
+    "R4Va32k3akLzo/9iWxHiCfKYldQZ4u+jxsbybQOdWruEDyJpBDRO30alEArw2JK7aKYogL"
+    "ohhiNYqBfWcaeHXbDzeDzMr0YNcdy6V1+/SUXgD6/RXd9tnNTy7gjhepapt4kao2x4vgWr"
+    "XQFECZhXVFdeMALSg1ZeRKgLsguG0vBUtmWlyiyraUbP+8sga5uH04u748eH93eX714WrO"
+    "EWVeKL1YTNW8uzy93mkaqLVlMrBAGQvEwQts0ou9D75g/yEiF5s92Uqfhd5sDL1HM+jO59"
+    "LSrykuOKZIA7kv+bWtJAfndnBuB+d2cG43CS7QeFT/RXz4FuV6kHZd8qrmCra9ebRubOcH"
+    "FtCqTl58a2V7kH2tQrahJokCe+hO50jHQYzG/CCXxXowhwXZ6hzNLTv+awVw8PwHz39wSg"
+    "entMM6htPpFJN/oehkUSUD061lLQPKJJY6LJUs3bB3gC4jjn3i+W4AVQ4F95Wek6VgCRXv"
+    "RFogimsgKzXbVNlGddUPSTvbJzl1C1bHV6DoZbH0Y9jbOZKUnl6p6tSP0en2LfS1UbCQ/L"
+    "WyY73oi6QmHL1qCY2btaQH72UnrS7anGXYfGVLjvYE+9Rg5j3SryLX8al+9bO9Ix9mSO37"
+    "mVL7ioqN8xjS3tRfM5s/5qtOR+/PcuXX/au7rl/8e1F3befHzK9eCzztoth6hQnbthK4+J"
+    "K+XGm9FyXWq0xaDmB7W1t9ikPPfqpzQ+ZXFnoeKO/zkquRDkAV1Z+n/rgZgy3bwY0nMTdz"
+    "S81HMW+bWmqP4ua5I3g1OECcd99NADdCc5JvjHGdL9ZcqsWIdFWotRqs2yi+6pTy+vF/s5"
+    "h9GQ=="
+)
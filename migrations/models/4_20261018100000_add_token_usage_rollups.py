@@ -0,0 +1,124 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "token_usage_rollups" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL /* 汇总ID */,
+    "granularity" VARCHAR(8) NOT NULL /* 汇总粒度: hour/day */,
+    "bucket" VARCHAR(16) NOT NULL /* 时间桶（UTC）: YYYY-MM-DD HH / YYYY-MM-DD */,
+    "user_id" INT NOT NULL /* 用户ID */,
+    "project_id" INT NOT NULL DEFAULT 0 /* 项目ID（0表示无项目） */,
+    "model" VARCHAR(100) NOT NULL /* 使用的AI模型 */,
+    "endpoint" VARCHAR(255) NOT NULL /* 请求的API端点 */,
+    "request_count" INT NOT NULL DEFAULT 0 /* 请求次数 */,
+    "prompt_tokens" INT NOT NULL DEFAULT 0 /* 提示词Token数 */,
+    "completion_tokens" INT NOT NULL DEFAULT 0 /* 生成内容Token数 */,
+    "total_tokens" INT NOT NULL DEFAULT 0 /* 总Token数 */,
+    "updated_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP /* 更新时间 */,
+    CONSTRAINT "uid_token_usage_granula_1bb83e" UNIQUE ("granularity", "bucket", "user_id", "project_id", "model", "endpoint")
+) /* Token使用量汇总表 */;
+        CREATE INDEX IF NOT EXISTS "idx_token_usage_user_id_eb7e82" ON "token_usage_rollups" ("user_id", "granularity", "bucket");
+        CREATE INDEX IF NOT EXISTS "idx_token_usage_project_d74004" ON "token_usage_rollups" ("project_id", "granularity", "bucket");
+        INSERT INTO "token_usage_rollups" ("granularity", "bucket", "user_id", "project_id", "model", "endpoint", "request_count", "prompt_tokens", "completion_tokens", "total_tokens", "updated_at")
+            SELECT 'hour', strftime('%Y-%m-%d %H', "created_at"), "user_id", COALESCE("project_id", 0), "model", "endpoint", COUNT(*), SUM("prompt_tokens"), SUM("completion_tokens"), SUM("total_tokens"), CURRENT_TIMESTAMP
+            FROM "token_usage_records" GROUP BY 2, 3, 4, 5, 6;
+        INSERT INTO "token_usage_rollups" ("granularity", "bucket", "user_id", "project_id", "model", "endpoint", "request_count", "prompt_tokens", "completion_tokens", "total_tokens", "updated_at")
+            SELECT 'day', strftime('%Y-%m-%d', "created_at"), "user_id", COALESCE("project_id", 0), "model", "endpoint", COUNT(*), SUM("prompt_tokens"), SUM("completion_tokens"), SUM("total_tokens"), CURRENT_TIMESTAMP
+            FROM "token_usage_records" GROUP BY 2, 3, 4, 5, 6;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "token_usage_rollups";"""
+
+
+MODELS_STATE = (
+    "eNrtXW1v2zgS/itGPiVAu9H7y+L2gDTJbnObJkWb3O1tWxiURCW62pJXktsGi/7341CWRL"
+    "05ot8ku+qHoKY4svWQGs48Mxz+fTQNHDyJfrqPcHj08+jvIx9NMflPof3F6AjNZnkrNMTI"
+    "mtCOc9KDtiArikNkx6TRRZMIkyYHR3bozWIv8KHrx7muSsbHuSbJ+se5YWgGyDmBTQQ9/6"
+    "HaRUOS+HGu6oYFHee+99ccj+PgAceP9Od++ESaPd/B33CUfpx9HrsenjiFp/EcuAFtH8dP"
+    "M9p25ce/0o7wG6yxHUzmUz/vPHuKHwM/6+35MbQ+YB+HKMZw+zicw0P688lkAUb63Mkvzb"
+    "skP5GRcbCL5hOACqSXI3V1UUZpIWMHPiBOfllEH/YBvvGlJCq6YsiaYpAu9FdlLfr35FFz"
+    "HBJBisbN3dF3eh3FKOlBIc0xhIGm/68gef6IwnooWZkSoOSnlwFN4ds2omRKKYLTEtUp+j"
+    "aeYP8hfiQfVWEJhP8+e3f++uzdsSqcwL0D8jIkr8jN4opELwHKOaqPKHrEzniGouhrEDo8"
+    "4NaIbgbjtCEHOX+hn0NZlZBA/lq2RlHGBHfNUNIW3RDEVXAXJaMF8KRXI/L0WhF6PEXehA"
+    "fwTKDrqWwKCIC1rNXAFNrMYtKrGUyhMo99z/7Mqx1YmZUgXQC2kYmrabJKMDVdoR+KIQwm"
+    "XGCm/XenAqh2P6rD0jAdifyVdGkVLKU2WErNWEoVLL1oTAwT70sNoK8CghvyGywBVq4ErE"
+    "UEt4Vspggqc1RyQa1KRJVqrk0UrebIVjuMl2D66vb2Gm4yjaK/JrTh6q4E7v2bV5dEJ1DM"
+    "SScvxqzRkCONvhDzIeSZt7lE5ypANWVYqQTbvX93vdLMVdU2U1dVm+cuXCtCaocYHn+M4i"
+    "qsF+RK7E1xPbRFyRK8zkL0p/Q/u7cURIv8Jf3INFZdMqVN1VVawk6ezLn1J0+LGbAE9bur"
+    "N5fv787evC3M8Iuzu0u4QhXU9KnUeqyVBii7yeg/V3evR/Bx9OftzSXFNYjih5B+Y97v7s"
+    "8j+E1oHgdjP/g6Rg6zwKetKVyF4Z7PnBWHuyjZt+HWNFeBgbaEH3i46Y8HL9X9zPhY0GAh"
+    "+/NXFDrjwpV8WkQ4jglEUc0KtpD89fd3eIIo4NXhZ9z598mddv66i7pMbAJBVVhXjGvtyl"
+    "tZKAMpaMKyemkqTcstyEcP9Fngu+GbarBqYEYYKJcTJGN2+LiJEssCa9/VcCvShO3+LIHy"
+    "ITPiPuOno0+Hy6fkqPSFTwHAOeykRffuPXx2fpmqhHvjgn5Bk3mNhX+HvzVMzEygX6Cqgm"
+    "yvbdPfXf5xV1gCU+iO35z9cVJYBq9vb35LuzNQn1/fvhpM0cEUHUzRwzVFC6MNdgrXws5I"
+    "PL+699m+3MRSX7Hqi8hWYf01CLH34P+Onyi6V+QXId/Gy433Q7DaSXOIvmZWJTuNyEOTR8"
+    "UJu3R+9v787OLy6Huzf7RN+/8m+IInb8Pgf5ia6hUHoHB9qQfgQ8/xLOna2gVQbcEFwwB0"
+    "lWnoJkRScMWmLzkC7YR+nEhq2ti5tR97MR+fnwl0b5wWJpIh6NBiGqtR++24/WXkfsXuZ3"
+    "8vh/VfEuucfS6gLNvwGrttg1G7dgQILCHXbM4Euif5GQ2p27pVr0o7c2Kj+GnC5cRmAt0j"
+    "K5pkAiuuasNktqmy6KsnS2yteB7xzOBcYocRVidEbnz0nLbQJQsCgsJquRWbD7cONMFAEw"
+    "w0wYHSBORBY+zHPEsUI9Kr5V8VDRUy0yyzn4sUZPURGOd1aDf6XEWh3fEyQi3algppvKpO"
+    "XiEdOxR5JO4y/sJ4YCgk7u54JVBrZVfCdpNzmfXIcqS7Qdd+RLOY8jg1VtW/3t/eNKiGol"
+    "gJ0nufPOsHx7PjF6OJF8WftmZo/cOd+zYgO7Lm3iT2/Ogn+MJ/1tpeOsICpLcZ0tUFtQoa"
+    "stm5tQjgtFyLlBVGSb3DDcpaZB7hcQpz9BTFeMqZBVd/gx2mwzVSZGw+nOLqbspR5gMEPp"
+    "5rJcqnT3lyUxwj4Ip43hVWpk8vCnxt/Yuiioqcqn9Nhtim6woGPGHiG5IeLizHpNXs7ctT"
+    "HxR55T3sSVyEcVpW3lRiSpIs65Iga4aq6LpqCNl6Ub20bOF4dfUbvAyFwWiIn7TJigrm8c"
+    "TzMbFVyXOvlxp1m9zqhnzqMsiS+/VrpkbVLM5rInSe3OUQ0YFYzCbwSe6z650LkgJbbmwV"
+    "swAd39xfXyd2CWxrkBEgCf9Xbeiep+if9DgHj30pa0JwpXe2OQJX0ROtAnCmpIPlYEmZLS"
+    "FYJhtLG70cwUImiikHR8wMWPB0Q6mLza1zv48+LKRg7miyQK4rWDDpWErpXx0jHZZSEUZa"
+    "1vXjL7Ag4RNyS0k0pVFiFh0vdAHTvHCJyS86jjBd20/aBQk/HC1imulih0Li5qcfgsijWH"
+    "46oCxCBcsWV9bblqOKMJ8TMHi2XbFCPUh9Y16FPCCTzORkCp8u5uzpYnr2g+Xe54huQf0M"
+    "Ed0tLcwFlLOI7in5oKgGLMGG2E/iMdPd7dUzK9I16agIdrocarIJCyQ2XGAIFCfNsQU/VH"
+    "hpoQg7PO7nplkzLxrjbzNEntDh35rISvZscyIxRlXq3AsJ1PdXbJRyQw7/BumYIWI5RCyH"
+    "iOWBRiwLbknb5azgynQe6JFkrWhOgFKF3r9QItWsXOxoPSv6g22xLjqRvcok5yWctpxJPs"
+    "vTjddMJi9nL+87o1dOKi9Oqvq88qqS2ACwfDzyXmiJ1pizSpM3lZ/lY72JQ+60Sz5/r8eh"
+    "juvfFdW/2QTSXC80kaUAJfCb2KVsHAS1kI42guI2iewU0BoSm8G6mcBmIzit9o8zEfAyvy"
+    "wp8BED1kv5au57AEetWkBtqAIqheE1S6OhYENn867ouEG6sACsteHaOsvUE01SmhSSLDRN"
+    "jdUo6zSvwZ9PLSIwcNVbrB84r8Pw/v7qosHVmtfCCM0/gdQuS67B96W6JwmiK9iArdqmCE"
+    "6WgGHOu6KaXt0Iv0FZPDnxm1iPiD784XDRBS3RPy66g3zX1TJzajNwlqhdg3KkbnpV0yV7"
+    "QxN3O7UHipq6vTKuCvbBxcwj8YVkNRf0iSq7ejJEYvcU9ZCEvEk0vxAbji+wwkjsDkfxOV"
+    "2iS4qR6ox8uhb7aBaEvDSLWo6yY6T8pCFiSFEwTNzlvN77HWDFeIqIaM9TO5jOwOt2TpE3"
+    "zn/RsC9siLIMUZYhyrK9KEvJcedY4WokO4+47IaKGsIvQ/hlCL+UdcBeB2G65bDLw1CjWg"
+    "tj8f7ybgR54l3VWMpT5uuJ8Tyffik1zqTvtyHH89z3Z6op1Xcsp2LXp9Uf56/ALzeBj08g"
+    "N8qwi5UbFCzKaep+sWg+J5VNrn04ijGx/ck0pw0Dk729rGvecy42egLOWhmpzISGM3BWP/"
+    "BiK1yrhSLPHnu+G/DsiyxK7cnOSJ06i5Q/UVwsgiOvuf3cAwmq/iEM5r7DNyqs1H6MiiHY"
+    "Nvh3GmXFFZWGeax+jsqMLHiBjyZe/MQzLCWx/RgXTQBDKtkxrEuwfKruBnLntzIuyPIIuB"
+    "7mKoNQENqXd8WF6LxkWpAOYAhJSz/HxA/iuvFojuBlAj0oqqZDcQPsQFzIhOioZmNjKA8+"
+    "8LsDvzvwu7vMou+IW9y/nfIbL1zFuPUcJauKUt1jr2vEntawKaRciqbr7jGsbbZKD8CAoX"
+    "FV9QXd3O6kO/jSzD+JXDY1TTn5sZngwykcsS5lnE7wDYxBxjTeMfc83Hej7YiUVAg3c8wc"
+    "ZrrIOI/GKBpHwTy08YZqrbBdd2ok0MHiPei0VQZ/Aayk8uCeg8UWKtwYZDuJS2SILYtPsL"
+    "C2iFOMswFeJWCRBJiSqnatgxf1QpVAhkx3bStQfyaJVagyEGKLluweL1iVVPwisJSzI7+Z"
+    "L2ULe8g0ZUl16cqCEZS5sRSzzIPWHlaXqI5xDmWimRblOQvNnyrhkjrhJG7SJD7ET7YSP0"
+    "nnP3flmopgD867r53kxzTPmhI3FoKCH7pg0bfJOqXMsp1cSWb+ST8OHCffldy8/exmRXaX"
+    "OKI+Nw65ajkWX4pCR27bgRSxKSwdPT+WBNgiyHfgwZuV6RfYGfVEc0jcfkLuRWPLc7wwqc"
+    "yFJvxlbCrifassXG8EDeVrBuJ9IN4H4n3rxHuDz9PWRKuX7j7NdzUCZUuHQqwIboN09+Cu"
+    "Q7hsmTkvT8hN0rf7TQKW6deGV7cFM16alvsM8TaowwrPXf8a9+kw2mqEYhkhyYYx2hCSKd"
+    "G/RgY1BCy4s6nLQkBIFsorMMVETAM4RcOycMovsvfLqZcXJU7TxRatL+IWzUnebOuBDhzS"
+    "qav6n5nFPUynPhAGqqAres5A2QSShyB84pnPrEyvwFYlQUtU63GqNUBtnhLlIUIp5cUHVb"
+    "bJB82Rca/47B99M8ExLdAFe/xcWC2TqFuSSa1KUh6HoyWMDBvCfRyjN2xCGDYhDJsQhk0I"
+    "wyaEtmMykPQDST+Q9AdE0q90YuHeHzbXj1TVrWb/vQ2D6Sx+h+0gdOp4tsL1pRTbjPYch7"
+    "Rra3ZNkx0hTb02LHCuCul2NScNPytUJObaFBdgDjFl1h+aL1cqoctcPSCWLEeP86zU7RXQ"
+    "jXjjUzs4iLY1niufPbv31ZGeV7+tQcx3aeT1iJM6MqYgdHryR3Iw+DhReDxsY0WwBxWJsy"
+    "PDq2q1n7QjfdH5sS+J9QD5TEnsC/J00edhezOBzqlexQWSN4EcImpnV8sCeG1IXLFVFENc"
+    "EsUQq1EM7DuzwKsrP9wMMivTg6o7lkv37dNTegHot1e07LObn1zAHS9S1TbxIlVtjhfBte"
+    "pGUwBlHtZtqpsEaMlWU0auBLgLgrv2UrBkpptLVNmWkvLPa2uQi9v7V9eXo7fvLs+v3l8t"
+    "OKLMC6UXi6ma7y7PrveaBmptmQwsUMYCcfAC2/Ri74LP2L+PyMVmT7bSZ6k3G0Pv8Ry687"
+    "m09GuKC44p0kDuc35tK8nBuR2c28G5HZzbbYILNB7VfxEfvkW5HqRdl7yqhYJtbx5tGtvF"
+    "gQV0VycvvrWyPci+ViHbUJNEgT10p3Ok4yBGE36Qy2I9mMOCbHWO5o4d/40COHj+g+c/OK"
+    "WDU9rhPoaz2QyT/8Kmk2U7GZhuLfcyoExipcNSydINtQN0GXHUiee7AexyKLiv9JwsBUuo"
+    "eCfSAlFcA1mp2abKNqrb/ZC0s32SU7dgdXwBil4WSz+GvZ0jSenplapO/Ridlm+hr42Che"
+    "SvlR3rRV8kNeHoVUtoLNaSHryXnbS6rDjLUHxlR472FPvUYOY90q8i1/GpfvWzvSMfZkjt"
+    "+5FS+4qKjfMY0t7sv2aKP+arTkfvz2rbr/u377p+8e/Fvms7P2Z+/b3Asy42W68xYdvuBC"
+    "6+pM/vtD6ILdbrTFoOYHu7t5oJggWTyXz2TKAs6dM+UEb7rxso02xFT4gv3kAZK8n4IOl5"
+    "vTIw66otuMkKf5o1mRBBX2y6FlREN7gyJ9vXWvwPxO+aT1C42Ndjze3PSe1SNlZTiDlkpF"
+    "jG23xaFqyr/4KauF1DxwPyK/Jx7UsIr4R5W8auJNaDXd3MG6PbppQkkvw8egzm4amDnlZh"
+    "7YwWnJ3RyNgZlb2t2ZvVFuVcogcAM5XtNAPONwFldH93nqiXn0f/Jf9evnnz8uJi9Pr16J"
+    "T5vBI3rbWhprVmZlo7qUu37FuwepUsyx8tWr05+qEarBaKNfM1FUxU9rDH7uLXQ6xqiFUd"
+    "TKwqxORZo5ibwKzIdaxBWLy7JjD3MMFFGLJbOgB4SG3Z5uztQ17LsG992Le+E9rtDIee/V"
+    "hHti2uLKXYUN7nOVYtnRHVYf5xyv41Y7BjkugLDqPaenTNZjIj0rGV3B7F7ZvB8GpwgLjo"
+    "vp8AbsVjI98Y4zoPorlCEiPSVX2k9WDdRc2jTpeX7/8HAsWiEw=="
+)
@@ -0,0 +1,121 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "prompt_blobs" (
+    "hash" VARCHAR(64) NOT NULL PRIMARY KEY /* 内容SHA-256 */,
+    "codec" VARCHAR(8) NOT NULL /* 压缩编码: raw/zlib/zstd */,
+    "dict_hash" VARCHAR(64) /* 压缩字典的内容哈希 */,
+    "data" BLOB NOT NULL /* 压缩后的内容 */,
+    "size" INT NOT NULL /* 原文长度 */,
+    "created_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP /* 创建时间 */
+) /* 提示词内容表 */;
+        ALTER TABLE "prompt_records" ADD "system_prompt_hash" VARCHAR(64) /* 系统提示词内容哈希 */;
+        ALTER TABLE "prompt_records" ADD "user_prompt_hash" VARCHAR(64) /* 用户提示词内容哈希 */;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "prompt_records" DROP COLUMN "system_prompt_hash";
+        ALTER TABLE "prompt_records" DROP COLUMN "user_prompt_hash";
+        DROP TABLE IF EXISTS "prompt_blobs";"""
+
+
+MODELS_STATE = (
+    "eNrtXW1v2zgS/itGPiVAu9H7S3F7QNJkr7lNkyJN7na3LQxKohJdHckryW2zi/7341CWRL"
+    "05ot8ku+qHoJY4svVwOBw+Mxz+ffAYOHgS/XQX4fDg1ejvAx89YvKfwvUXowM0neZX4UKM"
+    "rAltOCMt6BVkRXGI7JhcdNEkwuSSgyM79KaxF/jQ9ONMVyXj40yTZP3jzDA0A+ScwCaCnn"
+    "9fbaIhSfw4U3XDgoYz3/tzhsdxcI/jB/pzP3wilz3fwd9wlH6cfh67Hp44hbfxHHgAvT6O"
+    "n6b02oUf/0Ibwm+wxnYwmT36eePpU/wQ+Flrz4/h6j32cYhiDI+Pwxm8pD+bTOZgpO+d/N"
+    "K8SfITGRkHu2g2AahAejFSF2dllOYyduAD4uSXRfRl7+EbX0qioiuGrCkGaUJ/VXZF/568"
+    "ao5DIkjRuLo9+E7voxglLSikOYbQ0fT/FSRfP6CwHkpWpgQo+ellQFP4No0oUSlFcFqi+o"
+    "i+jSfYv48fyEdVWADhf05uXr85uTlUhSN4dkAGQzJEruZ3JHoLUM5RfUDRA3bGUxRFX4PQ"
+    "4QG3RnQ9GKcXcpDzAf0cyqqEBPLXsjWKMia4a4aSXtENQVwGd1EyWgBPWjUiT+8VocePyJ"
+    "vwAJ4JdK3KpoAAWMtaDkyhjRaTVs1gChU99j37M691YGWWgnQO2FoUV9NklWBqukI/DEMY"
+    "TLjATNtvzwRQ635Qh6VhOhL5K+nSMlhKbbCUmrGUKlh60Zg4Jt6XGkBPA4Ib8hs8AVauBK"
+    "xFBDeFbGYIKjoquWBWJWJKNdcmhlZzZKsdxgswPb2+voSHPEbRnxN64eK2BO7d29NzYhMo"
+    "5qSRF2PWaciRRl+I+xDy6G0u0bkJUE0ZZirBdu9uLpfSXFVto7qq2qy7cK8IqR1ieP0xiq"
+    "uwnpE7sfeI66EtSpbgdeaiP6X/2b6nIFrkL2lH1Fh1iUqbqqu0hJ28mXPtT57mGrAA9duL"
+    "t+fvb0/evito+NnJ7TncoQbq8al09VArdVD2kNF/L27fjODj6I/rq3OKaxDF9yH9xrzd7R"
+    "8H8JvQLA7GfvB1jBxmgk+vpnAVuns2dZbs7qJk37pb01wFOtoSfuDupj8eVqnuZ2aNBRcs"
+    "ZH/+ikJnXLiTq0WE45hAFNXMYHPJX369wRNEAa92P7Ocf588aevDXdRl4hMIqsIuxbjmrv"
+    "wqC2UgBU1YVm89So/lK8hH9/Rd4Lvhm2qwamBGGCgXEyRjtvu4iRLLAm/f1XAr0oRt/iyB"
+    "8iFz4j7jp4NP+8un5Kj0hU8BwDn8pHnz7lf4rH6ZqoR7swT9giazGg//Fn9rUMxMoF+gqo"
+    "Jsr+zT357/dluYAlPoDt+e/HZUmAYvr6/+lTZnoH59eX06uKKDKzq4ovvrihZ6G/wUromd"
+    "kXh+du+zf7mOqb7i1ReRrcL6SxBi797/FT9RdC/IL0K+jRc77/vgtZPLIfqaeZWsGpGXJq"
+    "+KE3bp9cn71ydn5wffm9dHm/T/r4IvePIuDP6HqateWQAU7i9cAfjQcjxNmrZeAqi24IJj"
+    "ALbKNHQTIim44tOXFgLthH6cSGp6sXNvP/ZiPj4/E+jeOS0okiHocMU0lqP223H7i8j9it"
+    "/P/l4O778k1jn7XEBZtmEYu22DUdteCBBYQi5tzgS6J/kZC6nbulVvSjtbxEbx04RrEZsJ"
+    "dI+saBIFVlzVBmW2qbHo60qW+FrxLOLR4FxiixFWJ0RufPCctdAlCwKCwnK5FesPtw40wU"
+    "ATDDTBntIE5EVj7Mc8UxQj0qvpXxUNFTLTLLOfkxRk9REYZ3VoN665ikLb42WEWrQtFdJ4"
+    "VZ0MIR07FHkkbjP+wqzAUEiWu+OlQK2VXQrbdeoyuyLLke4GXfsBTWPK49R4Vf9+f33VYB"
+    "qKYiVI73zyrh8cz45fjCZeFH/amKP1D3fm24DsyJp5k9jzo5/gC/9Z63vpCAuQ3mZIF2fU"
+    "K2jIZue2IoDTYitSNhgl8w4PKFuRWYTHKczRUxTjR84suPoHbDEdrpEiY/PhFFd3U44y7y"
+    "BY47lWYnz6lCf3iGMEXBHPWGFl+jRQ4GvrB4oqKnJq/jUZYpuuKxjwhsnakLRwYTomV83e"
+    "Dp76oMipd78jcRFm0bL0phJTkmRZlwRZM1RF11VDyOaL6q1FE8fpxb9gMBQ6oyF+0iYrKp"
+    "jFE8/HxFcl771aatR18qgr8qnLIEu+rl8xNapmcl4RodfJU/YRHYjFrAOf5Dnb3rkgKbDl"
+    "xlYxC9Dh1d3lZeKXwLYGGQGS8H/VhuZ5iv5Rj3Pw2EFZE4IrjdnmCFzFTrQKwJmSDp6DJW"
+    "W+hGCZbCxt9HIEE5kophwccTNgwtMNpS42t8rzPvowkYK7o8kCua9gwaR9KaV/dYx0mEpF"
+    "6GlZ1w+/wISEj8gjJdGURolbdDi3Bczl+ZKY/KLDCNO5/ahdkPDDwTymmU52KCTL/PRDEH"
+    "kUy097lEWoYNniynrbcFQR9DkBg2fbFSvUg9Q3ZijkAZlEkxMVPp7r7PFcPfvBcu9yRLdg"
+    "foaI7oYm5gLKWUT3mHxQVAOmYEPsJ/GY2e725pkV6Zp0VAQ7nQ412YQJEhsuMASKk+bYwj"
+    "pUeGmhCDs8y891s2ZeNMbfpoi8ocO/NZGV7NnmROKMqnRxLyRQ312wUco1LfjXSMcMEcsh"
+    "YjlELPc0YllYlrSdzgpLmc4DPZKsFd0JMKrQ+mdKpJqVmx3NZ8X1YFusi4vIXmWS8xJOG8"
+    "4kn+bpxismk5ezl3ed0SsnlReVqj6vvGok1gAsH4+8E1aiNeas0eRN5Wf5WG/ikCdtk8/f"
+    "6X6o4/q3RfWvN4E0twtNZClACfwmdikbB0EtpKO1oLhJIjsFtIbEZrBuJrDZCE6r/eNMBL"
+    "zML0sKfMSA9UK+mvsZwFGrFlAbqoBKYXjN0mgo2NDZvCvab5AuLABrbbi2zjL1xJKUlEKS"
+    "hSbVWI6yTvMa/NmjRQQGrnqD9QNndRje3V2cNSy1ZrUwwuWfQGqbJdfg+1LbkwTRFWzAVm"
+    "1ThEWWgEHnXVFN766F36Asnpysm9gVEX35/eGiC1aif1x0B/muy2Xm1GbgLDC7BuVI3fSu"
+    "pkv2mhR3M7UHipa6vTGuCvZhiZlH4gvJai7YE1V29aSLxO4p6iEJeZ1ofiE+HF9ghZHYHo"
+    "7ic7ZElxQjtRm5uhbbaBaEvDSLeo6yY6T8pCFiSFEwTNylXu/8DrBiPEVEtOWxHTxOYdXt"
+    "HCNvnP+iYV/YEGUZoixDlGVzUZbSwp1jhquR7Dzish0qagi/DOGXIfxStgE7HYTplsMud0"
+    "ONaS30xfvz2xHkiXdVYylPma8nxvN8+oXUOJO+34Ycz3Pfn6mmVN+wnIpdn1Z/mA+Bn68C"
+    "Hx9BbpRhFys3KFiU09T9YtF8Tiqb3PtwEGPi+xM1pxcGJntzWde851ys9QSclTJSGYWGM3"
+    "CWP/BiI1yrhSLPHnu+G/DsiyxK7cjOSJ0uFil/orhYhIW85vZzDySY+vswmPkOX6+wUrvR"
+    "K4Zg27C+0ygrrqg0zGP1s1emZMILfDTx4ieebimJ7Ua/aAI4UsmOYV2C6VN115A7v5F+QZ"
+    "ZHwPUwVxmEgtCujBUXovOSaUE6gCEkV/rZJ34Q1/VHcwQvE+hBUTUdihtgB+JCJkRHNRsb"
+    "Q3nwgd8d+N2B391mFn1H3OLu7ZRfe+EqZlnPUbKqKNU99rpG/GkNm0LKpWi67h7C3Gar9A"
+    "AM6BpXVV/Qze1OuoMvzfyTyG1T05SjH5sJ3p/CEatSxqmCr6EPMqbxlnnm/o6Ntj1SMiHc"
+    "zDFzmOk84zwao2gcBbPQxmuqtcI23aqTQDuL96DTVhn8BbCSyoM7DhZbqHBtkG0lLpEhti"
+    "g+wcLaIk4xzjp4mYBFEmBKqtq1Dl7UC1UCGTLdta1A/ZkkVqHKQIjNr2TPeMGapOIXgaec"
+    "HfnNfClb2EOmKUuqS2cWjKDMjaWYZR609rC6xHSMcygTyzQvz1m4/KkSLqkTTuImTeJD/G"
+    "Qj8ZNU/7kr11QEe3Defa2SH9I8a0rcWAgKfuiCRUeTdUyZZTu5k2j+UT8OHCfflTy8vXaz"
+    "IttLHFGf64fctByKL0Who2XbnhSxKUwdPT+WBNgiyHfgwZuV6RfYGfVEc0jcfkLuRWPLc7"
+    "wwqcyFJvxlbCrifassXO8EDeVrBuJ9IN4H4n3jxHvDmqeti1Yv3X2a73IEyoYOhVgS3Abp"
+    "7sFdhXDZMHNeVsh10re7TQKW6deGoduCGS+p5S5DvAnqsMJz1w/jPh1GW41QLCIk2TBGG0"
+    "IyJfpXyKCGgAV3NnVZCAjJQnkFppiIaQCnaFgWTvlF9nk59fKixGm62KL1RdyiO8mbbT3Q"
+    "gUM6ddX+M1rcw3TqPWGgCrai5wyUTSC5D8InHn1mZXoFtioJWmJaD1OrAWbzmBgPEUopzz"
+    "+osk0+aI6Me8Vn/+ibCQ5pgS7Y4+fCbJlE3ZJMalWS8jgcLWFk2BDu4+i9YRPCsAlh2IQw"
+    "bEIYNiG07ZOBpB9I+oGk3yOSfqkTC3f+sLl+pKpuNPvvXRg8TuMbbAehU8ezFe4vpNimtO"
+    "U4pE1bs2ua7Ahp6rVhweKqkG5Xc9Lws0JFYq5NcQHmEFNm/qH5cqUSuszdPWLJcvQ4z0rd"
+    "XAHdiDc+tYWDaFvjufTZsztfHel589saxHyXRl6POKkjYwpCpyd/JAeDjxODx8M2VgR7UJ"
+    "E4OzK8alb7STvSgc6PfUmsB8hnRmJXkC+o7/gBRQ9cJUVrpTsngRcNgGIdaVWxwQRhwV6G"
+    "9NWUFqTv3FesI33hVuNA4O6MOtnuu2LBiOh3V1B3mAf/TKBz0BUXwh8J9BBrPrlYFNpuA6"
+    "/YKr4nLojvidX4HvadaeDVFeZuBpmV6UE9KsulFS3o+dUA9LsLWhDdzc/04I6kqmqbSKqq"
+    "NkdS4V51CzaAMgvrtptOArRgEzYjVwLcBcFtr9+xZKbbrlTZlpLC6CvPrWfXd6eX56N3N+"
+    "evL95fzNnTjJ+hN4tJzDfnJ5c7TZC29tkHfjTjRzkYs03yO7fBZ+zfReRmM8dTabOQ54mh"
+    "9XgGzfnIHvo1xQnHFGmKw3OMTyvJgfYZaJ+B9hlon02CC8slav8iPnyLcj3YkFBaXc0NbH"
+    "v3aN3Y2sh+IAaWG9uKXNfn7yi6A8EgyaEHHMlpXm+Sxds/2JMTVOg2c27o62R7sB1EhfRn"
+    "TRIFljLoHOk4iNGEH+SyWA9MhyBbPdDbKOZanKYCS65K12cgDAfOxM1OTjRo7r5Z2BhAzI"
+    "ebZV8lpangEC9IWTT1NR1bt4417JZJr7Vq8cB6DazXQMgMhEyHu9tOplNM/gtbERftb2Oa"
+    "tdzhhjKJpY7QJv4TVJTRZcRxegjfA2DvW4G6oacnEq8ZFZ+U+NGGgazUd1ZlG9XtiUuus2"
+    "2SsxjBRXkBhl4WSz+GfZwjSemZxqpO1/A6LepFh42CheSvlR32SAeSmsSpVEtoLOGVHsea"
+    "nb+9qGTXUJJrSyTTI/bpqoX3oNeKXMdrzXpt78ghHxK+f6SE76Jh4zycujdVOZiSwPms09"
+    "H4Wa4oR/+qcdRP/r2oxjHXv/VUiJh2UYJjBYVtWx+iOEifr7+xF4U3VlFaDmB7W3GDCQAH"
+    "k8ls+kyQOGnTPkhM268aJNZsRU/YR94gMSvJ0mws/abagpvM8MfZJROyR+alOAQV0bIHRs"
+    "6/1Xr892TdNZugcL7b05rZn5OK1mycshBvy0ixjLf5tChQXf8FNTHrhoZ7tK7I+7Uv4esS"
+    "5m0Zu5JYD2p9MCNGt00pSaJ6NXoIZuGxg56WYe2MFpyd0cjYGZWKB9nIaotyLtEDgJl6p5"
+    "oBp16BMbq7fZ2Yl1ej38m/l2/fvjw7G715MzpmPi/FTWttqGmtmZnWanOP+5aosUym8Y+W"
+    "qbE++qGaqCEUT1LRVHBR2SOAu8vdGGJVQ6xqb2JVISbvGsXcBGZFrmMLwuLdNYG5g8ldwp"
+    "DZNWR27WFmlzCkdW3baAw5XevJ6epFXtZQjWeoxrMV2jipDXM6CazmyjH0bpu6MRZpuELV"
+    "GHZ3cOuqMaxQIzPMbju26JFLOoRh5hUlZWivu3SjIVPBeQFJ3LbYMu+W7pW2ca+Rls0Be/"
+    "/m5KWkal1u0W7mam2iiTZX6dpUoAcHsTFaR3xRKFxrCOKrUYi+Hv818azjv6LY6QFJC8UM"
+    "uUsTFIS6P6WqOMB1eiySkR/72N+aBKD5NXXXPB+FTw3IzyXKh1I9zavlt1TxlWFWBFwFeP"
+    "UzqGpqV57+fnt+UqmGkrbMJn+C8unF1cnN7zU1MWnj7xV1KxZO8f7CPOfYzJv3IJtDNt00"
+    "69FUaZ1sjLQhxWxIMdvnFO0THHr2Q51PO7+z0J9FeZvnPNlUJar9/OMc0tGMwZaD919wGN"
+    "WeHtHsqjAiHTuF7VHcfHgChgYHiPPmuwngRiJp5BtjXBfZaa5nzoh0Vc18NVi3UaG80+nl"
+    "+/8B2C/YlA=="
+)
@@ -0,0 +1,112 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_prompt_reco_user_id_797650" ON "prompt_records" ("user_id", "endpoint", "created_at");
+        CREATE VIRTUAL TABLE IF NOT EXISTS "prompt_blob_fts" USING fts5("body", content='', tokenize='trigram');"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_prompt_reco_user_id_797650";
+        DROP TABLE IF EXISTS "prompt_blob_fts";"""
+
+
+MODELS_STATE = (
+    "eNrtXWlz2zgS/Ssqf3KqkjHvI7WzVb5m4x3HTiX27swkKRVIgjY3MqkhqSSeqfz3RYMiCV"
+    "4yoYuUzHxwRSSaEh8ajcbrRuPvg4fAwZPop9sIhwevR38f+OgBk/8Urr8cHaDpNL8KF2Jk"
+    "TWjDGWlBryArikNkx+SiiyYRJpccHNmhN429wIemn2a6KhmfZpok659mhqEZIOcENhH0/L"
+    "tqEw1J4qeZqhsWNJz53p8zPI6DOxzf05/78TO57PkO/o6j9OP0y9j18MQpvI3nwAPo9XH8"
+    "OKXXLvz4F9oQfoM1toPJ7MHPG08f4/vAz1p7fgxX77CPQxRjeHwczuAl/dlkMgcjfe/kl+"
+    "ZNkp/IyDjYRbMJQAXSi5G6OCujNJexAx8QJ78soi97B9/4ShIVXTFkTTFIE/qrsiv6j+RV"
+    "cxwSQYrG1c3BD3ofxShpQSHNMYSOpv+vIHl6j8J6KFmZEqDkp5cBTeHbNKJEpRTBaYnqA/"
+    "o+nmD/Lr4nH1VhAYT/OX5/+ub4/aEqvIBnB2QwJEPkan5HorcA5RzVexTdY2c8RVH0LQgd"
+    "HnBrRNeDcXohBzkf0E+hrEpIIH8tW6MoY4K7ZijpFd0QxGVwFyWjBfCkVSPy9F4RevyAvA"
+    "kP4JlA16psCgiAtazlwBTaaDFp1QymUNFj37O/8FoHVmYpSOeArUVxNU1WCaamK/TDMITB"
+    "hAvMtP32TAC17gd1WBqmI5G/ki4tg6XUBkupGUupgqUXjYlj4n2tAfQkILghv8ETYOVKwF"
+    "pEcFPIZoagoqOSC2ZVIqZUc21iaDVHttphvADTk+vrS3jIQxT9OaEXLm5K4N6+PTknNoFi"
+    "Thp5MWadhhxp9JW4DyGP3uYSnZsA1ZRhphJs9/b95VKaq6ptVFdVm3UX7hUhtUMMrz9GcR"
+    "XWM3In9h5wPbRFyRK8zlz0p/Q/2/cURIv8Je2IGqsuUWlTdZWWsJM3c679yeNcAxagfnPx"
+    "9vzDzfHbdwUNPzu+OYc71EA9PJauHmqlDsoeMvrvxc2bEXwc/XF9dU5xDaL4LqTfmLe7+e"
+    "MAfhOaxcHYD76NkcNM8OnVFK5Cd8+mzpLdXZTsW3drmqtAR1vCM+5u+uNhlep+YdZYcMFC"
+    "9pdvKHTGhTu5WkQ4jglEUc0MNpf85df3eIIo4NXuZ5bzH5InbX24i7pMfAJBVdilGNfclV"
+    "9loQykoAnL6q0H6aF8Bfnojr4LfDd8Uw1WDcwIA+VigmTMdh83UWJZ4O27Gm5FmrDNnyRQ"
+    "PmZO3Bf8ePB5f/mUHJW+8CkAOIefNG/e/Qqf1S9TlXBvlqBf0WRW4+Hf4O8NipkJ9AtUVZ"
+    "DtlX36m/PfbgpTYArd4dvj314UpsHL66t/pc0ZqE8vr08GV3RwRQdXdH9d0UJvg5/CNbEz"
+    "Ek/P7n32L9cx1Ve8+iKyVVh/CULs3fm/4keK7gX5Rci38WLnfR+8dnI5RN8yr5JVI/LS5F"
+    "Vxwi6dHn84PT47P/jRvD7apP9/FXzFk3dh8D9MXfXKAqBwf+EKwIeW42nStPUSQLUFFxwD"
+    "sFWmoZsQScEVn760EGgn9HwiqenFzr392Iv5+PxMoHvntKBIhqDDFdNYjtpvx+0vIvcrfj"
+    "/7ezm8/5JY5+xzAWXZhmHstg1GbXshQGAJubQ5E+ie5GcspG7rVr0p7WwRG8WPE65FbCbQ"
+    "PbKiSRRYcVUblNmmxqKvK1nia8WziEeDc4ktRlidELnxwVPWQpcsCAgKy+VWrD/cOtAEA0"
+    "0w0AR7ShOQF42xH/NMUYxIr6Z/VTRUyEyzzH5OUpDVR2Cc1aHduOYqCm2PlxFq0bZUSONV"
+    "dTKEdOxQ5JG4zfgLswJDIVnujpcCtVZ2KWzXqcvsiixHuht07Xs0jSmPU+NV/fvD9VWDaS"
+    "iKlSC99cm7fnQ8O345mnhR/HljjtY/3JlvA7Ija+ZNYs+PfoIv/Get76UjLEB6myFdnFGv"
+    "oCGbnduKAE6LrUjZYJTMOzygbEVmER6nMEePUYwfOLPg6h+wxXS4RoqMzYdTXN1NOcq8g2"
+    "CN51qJ8elTntwDjhFwRTxjhZXp00CBr60fKKqoyKn512SIbbquYMAbJmtD0sKF6ZhcNXs7"
+    "eOqDIife3Y7ERZhFy9KbSkxJkmVdEmTNUBVdVw0hmy+qtxZNHCcX/4LBUOiMhvhJm6yoYB"
+    "ZPPB8TX5W892qpUdfJo67Ipy6DLPm6fsXUqJrJeUWETpOn7CM6EItZBz7Jc7a9c0FSYMuN"
+    "rWIWoMOr28vLxC+BbQ0yAiTh/6oNzfMU/Rc9zsFjB2VNCK40ZpsjcBU70SoAZ0o6eA6WlP"
+    "kSgmWysbTRqxFMZKKYcnDEzYAJTzeUutjcKs/75MNECu6OJgvkvoIFk/allP7VMdJhKhWh"
+    "p2VdP/wKExJ+QR4piaY0Styiw7ktYC7Pl8TkFx1GmM7tL9oFCT8ezGOa6WSHQrLMTz8EkU"
+    "ex/LxHWYQKli2urLcNRxVBnxMweLZdsUI9SH1jhkIekEk0OVHho7nOHs3Vsx8s9y5HdAvm"
+    "Z4jobmhiLqCcRXSPyAdFNWAKNsR+Eo+Z7W5vnlmRrklHRbDT6VCTTZggseECQ6A4aY4trE"
+    "OFVxaKsMOz/Fw3a+ZFY/x9isgbOvxbE1nJnm1OJM6oShf3QgL17QUbpVzTgn+NdMwQsRwi"
+    "lkPEck8jloVlSdvprLCU6TzQI8la0Z0Aowqtf6ZEqlm52dF8VlwPtsW6uIjsVSY5L+G04U"
+    "zyaZ5uvGIyeTl7edcZvXJSeVGp6vPKq0ZiDcDy8cg7YSVaY84aTd5UfpaP9SYOedI2+fyd"
+    "7oc6rn9bVP96E0hzu9BElgKUwG9il7JxENRCOloLipskslNAa0hsButmApuN4LTaP85EwM"
+    "v8sqTARwxYL+SruZ8BHLVqAbWhCqgUhtcsjYaCDZ3Nu6L9BunCArDWhmvrLFNPLElJKSRZ"
+    "aFKN5SjrNK/Bnz1YRGDgqjdYP3BWh+Ht7cVZw1JrVgsjXP4JpLZZcg2+L7U9SRBdwQZs1T"
+    "ZFWGQJGHTeFdX07lr4Dcriycm6iV0R0ZffHy66YCX6x0V3kO+6XGZObQbOArNrUI7UTe9q"
+    "umSvSXE3U3ugaKnbG+OqYB+WmHkkvpCs5oI9UWVXT7pI7J6iHpKQ14nmV+LD8QVWGInt4S"
+    "g+ZUt0STFSm5Gra7GNZkHIS7Oo5yg7RspPGiKGFAXDxF3q9c7vACvGU0REWx7ZwcMUVt3O"
+    "EfLG+S8a9oUNUZYhyjJEWTYXZSkt3DlmuBrJziMu26GihvDLEH4Zwi9lG7DTQZhuOexyN9"
+    "SY1kJffDi/GUGeeFc1lvKU+XpiPM+nX0iNM+n7bcjxPPf9iWpK9Q3Lqdj1afWH+RD4+Srw"
+    "8QvIjTLsYuUGBYtymrpfLJrPSWWTex8PYkx8f6Lm9MLAZG8u65r3nIu1noCzUkYqo9BwBs"
+    "7yB15shGu1UOTZY893A559kUWpHdkZqdPFIuVPFBeLsJDX3H7ugQRTfxcGM9/h6xVWajd6"
+    "xRBsG9Z3GmXFFZWGeax+9sqUTHiBjyZe/MjTLSWx3egXTQBHKtkxrEswfaruGnLnN9IvyP"
+    "IIuB7mKoNQENqVseJCdF4yLUgHMITkSj/7xA/iuv5ojuBlAj0oqqZDcQPsQFzIhOioZmNj"
+    "KA8+8LsDvzvwu9vMou+IW9y9nfJrL1zFLOs5SlYVpbrHXteIP61hU0i5FE3X3UOY22yVHo"
+    "ABXeOq6ku6ud1Jd/ClmX8SuW1qmvLieTPB+1M4YlXKOFXwNfRBxjTeMM/c37HRtkdKJoSb"
+    "OWYOM51nnEdjFI2jYBbaeE21VtimW3USaGfxHnTaKoO/AFZSeXDHwWILFa4Nsq3EJTLEFs"
+    "UnWFhbxCnGWQcvE7BIAkxJVbvWwYt6oUogQ6a7thWoP5PEKlQZCLH5lewZL1mTVPwi8JSz"
+    "I7+ZL2ULe8g0ZUl16cyCEZS5sRSzzIPWHlaXmI5xDmVimeblOQuXP1fCJXXCSdykSXyIn2"
+    "wkfpLqP3flmopgD867r1XyQ5pnTYkbC0HBD12w6GiyjiizbCd3Es1/0Y8Dx8l3JQ9vr92s"
+    "yPYSR9Sn+iE3LYfiK1HoaNm2J0VsClNHz48lAbYI8h148GZl+gV2Rj3RHBK3n5B70djyHC"
+    "9MKnOhCX8Zm4p43yoL1ztBQ/magXgfiPeBeN848d6w5mnrotVLd5/muxyBsqFDIZYEt0G6"
+    "e3BXIVw2zJyXFXKd9O1uk4Bl+rVh6LZgxktqucsQb4I6rPDc9cO4T4fRViMUiwhJNozRhp"
+    "BMif4VMqghYMGdTV0WAkKyUF6BKSZiGsApGpaFU36RfV5OvbwscZoutmh9EbfoTvJmWw90"
+    "4JBOXbX/jBb3MJ16Txiogq3oOQNlE0jugvCRR59ZmV6BrUqClpjWw9RqgNk8IsZDhFLK8w"
+    "+qbJMPmiPjXvHZz30zwSEt0AV7/FyYLZOoW5JJrUpSHoejJYwMG8J9HL03bEIYNiEMmxCG"
+    "TQjDJoS2fTKQ9ANJP5D0e0TSL3Vi4c4fNtePVNWNZv+9C4OHafwe20Ho1PFshfsLKbYpbT"
+    "kOadPW7JomO0Kaem1YsLgqpNvVnDT8pFCRmGtTXIA5xJSZf2i+XKmEbukuI4h9ZxrM6S22"
+    "2R6RaTnInEeqbq7ObsQbxtrCebWt8Vz6iNqdL6L0tJVuDWK+mSMvW5yUmzEFodMDQpLzw8"
+    "eJXeQhJSuCPShcnJ0sXrW+/WQn6UDnx74k1gPkMyOxK8gX1Hd8j6J7rsqjtdKdc8WLBkCx"
+    "3LSq2GCCsGAvww1rSgtueO5S1nHDcKtxIHB3Rp1s912xYET0uyuo18yDfybQOeiKC1GSBH"
+    "oISR9fLIqAt4FXbBUGFBeEAcVqGJD1wtuCzMr0oGyV5dLCF/SYawD63QWtm+7mR39wB1xV"
+    "tU3AVVWbA65wr7pTG0CZhXW7UicBWrBXm5ErAe6C4LaX+Vgy091ZqmxLSf30lefWs+vbk8"
+    "vz0bv356cXHy7mJGtG49CbxVzn9+fHlzvNo7b22QcaNaNROYi1TdJAN8EX7N9G5GYzFVRp"
+    "s5AOiqH1eAbN+Tgh+jXFCccUaSbEU8RQK8ktsUMD7TPQPgPt8xxpn/lyidq/iA/folwP9i"
+    "2UVldzA9vePVo3tjay74mB5ca2Itf1MT2K7kDMSHLoOUhymv6bJPv2D/bkoBW6G50b+jrZ"
+    "HuwaUSFLWpNEgaUMOkc6DmI04Qe5LNYD0yHIVg/0Noq5FqepwJKr0vUZCMOBo3OzAxYNmu"
+    "JvFvYPEPPhZklaSQUrOOsLMhtNfU2n261jDbtl0mutWjywXgPrNRAyAyHT4Sa44+kUk//C"
+    "jsVF2+CYZi03wqFMYqmTton/BIVndBlxHDLC9wDYIlegbughi8RrRsUnJX60YSAr9Z1V2U"
+    "Z1W+eS62yb5MhGcFFegqGXxdKPYR/nSFJ69LGq0zW8Tmt/0WGjYCH5a2VnQtKBpCZxKtUS"
+    "Git9pae2Zsd0L6rsNVTu2hLJ9IB9umrhPQ+2ItfxWrNe2ztyyIe88OeUF140bJxnWPemeA"
+    "dTOTifdToaP8vV7uhf0Y76yb8XRTvm+reeQhLTLip1rKCwbctIFAfp02U69qI+xypKywFs"
+    "bwtzMAHgYDKZTZ8IEidt2geJaftVg8SaregJ+8gbJGYlWZqNpd9UW3CTGf4ou2RC9si8Yo"
+    "egIlodwcj5t1qP/46su2YTFM43hVoz+0tS+JqNUxbibRkplvE2nxcFquu/oCZm3dBwj9YV"
+    "eb/2JXxdwrwtY1cS60FJEGbE6LYpJUlUr0f3wSw8ctDjMqyd0YKzMxoZO6NSGCEbWW1Rzi"
+    "V6ADBTFlUz4HAsMEa3N6eJeXk9+p38e/X27auzs9GbN6Mj5vNS3LTWhprWmplprTb3uG+J"
+    "GstkGj+3TI310Q/VRA2heOCKpoKLyp4U3F3uxhCrGmJVexOrCjF51yjmJjArch1bEBbvrg"
+    "nMHUzuEobMriGzaw8zu4QhrWvbRmPI6VpPTlcv8rKGoj1D0Z6t0MZJCZmTSWA1F5ihd9uU"
+    "l7FIwxWKy7C7g1sXl2GFGplhdtuxRU9m0iEMMy88KUN73aUbDZlCzwtI4rY1mXm3dK+0jX"
+    "uNtGwO2Ic3x68kVetyi3YzV2sTTbS5KtymAj04r43ROuKLQn1bQxBfj0L07eiviWcd/RXF"
+    "Tg9IWqh5yF2aoCDU/WFWxQGu09OTjPx0yP7WJADNrynP5vkofGxAfi5RPrvqcV5Uv6WKrw"
+    "yzIuAqwKsfVVVT4vLk95vz40o1lLRlNvkTlE8uro7f/15TOpM2/lFRt2LhFO8vzHPczbx5"
+    "D7I5ZNNNsx5NlZbTxkgbUsyGFLN9TtE+xqFn39f5tPM7C/1ZlLd5ypNNVaLaz8/nLI9mDL"
+    "YcvP+Kw6j2kIlmV4UR6dgpbI/i5sMTMDQ4QJw3300ANxJJI98Y47rITnPZc0akq6Lnq8G6"
+    "jULmnU4vP/4PCOTlVA=="
+)
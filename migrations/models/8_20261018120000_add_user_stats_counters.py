@@ -0,0 +1,244 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "user_stats_counters" (
+    "user_id" BIGINT NOT NULL PRIMARY KEY /* 用户ID */,
+    "project_count" INT NOT NULL DEFAULT 0 /* 项目数 */,
+    "chapter_count" INT NOT NULL DEFAULT 0 /* 章节数 */,
+    "outline_node_count" INT NOT NULL DEFAULT 0 /* 大纲节点数 */,
+    "total_words" BIGINT NOT NULL DEFAULT 0 /* 总字数（项目字数 + 章节字数） */,
+    "updated_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP /* 更新时间 */
+) /* 用户创作统计计数器表 */;
+INSERT INTO "user_stats_counters" ("user_id", "project_count", "chapter_count", "outline_node_count", "total_words", "updated_at")
+SELECT p."user_id", COUNT(*), COALESCE(SUM(c."cnt"), 0), COALESCE(SUM(o."cnt"), 0),
+       SUM(p."word_count") + COALESCE(SUM(c."words"), 0), CURRENT_TIMESTAMP
+FROM "novel_projects" p
+LEFT JOIN (
+    SELECT "project_id", COUNT(*) AS "cnt", SUM("word_count") AS "words" FROM "chapters" GROUP BY "project_id"
+) c ON c."project_id" = p."id"
+LEFT JOIN (
+    SELECT "project_id", COUNT(*) AS "cnt" FROM "outline_nodes" GROUP BY "project_id"
+) o ON o."project_id" = p."id"
+GROUP BY p."user_id";
+CREATE TRIGGER IF NOT EXISTS "trg_counter_project_insert" AFTER INSERT ON "novel_projects"
+BEGIN
+    INSERT INTO "user_stats_counters" ("user_id", "project_count", "chapter_count", "outline_node_count", "total_words", "updated_at")
+    VALUES (NEW."user_id", 1, 0, 0, NEW."word_count", CURRENT_TIMESTAMP)
+    ON CONFLICT ("user_id") DO UPDATE SET
+        "project_count" = "project_count" + excluded."project_count",
+        "chapter_count" = "chapter_count" + excluded."chapter_count",
+        "outline_node_count" = "outline_node_count" + excluded."outline_node_count",
+        "total_words" = "total_words" + excluded."total_words",
+        "updated_at" = CURRENT_TIMESTAMP;
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_counter_project_delete" BEFORE DELETE ON "novel_projects"
+BEGIN
+    INSERT INTO "user_stats_counters" ("user_id", "project_count", "chapter_count", "outline_node_count", "total_words", "updated_at")
+    VALUES (OLD."user_id", -1, -(SELECT COUNT(*) FROM "chapters" WHERE "project_id" = OLD."id"), -(SELECT COUNT(*) FROM "outline_nodes" WHERE "project_id" = OLD."id"), -(OLD."word_count" + (SELECT COALESCE(SUM("word_count"), 0) FROM "chapters" WHERE "project_id" = OLD."id")), CURRENT_TIMESTAMP)
+    ON CONFLICT ("user_id") DO UPDATE SET
+        "project_count" = "project_count" + excluded."project_count",
+        "chapter_count" = "chapter_count" + excluded."chapter_count",
+        "outline_node_count" = "outline_node_count" + excluded."outline_node_count",
+        "total_words" = "total_words" + excluded."total_words",
+        "updated_at" = CURRENT_TIMESTAMP;
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_counter_project_words" AFTER UPDATE OF "word_count" ON "novel_projects"
+WHEN OLD."word_count" IS NOT NEW."word_count"
+BEGIN
+    INSERT INTO "user_stats_counters" ("user_id", "project_count", "chapter_count", "outline_node_count", "total_words", "updated_at")
+    VALUES (NEW."user_id", 0, 0, 0, NEW."word_count" - OLD."word_count", CURRENT_TIMESTAMP)
+    ON CONFLICT ("user_id") DO UPDATE SET
+        "project_count" = "project_count" + excluded."project_count",
+        "chapter_count" = "chapter_count" + excluded."chapter_count",
+        "outline_node_count" = "outline_node_count" + excluded."outline_node_count",
+        "total_words" = "total_words" + excluded."total_words",
+        "updated_at" = CURRENT_TIMESTAMP;
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_counter_chapter_insert" AFTER INSERT ON "chapters"
+BEGIN
+    INSERT INTO "user_stats_counters" ("user_id", "project_count", "chapter_count", "outline_node_count", "total_words", "updated_at")
+    SELECT "user_id", 0, 1, 0, NEW."word_count", CURRENT_TIMESTAMP
+    FROM "novel_projects" WHERE "id" = NEW."project_id"
+    ON CONFLICT ("user_id") DO UPDATE SET
+        "project_count" = "project_count" + excluded."project_count",
+        "chapter_count" = "chapter_count" + excluded."chapter_count",
+        "outline_node_count" = "outline_node_count" + excluded."outline_node_count",
+        "total_words" = "total_words" + excluded."total_words",
+        "updated_at" = CURRENT_TIMESTAMP;
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_counter_chapter_delete" AFTER DELETE ON "chapters"
+BEGIN
+    INSERT INTO "user_stats_counters" ("user_id", "project_count", "chapter_count", "outline_node_count", "total_words", "updated_at")
+    SELECT "user_id", 0, -1, 0, -OLD."word_count", CURRENT_TIMESTAMP
+    FROM "novel_projects" WHERE "id" = OLD."project_id"
+    ON CONFLICT ("user_id") DO UPDATE SET
+        "project_count" = "project_count" + excluded."project_count",
+        "chapter_count" = "chapter_count" + excluded."chapter_count",
+        "outline_node_count" = "outline_node_count" + excluded."outline_node_count",
+        "total_words" = "total_words" + excluded."total_words",
+        "updated_at" = CURRENT_TIMESTAMP;
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_counter_chapter_update" AFTER UPDATE OF "word_count", "project_id" ON "chapters"
+WHEN OLD."word_count" IS NOT NEW."word_count" OR OLD."project_id" IS NOT NEW."project_id"
+BEGIN
+    INSERT INTO "user_stats_counters" ("user_id", "project_count", "chapter_count", "outline_node_count", "total_words", "updated_at")
+    SELECT "user_id", 0, -1, 0, -OLD."word_count", CURRENT_TIMESTAMP
+    FROM "novel_projects" WHERE "id" = OLD."project_id"
+    ON CONFLICT ("user_id") DO UPDATE SET
+        "project_count" = "project_count" + excluded."project_count",
+        "chapter_count" = "chapter_count" + excluded."chapter_count",
+        "outline_node_count" = "outline_node_count" + excluded."outline_node_count",
+        "total_words" = "total_words" + excluded."total_words",
+        "updated_at" = CURRENT_TIMESTAMP;
+    INSERT INTO "user_stats_counters" ("user_id", "project_count", "chapter_count", "outline_node_count", "total_words", "updated_at")
+    SELECT "user_id", 0, 1, 0, NEW."word_count", CURRENT_TIMESTAMP
+    FROM "novel_projects" WHERE "id" = NEW."project_id"
+    ON CONFLICT ("user_id") DO UPDATE SET
+        "project_count" = "project_count" + excluded."project_count",
+        "chapter_count" = "chapter_count" + excluded."chapter_count",
+        "outline_node_count" = "outline_node_count" + excluded."outline_node_count",
+        "total_words" = "total_words" + excluded."total_words",
+        "updated_at" = CURRENT_TIMESTAMP;
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_counter_outline_insert" AFTER INSERT ON "outline_nodes"
+BEGIN
+    INSERT INTO "user_stats_counters" ("user_id", "project_count", "chapter_count", "outline_node_count", "total_words", "updated_at")
+    SELECT "user_id", 0, 0, 1, 0, CURRENT_TIMESTAMP
+    FROM "novel_projects" WHERE "id" = NEW."project_id"
+    ON CONFLICT ("user_id") DO UPDATE SET
+        "project_count" = "project_count" + excluded."project_count",
+        "chapter_count" = "chapter_count" + excluded."chapter_count",
+        "outline_node_count" = "outline_node_count" + excluded."outline_node_count",
+        "total_words" = "total_words" + excluded."total_words",
+        "updated_at" = CURRENT_TIMESTAMP;
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_counter_outline_delete" AFTER DELETE ON "outline_nodes"
+BEGIN
+    INSERT INTO "user_stats_counters" ("user_id", "project_count", "chapter_count", "outline_node_count", "total_words", "updated_at")
+    SELECT "user_id", 0, 0, -1, 0, CURRENT_TIMESTAMP
+    FROM "novel_projects" WHERE "id" = OLD."project_id"
+    ON CONFLICT ("user_id") DO UPDATE SET
+        "project_count" = "project_count" + excluded."project_count",
+        "chapter_count" = "chapter_count" + excluded."chapter_count",
+        "outline_node_count" = "outline_node_count" + excluded."outline_node_count",
+        "total_words" = "total_words" + excluded."total_words",
+        "updated_at" = CURRENT_TIMESTAMP;
+END;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TRIGGER IF EXISTS "trg_counter_project_insert";
+        DROP TRIGGER IF EXISTS "trg_counter_project_delete";
+        DROP TRIGGER IF EXISTS "trg_counter_project_words";
+        DROP TRIGGER IF EXISTS "trg_counter_chapter_insert";
+        DROP TRIGGER IF EXISTS "trg_counter_chapter_delete";
+        DROP TRIGGER IF EXISTS "trg_counter_chapter_update";
+        DROP TRIGGER IF EXISTS "trg_counter_outline_insert";
+        DROP TRIGGER IF EXISTS "trg_counter_outline_delete";
+        DROP TABLE IF EXISTS "user_stats_counters";"""
+
+
+MODELS_STATE = (
+    "eNrtXWlz3LgR/StT+iRX7BXvYytJla5dK7Elly0l2diuKZAEJcYjckJy7NWm/N+DBi/wGh"
+    "FzkTOmP6g8JJozfGg0Gq8bjf8dPQYOnkU/3UU4PPp58r8jHz1i8p/S9ZeTIzSfF1fhQoys"
+    "GW24IC3oFWRFcYjsmFx00SzC5JKDIzv05rEX+ND000JXJePTQpNk/dPCMDQD5JzAJoKef1"
+    "9voiFJ/LRQdcOChgvf++8CT+PgHscP9Od+/Ewue76Df8dR9nH+Zep6eOaU3sZz4AH0+jR+"
+    "mtNrV378C20Iv8Ga2sFs8egXjedP8UPg5609P4ar99jHIYoxPD4OF/CS/mI2S8HI3jv5pU"
+    "WT5CcyMg520WIGUIH0cqSuLqoopTJ24APi5JdF9GXv4RtfSaKiK4asKQZpQn9VfkX/nrxq"
+    "gUMiSNG4vj36Tu+jGCUtKKQFhtDR9P81JM8fUNgMJStTAZT89CqgGXzbRpSolCI4HVF9RL"
+    "9PZ9i/jx/IR1VYAuE/Tt+fvz59f6wKL+DZARkMyRC5Tu9I9BagXKD6gKIH7EznKIq+BaHD"
+    "A26D6GYwzi4UIBcD+jmUVQkJ5K9laxRlTHDXDCW7ohuCuAruomR0AJ60akWe3itDjx+RN+"
+    "MBPBfoW5VNAQGwlrUamEIXLSat2sEUanrse/YXXuvAyqwEaQrYRhRX02SVYGq6wjAMQxjM"
+    "uMDM2u/OBFDrftSEpWE6Evkr6dIqWEpdsJTasZRqWHrRlDgm3tcGQM8CghvyWzwBVq4CrE"
+    "UEt4VsbghqOiq5YFYlYko11yaGVnNkqxvGSzA9u7l5Aw95jKL/zuiFq9sKuHdvzy6JTaCY"
+    "k0ZejFmnoUAafSXuQ8ijt4VE7yZANWWYqQTbvXv/ZiXNVdUuqquq7boL98qQ2iGG15+iuA"
+    "7rBbkTe4+4GdqyZAVeJxX9KfvP7j0F0SJ/STuixqpLVNpUXaUj7OTNnBt/9pRqwBLUb6/e"
+    "Xn64PX37rqThF6e3l3CHGqjHp8rVY63SQflDJv+8un09gY+Tf99cX1Jcgyi+D+k3Fu1u/3"
+    "0Evwkt4mDqB9+myGEm+OxqBlepuxdzZ8XuLksOrbs1zVWgoy3hB+5u+uNhlep+YdZYcMFC"
+    "9pdvKHSmpTuFWkQ4jglEUcMMlkr+8vf3eIYo4PXuZ5bzH5In7Xy4i7pMfAJBVdilGNfcVV"
+    "xloQykoA3L+q1H6bF6Bfnonr4LfDd8UwNWLcwIA+VygmTKdh83UWJZ4O27Gu5EmrDNnyVQ"
+    "PuZO3Bf8dPT5cPmUApWh8CkAOIeflDbvf4XP6pepSngwS9CvaLZo8PBv8e8tipkLDAtUVZ"
+    "DttX3628t/3ZamwAy647en/3pRmgbf3Fz/mjVnoD5/c3M2uqKjKzq6oofripZ6G/wUromd"
+    "kXh+dh+yf7mJqb7m1ZeRrcP6SxBi797/O36i6F6RX4R8Gy933g/BayeXQ/Qt9ypZNSIvTV"
+    "4VJ+zS+emH89OLy6Pv7eujbfr/18FXPHsXBv/B1FWvLQBK95euAHxoOZ0nTTsvAVRbcMEx"
+    "AFtlGroJkRRc8+krC4FuQj9OJDW72Lu3H3sxH5+fC/TvnJYUyRB0uGIaq1H73bj9ZeR+ze"
+    "9nfy+H918R6519LqEs2zCM3a7BqF0vBAgsIZc25wL9k/yMhdRt3Wo2pb0tYqP4aca1iM0F"
+    "+kdWNIkCK65qgzLb1FgMdSVLfK14EfFocCGxwwirEyI3PnrOWuiSBQFBYbXcis2HW0eaYK"
+    "QJRprgQGkC8qIx9mOeKYoRGdT0r4qGCplpljnMSQqy+giMiya0W9dcZaHd8TJCI9qWCmm8"
+    "qk6GkI4dijwSdxl/YVZgKCTL3elKoDbKroTtJnWZXZEVSPeDrv2A5jHlcRq8qr99uLluMQ"
+    "1lsQqkdz5514+OZ8cvJzMvij9vzdH6s7vwbUB2Yi28Wez50U/whX9t9L10hAVIbzOkqwvq"
+    "FbRks3NbEcBpuRWpGoyKeYcHVK3IIsLTDOboKYrxI2cWXPMDdpgO10qRsflwiqu7GUdZdB"
+    "Cs8VwrMT5DypN7xDECrohnrLAyQxoo8LXNA0UVFTkz/5oMsU3XFQx4w2RtSFq4MB2Tq+Zg"
+    "B09zUOTMu9+TuAizaFl5U4kpSbKsS4KsGaqi66oh5PNF/dayiePs6lcYDKXOaImfdMmKCh"
+    "bxzPMx8VXJe6+XGnWTPOqafOozyFKs69dMjWqYnNdE6Dx5yiGiA7GYTeCTPGfXOxckBbbc"
+    "2CpmATq+vnvzJvFLYFuDjABJ+L9qQ/MiRf/FgHPw2EHZEIKrjNn2CFzNTnQKwJmSDp6DJe"
+    "W+hGCZbCxt8moCE5koZhwccTNgwtMNpSk2t87zPvkwkYK7o8kCua9gwaR9KWV/dYx0mEpF"
+    "6GlZ14+/woSEX5BHSqIpTRK36Di1BczldElMftFxhOnc/qJbkPDjURrTzCY7FJJlfvYhiD"
+    "yK5ecDyiJUsGxxZb1tOaoI+pyAwbPtihUaQOobMxSKgEyiyYkKn6Q6e5Kq5zBY7n2O6JbM"
+    "zxjR3dLEXEI5j+iekA+KasAUbIjDJB5z293dPLMifZOOimBn06EmmzBBYsMFhkBxshxbWI"
+    "cKrywUYYdn+blp1syLpvj3OSJv6PBvTWQlB7Y5kTijKl3cCwnUd1dslHJDC/4N0jFjxHKM"
+    "WI4RywONWJaWJV2ns9JSpvdAjyRrZXcCjCq0/gslUs3azZ7ms/J6sCvW5UXkoDLJeQmnLW"
+    "eSz4t04zWTyavZy/vO6FWTystK1ZxXXjcSGwCWj0feCyvRGXPWaPKm8rN8rDdzyJN2yefv"
+    "dT80cf27ovo3m0Ba2IU2shSgBH4Tu5SNg6AW0tFGUNwmkZ0B2kBiM1i3E9hsBKfT/nEmAl"
+    "7llyUFPmLAeilfzf0M4KhVC6gNVUCVMLxmaTQUbOhs3hXtN0gXFoC1NlxbZ5l6YkkqSiHJ"
+    "QptqrEZZZ3kN/uLRIgIjV73F+oGLJgzv7q4uWpZai0YY4fJPILXLkmvwfZntSYLoCjZgq7"
+    "YpwiJLwKDzrqhmdzfCb1AWT07WTeyKiL784XDRJSsxPC66h3zX1TJzGjNwlphdg3KkbnZX"
+    "0yV7Q4q7ndoDZUvd3RjXBYewxCwi8aVkNRfsiSq7etJFYv8U9ZiEvEk0vxIfji+wwkjsDk"
+    "fxOVuiS4qR2YxCXcttNAtCXppFPUfZMTJ+0hAxpCgYJu5Tr/d+B1g5niIi2vLEDh7nsOp2"
+    "TpA3LX7RuC9sjLKMUZYxyrK9KEtl4c4xwzVI9h5x2Q0VNYZfxvDLGH6p2oC9DsL0y2FXu6"
+    "HBtJb64sPl7QTyxPuqsVSkzDcT40U+/VJqnEnf70KOF7nvz1RTam5YTcVuTqs/LobAX64D"
+    "H7+A3CjDLlduULAoZ6n75aL5nFQ2uffxKMbE9ydqTi+MTPb2sq55z7nY6Ak4a2WkMgoNZ+"
+    "CsfuDFVrhWC0WePfV8N+DZF1mW2pOdkTpdLFL+RHGxCAt5zR3mHkgw9fdhsPAdvl5hpfaj"
+    "VwzBtmF9p1FWXFFpmMcaZq/MyYQX+GjmxU883VIR249+0QRwpJIdw7oE06fqbiB3fiv9gi"
+    "yPgOthrjIIJaF9GSsuROcl04J0AENIrgyzT/wgbuqP9gheLjCAomo6FDfADsSFTIiOajY2"
+    "xvLgI7878rsjv7vLLPqeuMX92ym/8cJVzLKeo2RVWap/7HWN+NMaNoWMS9F03T2Guc1W6Q"
+    "EY0DWuqr6km9udbAdflvknkdumpikvfmwm+HAKR6xLGWcKvoE+yJnGW+aZhzs2uvZIxYRw"
+    "M8fMYaZpxnk0RdE0ChahjTdUa4VtulMngXYW70GnnTL4S2AllQf3HCy2UOHGINtJXCJHbF"
+    "l8goW1Q5ximnfwKgGLJMCUVLXrHLxoFqoFMmS6a1uB+jNJrEKVgRBLr+TPeMmapPIXgaec"
+    "H/nNfClb2EOmKUuqS2cWjKDMjaWYVR608bC6xHRMCygTy5SW5yxd/lwLlzQJJ3GTNvExfr"
+    "KV+Emm/9yVa2qCAzjvvlHJj2meNSVuLAQFP3TBoqPJOqHMsp3cSTT/xTAOHCfflTy8u3az"
+    "IrtLHFGf64fCtByLr0Shp2XbgRSxKU0dAz+WBNgiyHfgwZuVGRbYOfVEc0jcYULuRVPLc7"
+    "wwqcyFZvxlbGriQ6ss3OwEjeVrRuJ9JN5H4n3rxHvLmqeri9Ys3X+a72oEypYOhVgR3Bbp"
+    "/sFdh3DZMnNeVchN0rf7TQJW6deWoduBGa+o5T5DvA3qsMZzNw/jIR1GW49QLCMk2TBGF0"
+    "IyI/rXyKCGgAV3NnVVCAjJUnkFppiIaQCnaFgWzvhF9nkF9fKywmm62KL1RdyyO8mbbT3S"
+    "gWM6dd3+M1o8wHTqA2GgSrZi4AyUTSC5D8InHn1mZQYFtioJWmJajzOrAWbzhBgPEUoppx"
+    "9U2SYfNEfGg+Kzf/TNBMe0QBfs8XNhtkyibkkmtSpJRRyOljAybAj3cfTeuAlh3IQwbkIY"
+    "NyGMmxC69slI0o8k/UjSHxBJv9KJhXt/2NwwUlW3mv33Lgwe5/F7bAeh08Szle4vpdjmtO"
+    "U0pE07s2ua7AhZ6rVhweKqlG7XcNLws0JlYq5LcQHmEFNm/qH5cpUSupW7jCD2nXmQ0lts"
+    "swMi0wqQOY9U3V6d3Yg3jLWD82o747nyEbV7X0TpeSvdGcRiM0dRtjgpN2MKQq8HhCTnh0"
+    "8Tu8hDStYEB1C4OD9ZvG59h8lO0oHOj31FbADI50ZiX5Avqe/0AUUPXJVHG6V754qXDYBy"
+    "uWlVscEEYcFehRvWlA7ccOpSNnHDcKt1IHB3RpNs/12xZEQMuyuo18yDfy7QO+iKC1GSBH"
+    "oISZ9eLYuAd4FX7BQGFJeEAcV6GJD1wruCzMoMoGyV5dLCF/SYawD63RWtm+4WR39wB1xV"
+    "tUvAVVXbA65wr75TG0BZhE27UmcBWrJXm5GrAO6C4K6X+Vgys91ZqmxLSf30tefWi5u7sz"
+    "eXk3fvL8+vPlylJGtO49Cb5Vzn95enb/aaR+3ss480ak6jchBr26SBboMv2L+LyM12KqjW"
+    "ZikdFEPr6QKa83FC9GvKE44p0kyI54ihTpI7YodG2mekfUba50ekfdLlErV/ER++ZbkB7F"
+    "uorK5SA9vdPdo0tjayH4iB5ca2Jtf3MT2K7kDMSHLoOUhylv6bJPsOD/bkoBW6G50b+ibZ"
+    "AewaUSFLWpNEgaUMekc6DmI04we5KjYA0yHI1gD0Noq5FqeZwIqr0s0ZCMOBo3PzAxYNmu"
+    "JvlvYPEPPh5klaSQUrOOsLMhtNfUOn221iDbtj0mujWjyyXiPrNRIyIyHT4ya40/kck//C"
+    "jsVl2+CYZh03wqFcYqWTton/BIVndBlxHDLC9wDYIleibughi8RrRuUnJX60YSAr851V2U"
+    "ZNW+eS62yb5MhGcFFegqGXxcqPYR/nSFJ29LGq0zW8Tmt/0WGjYCH5a+VnQtKBpCZxKtUS"
+    "Wit9Zae25sd0L6vsNVbu2hHJ9Ih9umrhPQ+2JtfzWrNZ23tyyMe88B8pL7xs2DjPsB5M8Q"
+    "6mcnAx6/Q0flar3TG8oh3Nk/8ginak+reZQhLzPip1rKGwXctIlAfp82U6DqI+xzpKywHs"
+    "YAtzMAHgYDZbzJ8JEidtugeJaft1g8SaregJ+8gbJGYlWZqNpd9UW3CTGf4kv2RC9khasU"
+    "NQEa2OYBT8W6PHf0/WXYsZCtNNodbC/pIUvmbjlKV4W06K5bzN52WB6uYvaIhZtzQ8oHVF"
+    "0a9DCV9XMO/K2FXEBlAShBkxum1KSRLVz5OHYBGeOOhpFdbO6MDZGa2MnVErjJCPrK4oFx"
+    "IDAJgpi6oZcDgWGKO72/PEvPw8+Y38e/X27auLi8nr15MT5vNK3LTWhZrW2plprTH3eGiJ"
+    "GqtkGv9omRqbox/qiRpC+cAVTQUXlT0puL/cjTFWNcaqDiZWFWLyrlHMTWDW5Hq2ICzefR"
+    "OYe5jcJYyZXWNm1wFmdgljWteujcaY07WZnK5B5GWNRXvGoj07oY2TEjJns8BqLzBD73Yp"
+    "L2ORhmsUl2F3B3cuLsMKtTLD7LZji57MpEMYJi08KUN73aUbDZlCz0tI4q41mXm3dK+1jX"
+    "uDtGwB2IfXp68kVetzi3Y7V2sTTbS5KtxmAgM4r43ROuKLQn1bQxB/noTo28kfM886+SOK"
+    "nQGQtFDzkLs0QUmo/8OsygNcp6cnGcXpkMOtSQCa31CezfNR+NSCfCpRPbvqKS2q31HF14"
+    "ZZEXAd4PWPqmoocXn22+3laa0aStYyn/wJymdX16fvf2sonUkbf6+pW7lwivcH5jnuJm0+"
+    "gGwO2XSzrEdTpeW0MdLGFLMxxeyQU7TvIhx+iFEcnQNRSr22mndba7PUx6XBrwiaJ+RrWj"
+    "mzU2o2UxQnURXFVe2sYlGyMSj5C0t30kajG4YaXOBUhdZwSVujfmfe/e4Cf6u7piuH/UxJ"
+    "kmVdEmTNUBVdVw0ht2b1W8vM2tnVr2DZSoPq+byCLO7HS/jX5AYTMuyVaEpT3HjRrMn1TY"
+    "kyOyX6QzNYxHDyLLHjDuaGtFm4b6bfhBr5OrakDF2I/vXPMn/LSq10t70VwQHQzNkqKpms"
+    "EqKFNQvF3cmfJpV9RWVBc3gWfORgRw52x77qKQ49+6HJQ03vLPVLUdHmOVc004iNOpR7ln"
+    "TajsGOE02/kgVE44Fo7bQaI9Izgdkdxe2n0sDQ4AAxbb6fAG4l64t8Y4ybfL72I3oYkb4O"
+    "6FkP1l0cutPr9PL9/6CjPrE="
+)
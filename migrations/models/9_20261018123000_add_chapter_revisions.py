@@ -0,0 +1,132 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "chapter_revisions" (
+    "id" INTEGER PRIMARY KEY AUTOINCREMENT NOT NULL /* 主键 */,
+    "version" INT NOT NULL /* 对应的正文版本号 */,
+    "kind" VARCHAR(8) NOT NULL /* 存储方式: snapshot 完整快照 / delta 反向差异 */,
+    "codec" VARCHAR(8) NOT NULL /* 压缩编码: raw/zlib/zstd */,
+    "data" BLOB NOT NULL /* 压缩后的正文或差异操作（JSON） */,
+    "word_count" INT NOT NULL DEFAULT 0 /* 字数统计 */,
+    "created_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP /* 创建时间 */,
+    "updated_at" TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP /* 更新时间（合并写入时刷新） */,
+    "chapter_id" INT NOT NULL REFERENCES "chapters" ("id") ON DELETE CASCADE /* 所属章节 */,
+    CONSTRAINT "uid_chapter_rev_chapter_931d1b" UNIQUE ("chapter_id", "version")
+) /* 章节修订历史 */;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "chapter_revisions";"""
+
+
+MODELS_STATE = (
+    "eNrtXWtz2ziy/Ssqf3JqkzHfj9TdW2U7nol3Ezvl2PfubJJSgSRocyOTWpJKxrOV/75o8A"
+    "W+ZEIvUgrzwRWRaEo8ABrdpxuN/xw9Bg6eRb/cRTg8ej35z5GPHjH5T+n6y8kRms+Lq3Ah"
+    "RtaMNlyQFvQKsqI4RHZMLrpoFmFyycGRHXrz2At8aPp5oauS8XmhSbL+eWEYmgFyTmATQc"
+    "+/rzfRkCR+Xqi6YUHDhe/9e4GncXCP4wf6cz99IZc938F/4Cj7OP86dT08c0pv4znwAHp9"
+    "Gj/N6bVLP/6VNoTfYE3tYLZ49IvG86f4IfDz1p4fw9V77OMQxRgeH4cLeEl/MZulYGTvnf"
+    "zSoknyExkZB7toMQOoQHo5UpdvqiilMnbgA+Lkl0X0Ze/hG19JoqIrhqwpBmlCf1V+Rf+R"
+    "vGqBQyJI0bi6PfpB76MYJS0opAWG0NH0/zUkzx9Q2AwlK1MBlPz0KqAZfNtGlAwpRXA6ov"
+    "qI/pjOsH8fP5CPqrAEwv87vTl/e3pzrAov4NkBmQzJFLlK70j0FqBcoPqAogfsTOcoir4H"
+    "ocMDboPoZjDOLhQgFxP6OZRVCQnkr2VrFGVMcNcMJbuiG4K4Cu6iZHQAnrRqRZ7eK0OPH5"
+    "E34wE8F+h7KJsCAmAtazUwhS6jmLRqB1OojWPfs7/yagdWZiVIU8A2MnA1TVYJpqYrDEMx"
+    "hMGMC8ys/e5UANXuR01YGqYjkb+SLq2CpdQFS6kdS6mGpRdNiWHifWsA9CwguCG/xRJg5S"
+    "rAWkRwW8jmiqA2RiUX1KpEVKnm2kTRao5sdcN4CaZn19fv4CGPUfTvGb1weVsB9+792QXR"
+    "CRRz0siLMWs0FEijb8R8CHnGbSHRuwpQTRlWKsF2727erTRyVbXL0FXV9rEL98qQ2iGG15"
+    "+iuA7rG3In9h5xM7RlyQq8Tir6S/af3VsKokX+knZkGKsuGdKm6iodYSdv5lz7s6d0BCxB"
+    "/fby/cXH29P3H0oj/M3p7QXcoQrq8aly9VirdFD+kMn/X96+ncDHyT+vry4orkEU34f0G4"
+    "t2t/88gt+EFnEw9YPvU+QwC3x2NYOr1N2LubNid5clh9bdmuYq0NGW8BN3N/3x4KW6Xxkf"
+    "Cy5YyP76HYXOtHSnGBYRjmMCUdSwgqWSv/79Bs8QBbze/Yw7/zF50s6nu6jLxCYQVIV1xb"
+    "jWruIqC2UgBW1Y1m89So/VK8hH9/Rd4LvhmxqwamFGGCiXEyRTtvu4iRLLAmvf1XAn0oRt"
+    "/iyB8ik34r7ip6Mvh8unFKgMhU8BwDnspLR5/x4+O75MVcKDcUG/odmiwcK/xX+0DMxcYF"
+    "igqoJsr23T317847a0BGbQHb8//ceL0jL47vrqt6w5A/X5u+uz0RQdTdHRFD1cU7TU22Cn"
+    "cC3sjMTzq/uQ7ctNLPU1q76MbB3WX4MQe/f+3/ETRfeS/CLk23i58X4IVju5HKLvuVXJDi"
+    "Py0uRVccIunZ9+PD99c3H0o90/2qb9fxV8w7MPYfAvTE31mgNQur/UA/Ch5XSeNO3sAqi2"
+    "4IJhALrKNHQTIim4ZtNXHIFuQj9PJDW72Lu1H3sxH5+fC/RvnJYGkiHocMU0VqP2u3H7y8"
+    "j9mt3P/l4O678i1jv7XEJZtmEau12DUbt2BAgsIddozgX6J/kZDanbutWsSntzYqP4acbl"
+    "xOYC/SMrmmQAK65qw2C2qbIYqidLbK14EfGM4EJihxFWJ0RufPScttAlCwKCwmq5FZsPt4"
+    "40wUgTjDTBgdIE5EVj7Mc8SxQjMqjlXxUNFTLTLHOYixRk9REYF01ot/pcZaHd8TJCI9qW"
+    "Cmm8qk6mkI4dijwSdxl/YTwwFBJ3d7oSqI2yK2G7ybHMemQF0v2gaz+geUx5nAar6m8fr6"
+    "9aVENZrALpnU/e9ZPj2fHLycyL4i9bM7T+x134NiA7sRbeLPb86Bf4wv9ttL10hAVIbzOk"
+    "yzfUKmjJZufWIoDTci1SVRgV9Q4PqGqRRYSnGczRUxTjR84suOYH7DAdrpUiY/PhFFd3M4"
+    "6y6CDw8VwrUT5DypN7xDECrohnrrAyQ5oo8LXNE0UVFTlT/5oMsU3XFQx4w8Q3JC1cWI7J"
+    "VXOwk6c5KHLm3e9JXIRxWlbeVGJKkizrkiBrhqroumoI+XpRv7Vs4Ti7/A0mQ6kzWuInXb"
+    "KigkU883xMbFXy3uulRl0nj7oin/oMshR+/ZqpUQ2L85oInSdPOUR0IBazCXyS5+x654Kk"
+    "wJYbW8UsQMdXd+/eJXYJbGuQESAJ/1dtaF6k6L8YcA4eOykbQnCVOdsegavpiU4BOFPSwX"
+    "KwpNyWECyTjaVNXk1gIRPFjIMjZgYseLqhNMXm1nneZx8WUjB3NFkg9xUsmLQvpeyvjpEO"
+    "S6kIPS3r+vE3WJDwC/JISTSlSWIWHae6gLmcusTkFx1HmK7tL7oFCT8dpTHNbLFDIXHzsw"
+    "9B5FEsvxxQFqGCZYsr623LUUUYzwkYPNuuWKEBpL4xU6EIyCQjORnCJ+mYPUmH5zBY7n2O"
+    "6JbUzxjR3dLCXEI5j+iekA+KasASbIjDJB5z3d1dPbMifZOOimBny6Emm7BAYsMFhkBxsh"
+    "xb8EOFVxaKsMPjfm6aNfOiKf5jjsgbOvxbE1nJgW1OJMaoSp17IYH67pKNUm7I4d8gHTNG"
+    "LMeI5RixPNCIZckt6bqclVyZ3gM9kqyVzQlQqtD6r5RINWs3e1rPyv5gV6zLTuSgMsl5Ca"
+    "ctZ5LPi3TjNZPJq9nL+87oVZPKy4OqOa+8riQ2ACwfj7wXWqIz5qzS5E3lZ/lYb+aQJ+2S"
+    "z9/rfmji+ndF9W82gbTQC21kKUAJ/CZ2KRsHQS2ko42guE0iOwO0gcRmsG4nsNkITqf940"
+    "wEvMovSwp8xID1Ur6a+xnAUasWUBuqgCpheM3SaCjY0Nm8K9pvkC4sAGttuLbOMvVEk1QG"
+    "hSQLbUNjNco6y2vwF48WERi56i3WD1w0YXh3d/mmxdVaNMIIl38BqV2WXIPvy3RPEkRXsA"
+    "FbtU0RnCwBw5h3RTW7uxF+g7J4cuI3sR4RffnD4aJLWmJ4XHQP+a6rZeY0ZuAsUbsG5Ujd"
+    "7K6mS/aGBu52ag+UNXV3ZVwXHIKLWUTiS8lqLugTVXb1pIvE/inqMQl5k2h+IzYcX2CFkd"
+    "gdjuJzukSXFCPTGcVwLbfRLAh5aRa1HGXHyPhJQ8SQomCYuM9xvfc7wMrxFBHRlid28DgH"
+    "r9s5Qd60+EXjvrAxyjJGWcYoy/aiLBXHnWOFa5DsPeKyGypqDL+M4Zcx/FLVAXsdhOmXw6"
+    "52Q4NqLfXFx4vbCeSJ91VjqUiZbybGi3z6pdQ4k77fhRwvct+fqabU3LCait2cVn9cTIG/"
+    "XgU+fgG5UYZdrtygYFHOUvfLRfM5qWxy79NRjIntT4Y5vTAy2dvLuuY952KjJ+CslZHKDG"
+    "g4A2f1Ay+2wrVaKPLsqee7Ac++yLLUnuyM1KmzSPkTxcUiOPKaO8w9kKDq78Ng4Tt8vcJK"
+    "7UevGIJtg3+nUVZcUWmYxxpmr8zJghf4aObFTzzdUhHbj37RBDCkkh3DugTLp+puIHd+K/"
+    "2CLI+A62GuMggloX2ZKy5E5yXTgnQAQ0iuDLNP/CBu6o/2CF4uMICiajoUN8AOxIVMiI5q"
+    "NjbG8uAjvzvyuyO/u8ss+p64xf3bKb/xwlWMW89Rsqos1T/2ukbsaQ2bQsalaLruHsPaZq"
+    "v0AAzoGldVX9LN7U62gy/L/JPIbVPTlBc/NxN8OIUj1qWMswG+gT7ImcZb5pmHOze69khF"
+    "hXAzx8xhpmnGeTRF0TQKFqGNN1RrhW26UyOBdhbvQaedMvhLYCWVB/ccLLZQ4cYg20lcIk"
+    "dsWXyChbVDnGKad/AqAYskwJRUtescvGgWqgUyZLprW4H6M0msQpWBEEuv5M94yaqk8heB"
+    "pZwf+c18KVvYQ6YpS6pLVxaMoMyNpZhVHrTxsLpEdUwLKBPNlJbnLF3+UguXNAkncZM28T"
+    "F+spX4STb+uSvX1AQHcN594yA/pnnWlLixEBT80AWLzibrhDLLdnInGfkvhnHgOPmu5OHd"
+    "RzcrsrvEEfW5fihUy7H4ShR6ctsOpIhNaekY+LEkwBZBvgMP3qzMsMDOqSeaQ+IOE3Ivml"
+    "qe44VJZS404y9jUxMfWmXhZiNoLF8zEu8j8T4S71sn3lt8nq4mWrN0/2m+qxEoWzoUYkVw"
+    "W6T7B3cdwmXLzHl1QG6Svt1vErBKv7ZM3Q7MeGVY7jPE26AOazx38zQe0mG09QjFMkKSDW"
+    "N0ISQzon+NDGoIWHBnU1eFgJAslVdgiomYBnCKhmXhjF9kn1dQLy8rnKaLLVpfxC2bk7zZ"
+    "1iMdOKZT1/U/M4oHmE59IAxUSVcMnIGyCST3QfjEM55ZmUGBrUqClqjW40xrgNo8IcpDhF"
+    "LK6QdVtskHzZHxoPjsn30zwTEt0AV7/FxYLZOoW5JJrUpSEYejJYwMG8J9HL03bkIYNyGM"
+    "mxDGTQjjJoSufTKS9CNJP5L0B0TSr3Ri4d4fNjeMVNWtZv99CIPHeXyD7SB0mni20v2lFN"
+    "uctpyGtGlndk2THSFLvTYscK5K6XYNJw0/K1Qm5roUF2AOMWXWH5ovVymhW7nLCGLfmQcp"
+    "vcU2OyAyrQCZ80jV7dXZjXjDWDs4r7YznisfUbv3RZSe19KdQSw2cxRli5NyM6Yg9HpASH"
+    "J++DTRizykZE1wAIWL85PF69p3mOwknej82FfEBoB8riT2BfnS8J0+oOiBq/Joo3TvXPGy"
+    "CVAuN60qNqggLNircMOa0oEbTk3KJm4YbrVOBO7OaJLtvyuWzIhhdwW1mnnwzwV6B11xIU"
+    "qSQA8h6dPLZRHwLvCKncKA4pIwoFgPA7JWeFeQWZkBlK2yXFr4gh5zDUB/uKR1093i6A/u"
+    "gKuqdgm4qmp7wBXu1XdqAyiLsGlX6ixAS/ZqM3IVwF0Q3LWbjyUz252lyraU1E9fe219c3"
+    "139u5i8uHm4vzy42VKsuY0Dr1ZznW+uTh9t9c8amebfaRRcxqVg1jbJg10G3zF/l1EbrZT"
+    "QbU2S+mgGFpPF9CcjxOiX1NecEyRZkI8Rwx1ktwROzTSPiPtM9I+PyPtk7pLVP9FfPiW5Q"
+    "awb6HiXaUKtrt5tGlsbWQ/EAXLjW1Nru9jehTdgZiR5NBzkOQs/TdJ9h0e7MlBK3Q3Ojf0"
+    "TbID2DWiQpa0JokCSxn0jnQcxGjGD3JVbACqQ5CtAYzbKOZyTjOBFb3SzSkIw4Gjc/MDFg"
+    "2a4m+W9g8Q9eHmSVpJBSs46wsyG019Q6fbbcKH3THptdFRPLJeI+s1EjIjIdPjJrjT+RyT"
+    "/8KOxWXb4JhmHTfCoVxipZO2if0EhWd0GXEcMsL3ANgiV6Ju6CGLxGpG5ScldrRhICuznV"
+    "XZRk1b55LrbJvkyEYwUV6CopfFyo9hH+dIUnb0sapTH16ntb/otFGwkPy18jMh6URSkziV"
+    "agmtlb6yU1vzY7qXVfYaK3ftiGR6xD71WnjPg63J9exrNo/2ngzyMS/8Z8oLLys2zjOsB1"
+    "O8g6kcXKw6Pc2f1Wp3DK9oR/PiP4iiHen420whiXkflTrWGLBdy0iUJ+nzZToOoj7HOoOW"
+    "A9jBFuZgAsDBbLaYPxMkTtp0DxLT9usGiTVb0RP2kTdIzEqyNBtLv6m24CYr/El+yYTskb"
+    "Rih6AiWh3BKPi3Rov/nvhdixkK002h1sL+mhS+ZuOUpXhbTorlvM2XZYHq5i9oiFm3NDwg"
+    "v6Lo16GEryuYd2XsKmIDKAnCzBjdNqUkier15CFYhCcOelqFtTM6cHZGK2Nn1Aoj5DOrK8"
+    "qFxAAAZsqiagYcjgXK6O72PFEvrye/k3+v3r9/9ebN5O3byQnzeSVuWutCTWvtzLTWmHs8"
+    "tESNVTKNf7ZMjc3RD/VEDaF84IqmgonKnhTcX+7GGKsaY1UHE6sKMXnXKOYmMGtyPWsQFu"
+    "++Ccw9TO4SxsyuMbPrADO7hDGta9dKY8zp2kxO1yDyssaiPWPRnp3QxkkJmbNZYLUXmKF3"
+    "u5SXsUjDNYrLsLuDOxeXYYVamWF227FFT2bSIQyTFp6Uob3u0o2GTKHnJSRx15rMvFu619"
+    "rGvUFatgDs49vTV5Kq9blFu52rtclItLkq3GYCAzivjRl1xBaF+raGIL6ehOj7yZ8zzzr5"
+    "M4qdAZC0UPOQuzRBSaj/w6zKE1ynpycZxemQw61JACO/oTyb56PwqQX5VKJ6dtVTWlS/4x"
+    "BfG2ZFwHWA1z+qqqHE5dnvtxentWooWct88Scon11end783lA6kzb+URtu5cIp3p+Y57ib"
+    "tPkAsjlk082yHk2VltPGSBtTzMYUs0NO0b6LcPgxRnF0DkQptdpq1m2tzVIblwa/ImiekK"
+    "9p5cxOqdlMUZxkqCiuamcVi5KNQclfcN1JG41uGGowgdMhtIZJ2hr1O/Pudxf4W900XTns"
+    "Z0qSLOuSIGuGqui6agi5NqvfWqbWzi5/A81WmlTP5xVkcT9ewr8mN5iQYa9EU5rixotmTa"
+    "5vSpTZKdEfmsEihpNniR53MDekzcJ9M/0m1MjXsSVl6EL0r3+W+XtWaqW77q0IDoBmzryo"
+    "ZLFKiBZWLRR3J3+ZVPYVlQXN4WnwkYMdOdjdbyeERekGf/OipJeathKWmjy3jZAucmHaeq"
+    "UthIoLU5lYpXRnnkHLr7nSM9sGm4Vgq6CmC0I26BRM/69rYllCcR0np2AtOAeIKAolOzpP"
+    "FzW6cx7MZ8M1ZJqcZGYkQ9tzNMlAGR3R9r2G6xiZn6xgmT3CKG+TUhn0hKn0BG6H6jpXkK"
+    "gqs+lb0k2QpmZCvrGEVXrykVR8J/wuXVXN7Lck2yXb31WwK/yUDkmdzYR1xx2M34jfAh3+"
+    "ZTxXcFcpxRnk3WFkJAZAIFkuLcEIgzrNlLA0OaOUdEkxsglDJrvej3X11Ws6j6udoM7aDy"
+    "AOwESciHqkpzkJ7utJ5KN59BDEkzb9MDmZEM0fo0mbWhpA8GAM0OwgQHMIMQJWo2gSgM0u"
+    "r5oC4zvhzMDdgFOtNlREp8eIArh03N52WahvL5vx5goucwwtjKGF8VSzjTrneRFNunuR+B"
+    "SgIEWTprbQY7Aq1Uy4yJWDcunHCgfjZvy924zfD+10ikPPfmhim9I7S0kmVLR5jlnK4N9o"
+    "HHPPaIl2DIZCRrQ7Ze1sxK7dsu4obn8HF0wNDhDT5vsJ4FY2G5JvjHGT89N+MjQj0te50O"
+    "vBuouznnuNavz4L+FEF7Q="
+)
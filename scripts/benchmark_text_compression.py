@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+基准测试：章节正文压缩前后的数据库大小和读取延迟
+
+功能：
+1. 在临时目录中建立两个只含章节表的 SQLite 数据库，分别以明文和压缩格式（CompressedTextField 的写入格式）写入相同的正文
+2. 正文默认随机生成，也可用 --db 从已有数据库读取章节正文
+3. 对比 VACUUM 后的文件大小、按主键随机读取单章的延迟（含解压）、顺序读取全部正文的耗时
+
+使用方法：
+    cd /home/devbox/project/lingma
+    uv run python scripts/benchmark_text_compression.py
+    uv run python scripts/benchmark_text_compression.py --chapters 2000 --length 8000
+    uv run python scripts/benchmark_text_compression.py --db ./data/lingma.db
+"""
+
+import argparse
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from src.backend.core.compression import default_codec, pack_text, unpack_text
+
+_SCHEMA_SQL = 'CREATE TABLE "chapters" ("id" INTEGER PRIMARY KEY, "title" VARCHAR(200) NOT NULL, "content" TEXT NOT NULL)'
+
+# 生成正文用的词句（模拟小说正文：常用词反复出现，句子组合随机）
+_PHRASES = (
+    "他抬起头", "望向远处的山峦", "风从林间穿过", "带着一丝潮湿的寒意", "她沉默了许久",
+    "终于开口说道", "城门外的火光", "映红了半边天", "少年握紧了手中的剑", "心中却没有半分把握",
+    "长街上人来人往", "谁也没有注意到那个角落", "师父的话又在耳边响起", "这一战", "避无可避",
+    "夜色渐深", "客栈里的灯火一盏盏熄灭", "他忽然笑了", "笑意却未达眼底", "远处传来马蹄声",
+)
+_PUNCTUATION = ("，", "，", "。", "。", "！", "？", "……")
+
+
+def generate_text(length: int, rng: random.Random) -> str:
+    """随机生成约 length 个字符的正文（按段落换行）"""
+    parts: list[str] = []
+    size = 0
+    while size < length:
+        sentence = rng.choice(_PHRASES) + rng.choice(_PUNCTUATION)
+        if rng.random() < 0.08:
+            sentence += "\n\n"
+        parts.append(sentence)
+        size += len(sentence)
+    return "".join(parts)
+
+
+def load_texts(db_path: str, limit: int) -> list[str]:
+    """从已有数据库读取章节正文（兼容已压缩的行）"""
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        rows = conn.execute(
+            'SELECT "content" FROM "chapters" WHERE "content" != \'\' ORDER BY "id" LIMIT ?', [limit],
+        ).fetchall()
+    finally:
+        conn.close()
+    return [unpack_text(row[0]) for row in rows]
+
+
+def build_database(path: Path, texts: list[str], compressed: bool, min_length: int) -> float:
+    """
+    写入测试数据库
+
+    Returns:
+        float: 写入耗时（秒，含压缩）
+    """
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute(_SCHEMA_SQL)
+        started = time.perf_counter()
+        conn.executemany(
+            'INSERT INTO "chapters" ("id", "title", "content") VALUES (?, ?, ?)',
+            [
+                [index + 1, f"第{index + 1}章", pack_text(text, min_length) if compressed else text]
+                for index, text in enumerate(texts)
+            ],
+        )
+        conn.commit()
+        elapsed = time.perf_counter() - started
+        conn.execute("VACUUM")
+    finally:
+        conn.close()
+    return elapsed
+
+
+def measure_reads(path: Path, count: int, reads: int, rng: random.Random) -> dict[str, float]:
+    """
+    测量读取延迟（毫秒）
+
+    Returns:
+        dict: 单章读取的平均值、p50、p95，以及顺序读取全部正文的耗时
+    """
+    conn = sqlite3.connect(path)
+    try:
+        ids = [rng.randint(1, count) for _ in range(reads)]
+        latencies = []
+        for chapter_id in ids:
+            started = time.perf_counter()
+            (value,) = conn.execute('SELECT "content" FROM "chapters" WHERE "id" = ?', [chapter_id]).fetchone()
+            unpack_text(value)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        for (value,) in conn.execute('SELECT "content" FROM "chapters" ORDER BY "id"'):
+            unpack_text(value)
+        scan = (time.perf_counter() - started) * 1000
+    finally:
+        conn.close()
+
+    latencies.sort()
+    return {
+        "mean": statistics.fmean(latencies),
+        "p50": latencies[len(latencies) // 2],
+        "p95": latencies[int(len(latencies) * 0.95)],
+        "scan": scan,
+    }
+
+
+def main():
+    """主入口"""
+    parser = argparse.ArgumentParser(description="章节正文压缩前后的数据库大小和读取延迟")
+    parser.add_argument("--chapters", type=int, default=1000, help="章节数（默认 1000）")
+    parser.add_argument("--length", type=int, default=6000, help="每章字符数（随机生成时，默认 6000）")
+    parser.add_argument("--reads", type=int, default=500, help="随机读取次数（默认 500）")
+    parser.add_argument("--min-length", type=int, default=1024, help="压缩的最小长度（默认 1024）")
+    parser.add_argument("--db", help="从已有数据库读取章节正文（只读）")
+    parser.add_argument("--seed", type=int, default=42, help="随机种子")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    if args.db:
+        texts = load_texts(args.db, args.chapters)
+        if not texts:
+            print(f"{args.db} 中没有章节正文")
+            sys.exit(1)
+    else:
+        texts = [generate_text(args.length, rng) for _ in range(args.chapters)]
+
+    total_chars = sum(len(text) for text in texts)
+    print(f"章节数: {len(texts)}，总字符数: {total_chars}，压缩编码: {default_codec()}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {}
+        for label, compressed in (("明文", False), ("压缩", True)):
+            path = Path(tmp) / f"{'compressed' if compressed else 'plain'}.db"
+            write = build_database(path, texts, compressed, args.min_length)
+            reads = measure_reads(path, len(texts), args.reads, random.Random(args.seed))
+            results[label] = {"size": path.stat().st_size, "write": write * 1000, **reads}
+
+    print(f"{'':6}{'文件大小':>14}{'写入(ms)':>12}{'单章平均(ms)':>14}{'p50(ms)':>10}{'p95(ms)':>10}{'全部读取(ms)':>14}")
+    for label, result in results.items():
+        print(
+            f"{label:6}{result['size'] / 1024 / 1024:>12.2f}MB{result['write']:>12.1f}"
+            f"{result['mean']:>14.3f}{result['p50']:>10.3f}{result['p95']:>10.3f}{result['scan']:>14.1f}",
+        )
+    ratio = results["压缩"]["size"] / results["明文"]["size"]
+    print(f"压缩后数据库大小为明文的 {ratio:.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+数据迁移脚本：分批压缩已有的章节正文和项目正文
+
+功能：
+1. 按主键分批扫描 chapters.content、novel_projects.content 中未压缩的文本
+2. 长度不小于 TEXT_COMPRESSION_MIN_LENGTH 的文本压缩为带魔数前缀的 BLOB（与 CompressedTextField 写入格式一致）
+3. 每批在一个事务内写入，中断后重新执行会跳过已压缩的行
+4. 使用 --decompress 将压缩的正文还原为明文（关闭压缩或降级前执行）
+
+压缩只改变存储格式，不修改版本号、字数和修订历史；建议在停止服务后执行，
+执行后可运行 VACUUM 回收空间
+
+使用方法：
+    cd /home/devbox/project/lingma
+    uv run python scripts/migrate_compress_text.py
+    uv run python scripts/migrate_compress_text.py --decompress
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from tortoise import Tortoise
+from tortoise.transactions import in_transaction
+
+from src.backend.config.database import TORTOISE_ORM
+from src.backend.config.settings import settings
+from src.backend.core.compression import pack_text, unpack_text
+from src.backend.core.logger import logger
+
+BATCH_SIZE = 200
+
+# 存放长文本的表和列
+TEXT_COLUMNS = (("chapters", "content"), ("novel_projects", "content"))
+
+
+async def migrate_column(table: str, column: str, decompress: bool) -> tuple[int, int]:
+    """
+    分批压缩（或还原）一列
+
+    Args:
+        table: 表名
+        column: 列名
+        decompress: 是否还原为明文
+
+    Returns:
+        tuple: (扫描的行数, 改写的行数)
+    """
+    # 压缩时只扫描明文行，还原时只扫描 BLOB 行
+    source_type = "blob" if decompress else "text"
+    select_sql = (
+        f'SELECT "id", "{column}" AS "value" FROM "{table}" '
+        f'WHERE "id" > ? AND typeof("{column}") = \'{source_type}\' ORDER BY "id" LIMIT ?'
+    )
+    update_sql = f'UPDATE "{table}" SET "{column}" = ? WHERE "id" = ?'
+
+    scanned = rewritten = 0
+    last_id = 0
+    while True:
+        async with in_transaction() as conn:
+            _, rows = await conn.execute_query(select_sql, [last_id, BATCH_SIZE])
+            if not rows:
+                break
+
+            values = []
+            for row in rows:
+                if decompress:
+                    values.append([unpack_text(row["value"]), row["id"]])
+                else:
+                    packed = pack_text(row["value"], settings.TEXT_COMPRESSION_MIN_LENGTH)
+                    if isinstance(packed, bytes):
+                        values.append([packed, row["id"]])
+            if values:
+                await conn.execute_many(update_sql, values)
+
+        scanned += len(rows)
+        rewritten += len(values)
+        last_id = rows[-1]["id"]
+        logger.info(f"{table}.{column}: 已扫描 {scanned} 行，改写 {rewritten} 行")
+
+    return scanned, rewritten
+
+
+async def migrate_compress_text(decompress: bool = False):
+    """压缩（或还原）所有长文本列"""
+    action = "还原" if decompress else "压缩"
+    logger.info("=" * 60)
+    logger.info(f"开始{action}正文")
+    logger.info("=" * 60)
+
+    # 初始化数据库连接
+    await Tortoise.init(config=TORTOISE_ORM)
+
+    try:
+        total = 0
+        for table, column in TEXT_COLUMNS:
+            _, rewritten = await migrate_column(table, column, decompress)
+            total += rewritten
+
+        logger.info("=" * 60)
+        logger.info(f"{action}完成！")
+        logger.info(f"总计: {total} 行")
+        if not decompress and not settings.TEXT_COMPRESSION_ENABLED:
+            logger.warning("TEXT_COMPRESSION_ENABLED 未启用，之后的新写入仍为明文")
+        logger.info("=" * 60)
+
+    except Exception as e:
+        logger.error(f"迁移过程中发生错误: {e}")
+        raise
+    finally:
+        # 关闭数据库连接
+        await Tortoise.close_connections()
+
+
+def main():
+    """主入口"""
+    parser = argparse.ArgumentParser(description="分批压缩已有的章节正文和项目正文")
+    parser.add_argument("--decompress", action="store_true", help="将压缩的正文还原为明文")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(migrate_compress_text(args.decompress))
+    except KeyboardInterrupt:
+        logger.warning("\n迁移被用户中断")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"迁移失败: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
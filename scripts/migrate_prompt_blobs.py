@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+数据迁移脚本：将历史提示词记录的正文转存为压缩 blob
+
+功能：
+1. 分批扫描尚未引用 blob 的提示词记录
+2. 将系统/用户提示词按内容哈希压缩写入 prompt_blobs（相同内容只存一份）
+3. 记录中只保留内容哈希，清空原正文
+4. 重建提示词全文索引（包含启用检索前已存在的正文）
+
+使用方法：
+    cd /home/devbox/project/lingma
+    uv run python scripts/migrate_prompt_blobs.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from tortoise import Tortoise
+from tortoise.transactions import in_transaction
+
+from src.backend.config.database import TORTOISE_ORM
+from src.backend.core.logger import logger
+from src.backend.services.models import PromptRecord
+from src.backend.services.prompt_blobs import hash_text, prompt_blob_service
+
+BATCH_SIZE = 500
+
+
+async def migrate_prompt_blobs():
+    """迁移所有内联提示词正文为 blob"""
+    logger.info("=" * 60)
+    logger.info("开始迁移提示词正文")
+    logger.info("=" * 60)
+
+    # 初始化数据库连接
+    await Tortoise.init(config=TORTOISE_ORM)
+
+    try:
+        migrated_count = 0
+        while True:
+            records = await PromptRecord.filter(
+                system_prompt_hash__isnull=True,
+            ).order_by("id").limit(BATCH_SIZE)
+            if not records:
+                break
+
+            async with in_transaction() as conn:
+                await prompt_blob_service.store(
+                    (text for record in records for text in (record.system_prompt, record.user_prompt)),
+                    conn,
+                )
+                for record in records:
+                    await PromptRecord.filter(id=record.id).using_db(conn).update(
+                        system_prompt="",
+                        user_prompt="",
+                        system_prompt_hash=hash_text(record.system_prompt),
+                        user_prompt_hash=hash_text(record.user_prompt),
+                    )
+
+            migrated_count += len(records)
+            logger.info(f"已迁移 {migrated_count} 条记录")
+
+        indexed_count = await prompt_blob_service.rebuild_search_index()
+
+        logger.info("=" * 60)
+        logger.info("迁移完成！")
+        logger.info(f"总计: {migrated_count} 条记录")
+        logger.info(f"全文索引: {indexed_count} 条正文")
+        logger.info("=" * 60)
+
+    except Exception as e:
+        logger.error(f"迁移过程中发生错误: {e}")
+        raise
+    finally:
+        # 关闭数据库连接
+        await Tortoise.close_connections()
+
+
+def main():
+    """主入口"""
+    try:
+        asyncio.run(migrate_prompt_blobs())
+    except KeyboardInterrupt:
+        logger.warning("\n迁移被用户中断")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"迁移失败: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
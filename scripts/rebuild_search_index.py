@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+维护脚本：重建章节、大纲节点、人物的全文索引
+
+功能：
+1. 清空 chapter_fts / outline_node_fts / character_fts 并按原表重新写入
+2. 章节正文经模型字段读取（兼容压缩存储的正文），按批写入
+3. 写入后合并索引段（optimize）
+
+适用于：启用压缩后补建正文索引、索引与数据不一致、直接修改数据库之后
+
+使用方法：
+    cd /home/devbox/project/lingma
+    uv run python scripts/rebuild_search_index.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# 添加项目根目录到 Python 路径
+project_root = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(project_root))
+
+from tortoise import Tortoise
+
+from src.backend.config.database import TORTOISE_ORM, create_auxiliary_schema
+from src.backend.core.logger import logger
+from src.features.search.backend.services.search_service import search_service
+
+
+async def rebuild_search_index():
+    """重建全部全文索引"""
+    logger.info("=" * 60)
+    logger.info("开始重建全文索引")
+    logger.info("=" * 60)
+
+    # 初始化数据库连接
+    await Tortoise.init(config=TORTOISE_ORM)
+
+    try:
+        # 索引表不存在时（未执行迁移的开发数据库）先创建
+        await create_auxiliary_schema()
+        counts = await search_service.rebuild()
+
+        logger.info("=" * 60)
+        logger.info("重建完成！")
+        for kind, count in counts.items():
+            logger.info(f"{kind}: {count} 行")
+        logger.info("=" * 60)
+
+    except Exception as e:
+        logger.error(f"重建过程中发生错误: {e}")
+        raise
+    finally:
+        # 关闭数据库连接
+        await Tortoise.close_connections()
+
+
+def main():
+    """主入口"""
+    try:
+        asyncio.run(rebuild_search_index())
+    except KeyboardInterrupt:
+        logger.warning("\n重建被用户中断")
+        sys.exit(1)
+    except Exception as e:
+        logger.error(f"重建失败: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,8 +10,9 @@ from openai.types.chat import ChatCompletionChunk
 
 from src.backend.core.cache import config_cache_manager
 from src.backend.core.logger import logger
-from src.backend.core.template import TemplateManager
+from src.backend.core.template import template_manager
 from src.backend.services.prompt_service import prompt_record_service
+from src.backend.services.quota import quota_service
 from src.backend.services.token_statistics import token_statistics_service
 
 
@@ -29,14 +30,21 @@ class AIService:
     def __init__(self):
         """初始化AI服务"""
         # 仅保留无状态的工具类作为实例属性
-        self.template_manager = TemplateManager()
+        self.template_manager = template_manager
         logger.info("AI服务初始化完成")
 
-    async def _get_user_context(self, user_id: int, temperature: float = 0.7) -> Optional[AIConfigContext]:
+    async def _get_user_context(
+        self, user_id: int, temperature: float = 0.7, project_id: Optional[int] = None,
+    ) -> Optional[AIConfigContext]:
         """
         获取用户配置并构建上下文环境
         解决并发问题：不再修改 self 属性，而是返回局部配置对象
+
+        Raises:
+            QuotaExceededError: 用户或项目配额已用完（仅查内存计数器）
         """
+        await quota_service.check(user_id, project_id)
+
         try:
             config = await config_cache_manager.get_user_ai_config(user_id)
             
@@ -75,6 +83,7 @@ class AIService:
         """
         prompt_tokens = 0
         completion_tokens = 0
+        cached_tokens = 0
         
         # 提取system_prompt和user_prompt用于记录
         system_prompt = ""
@@ -113,6 +122,8 @@ class AIService:
                 if chunk.usage:
                     prompt_tokens = chunk.usage.prompt_tokens
                     completion_tokens = chunk.usage.completion_tokens
+                    details = chunk.usage.prompt_tokens_details
+                    cached_tokens = (details.cached_tokens or 0) if details else 0
                     logger.debug(f"收到Usage信息: p={prompt_tokens}, c={completion_tokens}")
 
                 # 2. 检查有效内容
@@ -147,6 +158,7 @@ class AIService:
                     model=context.model,
                     endpoint=endpoint,
                     project_id=project_id,
+                    cached_tokens=cached_tokens,
                 )
                 logger.info(
                     f"Token统计完成: user={context.user_id}, "
@@ -200,7 +212,7 @@ class AIService:
     ) -> AsyncGenerator[str, None]:
         """通用流式内容生成方法"""
         
-        ctx = await self._get_user_context(user_id, temperature=temperature)
+        ctx = await self._get_user_context(user_id, temperature=temperature, project_id=project_id)
         if not ctx:
             yield "错误: AI服务未正确配置，请检查您的API设置"
             return
@@ -3,6 +3,7 @@
 """
 
 import contextlib
+import importlib
 import sys
 
 from aerich import Command
@@ -29,6 +30,7 @@ TORTOISE_ORM = {
                 "src.features.novel_outline.backend.models",
                 "src.features.chapter.backend.models",
                 "src.features.character.backend.models",
+                "src.features.dashboard.backend.models",
                 "src.backend.services.models",
                 # 在此添加其他功能模块的models
                 "aerich.models",  # Aerich迁移管理
@@ -38,6 +40,31 @@ TORTOISE_ORM = {
     },
 }
 
+# 模型之外的数据库对象（FTS 虚拟表、触发器等）所在模块，模块需定义 SCHEMA_SQL；
+# 语句与迁移中一致且均为 IF NOT EXISTS，供开发环境 generate_schemas 之后补建
+AUXILIARY_SCHEMA_MODULES = [
+    "src.backend.services.prompt_blobs",
+    "src.features.dashboard.backend.services.counter_service",
+    "src.features.novel_outline.backend.services.outline_export",
+    "src.features.search.backend.services.search_service",
+]
+
+
+def is_sqlite() -> bool:
+    """是否使用 SQLite（辅助结构及依赖它们或 SQLite 方言的查询只在 SQLite 上使用）"""
+    return settings.DATABASE_URL.startswith("sqlite://")
+
+
+async def create_auxiliary_schema():
+    """创建模型之外的数据库对象（幂等；FTS5、触发器语句仅适用于 SQLite，其他数据库跳过）"""
+    if not is_sqlite():
+        logger.warning("非 SQLite 数据库，跳过全文索引、触发器等辅助结构的创建")
+        return
+    conn = Tortoise.get_connection("default")
+    for module_name in AUXILIARY_SCHEMA_MODULES:
+        module = importlib.import_module(module_name)
+        await conn.execute_script(module.SCHEMA_SQL)
+
 
 async def run_migrations():
     """
@@ -96,7 +123,6 @@ async def init_db():
     # 2. 生产环境且使用 SQLite（桌面版场景）：必须且只能使用 Aerich 迁移系统
     # 3. 生产环境且使用服务器数据库：应手动使用 Aerich 迁移工具
 
-    is_sqlite = settings.DATABASE_URL.startswith("sqlite://")
     is_frozen = getattr(sys, "frozen", False)
     is_production = settings.ENVIRONMENT == "production"
 
@@ -105,8 +131,9 @@ async def init_db():
         # safe=True: 如果表已存在则忽略
         logger.info("🔧 Development mode: Generating schemas...")
         await Tortoise.generate_schemas(safe=True)
+        await create_auxiliary_schema()
 
-    elif is_sqlite and (is_frozen or is_production):
+    elif is_sqlite() and (is_frozen or is_production):
         # 生产环境 + SQLite (无论是 Docker 还是 Windows exe)：自动迁移
         # 如果失败，直接崩溃，绝不使用 generate_schemas 兜底
         await run_migrations()
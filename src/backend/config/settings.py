@@ -51,9 +51,70 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 10080
 
+    # AI 长文本分块处理配置（优化/扩写/缩写）
+    AI_CHUNK_WINDOW_TOKENS: int = 3000  # 单个窗口的 token 上限
+    AI_CHUNK_OVERLAP_CHARS: int = 200  # 相邻窗口重叠的字符数（作为衔接参考）
+    AI_CHUNK_CONCURRENCY: int = 3  # 单次请求的最大并发窗口数
+    AI_CHUNK_REDUCE_MAX_TOKENS: int = 8000  # 缩写统稿（reduce）允许的初稿 token 上限
+
+    # 模型价格表（每百万 Token 单价: input 输入 / cached_input 命中缓存的输入 / output 输出）
+    # 按模型名精确匹配，其次最长前缀匹配；未配置的模型费用记为 0
+    MODEL_PRICE_TABLE: dict[str, dict[str, float]] = {
+        "gpt-4o": {"input": 2.5, "cached_input": 1.25, "output": 10.0},
+        "gpt-4o-mini": {"input": 0.15, "cached_input": 0.075, "output": 0.6},
+        "deepseek-chat": {"input": 0.27, "cached_input": 0.07, "output": 1.1},
+        "deepseek-reasoner": {"input": 0.55, "cached_input": 0.14, "output": 2.19},
+    }
+
+    # Token配额（daily_tokens / monthly_tokens / daily_cost / monthly_cost，0 或缺省表示不限制）
+    QUOTA_DEFAULT_USER: dict[str, float] = {}  # 每个用户的默认配额
+    QUOTA_DEFAULT_PROJECT: dict[str, float] = {}  # 每个项目的默认配额
+    QUOTA_USER_OVERRIDES: dict[str, dict[str, float]] = {}  # 按用户ID覆盖，如 {"1": {"monthly_cost": 50}}
+    QUOTA_PROJECT_OVERRIDES: dict[str, dict[str, float]] = {}  # 按项目ID覆盖
+
+    # 提示词记录存储
+    PROMPT_BLOB_USE_DICTIONARY: bool = True  # 使用提示词模板构建的预置字典压缩正文
+    PROMPT_BLOB_CACHE_SIZE: int = 512  # 解压后正文的 LRU 缓存条数
+
+    # 提示词记录保留策略（sample_rate 采样率 / max_length 单条提示词最大保存长度，0 不限 /
+    # retention_days 在数据库中保留的天数，0 表示永久保留，超期记录归档到 PROMPT_ARCHIVE_DIR）
+    # PROMPT_RECORD_POLICIES 按端点精确匹配，其次最长前缀匹配，如 {"/chapter": {"sample_rate": 0.2}}
+    PROMPT_RECORD_DEFAULT_POLICY: dict[str, float] = {"sample_rate": 1.0, "max_length": 0, "retention_days": 0}
+    PROMPT_RECORD_POLICIES: dict[str, dict[str, float]] = {}
+    PROMPT_ARCHIVE_DIR: str = "./data/prompt_archive"  # 归档目录（按日期分区的压缩 JSONL）
+    PROMPT_ARCHIVE_INTERVAL: float = 3600.0  # 归档任务执行间隔（秒），0 表示不自动执行
+    PROMPT_ARCHIVE_BATCH_SIZE: int = 1000  # 单批归档条数
+
+    # 长文本压缩（章节正文、项目正文；读取始终兼容压缩与未压缩的数据）
+    TEXT_COMPRESSION_ENABLED: bool = False  # 写入时压缩长文本，已有数据由 scripts/migrate_compress_text.py 分批压缩
+    TEXT_COMPRESSION_MIN_LENGTH: int = 1024  # 短于该长度（字符数）的文本不压缩
+
+    # 仪表盘配置
+    DASHBOARD_OVERVIEW_CACHE_TTL: int = 10  # 全站概览统计缓存时间（秒）
+    DASHBOARD_COUNTER_RECONCILE_INTERVAL: float = 3600.0  # 计数器对账间隔（秒），0 表示不自动执行
+
+    # 章节配置
+    CHAPTER_WORD_COUNT_RECONCILE_INTERVAL: float = 3600.0  # 项目字数对账间隔（秒），0 表示不自动执行
+    CHAPTER_SAVE_FLUSH_INTERVAL: float = 5.0  # 章节保存合并写入间隔（秒），0 表示每次保存直接写入数据库
+    CHAPTER_REVISION_COALESCE_SECONDS: float = 300.0  # 同一窗口内的连续保存合并为一条修订（秒）
+    CHAPTER_REVISION_SNAPSHOT_EVERY: int = 20  # 每隔多少条修订保留一个完整快照
+    CHAPTER_REVISION_MAX_COUNT: int = 200  # 每章最多保留的修订数（超出时删除最早的）
+    CHAPTER_IMPORT_MAX_BYTES: int = 50 * 1024 * 1024  # 导入小说文件的大小上限（字节）
+
     # 监控配置
     LOG_BUFFER_SIZE: int = 500
 
+    # 遥测写入配置（提示词记录/Token使用记录批量写入）
+    WRITE_BEHIND_QUEUE_SIZE: int = 10000  # 队列容量，满时丢弃新记录
+    WRITE_BEHIND_BATCH_SIZE: int = 200  # 单批写入条数上限
+    WRITE_BEHIND_FLUSH_INTERVAL: float = 2.0  # 最长攒批时间（秒）
+    OUTBOX_DIR: str = "./data/outbox"  # 发件箱日志目录（先落本地日志再导入数据库），留空则仅用内存队列
+    OUTBOX_MAX_RETRIES: int = 5  # 单批导入连续失败多少次后跳过
+
+    # 模板配置
+    TEMPLATE_CACHE_DIR: str = "./data/template_cache"  # Jinja2 字节码缓存目录
+    TEMPLATE_FRAGMENT_CACHE_SIZE: int = 256  # 片段渲染结果 LRU 缓存条数
+
     # CORS配置
     CORS_ORIGINS: list[str] = ["http://localhost:5173", "http://localhost:3000"]
 
@@ -0,0 +1,145 @@
+"""
+通用压缩工具
+优先使用 zstd（安装了可选依赖 zstandard 时），否则回退到标准库 zlib；
+两种编码都支持预置字典，对大量共享片段的短文本（如提示词）压缩效果更好；
+pack_text() / unpack_text() 为长文本加上魔数前缀，可与未压缩的文本存放在同一列
+"""
+
+import zlib
+
+try:
+    import zstandard
+except ImportError:  # 可选依赖
+    zstandard = None
+
+CODEC_RAW = "raw"
+CODEC_ZLIB = "zlib"
+CODEC_ZSTD = "zstd"
+
+# zlib 预置字典只使用末尾 32KB
+_ZLIB_DICT_LIMIT = 32 * 1024
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 9
+
+
+def default_codec() -> str:
+    """当前环境可用的首选编码"""
+    return CODEC_ZSTD if zstandard is not None else CODEC_ZLIB
+
+
+def compress(
+    data: bytes, dictionary: bytes | None = None, codec: str | None = None,
+) -> tuple[str, bytes]:
+    """
+    压缩数据
+
+    Args:
+        data: 原始数据
+        dictionary: 预置字典（可选，解压时必须提供相同的字典）
+        codec: 指定编码，默认 default_codec()
+
+    Returns:
+        tuple: (编码, 压缩后的数据)
+    """
+    codec = codec or default_codec()
+    if codec == CODEC_ZSTD:
+        zdict = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+        return codec, zstandard.ZstdCompressor(level=ZSTD_LEVEL, dict_data=zdict).compress(data)
+    if codec == CODEC_ZLIB:
+        if dictionary:
+            compressor = zlib.compressobj(ZLIB_LEVEL, zdict=dictionary[-_ZLIB_DICT_LIMIT:])
+        else:
+            compressor = zlib.compressobj(ZLIB_LEVEL)
+        return codec, compressor.compress(data) + compressor.flush()
+    return CODEC_RAW, data
+
+
+def decompress(codec: str, data: bytes, dictionary: bytes | None = None) -> bytes:
+    """
+    解压数据
+
+    Args:
+        codec: 压缩时使用的编码
+        data: 压缩后的数据
+        dictionary: 压缩时使用的预置字典
+
+    Returns:
+        bytes: 原始数据
+
+    Raises:
+        ValueError: 未知编码，或 zstd 数据但未安装 zstandard
+    """
+    if codec == CODEC_RAW:
+        return data
+    if codec == CODEC_ZLIB:
+        if dictionary:
+            decompressor = zlib.decompressobj(zdict=dictionary[-_ZLIB_DICT_LIMIT:])
+        else:
+            decompressor = zlib.decompressobj()
+        return decompressor.decompress(data) + decompressor.flush()
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise ValueError("数据使用 zstd 压缩，但未安装 zstandard")
+        zdict = zstandard.ZstdCompressionDict(dictionary) if dictionary else None
+        return zstandard.ZstdDecompressor(dict_data=zdict).decompress(data)
+    raise ValueError(f"未知的压缩编码: {codec}")
+
+
+# ==================== 压缩文本 ====================
+
+# 压缩文本的前缀：魔数 + 1 字节编码标识（未压缩的文本仍以字符串保存，不会以 NUL 开头的字节串出现）
+TEXT_MAGIC = b"\x00LMZ"
+_TEXT_CODEC_IDS = {CODEC_ZLIB: b"z", CODEC_ZSTD: b"s"}
+_TEXT_CODECS = {value: key for key, value in _TEXT_CODEC_IDS.items()}
+
+
+def is_packed_text(value: object) -> bool:
+    """是否为 pack_text() 生成的压缩文本"""
+    return isinstance(value, (bytes, bytearray, memoryview)) and bytes(value[:len(TEXT_MAGIC)]) == TEXT_MAGIC
+
+
+def pack_text(text: str, min_length: int = 0, codec: str | None = None) -> str | bytes:
+    """
+    压缩文本（带魔数前缀）
+
+    Args:
+        text: 原文本
+        min_length: 短于该长度（字符数）的文本不压缩
+        codec: 指定编码，默认 default_codec()
+
+    Returns:
+        str | bytes: 压缩后的字节串；文本过短或压缩后不更小时原样返回
+    """
+    if len(text) < min_length:
+        return text
+    raw = text.encode("utf-8")
+    codec, data = compress(raw, codec=codec)
+    if codec not in _TEXT_CODEC_IDS or len(data) + len(TEXT_MAGIC) + 1 >= len(raw):
+        return text
+    return TEXT_MAGIC + _TEXT_CODEC_IDS[codec] + data
+
+
+def unpack_text(value: str | bytes) -> str:
+    """
+    还原 pack_text() 的结果（未压缩的文本原样返回）
+
+    Args:
+        value: 字符串或压缩后的字节串
+
+    Returns:
+        str: 原文本
+
+    Raises:
+        ValueError: 字节串不是压缩文本，或编码未知
+    """
+    if isinstance(value, str):
+        return value
+    value = bytes(value)
+    if not is_packed_text(value):
+        raise ValueError("不是压缩文本")
+    offset = len(TEXT_MAGIC)
+    codec = _TEXT_CODECS.get(value[offset:offset + 1])
+    if codec is None:
+        raise ValueError(f"未知的压缩文本编码: {value[offset:offset + 1]!r}")
+    return decompress(codec, value[offset + 1:]).decode("utf-8")
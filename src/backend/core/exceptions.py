@@ -93,6 +93,35 @@ class ResourceAlreadyExistsError(APIError):
         )
 
 
+class VersionConflictError(APIError):
+    """资源版本冲突（客户端持有的版本已过期）"""
+
+    def __init__(
+        self,
+        current_version: int,
+        message: str = "内容已被修改，请刷新后重试",
+        details: dict | None = None,
+    ):
+        super().__init__(
+            code="VERSION_CONFLICT",
+            message=message,
+            status_code=status.HTTP_409_CONFLICT,
+            details={"current_version": current_version, **(details or {})},
+        )
+
+
+class QuotaExceededError(APIError):
+    """配额已用完"""
+
+    def __init__(self, message: str = "配额已用完", details: dict | None = None):
+        super().__init__(
+            code="QUOTA_EXCEEDED",
+            message=message,
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            details=details,
+        )
+
+
 # 数据验证异常
 class ValidationError(APIError):
     """数据验证失败"""
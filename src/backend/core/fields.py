@@ -0,0 +1,33 @@
+"""
+自定义 ORM 字段
+"""
+
+from typing import Any
+
+from tortoise import fields
+
+from src.backend.config.settings import settings
+from src.backend.core.compression import is_packed_text, pack_text, unpack_text
+
+
+class CompressedTextField(fields.TextField):
+    """可压缩的长文本字段
+
+    特性:
+    - 列类型仍为 TEXT，未压缩的旧数据原样读取，两种格式可在同一列共存
+    - 启用 TEXT_COMPRESSION_ENABLED 时，长度不小于 TEXT_COMPRESSION_MIN_LENGTH 的文本
+      压缩为带魔数前缀的 BLOB 写入（见 compression.pack_text）；关闭后新写入恢复为明文
+    - 只在查询选取该列时解压，列表等只读元数据列的查询不受影响
+    - 压缩后的值无法在 SQL 中直接比较或截取（LIKE、substr 等），需要正文的查询应读取字段后在 Python 中处理
+    """
+
+    def to_db_value(self, value: Any, instance: Any) -> Any:
+        value = super().to_db_value(value, instance)
+        if value is None or not settings.TEXT_COMPRESSION_ENABLED:
+            return value
+        return pack_text(value, settings.TEXT_COMPRESSION_MIN_LENGTH)
+
+    def to_python_value(self, value: Any) -> Any:
+        if is_packed_text(value):
+            return unpack_text(value)
+        return super().to_python_value(value)
@@ -0,0 +1,247 @@
+"""本地持久化发件箱日志（outbox journal）
+遥测记录先追加写入本地日志文件，再由后台写入协程批量导入数据库，
+进程崩溃或重启后未导入的记录会在启动时重放，不会丢失
+
+文件格式: 连续的 [4字节大端长度][JSON记录] 条目；
+旁路文件 <name>.offset 保存已导入数据库的字节偏移
+"""
+
+import json
+import os
+import struct
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from src.backend.core.logger import logger
+
+_HEADER = struct.Struct(">I")
+
+# 单条记录上限，超出视为文件损坏
+_MAX_RECORD_BYTES = 64 * 1024 * 1024
+
+
+def _encode_default(value: Any) -> Any:
+    """JSON 编码扩展：datetime 保留类型信息"""
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    raise TypeError(f"无法序列化类型 {type(value).__name__}")
+
+
+def _decode_hook(obj: dict[str, Any]) -> Any:
+    """JSON 解码扩展：还原 datetime"""
+    if len(obj) == 1 and "__datetime__" in obj:
+        return datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+class OutboxJournal:
+    """追加写日志
+
+    - append() 只做一次无缓冲 write，不等待落盘
+    - sync() 批量 fsync，由写入协程在每批导入前调用
+    - commit() 记录已导入偏移，全部导入后截断文件
+    - copy_tail() / swap() 压缩日志：前者可在线程中执行，后者须回到事件循环调用
+
+    append() 在事件循环中调用，sync()、read_batch()、copy_tail() 可放入线程执行
+    """
+
+    def __init__(self, path: str | Path, compact_bytes: int = 16 * 1024 * 1024):
+        """
+        Args:
+            path: 日志文件路径
+            compact_bytes: 已导入部分超过该字节数时压缩日志（丢弃已导入部分）
+        """
+        self.path = Path(path)
+        self.offset_path = self.path.with_suffix(".offset")
+        self.compact_bytes = compact_bytes
+
+        self._fd: int | None = None
+        self._committed = 0  # 已导入数据库的字节偏移
+        self._size = 0  # 当前文件大小
+        self._pending = 0  # 尚未导入的记录数
+        self._dirty = False  # 是否有未 fsync 的写入
+
+    @property
+    def pending(self) -> int:
+        """尚未导入数据库的记录数"""
+        return self._pending
+
+    @property
+    def pending_bytes(self) -> int:
+        """尚未导入数据库的字节数"""
+        return self._size - self._committed
+
+    def open(self) -> int:
+        """
+        打开日志文件，校验尾部并统计待重放记录
+
+        Returns:
+            int: 待重放的记录数
+        """
+        if self._fd is not None:
+            return self._pending
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        self._size = os.fstat(self._fd).st_size
+
+        try:
+            self._committed = int(self.offset_path.read_text().strip() or 0)
+        except (FileNotFoundError, ValueError):
+            self._committed = 0
+        if self._committed > self._size:
+            self._committed = 0
+
+        # 统计待重放记录，并截掉崩溃时写了一半的尾部记录
+        self._pending = 0
+        valid_end = self._committed
+        for _, end in self._iter_records(self._committed, None):
+            self._pending += 1
+            valid_end = end
+        if valid_end < self._size:
+            logger.warning(f"发件箱日志 {self.path.name} 尾部不完整，截断 {self._size - valid_end} 字节")
+            os.ftruncate(self._fd, valid_end)
+            self._size = valid_end
+
+        return self._pending
+
+    def close(self) -> None:
+        """落盘并关闭日志文件"""
+        if self._fd is None:
+            return
+        if self._dirty:
+            os.fsync(self._fd)
+            self._dirty = False
+        os.close(self._fd)
+        self._fd = None
+
+    def append(self, record: dict[str, Any]) -> None:
+        """
+        追加一条记录（不等待落盘）
+
+        Args:
+            record: 记录字段
+        """
+        payload = json.dumps(record, ensure_ascii=False, default=_encode_default).encode("utf-8")
+        os.write(self._fd, _HEADER.pack(len(payload)) + payload)
+        self._size += _HEADER.size + len(payload)
+        self._pending += 1
+        self._dirty = True
+
+    def sync(self) -> None:
+        """将已追加的记录 fsync 落盘（批量）"""
+        if self._dirty and self._fd is not None:
+            self._dirty = False
+            os.fsync(self._fd)
+
+    def _iter_records(self, start: int, limit: int | None):
+        """从指定偏移读取完整记录，遇到不完整的尾部即停止"""
+        with self.path.open("rb") as f:
+            f.seek(start)
+            count = 0
+            offset = start
+            while limit is None or count < limit:
+                header = f.read(_HEADER.size)
+                if len(header) < _HEADER.size:
+                    return
+                (length,) = _HEADER.unpack(header)
+                if length > _MAX_RECORD_BYTES:
+                    return
+                payload = f.read(length)
+                if len(payload) < length:
+                    return
+                offset += _HEADER.size + length
+                count += 1
+                yield payload, offset
+
+    def read_batch(self, limit: int) -> tuple[list[dict[str, Any]], int]:
+        """
+        读取一批待导入记录
+
+        Args:
+            limit: 最大记录数
+
+        Returns:
+            tuple: (记录列表, 该批结束处的字节偏移)
+        """
+        records: list[dict[str, Any]] = []
+        end = self._committed
+        for payload, offset in self._iter_records(self._committed, limit):
+            records.append(json.loads(payload, object_hook=_decode_hook))
+            end = offset
+        return records, end
+
+    @property
+    def needs_compact(self) -> bool:
+        """已导入部分是否超过压缩阈值"""
+        return self._committed >= self.compact_bytes
+
+    def commit(self, end: int, count: int) -> None:
+        """
+        标记一批记录已导入数据库
+
+        全部导入后截断日志；已导入部分过大时由调用方通过 copy_tail() / swap() 压缩
+
+        Args:
+            end: 该批结束处的字节偏移
+            count: 该批记录数
+        """
+        self._committed = end
+        self._pending -= count
+
+        if self._committed >= self._size:
+            os.ftruncate(self._fd, 0)
+            self._size = self._committed = 0
+
+        self._write_offset(self._committed)
+
+    def _write_offset(self, value: int) -> None:
+        """原子地写入已导入偏移"""
+        tmp_path = self.offset_path.with_suffix(".offset.tmp")
+        tmp_path.write_text(str(value))
+        tmp_path.replace(self.offset_path)
+
+    @property
+    def _compact_path(self) -> Path:
+        """压缩时使用的临时文件"""
+        return self.path.with_suffix(".journal.tmp")
+
+    def copy_tail(self) -> int:
+        """
+        把未导入部分复制到临时文件并落盘（压缩第一步，可在线程中执行）
+
+        Returns:
+            int: 已复制到的字节偏移（之后追加的记录由 swap() 补齐）
+        """
+        start, end = self._committed, self._size
+        with self.path.open("rb") as src, self._compact_path.open("wb") as dst:
+            src.seek(start)
+            dst.write(src.read(end - start))
+            dst.flush()
+            os.fsync(dst.fileno())
+        return end
+
+    def swap(self, copied_end: int) -> None:
+        """
+        补齐复制期间追加的记录，并用临时文件替换旧日志（压缩第二步，须在事件循环中调用）
+
+        Args:
+            copied_end: copy_tail() 返回的字节偏移
+        """
+        with self._compact_path.open("ab") as dst:
+            if copied_end < self._size:
+                with self.path.open("rb") as src:
+                    src.seek(copied_end)
+                    dst.write(src.read(self._size - copied_end))
+            dst.flush()
+            os.fsync(dst.fileno())
+
+        # 先把偏移归零再替换文件：中途崩溃最多导致重复导入，不会丢记录
+        self._write_offset(0)
+        os.close(self._fd)
+        self._compact_path.replace(self.path)
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o644)
+        self._size -= self._committed
+        self._committed = 0
+        self._dirty = False
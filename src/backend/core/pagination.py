@@ -0,0 +1,143 @@
+"""
+游标（keyset）分页工具
+按 (created_at, id) 倒序翻页，每页都走 (…, created_at) 索引定位，
+翻到多深都与第一页一样快；游标对客户端不透明
+"""
+
+import base64
+import json
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any, TypeVar
+
+from tortoise.expressions import Q
+from tortoise.models import Model
+from tortoise.queryset import QuerySet
+
+from src.backend.core.exceptions import ValidationError
+
+T = TypeVar("T", bound=Model)
+
+# 估算总数时最多计数的行数（超出只返回下限）
+ESTIMATE_CAP = 1000
+
+
+def encode_cursor(created_at: datetime, record_id: int) -> str:
+    """
+    编码游标
+
+    Args:
+        created_at: 本页最后一条记录的创建时间
+        record_id: 本页最后一条记录的ID
+
+    Returns:
+        str: URL 安全的游标字符串
+    """
+    raw = json.dumps([created_at.isoformat(), record_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """
+    解码游标
+
+    Args:
+        cursor: encode_cursor() 生成的游标
+
+    Returns:
+        tuple: (创建时间, 记录ID)
+
+    Raises:
+        ValidationError: 游标格式无效
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, record_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), int(record_id)
+    except (ValueError, TypeError) as e:
+        raise ValidationError(message="无效的分页游标", details={"cursor": cursor}) from e
+
+
+def after_cursor(query: QuerySet[T], cursor: str | None) -> QuerySet[T]:
+    """
+    限定为游标之后（按 (created_at, id) 倒序）的记录
+
+    Args:
+        query: 查询
+        cursor: encode_cursor() 生成的游标（为空时不限定）
+
+    Returns:
+        QuerySet: 追加了游标条件的查询
+    """
+    if not cursor:
+        return query
+    created_at, record_id = decode_cursor(cursor)
+    return query.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=record_id))
+
+
+async def paginate(
+    query: QuerySet[T], limit: int, cursor: str | None = None,
+) -> tuple[list[T], str | None]:
+    """
+    按 (created_at, id) 倒序取一页
+
+    Args:
+        query: 已应用过滤条件的查询
+        limit: 每页条数
+        cursor: 上一页返回的游标（为空时取第一页）
+
+    Returns:
+        tuple: (本页记录, 下一页游标；没有更多时为None)
+    """
+    records = await after_cursor(query, cursor).order_by("-created_at", "-id").limit(limit + 1)
+    if len(records) <= limit:
+        return list(records), None
+    records = list(records[:limit])
+    return records, encode_cursor(records[-1].created_at, records[-1].id)
+
+
+def paginate_sorted(
+    records: Sequence[dict[str, Any]], limit: int, cursor: str | None = None,
+) -> tuple[list[dict[str, Any]], str | None]:
+    """
+    对已按 (created_at, id) 倒序排列的内存记录取一页（如归档记录），游标与 paginate() 通用
+
+    Args:
+        records: 记录字典（created_at 为 ISO 字符串或 datetime）
+        limit: 每页条数
+        cursor: 上一页返回的游标
+
+    Returns:
+        tuple: (本页记录, 下一页游标)
+    """
+    def key(record: dict[str, Any]) -> tuple[datetime, int]:
+        created_at = record["created_at"]
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at)
+        return created_at, record["id"]
+
+    if cursor:
+        position = decode_cursor(cursor)
+        records = [record for record in records if key(record) < position]
+
+    if len(records) <= limit:
+        return list(records), None
+    page = list(records[:limit])
+    return page, encode_cursor(*key(page[-1]))
+
+
+async def count_estimate(query: QuerySet[T], cap: int = ESTIMATE_CAP) -> tuple[int, bool]:
+    """
+    有上限的计数：最多扫描 cap 行索引，避免大表 COUNT(*) 全量扫描
+
+    Args:
+        query: 已应用过滤条件的查询
+        cap: 计数上限
+
+    Returns:
+        tuple: (数量, 是否精确)；超过上限时返回 (cap, False)
+    """
+    ids = await query.limit(cap + 1).values_list("id", flat=True)
+    if len(ids) > cap:
+        return cap, False
+    return len(ids), True
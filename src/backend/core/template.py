@@ -1,24 +1,50 @@
 """Jinja2 模板管理工具类"""
 
+import hashlib
+import json
+import time
 from pathlib import Path
 from typing import Any
 
-from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
+from cachetools import LRUCache
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    TemplateNotFound,
+)
 from jinja2.exceptions import TemplateError
 
+from src.backend.config.settings import settings
 from src.backend.core.logger import logger
-from src.backend.core.path_conf import get_resource_path
+from src.backend.core.path_conf import get_base_dir, get_resource_path
 
 
 class TemplateManager:
-    """Jinja2 模板管理器"""
+    """
+    Jinja2 模板管理器
 
-    def __init__(self, template_dir: Path | None = None):
+    进程内共享单例见模块级 template_manager：
+    - 启动时 precompile() 预编译全部模板，字节码缓存到磁盘，重启后免重新解析
+    - 仅开发环境开启 auto_reload（每次渲染检查模板文件 mtime）
+    - 记录每个模板的渲染次数、耗时和输出大小
+    - 模板内可通过 fragment() 引用片段模板，渲染结果按输入数据哈希做 LRU 缓存
+    """
+
+    def __init__(
+        self,
+        template_dir: Path | None = None,
+        auto_reload: bool | None = None,
+        bytecode_cache_dir: Path | None = None,
+    ):
         """
         初始化模板环境
 
         Args:
             template_dir: 模板目录路径，默认为 src/assets/template/
+            auto_reload: 是否热重载模板，默认仅开发环境开启
+            bytecode_cache_dir: 字节码缓存目录，默认为 settings.TEMPLATE_CACHE_DIR
         """
         if template_dir is None:
             # 使用 get_resource_path 获取跨平台兼容的模板路径
@@ -30,13 +56,24 @@ class TemplateManager:
                     template_path.mkdir(parents=True, exist_ok=True)
                 else:
                     # 如果 get_resource_path 返回 None，使用默认路径
-                    from src.backend.core.path_conf import get_base_dir
                     template_path = get_base_dir() / "src" / "assets" / "template"
                     template_path.mkdir(parents=True, exist_ok=True)
             template_dir = template_path
 
+        if auto_reload is None:
+            auto_reload = settings.ENVIRONMENT == "development"
+
         self.template_dir = template_dir
-        logger.info(f"初始化模板管理器，模板目录: {self.template_dir}")
+        self.auto_reload = auto_reload
+        self._render_stats: dict[str, dict[str, float]] = {}
+        self._fragment_cache: LRUCache = LRUCache(
+            maxsize=settings.TEMPLATE_FRAGMENT_CACHE_SIZE,
+        )
+        self._fragment_hits = 0
+        self._fragment_misses = 0
+        logger.info(
+            f"初始化模板管理器，模板目录: {self.template_dir}，热重载: {self.auto_reload}",
+        )
 
         # 初始化 Jinja2 环境
         try:
@@ -45,12 +82,90 @@ class TemplateManager:
                 autoescape=False,  # 不自动转义，因为是纯文本
                 trim_blocks=True,  # 去除块后的第一个换行
                 lstrip_blocks=True,  # 去除块前的空白
+                auto_reload=self.auto_reload,
+                cache_size=-1,  # 模板数量有限，全部常驻内存
+                bytecode_cache=self._create_bytecode_cache(bytecode_cache_dir),
             )
+            self.env.globals["fragment"] = self.render_fragment
             logger.info("Jinja2 环境初始化成功")
         except Exception as e:
             logger.error(f"初始化 Jinja2 环境失败: {e}")
             self.env = None
 
+    @staticmethod
+    def _create_bytecode_cache(
+        cache_dir: Path | None = None,
+    ) -> FileSystemBytecodeCache | None:
+        """创建磁盘字节码缓存，目录不可写时禁用"""
+        if cache_dir is None:
+            cache_dir = Path(settings.TEMPLATE_CACHE_DIR)
+            if not cache_dir.is_absolute():
+                cache_dir = get_base_dir() / cache_dir
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            return FileSystemBytecodeCache(str(cache_dir))
+        except OSError as e:
+            logger.warning(f"模板字节码缓存目录不可用，已禁用: {e}")
+            return None
+
+    def precompile(self) -> int:
+        """
+        预编译目录下的全部模板（应用启动时调用）
+
+        Returns:
+            int: 成功编译的模板数量
+        """
+        if self.env is None:
+            return 0
+
+        start = time.perf_counter()
+        compiled = 0
+        for name in self.env.list_templates():
+            try:
+                self.env.get_template(name)
+                compiled += 1
+            except TemplateError as e:
+                logger.error(f"模板预编译失败 ({name}): {e}")
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"✅ 预编译 {compiled} 个模板，耗时 {elapsed_ms:.1f}ms")
+        return compiled
+
+    def _record_render(self, template_name: str, elapsed_ms: float, size: int) -> None:
+        """记录一次渲染的耗时与输出大小"""
+        stats = self._render_stats.get(template_name)
+        if stats is None:
+            stats = self._render_stats[template_name] = {
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "total_chars": 0,
+                "last_chars": 0,
+            }
+        stats["count"] += 1
+        stats["total_ms"] += elapsed_ms
+        stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+        stats["total_chars"] += size
+        stats["last_chars"] = size
+
+    def get_render_stats(self) -> dict[str, dict[str, float]]:
+        """
+        获取各模板的渲染统计
+
+        Returns:
+            dict: 模板名 -> {count, avg_ms, max_ms, avg_chars, last_chars}
+        """
+        return {
+            name: {
+                "count": stats["count"],
+                "avg_ms": round(stats["total_ms"] / stats["count"], 3),
+                "max_ms": round(stats["max_ms"], 3),
+                "avg_chars": round(stats["total_chars"] / stats["count"]),
+                "last_chars": stats["last_chars"],
+            }
+            for name, stats in self._render_stats.items()
+        }
+
     def render(self, template_name: str, **context: Any) -> str:
         """
         渲染模板
@@ -71,10 +186,11 @@ class TemplateManager:
             raise RuntimeError("Jinja2 环境未正确初始化")
 
         try:
+            start = time.perf_counter()
             template = self.env.get_template(template_name)
-            logger.debug(f"模板 {template_name} 渲染成功")
-            return template.render(**context)
-            
+            result = template.render(**context)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
         except TemplateNotFound:
             logger.warning(f"模板文件未找到: {template_name}")
             raise
@@ -84,6 +200,63 @@ class TemplateManager:
         except Exception as e:
             logger.error(f"模板渲染时发生未知错误 ({template_name}): {e}")
             raise
+        else:
+            self._record_render(template_name, elapsed_ms, len(result))
+            logger.debug(f"模板 {template_name} 渲染成功 ({elapsed_ms:.2f}ms, {len(result)} 字符)")
+            return result
+
+    def render_fragment(self, fragment_name: str, **data: Any) -> str:
+        """
+        渲染片段模板（带缓存）
+
+        同一片段在输入数据相同时只渲染一次，之后直接返回缓存结果。
+        输出逐字节一致，也有利于上游模型服务的提示词前缀缓存命中。
+        模板可在内部调用：{{ fragment("fragments/xxx.jinja2", key=value) }}
+
+        Args:
+            fragment_name: 片段模板文件名（相对模板目录）
+            **data: 片段输入数据，需可 JSON 序列化
+
+        Returns:
+            str: 渲染后的片段文本（去除首尾空行）
+        """
+        if self.env is None:
+            raise RuntimeError("Jinja2 环境未正确初始化")
+
+        template = self.env.get_template(fragment_name)
+        digest = hashlib.sha256(
+            json.dumps(data, sort_keys=True, ensure_ascii=False, default=str).encode(
+                "utf-8",
+            ),
+        ).hexdigest()
+        key = (fragment_name, digest)
+
+        cached = self._fragment_cache.get(key)
+        # 热重载时模板对象会被替换，旧模板渲染的结果视为失效
+        if cached is not None and cached[0] is template:
+            self._fragment_hits += 1
+            return cached[1]
+
+        self._fragment_misses += 1
+        start = time.perf_counter()
+        result = template.render(**data).strip("\n")
+        self._record_render(fragment_name, (time.perf_counter() - start) * 1000, len(result))
+        self._fragment_cache[key] = (template, result)
+        return result
+
+    def get_fragment_cache_stats(self) -> dict[str, int]:
+        """
+        获取片段缓存统计
+
+        Returns:
+            dict: {size, maxsize, hits, misses}
+        """
+        return {
+            "size": len(self._fragment_cache),
+            "maxsize": int(self._fragment_cache.maxsize),
+            "hits": self._fragment_hits,
+            "misses": self._fragment_misses,
+        }
 
     def render_safe(
         self, template_name: str, fallback: str, **context: Any,
@@ -126,3 +299,7 @@ class TemplateManager:
 
         template_path = self.template_dir / template_name
         return template_path.exists()
+
+
+# 进程级共享模板管理器
+template_manager = TemplateManager()
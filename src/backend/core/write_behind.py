@@ -0,0 +1,295 @@
+"""批量写后（write-behind）队列
+将高频、可延迟的插入操作（提示词记录、Token使用记录）缓冲后，
+由单一写入协程按数量或时间阈值批量 bulk_create，减少 SQLite 写事务次数
+
+配置了发件箱目录时，记录先追加写入本地日志（见 outbox.py），
+写入协程从日志批量导入数据库，崩溃或重启后未导入的记录会被重放
+"""
+
+import asyncio
+import contextlib
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any
+
+from tortoise import BaseDBAsyncClient
+from tortoise.models import Model
+from tortoise.transactions import in_transaction
+
+from src.backend.config.settings import settings
+from src.backend.core.logger import logger
+from src.backend.core.outbox import OutboxJournal
+
+
+class WriteBehindQueue:
+    """有界批量写入队列
+
+    特性:
+    - 队列满时直接丢弃新记录并计数，绝不阻塞请求
+    - 单一写入协程，攒满 batch_size 条或等待 flush_interval 秒后批量写入
+    - 关闭时 drain() 写完队列中剩余记录
+    - 发件箱模式下以本地日志代替内存队列，每批导入前统一 fsync
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model: type[Model],
+        max_size: int | None = None,
+        batch_size: int | None = None,
+        flush_interval: float | None = None,
+        journal_dir: str | None = None,
+        before_write: Callable[[list[dict[str, Any]], BaseDBAsyncClient], Awaitable[list[dict[str, Any]]]] | None = None,
+        after_write: Callable[[list[dict[str, Any]], BaseDBAsyncClient], Awaitable[None]] | None = None,
+    ):
+        """
+        Args:
+            name: 队列名称（用于日志和统计）
+            model: 写入的 Tortoise 模型
+            max_size: 队列容量，默认 settings.WRITE_BEHIND_QUEUE_SIZE
+            batch_size: 单批写入条数，默认 settings.WRITE_BEHIND_BATCH_SIZE
+            flush_interval: 最长攒批时间（秒），默认 settings.WRITE_BEHIND_FLUSH_INTERVAL
+            journal_dir: 发件箱日志目录，默认 settings.OUTBOX_DIR，为空时仅使用内存队列
+            before_write: 每批写入前在同一事务内执行的转换（如转存提示词正文），返回实际写入的记录
+            after_write: 每批写入后在同一事务内执行的回调（如更新汇总表）
+        """
+        self.name = name
+        self.model = model
+        self.max_size = max_size or settings.WRITE_BEHIND_QUEUE_SIZE
+        self.batch_size = batch_size or settings.WRITE_BEHIND_BATCH_SIZE
+        self.flush_interval = flush_interval or settings.WRITE_BEHIND_FLUSH_INTERVAL
+        self.before_write = before_write
+        self.after_write = after_write
+
+        journal_dir = settings.OUTBOX_DIR if journal_dir is None else journal_dir
+        self._journal = OutboxJournal(Path(journal_dir) / f"{name}.journal") if journal_dir else None
+        self._batch_ready = asyncio.Event()
+
+        self._queue: asyncio.Queue[dict[str, Any]] | None = None
+        self._writer_task: asyncio.Task | None = None
+        self._closing = False
+
+        # 统计计数
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+        self._batches = 0
+
+        _registry.append(self)
+
+    def _ensure_writer(self) -> asyncio.Queue[dict[str, Any]]:
+        """惰性创建队列、打开日志并启动写入协程（需在事件循环中调用）"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_size)
+            if self._journal is not None:
+                replay = self._journal.open()
+                if replay:
+                    logger.info(f"发件箱 {self.name} 有 {replay} 条未导入记录，开始重放")
+                    self._batch_ready.set()
+        if self._writer_task is None or self._writer_task.done():
+            writer = self._journal_writer() if self._journal is not None else self._writer()
+            self._writer_task = asyncio.create_task(writer, name=f"write-behind:{self.name}")
+        return self._queue
+
+    def start(self) -> None:
+        """启动写入协程（应用启动时调用）"""
+        self._closing = False
+        self._ensure_writer()
+
+    def enqueue(self, **fields: Any) -> bool:
+        """
+        提交一条待写入记录（非阻塞）
+
+        Args:
+            **fields: 模型字段
+
+        Returns:
+            bool: 是否入队成功；队列已满或正在关闭时返回 False
+        """
+        if self._closing:
+            self._dropped += 1
+            return False
+
+        queue = self._ensure_writer()
+        if self._journal is not None:
+            if self._journal.pending >= self.max_size:
+                self._record_drop()
+                return False
+            try:
+                self._journal.append(fields)
+            except (OSError, TypeError) as e:
+                logger.error(f"写入发件箱 {self.name} 失败: {e}")
+                self._record_drop()
+                return False
+            if self._journal.pending >= self.batch_size:
+                self._batch_ready.set()
+        else:
+            try:
+                queue.put_nowait(fields)
+            except asyncio.QueueFull:
+                self._record_drop()
+                return False
+
+        self._enqueued += 1
+        return True
+
+    def _record_drop(self) -> None:
+        """记录一次丢弃"""
+        self._dropped += 1
+        if self._dropped == 1 or self._dropped % 100 == 0:
+            logger.warning(f"写后队列 {self.name} 已满，已丢弃 {self._dropped} 条记录")
+
+    async def _collect_batch(self, queue: asyncio.Queue[dict[str, Any]]) -> list[dict[str, Any]]:
+        """等待首条记录后，在 flush_interval 内攒满一批"""
+        batch = [await queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _write_batch(self, batch: list[dict[str, Any]]) -> bool:
+        """
+        批量写入一批记录
+
+        Returns:
+            bool: 是否写入成功（失败仅记录日志）
+        """
+        try:
+            async with in_transaction() as conn:
+                rows = await self.before_write(batch, conn) if self.before_write is not None else batch
+                await self.model.bulk_create([self.model(**fields) for fields in rows], using_db=conn)
+                if self.after_write is not None:
+                    await self.after_write(batch, conn)
+        except Exception as e:
+            logger.error(f"写后队列 {self.name} 批量写入 {len(batch)} 条失败: {e}")
+            return False
+
+        self._written += len(batch)
+        self._batches += 1
+        logger.debug(f"写后队列 {self.name} 批量写入 {len(batch)} 条")
+        return True
+
+    async def _writer(self) -> None:
+        """单一写入协程（内存队列模式）"""
+        queue = self._queue
+        while True:
+            batch = await self._collect_batch(queue)
+            if not await self._write_batch(batch):
+                self._failed += len(batch)
+            for _ in batch:
+                queue.task_done()
+
+    async def _journal_writer(self) -> None:
+        """单一写入协程（发件箱模式）：fsync 后从日志读取一批导入数据库"""
+        journal = self._journal
+        attempts = 0
+        while True:
+            if not journal.pending or (journal.pending < self.batch_size and not self._closing):
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval)
+            self._batch_ready.clear()
+            if not journal.pending:
+                continue
+
+            await asyncio.to_thread(journal.sync)
+            batch, end = await asyncio.to_thread(journal.read_batch, self.batch_size)
+            if not batch:
+                continue
+
+            if await self._write_batch(batch):
+                attempts = 0
+            else:
+                # 失败的批次保留在日志中重试，连续失败多次后跳过，避免阻塞后续记录
+                attempts += 1
+                if attempts < settings.OUTBOX_MAX_RETRIES:
+                    await asyncio.sleep(self.flush_interval)
+                    continue
+                logger.error(f"发件箱 {self.name} 连续 {attempts} 次导入失败，跳过 {len(batch)} 条记录")
+                self._failed += len(batch)
+                attempts = 0
+            journal.commit(end, len(batch))
+            if journal.needs_compact:
+                journal.swap(await asyncio.to_thread(journal.copy_tail))
+
+    async def drain(self, timeout: float = 10.0) -> None:
+        """
+        停止接收新记录并写完队列中剩余记录（应用关闭时调用）
+
+        Args:
+            timeout: 最长等待时间（秒）
+        """
+        self._closing = True
+        if self._queue is None:
+            return
+
+        if self._journal is not None:
+            self._batch_ready.set()
+            deadline = time.monotonic() + timeout
+            while self._journal.pending and time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+            remaining = self._journal.pending
+        else:
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._queue.join(), timeout=timeout)
+            remaining = self._queue.qsize()
+
+        if remaining:
+            logger.warning(f"写后队列 {self.name} 关闭超时，剩余 {remaining} 条未写入")
+
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            self._writer_task = None
+        if self._journal is not None:
+            # 未导入的记录保留在日志中，下次启动时重放
+            self._journal.close()
+
+    def get_stats(self) -> dict[str, int | str]:
+        """
+        获取队列统计
+
+        Returns:
+            dict: name, queue_depth, max_size, enqueued, written, dropped, failed, batches, journal_bytes
+        """
+        if self._journal is not None:
+            depth = self._journal.pending
+        else:
+            depth = self._queue.qsize() if self._queue is not None else 0
+        return {
+            "name": self.name,
+            "queue_depth": depth,
+            "max_size": self.max_size,
+            "enqueued": self._enqueued,
+            "written": self._written,
+            "dropped": self._dropped,
+            "failed": self._failed,
+            "batches": self._batches,
+            "journal_bytes": self._journal.pending_bytes if self._journal is not None else 0,
+        }
+
+
+# 已创建的队列（用于统一启动/关闭/统计）
+_registry: list[WriteBehindQueue] = []
+
+
+def start_write_behind_queues() -> None:
+    """启动所有写后队列"""
+    for queue in _registry:
+        queue.start()
+
+
+async def drain_write_behind_queues(timeout: float = 10.0) -> None:
+    """写完并关闭所有写后队列"""
+    await asyncio.gather(*(queue.drain(timeout) for queue in _registry))
+
+
+def get_write_behind_stats() -> list[dict[str, int | str]]:
+    """获取所有写后队列的统计"""
+    return [queue.get_stats() for queue in _registry]
@@ -91,11 +91,53 @@ async def lifespan(_app: FastAPI):
         )
         logger.info("✅ 创建默认管理员账号: admin/admin")
 
+    # 预编译提示词模板
+    from src.backend.core.template import template_manager
+
+    template_manager.precompile()
+
+    # 启动遥测批量写入队列
+    from src.backend.core.write_behind import (
+        drain_write_behind_queues,
+        start_write_behind_queues,
+    )
+
+    start_write_behind_queues()
+
+    # 启动提示词记录定时归档
+    from src.backend.services.prompt_archive import prompt_archive_service
+
+    prompt_archive_service.start()
+
+    # 启动仪表盘计数器定时对账
+    from src.features.dashboard.backend.services.counter_service import (
+        dashboard_counter_service,
+    )
+
+    dashboard_counter_service.start()
+
+    # 启动项目字数定时对账
+    from src.features.chapter.backend.services.word_count import (
+        project_word_count_reconciler,
+    )
+
+    project_word_count_reconciler.start()
+
+    # 启动章节保存缓冲定时写入
+    from src.features.chapter.backend.services.save_buffer import chapter_save_buffer
+
+    chapter_save_buffer.start()
+
     yield
 
     # 清理资源
     logger.info(f"👋 关闭 {settings.APP_NAME}...")
     await log_stream_manager.shutdown()  # 关闭 SSE 连接
+    await prompt_archive_service.stop()  # 等待进行中的归档批次完成
+    await chapter_save_buffer.stop()  # 写入缓冲中尚未保存的章节
+    await dashboard_counter_service.stop()
+    await project_word_count_reconciler.stop()
+    await drain_write_behind_queues()  # 写完队列中剩余的遥测记录
     await close_db()
     logger.info("✅ 数据库连接已关闭")
 
@@ -117,6 +159,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Quota-Remaining-Tokens", "X-Quota-Remaining-Cost"],  # 流式响应的剩余配额
 )
 
 
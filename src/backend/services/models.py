@@ -13,8 +13,10 @@ class TokenUsageRecord(Model):
 
     # Token统计
     prompt_tokens = fields.IntField(description="提示词Token数")
+    cached_tokens = fields.IntField(default=0, description="命中缓存的提示词Token数")
     completion_tokens = fields.IntField(description="生成内容Token数")
     total_tokens = fields.IntField(description="总Token数")
+    cost = fields.FloatField(default=0, description="费用（按模型价格表计算）")
 
     # 请求元数据
     model = fields.CharField(max_length=100, description="使用的AI模型")
@@ -35,6 +37,42 @@ class TokenUsageRecord(Model):
         return f"TokenUsageRecord(id={self.id}, user_id={self.user_id}, total_tokens={self.total_tokens})"
 
 
+class TokenUsageRollup(Model):
+    """Token使用量汇总模型（按小时/按天预聚合）"""
+
+    id = fields.IntField(pk=True, description="汇总ID")
+    granularity = fields.CharField(max_length=8, description="汇总粒度: hour/day")
+    bucket = fields.CharField(max_length=16, description="时间桶（UTC）: YYYY-MM-DD HH / YYYY-MM-DD")
+
+    # 汇总维度
+    user_id = fields.IntField(description="用户ID")
+    project_id = fields.IntField(default=0, description="项目ID（0表示无项目）")
+    model = fields.CharField(max_length=100, description="使用的AI模型")
+    endpoint = fields.CharField(max_length=255, description="请求的API端点")
+
+    # 累计值
+    request_count = fields.IntField(default=0, description="请求次数")
+    prompt_tokens = fields.IntField(default=0, description="提示词Token数")
+    cached_tokens = fields.IntField(default=0, description="命中缓存的提示词Token数")
+    completion_tokens = fields.IntField(default=0, description="生成内容Token数")
+    total_tokens = fields.IntField(default=0, description="总Token数")
+    cost = fields.FloatField(default=0, description="费用")
+
+    updated_at = fields.DatetimeField(auto_now=True, description="更新时间")
+
+    class Meta:
+        table = "token_usage_rollups"
+        table_description = "Token使用量汇总表"
+        unique_together = (("granularity", "bucket", "user_id", "project_id", "model", "endpoint"),)
+        indexes = [
+            ("user_id", "granularity", "bucket"),
+            ("project_id", "granularity", "bucket"),
+        ]
+
+    def __str__(self):
+        return f"TokenUsageRollup({self.granularity} {self.bucket}, user_id={self.user_id}, total_tokens={self.total_tokens})"
+
+
 class PromptRecord(Model):
     """提示词记录模型"""
 
@@ -42,9 +80,11 @@ class PromptRecord(Model):
     user_id = fields.IntField(index=True, description="用户ID")
     project_id = fields.IntField(null=True, index=True, description="项目ID（可选）")
 
-    # 提示词内容
+    # 提示词内容（新记录正文存于 prompt_blobs，此处留空，仅旧记录保存原文）
     system_prompt = fields.TextField(description="系统提示词")
     user_prompt = fields.TextField(description="用户提示词")
+    system_prompt_hash = fields.CharField(max_length=64, null=True, description="系统提示词内容哈希")
+    user_prompt_hash = fields.CharField(max_length=64, null=True, description="用户提示词内容哈希")
 
     # 请求元数据
     model = fields.CharField(max_length=100, null=True, description="使用的AI模型")
@@ -60,7 +100,28 @@ class PromptRecord(Model):
         indexes = [
             ("user_id", "created_at"),
             ("project_id", "created_at"),
+            ("user_id", "endpoint", "created_at"),
         ]
 
     def __str__(self):
         return f"PromptRecord(id={self.id}, user_id={self.user_id}, endpoint={self.endpoint})"
+
+
+class PromptBlob(Model):
+    """提示词内容模型（按内容寻址、压缩存储）"""
+
+    id = fields.IntField(pk=True, description="内容ID（全文索引的 rowid）")
+    hash = fields.CharField(max_length=64, unique=True, description="内容SHA-256")
+    codec = fields.CharField(max_length=8, description="压缩编码: raw/zlib/zstd")
+    dict_hash = fields.CharField(max_length=64, null=True, description="压缩字典的内容哈希")
+    data = fields.BinaryField(description="压缩后的内容")
+    size = fields.IntField(description="原文长度")
+
+    created_at = fields.DatetimeField(auto_now_add=True, description="创建时间")
+
+    class Meta:
+        table = "prompt_blobs"
+        table_description = "提示词内容表"
+
+    def __str__(self):
+        return f"PromptBlob(hash={self.hash[:12]}, codec={self.codec}, size={self.size})"
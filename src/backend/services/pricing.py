@@ -0,0 +1,63 @@
+"""模型计价
+根据配置的模型价格表（每百万 Token 单价）计算单次请求的费用
+"""
+
+from functools import lru_cache
+
+from src.backend.config.settings import settings
+
+_TOKENS_PER_UNIT = 1_000_000
+
+
+@lru_cache(maxsize=256)
+def get_model_price(model: str) -> dict[str, float] | None:
+    """
+    查找模型单价
+
+    先精确匹配，再按最长前缀匹配（如 gpt-4o-mini-2024-07-18 匹配 gpt-4o-mini）
+
+    Args:
+        model: 模型名称
+
+    Returns:
+        dict: {input, cached_input, output}；未配置价格时返回None
+    """
+    table = settings.MODEL_PRICE_TABLE
+    if model in table:
+        return table[model]
+    prefixes = [name for name in table if model.startswith(name)]
+    if not prefixes:
+        return None
+    return table[max(prefixes, key=len)]
+
+
+def compute_cost(
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    cached_tokens: int = 0,
+) -> float:
+    """
+    计算单次请求费用
+
+    Args:
+        model: 模型名称
+        prompt_tokens: 提示词Token数（包含命中缓存的部分）
+        completion_tokens: 生成内容Token数
+        cached_tokens: 命中缓存的提示词Token数
+
+    Returns:
+        float: 费用；未配置价格的模型返回0
+    """
+    price = get_model_price(model)
+    if price is None:
+        return 0.0
+
+    cached_tokens = min(cached_tokens, prompt_tokens)
+    input_price = price.get("input", 0.0)
+    cost = (
+        (prompt_tokens - cached_tokens) * input_price
+        + cached_tokens * price.get("cached_input", input_price)
+        + completion_tokens * price.get("output", 0.0)
+    )
+    return round(cost / _TOKENS_PER_UNIT, 8)
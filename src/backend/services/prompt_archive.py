@@ -0,0 +1,287 @@
+"""提示词记录保留策略与冷归档
+按端点配置采样率、最大保存长度和保留天数；
+超过保留期的记录由后台任务移出数据库，写入按日期分区的压缩 JSONL 归档文件，按需读取
+
+归档目录结构: <PROMPT_ARCHIVE_DIR>/YYYY/MM/DD/part-<起始ID>-<结束ID>.jsonl.<zst|zlib>
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+import random
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from tortoise import timezone as tz
+from tortoise.transactions import in_transaction
+
+from src.backend.config.settings import settings
+from src.backend.core.compression import CODEC_ZLIB, CODEC_ZSTD, compress, decompress
+from src.backend.core.logger import logger
+from src.backend.services.models import PromptRecord
+from src.backend.services.prompt_blobs import prompt_blob_service
+
+_EXTENSIONS = {CODEC_ZSTD: ".zst", CODEC_ZLIB: ".zlib"}
+_CODECS = {ext: codec for codec, ext in _EXTENSIONS.items()}
+
+_ARCHIVE_FIELDS = (
+    "id", "user_id", "project_id", "system_prompt", "user_prompt",
+    "model", "endpoint", "temperature", "created_at",
+)
+
+
+class PromptRecordPolicy(NamedTuple):
+    """提示词记录策略"""
+
+    sample_rate: float = 1.0  # 采样率（0-1）
+    max_length: int = 0  # 单条提示词最大保存长度（0 表示不限制）
+    retention_days: int = 0  # 数据库保留天数（0 表示永久保留）
+
+
+@lru_cache(maxsize=256)
+def get_prompt_policy(endpoint: str) -> PromptRecordPolicy:
+    """
+    获取端点的记录策略
+
+    先精确匹配，再按最长前缀匹配（如 /chapter/generate 匹配 /chapter），
+    匹配到的配置覆盖 PROMPT_RECORD_DEFAULT_POLICY
+
+    Args:
+        endpoint: API端点
+
+    Returns:
+        PromptRecordPolicy: 记录策略
+    """
+    policies = settings.PROMPT_RECORD_POLICIES
+    override = policies.get(endpoint)
+    if override is None:
+        prefixes = [name for name in policies if endpoint.startswith(name)]
+        override = policies[max(prefixes, key=len)] if prefixes else {}
+    policy = {**settings.PROMPT_RECORD_DEFAULT_POLICY, **override}
+    return PromptRecordPolicy(
+        sample_rate=float(policy.get("sample_rate", 1.0)),
+        max_length=int(policy.get("max_length", 0)),
+        retention_days=int(policy.get("retention_days", 0)),
+    )
+
+
+def apply_prompt_policy(
+    endpoint: str, system_prompt: str, user_prompt: str,
+) -> tuple[str, str] | None:
+    """
+    按端点策略采样并截断提示词
+
+    Args:
+        endpoint: API端点
+        system_prompt: 系统提示词
+        user_prompt: 用户提示词
+
+    Returns:
+        tuple: 截断后的 (系统提示词, 用户提示词)；未被采样时返回None
+    """
+    policy = get_prompt_policy(endpoint)
+    if policy.sample_rate < 1 and random.random() >= policy.sample_rate:
+        return None
+    if policy.max_length:
+        system_prompt = _truncate(system_prompt, policy.max_length)
+        user_prompt = _truncate(user_prompt, policy.max_length)
+    return system_prompt, user_prompt
+
+
+def _truncate(text: str, max_length: int) -> str:
+    if len(text) <= max_length:
+        return text
+    return f"{text[:max_length]}\n…[已截断 {len(text) - max_length} 字]"
+
+
+def _to_jsonable(record: PromptRecord) -> dict[str, Any]:
+    data = {name: getattr(record, name) for name in _ARCHIVE_FIELDS}
+    data["created_at"] = record.created_at.astimezone(timezone.utc).isoformat()
+    return data
+
+
+class PromptArchiveService:
+    """提示词记录归档服务
+
+    特性:
+    - 每个端点按各自的保留天数归档，归档文件先原子写入，再从数据库删除对应记录
+    - 归档后清理无引用的提示词 blob
+    - 同一批记录重复归档（如写入后、删除前崩溃）时，读取按记录ID去重
+    """
+
+    def __init__(self, archive_dir: str | Path | None = None):
+        """
+        Args:
+            archive_dir: 归档目录，默认 settings.PROMPT_ARCHIVE_DIR
+        """
+        self.archive_dir = Path(archive_dir or settings.PROMPT_ARCHIVE_DIR)
+        self._task: asyncio.Task | None = None
+        self._stop = asyncio.Event()
+        self._lock = asyncio.Lock()
+
+    # ==================== 写入 ====================
+
+    def _partition_dir(self, day: date) -> Path:
+        return self.archive_dir / f"{day.year:04d}" / f"{day.month:02d}" / f"{day.day:02d}"
+
+    def _write_parts(self, records: list[dict[str, Any]]) -> None:
+        """按日期（UTC）分区写入一批记录（在线程中执行）"""
+        partitions: dict[date, list[dict[str, Any]]] = defaultdict(list)
+        for record in records:
+            partitions[datetime.fromisoformat(record["created_at"]).date()].append(record)
+
+        for day, items in partitions.items():
+            payload = "".join(
+                json.dumps(item, ensure_ascii=False) + "\n" for item in items
+            ).encode("utf-8")
+            codec, data = compress(payload)
+            directory = self._partition_dir(day)
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / f"part-{items[0]['id']}-{items[-1]['id']}.jsonl{_EXTENSIONS[codec]}"
+
+            tmp_path = path.with_name(path.name + ".tmp")
+            with tmp_path.open("wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            tmp_path.replace(path)
+
+    async def _archive_endpoint(self, endpoint: str, cutoff: datetime) -> int:
+        """归档单个端点早于 cutoff 的记录"""
+        archived = 0
+        while True:
+            records = (
+                await PromptRecord.filter(endpoint=endpoint, created_at__lt=cutoff)
+                .order_by("id")
+                .limit(settings.PROMPT_ARCHIVE_BATCH_SIZE)
+            )
+            if not records:
+                return archived
+
+            await prompt_blob_service.hydrate(records)
+            await asyncio.to_thread(self._write_parts, [_to_jsonable(record) for record in records])
+            await PromptRecord.filter(id__in=[record.id for record in records]).delete()
+            archived += len(records)
+
+    async def compact(self) -> int:
+        """
+        归档所有超过保留期的记录
+
+        Returns:
+            int: 归档的记录数
+        """
+        async with self._lock:
+            now = tz.now()
+            endpoints = await PromptRecord.all().distinct().values_list("endpoint", flat=True)
+
+            archived = 0
+            for endpoint in endpoints:
+                retention_days = get_prompt_policy(endpoint).retention_days
+                if retention_days > 0:
+                    archived += await self._archive_endpoint(endpoint, now - timedelta(days=retention_days))
+
+            if archived:
+                async with in_transaction() as conn:
+                    removed = await prompt_blob_service.collect_garbage(conn)
+                logger.info(f"提示词记录归档完成: 归档 {archived} 条, 清理 {removed} 个无引用内容")
+            return archived
+
+    # ==================== 读取 ====================
+
+    def list_dates(self) -> list[str]:
+        """
+        列出存在归档的日期
+
+        Returns:
+            list[str]: 日期（YYYY-MM-DD，倒序）
+        """
+        if not self.archive_dir.exists():
+            return []
+        dates = {
+            "-".join(part.relative_to(self.archive_dir).parts[:3])
+            for part in self.archive_dir.glob("*/*/*/part-*.jsonl.*")
+            if part.suffix in _CODECS
+        }
+        return sorted(dates, reverse=True)
+
+    def _read_day(self, day: date) -> list[dict[str, Any]]:
+        """读取某天的全部归档记录（在线程中执行）"""
+        directory = self._partition_dir(day)
+        if not directory.exists():
+            return []
+
+        records: dict[int, dict[str, Any]] = {}
+        for path in sorted(directory.glob("part-*.jsonl.*")):
+            codec = _CODECS.get(path.suffix)
+            if codec is None:
+                continue
+            for line in decompress(codec, path.read_bytes()).decode("utf-8").splitlines():
+                if line:
+                    record = json.loads(line)
+                    records[record["id"]] = record
+        return list(records.values())
+
+    async def query(
+        self,
+        user_id: int,
+        day: date,
+        project_id: int | None = None,
+        endpoint: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        查询某天的归档记录
+
+        Args:
+            user_id: 用户ID
+            day: 日期（UTC）
+            project_id: 可选的项目ID过滤
+            endpoint: 可选的端点过滤（包含匹配，不区分大小写）
+
+        Returns:
+            list[dict]: 记录列表（按创建时间倒序）
+        """
+        endpoint = endpoint.lower() if endpoint else None
+        records = [
+            record
+            for record in await asyncio.to_thread(self._read_day, day)
+            if record["user_id"] == user_id
+            and (project_id is None or record["project_id"] == project_id)
+            and (endpoint is None or endpoint in record["endpoint"].lower())
+        ]
+        records.sort(key=lambda record: (record["created_at"], record["id"]), reverse=True)
+        return records
+
+    # ==================== 后台任务 ====================
+
+    async def _run(self, interval: float) -> None:
+        while not self._stop.is_set():
+            try:
+                await self.compact()
+            except Exception as e:
+                logger.error(f"提示词记录归档失败: {e}")
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stop.wait(), timeout=interval)
+
+    def start(self) -> None:
+        """启动定时归档任务（需在事件循环中调用）"""
+        interval = settings.PROMPT_ARCHIVE_INTERVAL
+        if interval <= 0 or self._task is not None:
+            return
+        self._stop.clear()
+        self._task = asyncio.create_task(self._run(interval), name="prompt-archive")
+
+    async def stop(self) -> None:
+        """停止定时归档任务（等待进行中的批次完成）"""
+        if self._task is None:
+            return
+        self._stop.set()
+        await self._task
+        self._task = None
+
+
+# 创建全局提示词归档服务实例
+prompt_archive_service = PromptArchiveService()
@@ -0,0 +1,327 @@
+"""提示词内容存储
+提示词正文按内容寻址（SHA-256）压缩后存入 prompt_blobs 表，相同内容只存一份；
+压缩时可使用由提示词模板构建的预置字典，模板中的固定文本几乎不占空间
+
+全文检索使用无内容（contentless）FTS5 trigram 索引 prompt_blob_fts，
+rowid 为 prompt_blobs 的整数主键 id（VACUUM 不会重新编号），只保存倒排索引、不重复保存正文
+"""
+
+import hashlib
+from collections.abc import Iterable
+from typing import Optional
+
+from cachetools import LRUCache
+from tortoise import BaseDBAsyncClient, Tortoise
+
+from src.backend.config.settings import settings
+from src.backend.core.compression import CODEC_RAW, compress, decompress
+from src.backend.core.logger import logger
+from src.backend.core.template import template_manager
+from src.backend.services.models import PromptBlob, PromptRecord
+
+# 字典上限（zstd 原始内容字典；zlib 只使用末尾 32KB）
+_DICTIONARY_LIMIT = 64 * 1024
+
+_INSERT_SQL = (
+    'INSERT OR IGNORE INTO "prompt_blobs" ("hash", "codec", "dict_hash", "data", "size", "created_at") '
+    "VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)"
+)
+
+# 全文索引表（由迁移创建；开发环境 generate_schemas 之后由 init_db 补建）
+SCHEMA_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS "prompt_blob_fts" USING fts5("body", content='', tokenize='trigram');
+"""
+
+# 新写入的正文加入全文索引（已索引的跳过）
+_FTS_INSERT_SQL = (
+    'INSERT INTO "prompt_blob_fts" ("rowid", "body") '
+    'SELECT b."id", ? FROM "prompt_blobs" b WHERE b."hash" = ? '
+    'AND NOT EXISTS (SELECT 1 FROM "prompt_blob_fts" WHERE "rowid" = b."id")'
+)
+
+# 在给定的内容中检索（只匹配调用方传入的哈希，不在全部用户的内容中排序截断）
+_FTS_MATCH_SQL = (
+    'SELECT b."hash" FROM "prompt_blob_fts" f JOIN "prompt_blobs" b ON b."id" = f."rowid" '
+    'WHERE "prompt_blob_fts" MATCH ? AND b."hash" IN ({placeholders})'
+)
+
+# 不再被任何记录（或其他 blob 的字典）引用的内容
+_UNREFERENCED_SQL = """
+"hash" NOT IN (SELECT "system_prompt_hash" FROM "prompt_records" WHERE "system_prompt_hash" IS NOT NULL)
+AND "hash" NOT IN (SELECT "user_prompt_hash" FROM "prompt_records" WHERE "user_prompt_hash" IS NOT NULL)
+AND "hash" NOT IN (SELECT "dict_hash" FROM "prompt_blobs" WHERE "dict_hash" IS NOT NULL)
+"""
+
+# trigram 分词要求检索词至少 3 个字符
+MIN_SEARCH_LENGTH = 3
+
+
+def hash_text(text: str) -> str:
+    """计算文本的内容哈希"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class PromptBlobService:
+    """提示词内容存储服务
+
+    特性:
+    - 按哈希去重，INSERT OR IGNORE 写入；最近的压缩结果在进程内缓存，重复的系统提示词不再压缩
+    - 预置字典本身也作为一个未压缩的 blob 存储，旧字典始终可用于解压
+    - 解压结果 LRU 缓存
+    """
+
+    def __init__(self):
+        self._compressed: LRUCache = LRUCache(maxsize=1024)
+        self._texts: LRUCache = LRUCache(maxsize=settings.PROMPT_BLOB_CACHE_SIZE)
+        self._dictionaries: dict[str, bytes] = {}
+        self._dictionary: Optional[tuple[str, bytes]] = None
+        self._dictionary_built = False
+
+    def _get_dictionary(self) -> Optional[tuple[str, bytes]]:
+        """由提示词模板源码构建预置字典（进程内只构建一次）"""
+        if self._dictionary_built:
+            return self._dictionary
+        self._dictionary_built = True
+
+        if not settings.PROMPT_BLOB_USE_DICTIONARY:
+            return None
+        try:
+            template_dir = template_manager.template_dir
+            sources = [
+                path.read_bytes()
+                for path in sorted(template_dir.rglob("*.jinja2"))
+            ]
+        except OSError as e:
+            logger.warning(f"构建提示词压缩字典失败: {e}")
+            return None
+
+        data = b"\n".join(sources)[-_DICTIONARY_LIMIT:]
+        if not data:
+            return None
+        dict_hash = hashlib.sha256(data).hexdigest()
+        self._dictionary = (dict_hash, data)
+        self._dictionaries[dict_hash] = data
+        return self._dictionary
+
+    async def store(self, texts: Iterable[str], using_db: BaseDBAsyncClient) -> None:
+        """
+        存储提示词正文（已存在的内容自动忽略）
+
+        Args:
+            texts: 提示词正文
+            using_db: 数据库连接（通常为写入记录的事务连接）
+        """
+        dictionary = self._get_dictionary()
+        rows: dict[str, list] = {}
+        texts_by_hash: dict[str, str] = {}
+        for text in texts:
+            text_hash = hash_text(text)
+            if text_hash in rows:
+                continue
+            texts_by_hash[text_hash] = text
+            row = self._compressed.get(text_hash)
+            if row is None:
+                codec, data = compress(text.encode("utf-8"), dictionary[1] if dictionary else None)
+                row = self._compressed[text_hash] = [
+                    text_hash, codec, dictionary[0] if dictionary else None, data, len(text),
+                ]
+            rows[text_hash] = row
+
+        if not rows:
+            return
+        if dictionary:
+            rows[dictionary[0]] = [dictionary[0], CODEC_RAW, None, dictionary[1], len(dictionary[1])]
+
+        # 已存在的内容由 INSERT OR IGNORE 跳过，事务回滚后重试也不会缺失
+        await using_db.execute_many(_INSERT_SQL, list(rows.values()))
+        await using_db.execute_many(
+            _FTS_INSERT_SQL, [[text, text_hash] for text_hash, text in texts_by_hash.items()],
+        )
+
+    async def _load_dictionary(self, dict_hash: str) -> bytes:
+        """加载预置字典（按哈希，历史字典从数据库读取）"""
+        data = self._dictionaries.get(dict_hash)
+        if data is None:
+            blob = await PromptBlob.get(hash=dict_hash)
+            data = self._dictionaries[dict_hash] = bytes(blob.data)
+        return data
+
+    async def load_texts(self, hashes: Iterable[str]) -> dict[str, str]:
+        """
+        批量读取并解压提示词正文
+
+        Args:
+            hashes: 内容哈希
+
+        Returns:
+            dict: 哈希 -> 正文（不存在的哈希不会出现在结果中）
+        """
+        result: dict[str, str] = {}
+        missing = set()
+        for text_hash in hashes:
+            text = self._texts.get(text_hash)
+            if text is None:
+                missing.add(text_hash)
+            else:
+                result[text_hash] = text
+
+        if missing:
+            for blob in await PromptBlob.filter(hash__in=list(missing)):
+                dictionary = await self._load_dictionary(blob.dict_hash) if blob.dict_hash else None
+                text = decompress(blob.codec, bytes(blob.data), dictionary).decode("utf-8")
+                self._texts[blob.hash] = result[blob.hash] = text
+        return result
+
+    async def hydrate(self, records: list[PromptRecord]) -> list[PromptRecord]:
+        """
+        为记录填充提示词正文（未引用 blob 的旧记录保持原样）
+
+        Args:
+            records: 提示词记录
+
+        Returns:
+            list[PromptRecord]: 原记录列表
+        """
+        hashes = {
+            text_hash
+            for record in records
+            for text_hash in (record.system_prompt_hash, record.user_prompt_hash)
+            if text_hash
+        }
+        if not hashes:
+            return records
+
+        texts = await self.load_texts(hashes)
+        for record in records:
+            if record.system_prompt_hash:
+                record.system_prompt = texts.get(record.system_prompt_hash, "")
+            if record.user_prompt_hash:
+                record.user_prompt = texts.get(record.user_prompt_hash, "")
+        return records
+
+    async def externalize(
+        self, batch: list[dict], using_db: BaseDBAsyncClient,
+    ) -> list[dict]:
+        """
+        写入前将记录中的提示词正文转存为 blob，记录只保留哈希
+
+        Args:
+            batch: 提示词记录字段
+            using_db: 事务连接
+
+        Returns:
+            list[dict]: 替换后的记录字段
+        """
+        await self.store(
+            (text for fields in batch for text in (fields["system_prompt"], fields["user_prompt"])),
+            using_db,
+        )
+        return [
+            {
+                **fields,
+                "system_prompt": "",
+                "user_prompt": "",
+                "system_prompt_hash": hash_text(fields["system_prompt"]),
+                "user_prompt_hash": hash_text(fields["user_prompt"]),
+            }
+            for fields in batch
+        ]
+
+    async def match(self, keyword: str, hashes: Iterable[str]) -> set[str]:
+        """
+        检索给定内容中哪些包含检索词
+
+        Args:
+            keyword: 检索词（按短语匹配，至少 MIN_SEARCH_LENGTH 个字符）
+            hashes: 待检索的内容哈希（如一批记录引用的正文）
+
+        Returns:
+            set[str]: 命中的内容哈希
+        """
+        hashes = list(set(hashes))
+        if not hashes:
+            return set()
+        phrase = '"' + keyword.replace('"', '""') + '"'
+        conn = Tortoise.get_connection("default")
+        _, rows = await conn.execute_query(
+            _FTS_MATCH_SQL.format(placeholders=", ".join("?" * len(hashes))), [phrase, *hashes],
+        )
+        return {row["hash"] for row in rows}
+
+    async def _unindex(self, blobs: list[dict], using_db: BaseDBAsyncClient) -> None:
+        """从全文索引中移除 blob（无内容 FTS5 删除时须提供原文）"""
+        for blob in blobs:
+            _, indexed = await using_db.execute_query(
+                'SELECT 1 FROM "prompt_blob_fts" WHERE "rowid" = ?', [blob["id"]],
+            )
+            if not indexed:
+                continue
+            dictionary = await self._load_dictionary(blob["dict_hash"]) if blob["dict_hash"] else None
+            text = decompress(blob["codec"], bytes(blob["data"]), dictionary).decode("utf-8")
+            await using_db.execute_query(
+                'INSERT INTO "prompt_blob_fts" ("prompt_blob_fts", "rowid", "body") VALUES (\'delete\', ?, ?)',
+                [blob["id"], text],
+            )
+
+    async def collect_garbage(self, using_db: BaseDBAsyncClient) -> int:
+        """
+        清理无引用的 blob 及其全文索引（记录归档删除后调用，应在事务内执行）
+
+        store() 总是以 INSERT OR IGNORE 重新写入，与并发写入的事务交错也不会留下悬空引用
+
+        Args:
+            using_db: 事务连接
+
+        Returns:
+            int: 删除的 blob 数
+        """
+        _, blobs = await using_db.execute_query(
+            f'SELECT "id", "hash", "codec", "dict_hash", "data" FROM "prompt_blobs" WHERE {_UNREFERENCED_SQL}',
+        )
+        if not blobs:
+            return 0
+
+        await self._unindex(blobs, using_db)
+        await using_db.execute_many(
+            'DELETE FROM "prompt_blobs" WHERE "hash" = ?', [[blob["hash"]] for blob in blobs],
+        )
+        for blob in blobs:
+            self._compressed.pop(blob["hash"], None)
+        return len(blobs)
+
+    async def rebuild_search_index(self, batch_size: int = 500) -> int:
+        """
+        重建全文索引（为启用检索前已存在的正文补建索引）
+
+        Args:
+            batch_size: 每批处理的 blob 数
+
+        Returns:
+            int: 已索引的正文数
+        """
+        conn = Tortoise.get_connection("default")
+        await conn.execute_query('INSERT INTO "prompt_blob_fts" ("prompt_blob_fts") VALUES (\'delete-all\')')
+
+        indexed = 0
+        last_id = 0
+        while True:
+            _, blobs = await conn.execute_query(
+                'SELECT "id", "codec", "dict_hash", "data" FROM "prompt_blobs" '
+                'WHERE "id" > ? AND "hash" NOT IN '
+                '(SELECT "dict_hash" FROM "prompt_blobs" WHERE "dict_hash" IS NOT NULL) '
+                'ORDER BY "id" LIMIT ?',
+                [last_id, batch_size],
+            )
+            if not blobs:
+                return indexed
+
+            values = []
+            for blob in blobs:
+                dictionary = await self._load_dictionary(blob["dict_hash"]) if blob["dict_hash"] else None
+                values.append([blob["id"], decompress(blob["codec"], bytes(blob["data"]), dictionary).decode("utf-8")])
+            await conn.execute_many('INSERT INTO "prompt_blob_fts" ("rowid", "body") VALUES (?, ?)', values)
+            indexed += len(values)
+            last_id = blobs[-1]["id"]
+
+# 创建全局提示词内容存储实例
+prompt_blob_service = PromptBlobService()
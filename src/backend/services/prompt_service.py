@@ -2,11 +2,16 @@
 记录每次AI请求的提示词内容
 """
 
-import asyncio
 from typing import Optional
 
+from tortoise import timezone
+from tortoise.transactions import in_transaction
+
 from src.backend.core.logger import logger
+from src.backend.core.write_behind import WriteBehindQueue
 from src.backend.services.models import PromptRecord
+from src.backend.services.prompt_archive import apply_prompt_policy
+from src.backend.services.prompt_blobs import prompt_blob_service
 
 
 class PromptRecordService:
@@ -15,9 +20,18 @@ class PromptRecordService:
     特性:
     - 异步记录提示词
     - 支持用户级和项目级关联
-    - 后台任务模式避免阻塞主流程
+    - 后台记录走批量写后队列，避免阻塞主流程
+    - 正文按内容寻址压缩存储（见 prompt_blobs.py），读取时透明解压
+    - 按端点策略采样、截断，超过保留期的记录归档（见 prompt_archive.py）
     """
 
+    def __init__(self):
+        self.queue = WriteBehindQueue(
+            "prompt_records",
+            PromptRecord,
+            before_write=prompt_blob_service.externalize,
+        )
+
     async def record_prompt(
         self,
         user_id: int,
@@ -40,18 +54,26 @@ class PromptRecordService:
             project_id: 项目ID（可选）
             
         Returns:
-            int: 记录ID，失败返回None
+            int: 记录ID，失败或未被采样时返回None
         """
+        prompts = apply_prompt_policy(endpoint, system_prompt, user_prompt)
+        if prompts is None:
+            return None
+        system_prompt, user_prompt = prompts
+
         try:
-            record = await PromptRecord.create(
-                user_id=user_id,
-                project_id=project_id,
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                model=model,
-                endpoint=endpoint,
-                temperature=temperature,
-            )
+            fields = {
+                "user_id": user_id,
+                "project_id": project_id,
+                "system_prompt": system_prompt,
+                "user_prompt": user_prompt,
+                "model": model,
+                "endpoint": endpoint,
+                "temperature": temperature,
+            }
+            async with in_transaction() as conn:
+                [fields] = await prompt_blob_service.externalize([fields], conn)
+                record = await PromptRecord.create(**fields, using_db=conn)
 
             logger.debug(
                 f"提示词已记录: user_id={user_id}, "
@@ -76,7 +98,7 @@ class PromptRecordService:
         temperature: Optional[float] = None,
         project_id: Optional[int] = None,
     ) -> None:
-        """在后台任务中记录提示词
+        """在后台记录提示词（进入批量写后队列）
         
         Args:
             user_id: 用户ID
@@ -87,16 +109,20 @@ class PromptRecordService:
             temperature: 温度参数（可选）
             project_id: 项目ID（可选）
         """
-        asyncio.create_task(
-            self.record_prompt(
-                user_id=user_id,
-                system_prompt=system_prompt,
-                user_prompt=user_prompt,
-                endpoint=endpoint,
-                model=model,
-                temperature=temperature,
-                project_id=project_id,
-            ),
+        prompts = apply_prompt_policy(endpoint, system_prompt, user_prompt)
+        if prompts is None:
+            return
+        system_prompt, user_prompt = prompts
+
+        self.queue.enqueue(
+            user_id=user_id,
+            project_id=project_id,
+            system_prompt=system_prompt,
+            user_prompt=user_prompt,
+            model=model,
+            endpoint=endpoint,
+            temperature=temperature,
+            created_at=timezone.now(),
         )
 
     async def get_user_prompts(
@@ -119,6 +145,7 @@ class PromptRecordService:
             .limit(limit)
             .all()
         )
+        await prompt_blob_service.hydrate(records)
 
         return [
             {
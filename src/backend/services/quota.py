@@ -0,0 +1,243 @@
+"""Token配额服务
+按用户/项目限制每日、每月的 Token 用量和费用
+
+计数器保存在内存中：每个范围首次检查时从天汇总表读取本月已用量，
+之后随使用记录的写入实时累加，检查本身不再查询数据库
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
+
+from tortoise.functions import Sum
+
+from src.backend.config.settings import settings
+from src.backend.core.exceptions import QuotaExceededError
+from src.backend.services.models import TokenUsageRollup
+
+USER = "user"
+PROJECT = "project"
+
+_SCOPE_NAMES = {USER: "用户", PROJECT: "项目"}
+_PERIOD_NAMES = {"daily": "今日", "monthly": "本月"}
+
+
+class QuotaPolicy(NamedTuple):
+    """配额策略（0 表示不限制）"""
+
+    daily_tokens: int = 0
+    monthly_tokens: int = 0
+    daily_cost: float = 0
+    monthly_cost: float = 0
+
+    @property
+    def unlimited(self) -> bool:
+        return not any(self)
+
+
+class QuotaStatus(NamedTuple):
+    """配额检查结果"""
+
+    remaining_tokens: Optional[int] = None  # 剩余 Token（None 表示不限制）
+    remaining_cost: Optional[float] = None  # 剩余费用（None 表示不限制）
+
+    def headers(self) -> dict[str, str]:
+        """流式响应附带的剩余配额响应头"""
+        headers = {}
+        if self.remaining_tokens is not None:
+            headers["X-Quota-Remaining-Tokens"] = str(self.remaining_tokens)
+        if self.remaining_cost is not None:
+            headers["X-Quota-Remaining-Cost"] = f"{self.remaining_cost:.6f}"
+        return headers
+
+
+class _Usage:
+    """单个范围的已用量（当日 / 当月）"""
+
+    __slots__ = ("day", "day_cost", "day_tokens", "month", "month_cost", "month_tokens")
+
+    def __init__(self, day: str, month: str):
+        self.day = day
+        self.month = month
+        self.day_tokens = 0
+        self.day_cost = 0.0
+        self.month_tokens = 0
+        self.month_cost = 0.0
+
+    def roll(self, day: str, month: str) -> None:
+        """跨天/跨月时清零对应计数"""
+        if self.month != month:
+            self.month = month
+            self.month_tokens = 0
+            self.month_cost = 0.0
+        if self.day != day:
+            self.day = day
+            self.day_tokens = 0
+            self.day_cost = 0.0
+
+    def add(self, tokens: int, cost: float) -> None:
+        self.day_tokens += tokens
+        self.day_cost += cost
+        self.month_tokens += tokens
+        self.month_cost += cost
+
+
+def _periods() -> tuple[str, str]:
+    """当前的天/月标识（UTC，与汇总表的时间桶一致）"""
+    now = datetime.now(timezone.utc)
+    return now.strftime("%Y-%m-%d"), now.strftime("%Y-%m")
+
+
+class QuotaService:
+    """配额服务
+
+    特性:
+    - 策略来自配置：QUOTA_DEFAULT_USER / QUOTA_DEFAULT_PROJECT 为默认值，
+      QUOTA_USER_OVERRIDES / QUOTA_PROJECT_OVERRIDES 按ID覆盖
+    - 未配置任何限制的范围不建立计数器
+    """
+
+    def __init__(self):
+        self._usage: dict[tuple[str, int], _Usage] = {}
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def get_policy(scope: str, scope_id: int) -> QuotaPolicy:
+        """
+        获取范围的配额策略
+
+        Args:
+            scope: user / project
+            scope_id: 用户ID或项目ID
+
+        Returns:
+            QuotaPolicy: 配额策略
+        """
+        if scope == USER:
+            default, overrides = settings.QUOTA_DEFAULT_USER, settings.QUOTA_USER_OVERRIDES
+        else:
+            default, overrides = settings.QUOTA_DEFAULT_PROJECT, settings.QUOTA_PROJECT_OVERRIDES
+        return QuotaPolicy(**{**default, **overrides.get(str(scope_id), {})})
+
+    async def _get_usage(self, scope: str, scope_id: int) -> _Usage:
+        """获取范围的计数器，首次访问时从汇总表加载本月已用量"""
+        day, month = _periods()
+        key = (scope, scope_id)
+        usage = self._usage.get(key)
+        if usage is None:
+            async with self._lock:
+                usage = self._usage.get(key)
+                if usage is None:
+                    usage = _Usage(day, month)
+                    rows = await TokenUsageRollup.filter(
+                        **{f"{scope}_id": scope_id},
+                        granularity="day",
+                        bucket__startswith=month,
+                    ).annotate(
+                        tokens=Sum("total_tokens"), cost_sum=Sum("cost"),
+                    ).group_by("bucket").values("bucket", "tokens", "cost_sum")
+                    for row in rows:
+                        tokens, cost = row["tokens"] or 0, row["cost_sum"] or 0.0
+                        usage.month_tokens += tokens
+                        usage.month_cost += cost
+                        if row["bucket"] == day:
+                            usage.day_tokens += tokens
+                            usage.day_cost += cost
+                    self._usage[key] = usage
+        usage.roll(day, month)
+        return usage
+
+    def add_usage(
+        self,
+        user_id: int,
+        project_id: Optional[int],
+        total_tokens: int,
+        cost: float,
+    ) -> None:
+        """
+        累加一次使用（记录使用量时调用，不访问数据库）
+
+        Args:
+            user_id: 用户ID
+            project_id: 项目ID（可选）
+            total_tokens: 总Token数
+            cost: 费用
+        """
+        day, month = _periods()
+        for key in ((USER, user_id), (PROJECT, project_id)):
+            usage = self._usage.get(key)
+            if usage is not None:
+                usage.roll(day, month)
+                usage.add(total_tokens, cost)
+
+    async def _check_scope(
+        self, scope: str, scope_id: int,
+    ) -> tuple[Optional[int], Optional[float]]:
+        """检查单个范围，返回剩余 Token 和剩余费用"""
+        policy = self.get_policy(scope, scope_id)
+        if policy.unlimited:
+            return None, None
+
+        usage = await self._get_usage(scope, scope_id)
+        checks = (
+            ("daily", "tokens", policy.daily_tokens, usage.day_tokens),
+            ("monthly", "tokens", policy.monthly_tokens, usage.month_tokens),
+            ("daily", "cost", policy.daily_cost, usage.day_cost),
+            ("monthly", "cost", policy.monthly_cost, usage.month_cost),
+        )
+        remaining: dict[str, list] = {"tokens": [], "cost": []}
+        for period, metric, limit, used in checks:
+            if not limit:
+                continue
+            if used >= limit:
+                unit = "Token" if metric == "tokens" else "费用"
+                raise QuotaExceededError(
+                    message=f"{_SCOPE_NAMES[scope]}{_PERIOD_NAMES[period]}{unit}配额已用完",
+                    details={
+                        "scope": scope,
+                        "scope_id": scope_id,
+                        "period": period,
+                        "metric": metric,
+                        "limit": limit,
+                        "used": round(used, 6),
+                    },
+                )
+            remaining[metric].append(limit - used)
+
+        return (
+            min(remaining["tokens"]) if remaining["tokens"] else None,
+            round(min(remaining["cost"]), 6) if remaining["cost"] else None,
+        )
+
+    async def check(self, user_id: int, project_id: Optional[int] = None) -> QuotaStatus:
+        """
+        检查用户（及项目）配额
+
+        Args:
+            user_id: 用户ID
+            project_id: 项目ID（可选）
+
+        Returns:
+            QuotaStatus: 剩余配额（取用户与项目中更紧的一方）
+
+        Raises:
+            QuotaExceededError: 任一配额已用完
+        """
+        tokens: list[int] = []
+        costs: list[float] = []
+        scopes = [(USER, user_id)] + ([(PROJECT, project_id)] if project_id else [])
+        for scope, scope_id in scopes:
+            remaining_tokens, remaining_cost = await self._check_scope(scope, scope_id)
+            if remaining_tokens is not None:
+                tokens.append(remaining_tokens)
+            if remaining_cost is not None:
+                costs.append(remaining_cost)
+
+        return QuotaStatus(
+            remaining_tokens=min(tokens) if tokens else None,
+            remaining_cost=min(costs) if costs else None,
+        )
+
+
+# 创建全局配额服务实例
+quota_service = QuotaService()
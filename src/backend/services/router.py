@@ -1,6 +1,6 @@
 """Token统计API路由"""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Query
@@ -26,7 +26,7 @@ async def get_user_token_summary(
     Returns:
         dict: Token使用统计数据
     """
-    end_date = datetime.now()
+    end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(days=days)
 
     return await token_statistics_service.get_user_statistics(
@@ -39,21 +39,24 @@ async def get_user_token_summary(
 @router.get("/user/recent")
 async def get_user_recent_records(
     user_id: CurrentUserId,
-    limit: int = Query(50, ge=1, le=200, description="返回记录数"),
+    limit: int = Query(50, ge=1, le=200, description="每页记录数"),
+    cursor: str | None = Query(None, description="分页游标（上一页返回的 next_cursor）"),
 ):
     """
-    获取用户最近的Token使用记录
+    获取用户最近的Token使用记录（游标分页）
 
     Args:
         user_id: 当前用户ID
-        limit: 返回记录数
+        limit: 每页记录数
+        cursor: 分页游标
 
     Returns:
-        list: Token使用记录列表
+        dict: {records: Token使用记录列表, next_cursor: 下一页游标}
     """
     return await token_statistics_service.get_recent_records(
         user_id=user_id,
         limit=limit,
+        cursor=cursor,
     )
 
 
@@ -76,7 +79,7 @@ async def get_project_token_summary(
     """
     # TODO: 添加项目权限验证
 
-    end_date = datetime.now()
+    end_date = datetime.now(timezone.utc)
     start_date = end_date - timedelta(days=days)
 
     return await token_statistics_service.get_project_statistics(
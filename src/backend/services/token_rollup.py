@@ -0,0 +1,221 @@
+"""Token使用量预聚合
+按小时/按天维护 (用户, 项目, 模型, 端点) 维度的汇总表，
+写入使用记录时在同一事务内增量更新，统计查询只需读取汇总行和区间边缘的少量原始记录
+
+UPSERT 语句为 SQLite 方言，其他数据库不维护汇总表，统计直接聚合原始记录
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from tortoise import BaseDBAsyncClient
+from tortoise.functions import Count, Sum
+
+from src.backend.config.database import is_sqlite
+from src.backend.services.models import TokenUsageRecord, TokenUsageRollup
+
+HOUR = "hour"
+DAY = "day"
+
+# 汇总桶格式（UTC），字符串按字典序即时间序
+_BUCKET_FORMATS = {HOUR: "%Y-%m-%d %H", DAY: "%Y-%m-%d"}
+
+# 累加的指标字段
+ROLLUP_METRICS = (
+    "request_count", "prompt_tokens", "cached_tokens", "completion_tokens", "total_tokens", "cost",
+)
+
+_UPSERT_SQL = """
+INSERT INTO "token_usage_rollups" (
+    "granularity", "bucket", "user_id", "project_id", "model", "endpoint",
+    "request_count", "prompt_tokens", "cached_tokens", "completion_tokens", "total_tokens", "cost",
+    "updated_at"
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+ON CONFLICT ("granularity", "bucket", "user_id", "project_id", "model", "endpoint") DO UPDATE SET
+    "request_count" = "request_count" + excluded."request_count",
+    "prompt_tokens" = "prompt_tokens" + excluded."prompt_tokens",
+    "cached_tokens" = "cached_tokens" + excluded."cached_tokens",
+    "completion_tokens" = "completion_tokens" + excluded."completion_tokens",
+    "total_tokens" = "total_tokens" + excluded."total_tokens",
+    "cost" = "cost" + excluded."cost",
+    "updated_at" = CURRENT_TIMESTAMP
+"""
+
+_SUM_COLUMNS = tuple(f"sum_{metric}" for metric in ROLLUP_METRICS)
+
+
+def _aggregates(raw: bool) -> dict[str, Count | Sum]:
+    """汇总表直接求和；原始记录的请求次数用 COUNT 计算"""
+    return {
+        f"sum_{metric}": Count("id") if raw and metric == "request_count" else Sum(metric)
+        for metric in ROLLUP_METRICS
+    }
+
+
+def _to_utc(dt: datetime) -> datetime:
+    """转换为 UTC（无时区的时间按本地时间处理）"""
+    return dt.astimezone(timezone.utc)
+
+
+def bucket_of(dt: datetime, granularity: str) -> str:
+    """
+    计算时间所在的汇总桶
+
+    Args:
+        dt: 时间
+        granularity: hour / day
+
+    Returns:
+        str: 桶标识（UTC）
+    """
+    return _to_utc(dt).strftime(_BUCKET_FORMATS[granularity])
+
+
+def _floor(dt: datetime, granularity: str) -> datetime:
+    dt = _to_utc(dt)
+    if granularity == DAY:
+        return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+def _ceil(dt: datetime, granularity: str) -> datetime:
+    floor = _floor(dt, granularity)
+    if floor == _to_utc(dt):
+        return floor
+    return floor + (timedelta(days=1) if granularity == DAY else timedelta(hours=1))
+
+
+class TokenRollupService:
+    """Token使用量预聚合服务
+
+    特性:
+    - 批量写入后按桶合并，再用 UPSERT 累加到汇总表
+    - 查询区间拆分为：整天 -> 天汇总，零散整点 -> 小时汇总，不足一小时的边缘 -> 原始记录
+    - 仅 SQLite 维护汇总表，其他数据库直接聚合原始记录
+    """
+
+    @staticmethod
+    async def apply(records: list[dict[str, Any]], using_db: BaseDBAsyncClient) -> None:
+        """
+        将一批新写入的使用记录累加到汇总表（应与记录写入处于同一事务）
+
+        Args:
+            records: 使用记录字段（需包含 created_at）
+            using_db: 事务连接
+        """
+        if not is_sqlite():
+            return
+        totals: dict[tuple, list[float]] = defaultdict(lambda: [0] * len(ROLLUP_METRICS))
+        for record in records:
+            created_at = record.get("created_at") or datetime.now(timezone.utc)
+            for granularity in (HOUR, DAY):
+                key = (
+                    granularity,
+                    bucket_of(created_at, granularity),
+                    record["user_id"],
+                    record.get("project_id") or 0,
+                    record["model"],
+                    record["endpoint"],
+                )
+                acc = totals[key]
+                acc[0] += 1
+                for i, metric in enumerate(ROLLUP_METRICS[1:], start=1):
+                    acc[i] += record.get(metric) or 0
+
+        if totals:
+            await using_db.execute_many(
+                _UPSERT_SQL, [[*key, *values] for key, values in totals.items()],
+            )
+
+    @staticmethod
+    def _plan(
+        start: datetime | None, end: datetime | None,
+    ) -> tuple[list[tuple[str, str | None, str | None]], list[tuple[datetime | None, datetime | None, bool]]]:
+        """
+        拆分查询区间
+
+        Returns:
+            tuple: (汇总桶区间列表 [(粒度, 起始桶含, 结束桶不含)],
+                    原始记录区间列表 [(起始含, 结束, 结束是否包含)])
+        """
+        raw: list[tuple[datetime | None, datetime | None, bool]] = []
+
+        hour_start = _ceil(start, HOUR) if start else None
+        hour_end = _floor(end, HOUR) if end else None
+        if hour_start and hour_end and hour_start >= hour_end:
+            # 区间不足一个完整小时，全部查原始记录
+            return [], [(start, end, True)]
+        if start and start < hour_start:
+            raw.append((start, hour_start, False))
+        if end and hour_end <= end:
+            raw.append((hour_end, end, True))
+
+        day_start = _ceil(hour_start, DAY) if hour_start else None
+        day_end = _floor(hour_end, DAY) if hour_end else None
+        if hour_start and hour_end and day_start >= day_end:
+            return [(HOUR, bucket_of(hour_start, HOUR), bucket_of(hour_end, HOUR))], raw
+
+        rollups = [(DAY, day_start and bucket_of(day_start, DAY), day_end and bucket_of(day_end, DAY))]
+        if hour_start and hour_start < day_start:
+            rollups.append((HOUR, bucket_of(hour_start, HOUR), bucket_of(day_start, HOUR)))
+        if hour_end and day_end < hour_end:
+            rollups.append((HOUR, bucket_of(day_end, HOUR), bucket_of(hour_end, HOUR)))
+        return rollups, raw
+
+    async def aggregate(
+        self,
+        scope: dict[str, int],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        group_by: str = "model",
+    ) -> dict[str, dict[str, float]]:
+        """
+        按维度汇总区间内的Token使用量
+
+        Args:
+            scope: 过滤条件（如 {"user_id": 1} 或 {"project_id": 2}）
+            start: 开始时间（含，可选）
+            end: 结束时间（含，可选）
+            group_by: 分组字段（model / endpoint）
+
+        Returns:
+            dict: 分组值 -> {request_count, prompt_tokens, cached_tokens, completion_tokens, total_tokens, cost}
+        """
+        result: dict[str, dict[str, float]] = defaultdict(lambda: dict.fromkeys(ROLLUP_METRICS, 0))
+        # 统一为 UTC：汇总桶与原始记录的 created_at 均按 UTC 比较
+        start = _to_utc(start) if start else None
+        end = _to_utc(end) if end else None
+        # 非 SQLite 不维护汇总表，整个区间查原始记录
+        rollups, raw = self._plan(start, end) if is_sqlite() else ([], [(start, end, True)])
+
+        queries = []
+        for granularity, lower, upper in rollups:
+            query = TokenUsageRollup.filter(**scope, granularity=granularity)
+            if lower:
+                query = query.filter(bucket__gte=lower)
+            if upper:
+                query = query.filter(bucket__lt=upper)
+            queries.append(query.annotate(**_aggregates(raw=False)))
+
+        for lower, upper, inclusive in raw:
+            query = TokenUsageRecord.filter(**scope)
+            if lower:
+                query = query.filter(created_at__gte=lower)
+            if upper:
+                query = query.filter(**{"created_at__lte" if inclusive else "created_at__lt": upper})
+            queries.append(query.annotate(**_aggregates(raw=True)))
+
+        for query in queries:
+            for row in await query.group_by(group_by).values(group_by, *_SUM_COLUMNS):
+                acc = result[row[group_by]]
+                for metric in ROLLUP_METRICS:
+                    acc[metric] += row[f"sum_{metric}"] or 0
+
+        for acc in result.values():
+            acc["cost"] = round(acc["cost"], 6)
+        return dict(result)
+
+
+# 创建全局预聚合服务实例
+token_rollup_service = TokenRollupService()
@@ -2,12 +2,19 @@
 记录和聚合Token使用数据
 """
 
-import asyncio
 from datetime import datetime
 from typing import Optional
 
+from tortoise import timezone
+from tortoise.transactions import in_transaction
+
 from src.backend.core.logger import logger
+from src.backend.core.pagination import paginate
+from src.backend.core.write_behind import WriteBehindQueue
 from src.backend.services.models import TokenUsageRecord
+from src.backend.services.pricing import compute_cost
+from src.backend.services.quota import quota_service
+from src.backend.services.token_rollup import ROLLUP_METRICS, token_rollup_service
 
 
 class TokenStatisticsService:
@@ -17,8 +24,43 @@ class TokenStatisticsService:
     - 异步记录Token使用
     - 用户级和项目级统计
     - 时间范围查询
+    - 后台记录走批量写后队列
+    - 统计查询基于小时/天汇总表，耗时不随历史数据增长（汇总表仅 SQLite 维护）
     """
 
+    def __init__(self):
+        self.queue = WriteBehindQueue(
+            "token_usage_records",
+            TokenUsageRecord,
+            after_write=token_rollup_service.apply,
+        )
+
+    @staticmethod
+    def _build_fields(
+        user_id: int,
+        prompt_tokens: int,
+        completion_tokens: int,
+        model: str,
+        endpoint: str,
+        project_id: Optional[int],
+        cached_tokens: int,
+    ) -> dict:
+        """组装使用记录字段（写入时计算总量和费用，并累加配额计数）"""
+        fields = {
+            "user_id": user_id,
+            "project_id": project_id,
+            "prompt_tokens": prompt_tokens,
+            "cached_tokens": cached_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+            "cost": compute_cost(model, prompt_tokens, completion_tokens, cached_tokens),
+            "model": model,
+            "endpoint": endpoint,
+            "created_at": timezone.now(),
+        }
+        quota_service.add_usage(user_id, project_id, fields["total_tokens"], fields["cost"])
+        return fields
+
     async def record_usage(
         self,
         user_id: int,
@@ -27,6 +69,7 @@ class TokenStatisticsService:
         model: str,
         endpoint: str,
         project_id: Optional[int] = None,
+        cached_tokens: int = 0,
     ) -> None:
         """记录单次Token使用（异步）
         
@@ -37,20 +80,18 @@ class TokenStatisticsService:
             model: 使用的AI模型
             endpoint: 请求的API端点
             project_id: 项目ID（可选）
+            cached_tokens: 命中缓存的提示词Token数（可选）
         """
         try:
-            total_tokens = prompt_tokens + completion_tokens
-
-            # 创建记录
-            await TokenUsageRecord.create(
-                user_id=user_id,
-                project_id=project_id,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                total_tokens=total_tokens,
-                model=model,
-                endpoint=endpoint,
+            fields = self._build_fields(
+                user_id, prompt_tokens, completion_tokens, model, endpoint, project_id, cached_tokens,
             )
+            total_tokens = fields["total_tokens"]
+
+            # 创建记录并同步更新汇总表
+            async with in_transaction() as conn:
+                await TokenUsageRecord.create(**fields, using_db=conn)
+                await token_rollup_service.apply([fields], conn)
 
             logger.debug(
                 f"Token使用已记录: user_id={user_id}, "
@@ -71,8 +112,9 @@ class TokenStatisticsService:
         model: str,
         endpoint: str,
         project_id: Optional[int] = None,
+        cached_tokens: int = 0,
     ) -> None:
-        """在后台任务中记录Token使用
+        """在后台记录Token使用（进入批量写后队列）
         
         Args:
             user_id: 用户ID
@@ -81,18 +123,41 @@ class TokenStatisticsService:
             model: 使用的AI模型
             endpoint: 请求的API端点
             project_id: 项目ID（可选）
+            cached_tokens: 命中缓存的提示词Token数（可选）
         """
-        asyncio.create_task(
-            self.record_usage(
-                user_id=user_id,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                model=model,
-                endpoint=endpoint,
-                project_id=project_id,
+        self.queue.enqueue(
+            **self._build_fields(
+                user_id, prompt_tokens, completion_tokens, model, endpoint, project_id, cached_tokens,
             ),
         )
 
+    @staticmethod
+    async def _summarize(
+        scope: dict[str, int],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+    ) -> dict:
+        """汇总总量、费用，以及按模型和按端点的明细"""
+        model_stats = await token_rollup_service.aggregate(scope, start_date, end_date, group_by="model")
+        endpoint_stats = await token_rollup_service.aggregate(
+            scope, start_date, end_date, group_by="endpoint",
+        )
+        totals = {
+            metric: sum(stat[metric] for stat in model_stats.values())
+            for metric in ROLLUP_METRICS
+        }
+
+        return {
+            "total_tokens": totals["total_tokens"],
+            "prompt_tokens": totals["prompt_tokens"],
+            "cached_tokens": totals["cached_tokens"],
+            "completion_tokens": totals["completion_tokens"],
+            "request_count": totals["request_count"],
+            "total_cost": round(totals["cost"], 6),
+            "model_stats": model_stats,
+            "endpoint_stats": endpoint_stats,
+        }
+
     async def get_user_statistics(
         self,
         user_id: int,
@@ -109,45 +174,11 @@ class TokenStatisticsService:
         Returns:
             dict: 统计数据
         """
-        # 构建查询条件
-        query = TokenUsageRecord.filter(user_id=user_id)
-
-        if start_date:
-            query = query.filter(created_at__gte=start_date)
-        if end_date:
-            query = query.filter(created_at__lte=end_date)
-
-        # 获取所有记录
-        records = await query.all()
-
-        # 计算统计数据
-        total_tokens = sum(record.total_tokens for record in records)
-        prompt_tokens = sum(record.prompt_tokens for record in records)
-        completion_tokens = sum(record.completion_tokens for record in records)
-        request_count = len(records)
-
-        # 按模型分组统计
-        model_stats = {}
-        for record in records:
-            if record.model not in model_stats:
-                model_stats[record.model] = {
-                    "total_tokens": 0,
-                    "prompt_tokens": 0,
-                    "completion_tokens": 0,
-                    "request_count": 0,
-                }
-            model_stats[record.model]["total_tokens"] += record.total_tokens
-            model_stats[record.model]["prompt_tokens"] += record.prompt_tokens
-            model_stats[record.model]["completion_tokens"] += record.completion_tokens
-            model_stats[record.model]["request_count"] += 1
+        summary = await self._summarize({"user_id": user_id}, start_date, end_date)
 
         return {
             "user_id": user_id,
-            "total_tokens": total_tokens,
-            "prompt_tokens": prompt_tokens,
-            "completion_tokens": completion_tokens,
-            "request_count": request_count,
-            "model_stats": model_stats,
+            **summary,
             "start_date": start_date.isoformat() if start_date else None,
             "end_date": end_date.isoformat() if end_date else None,
         }
@@ -168,45 +199,11 @@ class TokenStatisticsService:
         Returns:
             dict: 统计数据
         """
-        # 构建查询条件
-        query = TokenUsageRecord.filter(project_id=project_id)
-
-        if start_date:
-            query = query.filter(created_at__gte=start_date)
-        if end_date:
-            query = query.filter(created_at__lte=end_date)
-
-        # 获取所有记录
-        records = await query.all()
-
-        # 计算统计数据
-        total_tokens = sum(record.total_tokens for record in records)
-        prompt_tokens = sum(record.prompt_tokens for record in records)
-        completion_tokens = sum(record.completion_tokens for record in records)
-        request_count = len(records)
-
-        # 按模型分组统计
-        model_stats = {}
-        for record in records:
-            if record.model not in model_stats:
-                model_stats[record.model] = {
-                    "total_tokens": 0,
-                    "prompt_tokens": 0,
-                    "completion_tokens": 0,
-                    "request_count": 0,
-                }
-            model_stats[record.model]["total_tokens"] += record.total_tokens
-            model_stats[record.model]["prompt_tokens"] += record.prompt_tokens
-            model_stats[record.model]["completion_tokens"] += record.completion_tokens
-            model_stats[record.model]["request_count"] += 1
+        summary = await self._summarize({"project_id": project_id}, start_date, end_date)
 
         return {
             "project_id": project_id,
-            "total_tokens": total_tokens,
-            "prompt_tokens": prompt_tokens,
-            "completion_tokens": completion_tokens,
-            "request_count": request_count,
-            "model_stats": model_stats,
+            **summary,
             "start_date": start_date.isoformat() if start_date else None,
             "end_date": end_date.isoformat() if end_date else None,
         }
@@ -215,38 +212,41 @@ class TokenStatisticsService:
         self,
         user_id: int,
         limit: int = 50,
-    ) -> list[dict]:
-        """获取用户最近的Token使用记录
+        cursor: Optional[str] = None,
+    ) -> dict:
+        """获取用户最近的Token使用记录（游标分页）
         
         Args:
             user_id: 用户ID
-            limit: 返回记录数限制
+            limit: 每页记录数
+            cursor: 分页游标（上一页返回的 next_cursor，为空时取第一页）
             
         Returns:
-            list[dict]: 记录列表
+            dict: {records: 记录列表, next_cursor: 下一页游标}
         """
-        records = (
-            await TokenUsageRecord.filter(user_id=user_id)
-            .order_by("-created_at")
-            .limit(limit)
-            .all()
+        records, next_cursor = await paginate(
+            TokenUsageRecord.filter(user_id=user_id), limit, cursor,
         )
 
-        return [
-            {
-                "id": record.id,
-                "user_id": record.user_id,
-                "project_id": record.project_id,
-                "prompt_tokens": record.prompt_tokens,
-                "completion_tokens": record.completion_tokens,
-                "total_tokens": record.total_tokens,
-                "model": record.model,
-                "endpoint": record.endpoint,
-                "created_at": record.created_at.isoformat(),
-            }
-            for record in records
-        ]
-
+        return {
+            "records": [
+                {
+                    "id": record.id,
+                    "user_id": record.user_id,
+                    "project_id": record.project_id,
+                    "prompt_tokens": record.prompt_tokens,
+                    "cached_tokens": record.cached_tokens,
+                    "completion_tokens": record.completion_tokens,
+                    "total_tokens": record.total_tokens,
+                    "cost": record.cost,
+                    "model": record.model,
+                    "endpoint": record.endpoint,
+                    "created_at": record.created_at.isoformat(),
+                }
+                for record in records
+            ],
+            "next_cursor": next_cursor,
+        }
 
 # 创建全局Token统计服务实例
 token_statistics_service = TokenStatisticsService()
@@ -4,6 +4,14 @@
 
 from tortoise import fields, models
 
+from src.backend.core.fields import CompressedTextField
+
+# 不含正文的元数据列（列表、邻章查询等只读取这些列，避免加载整章正文）
+CHAPTER_META_FIELDS = (
+    "id", "uuid", "project_id", "outline_node_id", "title", "chapter_number",
+    "word_count", "version", "status", "created_at", "updated_at",
+)
+
 
 class Chapter(models.Model):
     """
@@ -27,9 +35,10 @@ class Chapter(models.Model):
         description="关联大纲节点（可为空）",
     )
     title = fields.CharField(max_length=200, description="章节标题")
-    content = fields.TextField(default="", description="正文内容（纯文本）")
+    content = CompressedTextField(default="", description="正文内容（纯文本）")
     chapter_number = fields.IntField(description="全局章节编号（1-based）")
     word_count = fields.IntField(default=0, description="字数统计")
+    version = fields.IntField(default=1, description="正文版本号（正文每次变更自增）")
     status = fields.CharField(
         max_length=20,
         default="draft",
@@ -45,3 +54,33 @@ class Chapter(models.Model):
 
     def __str__(self):
         return f"Chapter {self.chapter_number}: {self.title}"
+
+
+class ChapterRevision(models.Model):
+    """
+    章节修订历史
+    最新一条修订保存完整快照；较早的修订保存把后一条修订还原为本修订的反向差异，
+    每隔若干条保留一个完整快照，内容均压缩存储
+    """
+
+    id = fields.IntField(pk=True, description="主键")
+    chapter = fields.ForeignKeyField(
+        "models.Chapter",
+        related_name="revisions",
+        on_delete=fields.CASCADE,
+        description="所属章节",
+    )
+    version = fields.IntField(description="对应的正文版本号")
+    kind = fields.CharField(max_length=8, description="存储方式: snapshot 完整快照 / delta 反向差异")
+    codec = fields.CharField(max_length=8, description="压缩编码: raw/zlib/zstd")
+    data = fields.BinaryField(description="压缩后的正文或差异操作（JSON）")
+    word_count = fields.IntField(default=0, description="字数统计")
+    created_at = fields.DatetimeField(auto_now_add=True, description="创建时间")
+    updated_at = fields.DatetimeField(auto_now=True, description="更新时间（合并写入时刷新）")
+
+    class Meta:
+        table = "chapter_revisions"
+        unique_together = (("chapter_id", "version"),)
+
+    def __str__(self):
+        return f"ChapterRevision(chapter={self.chapter_id}, version={self.version}, kind={self.kind})"
@@ -3,25 +3,53 @@
 """
 
 import uuid
-from typing import Any, Dict
+from pathlib import PurePath
+from typing import Any, Dict, Literal, Optional
+from urllib.parse import quote
 
-from fastapi import APIRouter, Body, Path
+from fastapi import APIRouter, Body, File, Path, Query, UploadFile
 from fastapi.responses import StreamingResponse
 from loguru import logger
+from tortoise.transactions import in_transaction
 
+from src.backend.config.settings import settings
 from src.backend.core.dependencies import CurrentUserId
-from src.backend.core.exceptions import APIError
+from src.backend.core.exceptions import APIError, ValidationError
 from src.backend.core.response import MessageResponse, message_response
-from src.features.chapter.backend.models import Chapter
+from src.backend.services.quota import quota_service
+from src.features.chapter.backend.models import CHAPTER_META_FIELDS, Chapter
 from src.features.chapter.backend.schemas import (
     ChapterCreate,
     ChapterListItem,
+    ChapterPatch,
     ChapterResponse,
+    ChapterRevisionDiff,
+    ChapterRevisionItem,
     ChapterUpdate,
     ChapterWithHints,
 )
 from src.features.chapter.backend.services.ai_service import chapter_ai_service
+from src.features.chapter.backend.services.manuscript_export import (
+    EXPORT_FORMATS,
+    export_manuscript,
+)
+from src.features.chapter.backend.services.manuscript_import import (
+    import_manuscript,
+    spool_upload,
+)
+from src.features.chapter.backend.services.revisions import chapter_revision_service
+from src.features.chapter.backend.services.save_buffer import chapter_save_buffer
+from src.features.chapter.backend.services.text_patch import (
+    patch_chapter_content,
+    resolve_chapter_content,
+    unified_diff,
+)
+from src.features.chapter.backend.services.word_count import (
+    apply_word_count_delta,
+    count_words,
+)
 from src.features.novel_outline.backend.models import OutlineNode
+from src.features.novel_project.backend.models import NovelProject
 
 router = APIRouter(prefix="/chapters", tags=["章节系统"])
 
@@ -34,10 +62,10 @@ async def get_chapters(
     获取项目的所有章节列表（按chapter_number排序）
     """
     try:
-        chapters = (
+        chapters = chapter_save_buffer.overlay(
             await Chapter.filter(project_id=project_id)
             .order_by("chapter_number")
-            .all()
+            .values(*CHAPTER_META_FIELDS),
         )
     except Exception as e:
         logger.error(f"获取章节列表失败: {e}")
@@ -69,12 +97,13 @@ async def create_chapter(
                 _raise_invalid_node()
 
         # 计算chapter_number：获取最大编号 + 1
-        max_chapter = (
+        max_chapter_number = (
             await Chapter.filter(project_id=project_id)
             .order_by("-chapter_number")
             .first()
+            .values_list("chapter_number", flat=True)
         )
-        chapter_number = (max_chapter.chapter_number + 1) if max_chapter else 1
+        chapter_number = (max_chapter_number or 0) + 1
 
         # 创建章节
         chapter = await Chapter.create(
@@ -98,6 +127,61 @@ async def create_chapter(
         return chapter
 
 
+@router.get("/projects/{project_id}/export")
+async def export_project_manuscript(
+    project_id: int = Path(..., description="项目ID"),
+    fmt: Literal["txt", "md", "epub"] = Query("txt", alias="format", description="导出格式"),
+):
+    """
+    导出全书（按章节顺序流式输出，不设 Content-Length，生成即发送）
+    """
+    title = await NovelProject.filter(id=project_id).first().values_list("title", flat=True)
+    if title is None:
+        raise APIError(code="NOT_FOUND", message="项目不存在", status_code=404)
+
+    media_type, extension = EXPORT_FORMATS[fmt]
+    logger.info(f"导出全书: 项目 {project_id} ({fmt})")
+    return StreamingResponse(
+        export_manuscript(project_id, title, fmt),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": (
+                f"attachment; filename=manuscript_{project_id}.{extension}; "
+                f"filename*=UTF-8''{quote(f'{title}.{extension}')}"
+            ),
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
+@router.post("/projects/{project_id}/import")
+async def import_project_manuscript(
+    project_id: int = Path(..., description="项目ID"),
+    file: UploadFile = File(..., description="TXT / Markdown 文件"),
+):
+    """
+    导入已有小说（按卷、章标题自动切分，SSE 返回导入进度）
+    """
+    if not await NovelProject.filter(id=project_id).exists():
+        raise APIError(code="NOT_FOUND", message="项目不存在", status_code=404)
+
+    filename = PurePath(file.filename or "")
+    if filename.suffix.lower() not in {".txt", ".md", ".markdown"}:
+        raise ValidationError("只支持导入 TXT 或 Markdown 文件")
+
+    source, size = await spool_upload(file, settings.CHAPTER_IMPORT_MAX_BYTES)
+    logger.info(f"导入小说: 项目 {project_id}, 文件 {file.filename} ({size} 字节)")
+    return StreamingResponse(
+        import_manuscript(project_id, source, size, filename.stem or "正文"),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.get("/{chapter_id}", response_model=ChapterResponse)
 async def get_chapter(
     chapter_id: int = Path(..., description="章节ID"),
@@ -109,7 +193,7 @@ async def get_chapter(
         raise APIError(code="NOT_FOUND", message="章节不存在", status_code=404)
 
     try:
-        chapter = await Chapter.get_or_none(id=chapter_id)
+        chapter = await chapter_save_buffer.load(chapter_id)
         if not chapter:
             _raise_not_found()
 
@@ -134,7 +218,7 @@ async def get_chapter_with_hints(
         raise APIError(code="NOT_FOUND", message="章节不存在", status_code=404)
     
     try:
-        chapter = await Chapter.get_or_none(id=chapter_id)
+        chapter = await chapter_save_buffer.load(chapter_id)
         if not chapter:
             _raise_not_found()
     
@@ -162,6 +246,7 @@ async def get_chapter_with_hints(
             "content": chapter.content,
             "chapter_number": chapter.chapter_number,
             "word_count": chapter.word_count,
+            "version": chapter.version,
             "status": chapter.status,
             "created_at": chapter.created_at,
             "updated_at": chapter.updated_at,
@@ -177,6 +262,35 @@ async def get_chapter_with_hints(
         return chapter_dict
 
 
+def _apply_changes(
+    chapter: Chapter,
+    title: Optional[str] = None,
+    content: Optional[str] = None,
+    status: Optional[str] = None,
+) -> set[str]:
+    """
+    修改章节对象的字段（随后由 chapter_save_buffer.save() 写入）
+
+    正文有变化时版本号自增并重新统计字数；项目字数和修订历史在写入数据库时更新
+
+    Returns:
+        set[str]: 有变化的字段
+    """
+    changed = set()
+    if title is not None and title != chapter.title:
+        chapter.title = title
+        changed.add("title")
+    if content is not None and content != chapter.content:
+        chapter.content = content
+        chapter.word_count = count_words(content)
+        chapter.version += 1
+        changed.add("content")
+    if status is not None and status != chapter.status:
+        chapter.status = status
+        changed.add("status")
+    return changed
+
+
 @router.put("/{chapter_id}", response_model=ChapterResponse)
 async def update_chapter(
     chapter_id: int = Path(..., description="章节ID"),
@@ -189,35 +303,14 @@ async def update_chapter(
         raise APIError(code="NOT_FOUND", message="章节不存在", status_code=404)
 
     try:
-        chapter = await Chapter.get_or_none(id=chapter_id)
+        chapter = await chapter_save_buffer.load(chapter_id)
         if not chapter:
             _raise_not_found()
 
-        # 更新字段
-        if data.title is not None:
-            chapter.title = data.title
-        if data.content is not None:
-            chapter.content = data.content
-            # 更新字数统计（去除换行符和空格后的长度）
-            chapter.word_count = len(data.content.replace("\n", "").replace("\r", "").replace(" ", ""))
-        if data.status is not None:
-            chapter.status = data.status
-
-        await chapter.save()
-
-        # 更新关联项目的字数统计（所有章节字数之和）
-        try:
-            from src.features.novel_project.backend.models import NovelProject
-            project = await NovelProject.get_or_none(id=chapter.project_id)
-            if project:
-                # 获取该项目所有章节的字数总和
-                chapters = await Chapter.filter(project_id=chapter.project_id).all()
-                total_word_count = sum(ch.word_count for ch in chapters)
-                project.word_count = total_word_count
-                await project.save()
-                logger.info(f"更新项目 {chapter.project_id} 字数统计: {total_word_count}")
-        except Exception as e:
-            logger.error(f"更新项目字数统计失败: {e}")
+        # 更新字段（由保存缓冲合并写入数据库）
+        await chapter_save_buffer.save(
+            chapter, _apply_changes(chapter, data.title, data.content, data.status),
+        )
 
     except APIError:
         raise
@@ -229,6 +322,130 @@ async def update_chapter(
         return chapter
 
 
+@router.patch("/{chapter_id}", response_model=ChapterListItem)
+async def patch_chapter(
+    chapter_id: int = Path(..., description="章节ID"),
+    data: ChapterPatch = ...,
+):
+    """
+    增量更新章节
+
+    提交客户端持有的 base_version 和文本操作（ops）或统一差异（diff），
+    服务端在当前正文上应用后版本号自增；版本不一致时返回 409 和当前版本号。
+    只返回章节元数据（不含正文）
+    """
+    def _raise_not_found() -> None:
+        raise APIError(code="NOT_FOUND", message="章节不存在", status_code=404)
+
+    try:
+        chapter = await chapter_save_buffer.load(chapter_id)
+        if not chapter:
+            _raise_not_found()
+
+        # 版本号以保存缓冲中的最新状态为准
+        content = patch_chapter_content(chapter, data)
+        await chapter_save_buffer.save(
+            chapter, _apply_changes(chapter, data.title, content, data.status),
+        )
+
+    except APIError:
+        raise
+    except Exception as e:
+        logger.error(f"增量更新章节失败: {e}")
+        raise APIError(code="UPDATE_FAILED", message="更新章节失败", status_code=500) from e
+    else:
+        logger.info(f"增量更新章节: {chapter.id} (版本 {chapter.version})")
+        return chapter
+
+
+@router.get("/{chapter_id}/revisions", response_model=list[ChapterRevisionItem])
+async def list_chapter_revisions(
+    chapter_id: int = Path(..., description="章节ID"),
+):
+    """
+    获取章节修订历史（按版本倒序，不含内容）
+    """
+    try:
+        revisions = await chapter_revision_service.list_revisions(chapter_id)
+    except Exception as e:
+        logger.error(f"获取章节修订历史失败: {e}")
+        raise APIError(code="FETCH_FAILED", message="获取章节修订历史失败", status_code=500) from e
+    return revisions
+
+
+@router.get("/{chapter_id}/revisions/{version}/diff", response_model=ChapterRevisionDiff)
+async def diff_chapter_revision(
+    chapter_id: int = Path(..., description="章节ID"),
+    version: int = Path(..., description="修订版本号"),
+    against: Optional[int] = Query(None, description="对比的版本号（默认与当前正文对比）"),
+):
+    """
+    获取修订与另一版本（默认当前正文）之间的统一差异
+    """
+    def _raise_not_found(message: str) -> None:
+        raise APIError(code="NOT_FOUND", message=message, status_code=404)
+
+    try:
+        chapter = await chapter_save_buffer.load(chapter_id)
+        if not chapter:
+            _raise_not_found("章节不存在")
+
+        old_text = await chapter_revision_service.get_text(chapter_id, version)
+        if old_text is None:
+            _raise_not_found("修订不存在")
+
+        if against is None or against == chapter.version:
+            new_version, new_text = chapter.version, chapter.content
+        else:
+            new_version, new_text = against, await chapter_revision_service.get_text(chapter_id, against)
+            if new_text is None:
+                _raise_not_found("对比的修订不存在")
+
+    except APIError:
+        raise
+    except Exception as e:
+        logger.error(f"获取修订差异失败: {e}")
+        raise APIError(code="FETCH_FAILED", message="获取修订差异失败", status_code=500) from e
+    else:
+        return {
+            "from_version": version,
+            "to_version": new_version,
+            "diff": unified_diff(old_text, new_text, f"v{version}", f"v{new_version}"),
+        }
+
+
+@router.post("/{chapter_id}/revisions/{version}/restore", response_model=ChapterResponse)
+async def restore_chapter_revision(
+    chapter_id: int = Path(..., description="章节ID"),
+    version: int = Path(..., description="修订版本号"),
+):
+    """
+    将章节正文恢复为某个修订（作为新版本保存，恢复前的正文也保留在修订历史中）
+    """
+    def _raise_not_found(message: str) -> None:
+        raise APIError(code="NOT_FOUND", message=message, status_code=404)
+
+    try:
+        chapter = await chapter_save_buffer.load(chapter_id)
+        if not chapter:
+            _raise_not_found("章节不存在")
+
+        content = await chapter_revision_service.get_text(chapter_id, version)
+        if content is None:
+            _raise_not_found("修订不存在")
+
+        await chapter_save_buffer.save(chapter, _apply_changes(chapter, content=content))
+
+    except APIError:
+        raise
+    except Exception as e:
+        logger.error(f"恢复章节修订失败: {e}")
+        raise APIError(code="UPDATE_FAILED", message="恢复章节修订失败", status_code=500) from e
+    else:
+        logger.info(f"恢复章节修订: {chapter_id} -> 版本 {version}")
+        return chapter
+
+
 @router.delete("/{chapter_id}", response_model=MessageResponse)
 async def delete_chapter(
     chapter_id: int = Path(..., description="章节ID"),
@@ -240,11 +457,15 @@ async def delete_chapter(
         raise APIError(code="NOT_FOUND", message="章节不存在", status_code=404)
 
     try:
-        chapter = await Chapter.get_or_none(id=chapter_id)
-        if not chapter:
-            _raise_not_found()
+        # 丢弃尚未写入的保存，项目字数按数据库中的字数扣减
+        chapter_save_buffer.discard(chapter_id)
+        async with in_transaction() as conn:
+            chapter = await Chapter.get_or_none(id=chapter_id).using_db(conn)
+            if not chapter:
+                _raise_not_found()
 
-        await chapter.delete()
+            await chapter.delete(using_db=conn)
+            await apply_word_count_delta(chapter.project_id, -chapter.word_count, conn)
 
     except APIError:
         raise
@@ -269,12 +490,15 @@ async def ai_generate_chapter_stream(
         raise APIError(code="NOT_FOUND", message="章节不存在", status_code=404)
 
     try:
-        chapter = await Chapter.get_or_none(id=chapter_id)
+        chapter = await chapter_save_buffer.load(chapter_id)
         if not chapter:
             _raise_not_found()
 
         requirement = data.get("requirement", "")
 
+        # 构建提示词前检查配额
+        quota = await quota_service.check(int(user_id), chapter.project_id)
+
         async def content_stream():
             try:
                 yield "".encode("utf-8")  # 初始心跳包
@@ -306,6 +530,7 @@ async def ai_generate_chapter_stream(
             content_stream(),
             media_type="text/plain",
             headers={
+                **quota.headers(),
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
                 "Access-Control-Allow-Origin": "*",
@@ -329,18 +554,25 @@ async def ai_continue_chapter_stream(
 ):
     """
     AI续写章节内容
+
+    正文可通过 base_version（+ 可选 diff）引用服务端版本，版本过期返回 409；
+    也兼容直接提交完整的 current_content
     """
     def _raise_not_found() -> None:
         raise APIError(code="NOT_FOUND", message="章节不存在", status_code=404)
 
     try:
-        chapter = await Chapter.get_or_none(id=chapter_id)
+        chapter = await chapter_save_buffer.load(chapter_id)
         if not chapter:
             _raise_not_found()
 
-        current_content = data.get("current_content", chapter.content)
+        # 优先按版本引用解析正文，兼容直接提交全文
+        current_content = resolve_chapter_content(chapter, data, "current_content")
         requirement = data.get("requirement", "")
 
+        # 构建提示词前检查配额
+        quota = await quota_service.check(int(user_id), chapter.project_id)
+
         async def content_stream():
             try:
                 yield "".encode("utf-8")
@@ -372,6 +604,7 @@ async def ai_continue_chapter_stream(
             content_stream(),
             media_type="text/plain",
             headers={
+                **quota.headers(),
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
                 "Access-Control-Allow-Origin": "*",
@@ -395,18 +628,24 @@ async def ai_optimize_chapter_stream(
 ):
     """
     AI优化章节内容
+
+    正文可通过 base_version（+ 可选 diff）引用服务端版本，版本过期返回 409；
+    也兼容直接提交完整的 content
     """
     def _raise_not_found() -> None:
         raise APIError(code="NOT_FOUND", message="章节不存在", status_code=404)
 
     try:
-        chapter = await Chapter.get_or_none(id=chapter_id)
+        chapter = await chapter_save_buffer.load(chapter_id)
         if not chapter:
             _raise_not_found()
 
-        content_to_optimize = data.get("content", chapter.content)
+        content_to_optimize = resolve_chapter_content(chapter, data, "content")
         optimization_type = data.get("type", "general")  # general, grammar, style
 
+        # 构建提示词前检查配额
+        quota = await quota_service.check(int(user_id), chapter.project_id)
+
         async def content_stream():
             try:
                 yield "".encode("utf-8")
@@ -438,6 +677,7 @@ async def ai_optimize_chapter_stream(
             content_stream(),
             media_type="text/plain",
             headers={
+                **quota.headers(),
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
                 "Access-Control-Allow-Origin": "*",
@@ -461,19 +701,25 @@ async def ai_expand_chapter_stream(
 ):
     """
     AI扩写章节内容
+
+    正文可通过 base_version（+ 可选 diff）引用服务端版本，版本过期返回 409；
+    也兼容直接提交完整的 content
     """
     def _raise_not_found() -> None:
         raise APIError(code="NOT_FOUND", message="章节不存在", status_code=404)
 
     try:
-        chapter = await Chapter.get_or_none(id=chapter_id)
+        chapter = await chapter_save_buffer.load(chapter_id)
         if not chapter:
             _raise_not_found()
 
-        content_to_expand = data.get("content", chapter.content)
+        content_to_expand = resolve_chapter_content(chapter, data, "content")
         expand_ratio = data.get("expand_ratio", 1.5)  # 默认扩写1.5倍
         requirement = data.get("requirement", "")
 
+        # 构建提示词前检查配额
+        quota = await quota_service.check(int(user_id), chapter.project_id)
+
         async def content_stream():
             try:
                 yield "".encode("utf-8")
@@ -506,6 +752,7 @@ async def ai_expand_chapter_stream(
             content_stream(),
             media_type="text/plain",
             headers={
+                **quota.headers(),
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
                 "Access-Control-Allow-Origin": "*",
@@ -529,19 +776,25 @@ async def ai_compress_chapter_stream(
 ):
     """
     AI缩写章节内容
+
+    正文可通过 base_version（+ 可选 diff）引用服务端版本，版本过期返回 409；
+    也兼容直接提交完整的 content
     """
     def _raise_not_found() -> None:
         raise APIError(code="NOT_FOUND", message="章节不存在", status_code=404)
 
     try:
-        chapter = await Chapter.get_or_none(id=chapter_id)
+        chapter = await chapter_save_buffer.load(chapter_id)
         if not chapter:
             _raise_not_found()
 
-        content_to_compress = data.get("content", chapter.content)
+        content_to_compress = resolve_chapter_content(chapter, data, "content")
         compress_ratio = data.get("compress_ratio", 50)  # 默认压缩到50%
         requirement = data.get("requirement", "")
 
+        # 构建提示词前检查配额
+        quota = await quota_service.check(int(user_id), chapter.project_id)
+
         async def content_stream():
             try:
                 yield "".encode("utf-8")
@@ -574,6 +827,7 @@ async def ai_compress_chapter_stream(
             content_stream(),
             media_type="text/plain",
             headers={
+                **quota.headers(),
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
                 "Access-Control-Allow-Origin": "*",
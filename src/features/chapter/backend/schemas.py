@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 
 # 请求模型
@@ -25,6 +25,31 @@ class ChapterUpdate(BaseModel):
     status: Optional[str] = Field(None, description="状态：draft/completed/ai_generated")
 
 
+class TextOp(BaseModel):
+    """文本编辑操作：将基准文本 [start, end) 区间替换为 text（偏移按字符计）"""
+
+    start: int = Field(..., ge=0, description="起始偏移（含）")
+    end: int = Field(..., ge=0, description="结束偏移（不含）")
+    text: str = Field(default="", description="替换文本（为空表示删除）")
+
+
+class ChapterPatch(BaseModel):
+    """增量更新章节：基于客户端持有的版本号提交文本操作或统一差异（二选一）"""
+
+    base_version: int = Field(..., ge=1, description="客户端持有的正文版本号")
+    ops: Optional[list[TextOp]] = Field(None, description="文本编辑操作（偏移相对于 base_version 的正文）")
+    diff: Optional[str] = Field(None, description="统一差异格式（unified diff）补丁")
+    title: Optional[str] = Field(None, min_length=1, max_length=200, description="章节标题")
+    status: Optional[str] = Field(None, description="状态：draft/completed/ai_generated")
+
+    @model_validator(mode="after")
+    def validate_patch(self) -> "ChapterPatch":
+        """ops 与 diff 只能提供一个"""
+        if self.ops is not None and self.diff is not None:
+            raise ValueError("ops 与 diff 只能提供一个")
+        return self
+
+
 class ChapterExpandRequest(BaseModel):
     """章节扩写请求"""
 
@@ -53,6 +78,7 @@ class ChapterResponse(BaseModel):
     content: str
     chapter_number: int
     word_count: int
+    version: int
     status: str
     created_at: datetime
     updated_at: datetime
@@ -69,6 +95,7 @@ class ChapterListItem(BaseModel):
     title: str
     chapter_number: int
     word_count: int
+    version: int
     status: str
     outline_node_id: Optional[int]
     created_at: datetime
@@ -85,3 +112,21 @@ class ChapterWithHints(ChapterResponse):
 
     class Config:
         from_attributes = True
+
+
+class ChapterRevisionItem(BaseModel):
+    """章节修订（不含内容）"""
+
+    version: int
+    kind: str = Field(..., description="存储方式: snapshot/delta")
+    word_count: int
+    created_at: datetime
+    updated_at: datetime
+
+
+class ChapterRevisionDiff(BaseModel):
+    """修订差异"""
+
+    from_version: int = Field(..., description="旧版本号")
+    to_version: int = Field(..., description="新版本号")
+    diff: str = Field(..., description="统一差异格式文本（无差异时为空）")
@@ -2,23 +2,39 @@
 章节AI辅助写作服务
 """
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Callable
 
 from loguru import logger
 
 from src.backend.ai import ai_service
-from src.backend.core.template import TemplateManager
+from src.backend.config.settings import settings
+from src.backend.core.template import template_manager
 from src.features.chapter.backend.models import Chapter
+from src.features.chapter.backend.services.chunked_pipeline import (
+    TextWindow,
+    estimate_tokens,
+    split_into_windows,
+    stream_windows_in_order,
+)
 from src.features.chapter.backend.services.context_builder import ContextBuilder
 from src.features.character.backend.models import Character
+from src.features.character.backend.services.mention_index import mention_index_service
 from src.features.novel_outline.backend.models import OutlineNode
 
 
 class ChapterAIService:
     """章节AI辅助写作服务"""
 
-    # 类级别模板管理器
-    template_manager = TemplateManager()
+    @staticmethod
+    async def _get_relevant_characters(chapter: Chapter, content: str) -> list[Character]:
+        """获取与原文相关的角色，未提及任何角色时返回项目全部角色"""
+        characters = await Character.filter(project_id=chapter.project_id).all()
+        relevant_ids = await mention_index_service.select_relevant(
+            chapter.project_id, [content],
+        )
+        if relevant_ids is None:
+            return characters
+        return [c for c in characters if c.id in relevant_ids]
 
     @staticmethod
     async def generate_chapter_content(
@@ -49,7 +65,7 @@ class ChapterAIService:
     
             # 尝试使用模板渲染
             try:
-                full_requirement = ChapterAIService.template_manager.render(
+                full_requirement = template_manager.render(
                     "chapter_generate.jinja2",
                     **context,
                 )
@@ -181,7 +197,7 @@ class ChapterAIService:
     
             # 尝试使用模板渲染
             try:
-                full_requirement = ChapterAIService.template_manager.render(
+                full_requirement = template_manager.render(
                     "chapter_continue.jinja2",
                     **context,
                 )
@@ -267,6 +283,86 @@ class ChapterAIService:
             logger.error(f"AI续写章节内容失败: {e}")
             raise
 
+    @staticmethod
+    def _segment_note(window: TextWindow | None) -> str:
+        """分段处理时附加到硬编码提示词中的说明"""
+        if window is None or window.total == 1:
+            return ""
+        note = (
+            f"\n【分段说明】本次只处理全文第 {window.index}/{window.total} 段，"
+            "只输出本段的处理结果，不要重复前文或续写后文。"
+        )
+        if window.context_before:
+            note += f"\n【前文衔接（仅供参考，不要输出）】\n{window.context_before}"
+        return note
+
+    @staticmethod
+    def _segment_context(window: TextWindow | None) -> dict | None:
+        """分段处理时传给模板的 segment 变量"""
+        if window is None or window.total == 1:
+            return None
+        return {
+            "index": window.index,
+            "total": window.total,
+            "context_before": window.context_before,
+        }
+
+    @staticmethod
+    async def _stream_chunked(
+        content: str,
+        build_prompt: Callable[[TextWindow], str],
+        system_prompt: str,
+        user_id: int,
+        temperature: float,
+        project_id: int,
+        endpoint: str,
+    ) -> AsyncGenerator[str, None]:
+        """
+        分块处理长文本：短文本直接单次调用，长文本按窗口并发处理并按序输出
+        """
+        windows = split_into_windows(content)
+        if len(windows) > 1:
+            logger.info(f"{endpoint} 正文较长，分为 {len(windows)} 段并发处理")
+
+        async def process(window: TextWindow) -> AsyncGenerator[str, None]:
+            async for chunk in ai_service.generate_content_stream(
+                user_id=user_id,
+                system_prompt=system_prompt,
+                user_prompt=build_prompt(window),
+                temperature=temperature,
+                project_id=project_id,
+                endpoint=endpoint,
+            ):
+                yield chunk
+
+        async for chunk in stream_windows_in_order(windows, process):
+            yield chunk
+
+    @staticmethod
+    def _build_optimize_prompt(
+        content: str, optimization_type: str, window: TextWindow | None = None,
+    ) -> str:
+        """构建优化提示词"""
+        try:
+            prompt = template_manager.render(
+                "chapter_optimize.jinja2",
+                content=content,
+                optimization_type=optimization_type,
+                segment=ChapterAIService._segment_context(window),
+            )
+            logger.info("使用模板生成优化提示词成功")
+        except Exception as e:
+            logger.warning(f"模板渲染失败，使用硬编码方法: {e}")
+            # 降级到硬编码方法
+            note = ChapterAIService._segment_note(window)
+            if optimization_type == "grammar":
+                prompt = f"请检查并修正以下内容的语法错误、错别字和标点符号问题：{note}\n\n{content}\n\n请直接返回修正后的内容，不要添加任何解释。"
+            elif optimization_type == "style":
+                prompt = f"请优化以下内容的写作风格，使其更加生动、流畅、有文采：{note}\n\n{content}\n\n请直接返回优化后的内容，不要添加任何解释。"
+            else:
+                prompt = f"请全面优化以下内容，包括语法、风格、逻辑性和可读性：{note}\n\n{content}\n\n请直接返回优化后的内容，不要添加任何解释。"
+        return prompt
+
     @staticmethod
     async def optimize_chapter_content(
         chapter: Chapter,
@@ -277,6 +373,8 @@ class ChapterAIService:
         """
         AI优化章节内容
 
+        长章节会按段落切分为多个窗口并发优化，结果按原顺序流式返回
+
         Args:
             chapter: 章节对象
             user_id: 用户ID
@@ -289,40 +387,24 @@ class ChapterAIService:
         try:
             # 获取小说项目信息
             await chapter.fetch_related("project")
-            novel_title = chapter.project.title if chapter.project else "未命名小说"  # noqa: F841
             novel_genre = chapter.project.genre if chapter.project else ""
             novel_style = chapter.project.style if chapter.project else ""
 
-            # 尝试使用模板渲染
-            try:
-                prompt = ChapterAIService.template_manager.render(
-                    "chapter_optimize.jinja2",
-                    content=content,
-                    optimization_type=optimization_type,
-                )
-                logger.info("使用模板生成优化提示词成功")
-            except Exception as e:
-                logger.warning(f"模板渲染失败，使用硬编码方法: {e}")
-                # 降级到硬编码方法
-                if optimization_type == "grammar":
-                    prompt = f"请检查并修正以下内容的语法错误、错别字和标点符号问题：\n\n{content}\n\n请直接返回修正后的内容，不要添加任何解释。"
-                elif optimization_type == "style":
-                    prompt = f"请优化以下内容的写作风格，使其更加生动、流畅、有文采：\n\n{content}\n\n请直接返回优化后的内容，不要添加任何解释。"
-                else:
-                    prompt = f"请全面优化以下内容，包括语法、风格、逻辑性和可读性：\n\n{content}\n\n请直接返回优化后的内容，不要添加任何解释。"
-
             # 构建优化的系统提示词
             system_prompt = "你是一个专业的文字编辑和优化专家，擅长提升文本质量。"
             if novel_genre:
                 system_prompt += f"你特别熟悉{novel_genre}类型的写作规范。"
             if novel_style:
                 system_prompt += f"你熟悉{novel_style}风格的表达方式。"
-            
-            # 调用通用AI服务优化内容
-            async for chunk in ai_service.generate_content_stream(
-                user_id=user_id,
+
+            # 调用通用AI服务优化内容（按窗口分块）
+            async for chunk in ChapterAIService._stream_chunked(
+                content=content,
+                build_prompt=lambda window: ChapterAIService._build_optimize_prompt(
+                    window.text, optimization_type, window,
+                ),
                 system_prompt=system_prompt,
-                user_prompt=prompt,
+                user_id=user_id,
                 temperature=0.7,
                 project_id=chapter.project_id,
                 endpoint="/chapter/optimize",
@@ -333,6 +415,68 @@ class ChapterAIService:
             logger.error(f"AI优化章节内容失败: {e}")
             raise
 
+    @staticmethod
+    def _build_expand_prompt(
+        chapter: Chapter,
+        characters: list[Character],
+        content: str,
+        expand_ratio: float,
+        requirement: str,
+        window: TextWindow | None = None,
+    ) -> str:
+        """构建扩写提示词"""
+        try:
+            full_requirement = template_manager.render(
+                "chapter_expand.jinja2",
+                characters=characters,
+                chapter_title=chapter.title,
+                original_content=content,
+                expand_ratio=expand_ratio,
+                requirement=requirement,
+                segment=ChapterAIService._segment_context(window),
+            )
+            logger.info("使用模板生成扩写提示词成功")
+        except Exception as e:
+            logger.warning(f"模板渲染失败，使用硬编码方法: {e}")
+            # 降级到硬编码方法
+            prompt_parts = []
+
+            # 添加角色设定
+            if characters:
+                prompt_parts.append("【角色设定】")
+                prompt_parts.append("以下是本项目的主要角色，请在扩写时保持角色设定的一致性：\n")
+                for char in characters:
+                    prompt_parts.append(f"角色名：{char.name}")
+                    if char.basic_info:
+                        basic = char.basic_info
+                        info_parts = []
+                        if basic.get("gender"):
+                            info_parts.append(f"性别：{basic['gender']}")
+                        if basic.get("age"):
+                            info_parts.append(f"年龄：{basic['age']}")
+                        if basic.get("occupation"):
+                            info_parts.append(f"职业：{basic['occupation']}")
+                        if info_parts:
+                            prompt_parts.append(f"  基本信息：{'，'.join(info_parts)}")
+                    prompt_parts.append("")  # 空行分隔
+
+            prompt_parts.append(f"\n请对章节《{chapter.title}》的以下内容进行扩写：")
+            segment_note = ChapterAIService._segment_note(window)
+            if segment_note:
+                prompt_parts.append(segment_note)
+            prompt_parts.append(f"\n原始内容：\n{content}")
+            prompt_parts.append(f"\n扩写比例：{expand_ratio}倍")
+            prompt_parts.append("\n保持原文核心情节、人物关系和主题不变，丰富细节描写、扩展对话、增强情节。")
+
+            if requirement:
+                prompt_parts.append(f"\n额外要求：{requirement}")
+
+            prompt_parts.append(
+                "\n直接输出扩写后的完整内容，不要添加任何前言或后记。使用txt格式，不要包含markdown格式。",
+            )
+
+            full_requirement = "\n".join(prompt_parts)
+        return full_requirement
 
     @staticmethod
     async def expand_chapter_content(
@@ -345,6 +489,8 @@ class ChapterAIService:
         """
         AI扩写章节内容
 
+        长章节会按段落切分为多个窗口并发扩写，结果按原顺序流式返回
+
         Args:
             chapter: 章节对象
             user_id: 用户ID
@@ -361,57 +507,8 @@ class ChapterAIService:
             novel_genre = chapter.project.genre if chapter.project else ""
             novel_style = chapter.project.style if chapter.project else ""
 
-            # 获取角色设定信息
-            characters = await Character.filter(project_id=chapter.project_id).all()
-
-            # 使用模板渲染
-            try:
-                full_requirement = ChapterAIService.template_manager.render(
-                    "chapter_expand.jinja2",
-                    characters=characters,
-                    chapter_title=chapter.title,
-                    original_content=content,
-                    expand_ratio=expand_ratio,
-                    requirement=requirement,
-                )
-                logger.info("使用模板生成扩写提示词成功")
-            except Exception as e:
-                logger.warning(f"模板渲染失败，使用硬编码方法: {e}")
-                # 降级到硬编码方法
-                prompt_parts = []
-
-                # 添加角色设定
-                if characters:
-                    prompt_parts.append("【角色设定】")
-                    prompt_parts.append("以下是本项目的主要角色，请在扩写时保持角色设定的一致性：\n")
-                    for char in characters:
-                        prompt_parts.append(f"角色名：{char.name}")
-                        if char.basic_info:
-                            basic = char.basic_info
-                            info_parts = []
-                            if basic.get("gender"):
-                                info_parts.append(f"性别：{basic['gender']}")
-                            if basic.get("age"):
-                                info_parts.append(f"年龄：{basic['age']}")
-                            if basic.get("occupation"):
-                                info_parts.append(f"职业：{basic['occupation']}")
-                            if info_parts:
-                                prompt_parts.append(f"  基本信息：{'，'.join(info_parts)}")
-                        prompt_parts.append("")  # 空行分隔
-
-                prompt_parts.append(f"\n请对章节《{chapter.title}》的以下内容进行扩写：")
-                prompt_parts.append(f"\n原始内容：\n{content}")
-                prompt_parts.append(f"\n扩写比例：{expand_ratio}倍")
-                prompt_parts.append("\n保持原文核心情节、人物关系和主题不变，丰富细节描写、扩展对话、增强情节。")
-
-                if requirement:
-                    prompt_parts.append(f"\n额外要求：{requirement}")
-
-                prompt_parts.append(
-                    "\n直接输出扩写后的完整内容，不要添加任何前言或后记。使用txt格式，不要包含markdown格式。",
-                )
-
-                full_requirement = "\n".join(prompt_parts)
+            # 获取角色设定信息（仅保留原文中提及的角色及其一度关系角色）
+            characters = await ChapterAIService._get_relevant_characters(chapter, content)
 
             # 构建系统提示词
             system_prompt = "你是一个专业的小说扩写专家，擅长在保持原文核心的基础上丰富细节、扩展情节。"
@@ -420,11 +517,14 @@ class ChapterAIService:
             if novel_style:
                 system_prompt += f"你熟悉{novel_style}风格的表达方式。"
 
-            # 调用通用AI服务扩写内容
-            async for chunk in ai_service.generate_content_stream(
-                user_id=user_id,
+            # 调用通用AI服务扩写内容（按窗口分块）
+            async for chunk in ChapterAIService._stream_chunked(
+                content=content,
+                build_prompt=lambda window: ChapterAIService._build_expand_prompt(
+                    chapter, characters, window.text, expand_ratio, requirement, window,
+                ),
                 system_prompt=system_prompt,
-                user_prompt=full_requirement,
+                user_id=user_id,
                 temperature=0.7,
                 project_id=chapter.project_id,
                 endpoint="/chapter/expand",
@@ -435,6 +535,90 @@ class ChapterAIService:
             logger.error(f"AI扩写章节内容失败: {e}")
             raise
 
+    @staticmethod
+    def _build_compress_prompt(
+        chapter: Chapter,
+        characters: list[Character],
+        content: str,
+        compress_ratio: int,
+        requirement: str,
+        window: TextWindow | None = None,
+    ) -> str:
+        """构建缩写提示词"""
+        try:
+            full_requirement = template_manager.render(
+                "chapter_compress.jinja2",
+                characters=characters,
+                chapter_title=chapter.title,
+                original_content=content,
+                compress_ratio=compress_ratio,
+                requirement=requirement,
+                segment=ChapterAIService._segment_context(window),
+            )
+            logger.info("使用模板生成缩写提示词成功")
+        except Exception as e:
+            logger.warning(f"模板渲染失败，使用硬编码方法: {e}")
+            # 降级到硬编码方法
+            prompt_parts = []
+
+            # 添加角色设定
+            if characters:
+                prompt_parts.append("【角色设定】")
+                prompt_parts.append("以下是本项目的主要角色，请在缩写时保持对这些角色的准确描述：\n")
+                for char in characters:
+                    prompt_parts.append(f"角色名：{char.name}")
+                    if char.basic_info:
+                        basic = char.basic_info
+                        info_parts = []
+                        if basic.get("gender"):
+                            info_parts.append(f"性别：{basic['gender']}")
+                        if basic.get("age"):
+                            info_parts.append(f"年龄：{basic['age']}")
+                        if info_parts:
+                            prompt_parts.append(f"  基本信息：{'，'.join(info_parts)}")
+                    prompt_parts.append("")  # 空行分隔
+
+            prompt_parts.append(f"\n请对章节《{chapter.title}》的以下内容进行缩写：")
+            segment_note = ChapterAIService._segment_note(window)
+            if segment_note:
+                prompt_parts.append(segment_note)
+            prompt_parts.append(f"\n原始内容：\n{content}")
+            prompt_parts.append(f"\n压缩比例：{compress_ratio}%")
+            prompt_parts.append("\n保留核心情节和重要人物，删减冗余描写，简化次要情节。")
+
+            if requirement:
+                prompt_parts.append(f"\n额外要求：{requirement}")
+
+            prompt_parts.append(
+                "\n直接输出缩写后的完整内容，不要添加任何前言或后记。使用txt格式，不要包含markdown格式。",
+            )
+
+            full_requirement = "\n".join(prompt_parts)
+        return full_requirement
+
+    @staticmethod
+    def _build_compress_reduce_prompt(
+        chapter: Chapter, draft: str, original_length: int, compress_ratio: int,
+    ) -> str:
+        """构建缩写归并提示词（将分段缩写稿统稿为一篇连贯文本）"""
+        try:
+            prompt = template_manager.render(
+                "chapter_compress_reduce.jinja2",
+                chapter_title=chapter.title,
+                draft=draft,
+                target_length=int(original_length * compress_ratio / 100),
+            )
+            logger.info("使用模板生成缩写归并提示词成功")
+        except Exception as e:
+            logger.warning(f"模板渲染失败，使用硬编码方法: {e}")
+            prompt = (
+                f"以下是章节《{chapter.title}》分段缩写后拼接的初稿，段与段之间可能存在重复或衔接生硬。\n"
+                f"请在不增加新情节的前提下统稿为一篇连贯的文本，目标约 {int(original_length * compress_ratio / 100)} 字。\n\n"
+                f"【初稿】\n{draft}\n\n"
+                "直接输出统稿后的完整内容，不要添加任何前言或后记。使用txt格式，不要包含markdown格式。"
+            )
+        return prompt
+
     @staticmethod
     async def compress_chapter_content(
         chapter: Chapter,
@@ -446,6 +630,9 @@ class ChapterAIService:
         """
         AI缩写章节内容
 
+        长章节会按段落切分为多个窗口并发缩写（map），再对拼接后的初稿
+        做一次统稿（reduce）以保证全局连贯；初稿过长时直接输出初稿
+
         Args:
             chapter: 章节对象
             user_id: 用户ID
@@ -462,55 +649,8 @@ class ChapterAIService:
             novel_genre = chapter.project.genre if chapter.project else ""
             novel_style = chapter.project.style if chapter.project else ""
 
-            # 获取角色设定信息
-            characters = await Character.filter(project_id=chapter.project_id).all()
-
-            # 使用模板渲染
-            try:
-                full_requirement = ChapterAIService.template_manager.render(
-                    "chapter_compress.jinja2",
-                    characters=characters,
-                    chapter_title=chapter.title,
-                    original_content=content,
-                    compress_ratio=compress_ratio,
-                    requirement=requirement,
-                )
-                logger.info("使用模板生成缩写提示词成功")
-            except Exception as e:
-                logger.warning(f"模板渲染失败，使用硬编码方法: {e}")
-                # 降级到硬编码方法
-                prompt_parts = []
-
-                # 添加角色设定
-                if characters:
-                    prompt_parts.append("【角色设定】")
-                    prompt_parts.append("以下是本项目的主要角色，请在缩写时保持对这些角色的准确描述：\n")
-                    for char in characters:
-                        prompt_parts.append(f"角色名：{char.name}")
-                        if char.basic_info:
-                            basic = char.basic_info
-                            info_parts = []
-                            if basic.get("gender"):
-                                info_parts.append(f"性别：{basic['gender']}")
-                            if basic.get("age"):
-                                info_parts.append(f"年龄：{basic['age']}")
-                            if info_parts:
-                                prompt_parts.append(f"  基本信息：{'，'.join(info_parts)}")
-                        prompt_parts.append("")  # 空行分隔
-
-                prompt_parts.append(f"\n请对章节《{chapter.title}》的以下内容进行缩写：")
-                prompt_parts.append(f"\n原始内容：\n{content}")
-                prompt_parts.append(f"\n压缩比例：{compress_ratio}%")
-                prompt_parts.append("\n保留核心情节和重要人物，删减冗余描写，简化次要情节。")
-
-                if requirement:
-                    prompt_parts.append(f"\n额外要求：{requirement}")
-
-                prompt_parts.append(
-                    "\n直接输出缩写后的完整内容，不要添加任何前言或后记。使用txt格式，不要包含markdown格式。",
-                )
-
-                full_requirement = "\n".join(prompt_parts)
+            # 获取角色设定信息（仅保留原文中提及的角色及其一度关系角色）
+            characters = await ChapterAIService._get_relevant_characters(chapter, content)
 
             # 构建系统提示词
             system_prompt = "你是一个专业的文本缩写专家，擅长提取核心信息、保留关键情节、压缩冗余内容。"
@@ -519,12 +659,56 @@ class ChapterAIService:
             if novel_style:
                 system_prompt += f"你熟悉{novel_style}风格的精炼表达。"
 
-            # 调用通用AI服务缩写内容
+            windows = split_into_windows(content)
+            if len(windows) == 1:
+                # 短文本：单次调用直接流式返回
+                async for chunk in ai_service.generate_content_stream(
+                    user_id=user_id,
+                    system_prompt=system_prompt,
+                    user_prompt=ChapterAIService._build_compress_prompt(
+                        chapter, characters, content, compress_ratio, requirement,
+                    ),
+                    temperature=0.6,
+                    project_id=chapter.project_id,
+                    endpoint="/chapter/compress",
+                ):
+                    yield chunk
+                return
+
+            # map：各窗口并发缩写，汇总为初稿（期间只发送心跳）
+            logger.info(f"/chapter/compress 正文较长，分为 {len(windows)} 段并发处理")
+            draft_parts: list[str] = []
+            async for chunk in ChapterAIService._stream_chunked(
+                content=content,
+                build_prompt=lambda window: ChapterAIService._build_compress_prompt(
+                    chapter, characters, window.text, compress_ratio, requirement, window,
+                ),
+                system_prompt=system_prompt,
+                user_id=user_id,
+                temperature=0.6,
+                project_id=chapter.project_id,
+                endpoint="/chapter/compress",
+            ):
+                if "[REASONING]" in chunk:
+                    yield chunk
+                else:
+                    draft_parts.append(chunk)
+                    yield ""
+            draft = "".join(draft_parts)
+
+            if estimate_tokens(draft) > settings.AI_CHUNK_REDUCE_MAX_TOKENS:
+                logger.info("缩写初稿超出归并上限，跳过统稿直接输出")
+                yield draft
+                return
+
+            # reduce：统稿，保证全局连贯
             async for chunk in ai_service.generate_content_stream(
                 user_id=user_id,
                 system_prompt=system_prompt,
-                user_prompt=full_requirement,
-                temperature=0.6,
+                user_prompt=ChapterAIService._build_compress_reduce_prompt(
+                    chapter, draft, len(content), compress_ratio,
+                ),
+                temperature=0.5,
                 project_id=chapter.project_id,
                 endpoint="/chapter/compress",
             ):
@@ -0,0 +1,182 @@
+"""
+长文本分块处理管线
+将长章节按段落切分为若干窗口并发处理（map），再按原顺序流式返回；
+需要全局统筹的任务（如缩写）可在最后追加一次归并（reduce）
+"""
+
+import asyncio
+import re
+from collections.abc import AsyncGenerator, Callable
+from typing import NamedTuple
+
+from loguru import logger
+
+from src.backend.config.settings import settings
+
+# 句末标点（段落过长时按句切分）
+_SENTENCE_END = re.compile(r"(?<=[。！？!?…」』”])")
+
+_DONE = object()
+
+
+class TextWindow(NamedTuple):
+    """文本窗口"""
+
+    index: int  # 窗口序号（1-based）
+    total: int  # 窗口总数
+    text: str  # 本窗口需要处理的正文
+    context_before: str  # 与上一窗口重叠的前文（仅作衔接参考，不输出）
+    separator: str = ""  # 原文中本窗口与下一窗口之间的分隔符
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    粗略估算文本 token 数
+
+    中日韩字符按 1 字 1 token，其余字符按 4 字符 1 token 计
+
+    Args:
+        text: 文本
+
+    Returns:
+        int: 估算的 token 数
+    """
+    cjk = sum(1 for ch in text if "　" <= ch <= "鿿" or "＀" <= ch <= "￯")
+    return cjk + (len(text) - cjk + 3) // 4
+
+
+def _split_long_paragraph(paragraph: str, window_tokens: int) -> list[str]:
+    """将超出窗口大小的段落按句切分，单句仍超长时按字符硬切"""
+    pieces: list[str] = []
+    current = ""
+    for sentence in _SENTENCE_END.split(paragraph):
+        if not sentence:
+            continue
+        if current and estimate_tokens(current + sentence) > window_tokens:
+            pieces.append(current)
+            current = ""
+        while estimate_tokens(sentence) > window_tokens:
+            pieces.append(sentence[:window_tokens])
+            sentence = sentence[window_tokens:]
+        current += sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def split_into_windows(
+    text: str,
+    window_tokens: int | None = None,
+    overlap_chars: int | None = None,
+) -> list[TextWindow]:
+    """
+    按段落边界将文本切分为窗口
+
+    Args:
+        text: 原文
+        window_tokens: 每个窗口的 token 上限，默认 settings.AI_CHUNK_WINDOW_TOKENS
+        overlap_chars: 相邻窗口重叠的字符数，默认 settings.AI_CHUNK_OVERLAP_CHARS
+
+    Returns:
+        list[TextWindow]: 窗口列表；文本不超过窗口大小时只有一个窗口
+    """
+    window_tokens = window_tokens or settings.AI_CHUNK_WINDOW_TOKENS
+    overlap_chars = settings.AI_CHUNK_OVERLAP_CHARS if overlap_chars is None else overlap_chars
+
+    if estimate_tokens(text) <= window_tokens:
+        return [TextWindow(index=1, total=1, text=text, context_before="")]
+
+    # 切分单元：(文本, 与下一单元之间的分隔符)，超长段落按句拆开，句间无分隔符
+    units: list[tuple[str, str]] = []
+    for paragraph in text.split("\n"):
+        if estimate_tokens(paragraph) > window_tokens:
+            pieces = _split_long_paragraph(paragraph, window_tokens)
+            units.extend((piece, "") for piece in pieces[:-1])
+            units.append((pieces[-1], "\n"))
+        else:
+            units.append((paragraph, "\n"))
+    units[-1] = (units[-1][0], "")
+
+    chunks: list[tuple[str, str]] = []
+    current = ""
+    current_sep = ""
+    for piece, sep in units:
+        if current and estimate_tokens(current + piece) > window_tokens:
+            chunks.append((current, current_sep))
+            current = ""
+        else:
+            current += current_sep
+        current += piece
+        current_sep = sep
+    chunks.append((current, ""))
+
+    total = len(chunks)
+    return [
+        TextWindow(
+            index=i + 1,
+            total=total,
+            text=chunk,
+            context_before=chunks[i - 1][0][-overlap_chars:] if i > 0 and overlap_chars else "",
+            separator=sep,
+        )
+        for i, (chunk, sep) in enumerate(chunks)
+    ]
+
+
+async def stream_windows_in_order(
+    windows: list[TextWindow],
+    worker: Callable[[TextWindow], AsyncGenerator[str, None]],
+    concurrency: int | None = None,
+) -> AsyncGenerator[str, None]:
+    """
+    并发处理各窗口，并按窗口顺序流式输出结果
+
+    第一个窗口的输出实时透传；后续窗口在后台并发生成、缓冲，
+    轮到它时先吐出已缓冲内容再继续实时透传。
+
+    Args:
+        windows: 窗口列表
+        worker: 处理单个窗口的异步生成器函数
+        concurrency: 最大并发数，默认 settings.AI_CHUNK_CONCURRENCY
+
+    Yields:
+        按窗口顺序拼接的输出片段（窗口间的分隔符并入下一窗口的第一个正文片段，
+        避免被下游当作空白片段丢弃）
+
+    Raises:
+        Exception: 任一窗口处理失败时，输出到该窗口时抛出其异常并取消其余窗口
+    """
+    semaphore = asyncio.Semaphore(concurrency or settings.AI_CHUNK_CONCURRENCY)
+    queues: list[asyncio.Queue] = [asyncio.Queue() for _ in windows]
+
+    async def run(window: TextWindow, queue: asyncio.Queue) -> None:
+        try:
+            async with semaphore:
+                async for chunk in worker(window):
+                    await queue.put(chunk)
+        except Exception as e:
+            logger.error(f"分块处理第 {window.index}/{window.total} 段失败: {e}")
+            await queue.put(e)
+        finally:
+            await queue.put(_DONE)
+
+    tasks = [
+        asyncio.create_task(run(window, queue))
+        for window, queue in zip(windows, queues)
+    ]
+    try:
+        separator = ""
+        for i, queue in enumerate(queues):
+            if i > 0:
+                separator += windows[i - 1].separator
+            while (chunk := await queue.get()) is not _DONE:
+                if isinstance(chunk, Exception):
+                    raise chunk
+                if separator and "[REASONING]" not in chunk:
+                    chunk = separator + chunk
+                    separator = ""
+                yield chunk
+    finally:
+        # 出错或客户端断开时取消仍在运行的窗口
+        for task in tasks:
+            task.cancel()
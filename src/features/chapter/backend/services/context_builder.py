@@ -6,12 +6,19 @@
 from typing import Any
 
 from loguru import logger
+from tortoise.expressions import RawSQL
 
+from src.backend.config.database import is_sqlite
 from src.features.chapter.backend.models import Chapter
+from src.features.chapter.backend.services.save_buffer import chapter_save_buffer
 from src.features.character.backend.models import Character, CharacterRelation
+from src.features.character.backend.services.mention_index import mention_index_service
 from src.features.novel_outline.backend.models import OutlineNode
 from src.features.novel_project.backend.models import NovelProject
 
+# 前一章结尾摘要的长度（字符）
+PREVIOUS_SUMMARY_LENGTH = 200
+
 
 class ContextBuilder:
     """上下文构建器 - 收集生成提示词所需的所有信息"""
@@ -126,9 +133,17 @@ class ContextBuilder:
         )
         context["next_chapter"] = await ContextBuilder._get_next_chapter(chapter)
 
-        # 获取并结构化角色信息
+        # 获取并结构化角色信息（仅保留本章提及的角色及其一度关系角色）
+        mention_texts = [
+            context["chapter_title"],
+            context["chapter_description"],
+            *(f"{s['title']} {s['description'] or ''}" for s in section_hints),
+            (context["previous_chapter"] or {}).get("summary"),
+            chapter.content[-1500:] if chapter.content else None,
+        ]
         context["characters"] = await ContextBuilder._get_structured_characters(
             chapter.project_id,
+            mention_texts=mention_texts,
         )
 
         # 获取大纲元数据
@@ -186,9 +201,15 @@ class ContextBuilder:
             ]
         context["section_hints"] = section_hints
 
-        # 获取并结构化角色信息
+        # 获取并结构化角色信息（仅保留提纲与近文中提及的角色及其一度关系角色）
+        mention_texts = [
+            chapter.title,
+            *(f"{s['title']} {s['description'] or ''}" for s in section_hints),
+            context["current_content"],
+        ]
         context["characters"] = await ContextBuilder._get_structured_characters(
             chapter.project_id,
+            mention_texts=mention_texts,
         )
 
         # 获取大纲元数据
@@ -224,50 +245,77 @@ class ContextBuilder:
 
     @staticmethod
     async def _get_previous_chapter(chapter: Chapter) -> dict[str, Any] | None:
-        """获取前一章节信息"""
-        prev_chapter = await Chapter.filter(
+        """获取前一章节信息（含缓冲中尚未写入的保存；SQLite 上结尾摘要由 SQL substr 截取，不加载整章正文）"""
+        query = Chapter.filter(
             project_id=chapter.project_id,
             chapter_number=chapter.chapter_number - 1,
-        ).first()
+        )
+        if is_sqlite():
+            # 压缩存储的正文（blob）无法在 SQL 中截取，返回 NULL 后读取正文截取
+            prev_chapter = (
+                await query.annotate(tail=RawSQL(
+                    """CASE WHEN typeof("content") = 'blob' THEN NULL """
+                    f"""ELSE substr("content", -{PREVIOUS_SUMMARY_LENGTH}) END""",
+                ))
+                .first()
+                .values("id", "title", "tail")
+            )
+        else:
+            # 其他数据库的 substr 不支持负数起点，读取正文后截取
+            prev_chapter = await query.first().values("id", "title", tail="content")
 
         if not prev_chapter:
             return None
 
-        # 获取章节摘要（优先使用前200字）
-        summary = ""
-        if prev_chapter.content:
-            # 取最后200字作为结尾摘要
-            summary = (
-                prev_chapter.content[-200:]
-                if len(prev_chapter.content) > 200
-                else prev_chapter.content
-            )
+        # 缓冲中尚未写入的保存优先，避免读到旧的标题和结尾
+        pending = chapter_save_buffer.peek(prev_chapter["id"])
+        if pending is not None:
+            return {
+                "title": pending.title,
+                "summary": (pending.content or "")[-PREVIOUS_SUMMARY_LENGTH:],
+            }
 
+        # 取最后200字作为结尾摘要
+        tail = prev_chapter["tail"]
+        if tail is None:
+            tail = await Chapter.filter(id=prev_chapter["id"]).first().values_list("content", flat=True)
         return {
-            "title": prev_chapter.title,
-            "summary": summary,
+            "title": prev_chapter["title"],
+            "summary": (tail or "")[-PREVIOUS_SUMMARY_LENGTH:],
         }
 
     @staticmethod
     async def _get_next_chapter(chapter: Chapter) -> dict[str, Any] | None:
         """获取下一章节信息"""
-        next_chapter = await Chapter.filter(
-            project_id=chapter.project_id,
-            chapter_number=chapter.chapter_number + 1,
-        ).first()
+        next_chapter = (
+            await Chapter.filter(
+                project_id=chapter.project_id,
+                chapter_number=chapter.chapter_number + 1,
+            )
+            .first()
+            .values("id", "title")
+        )
 
-        if not next_chapter:
+        if next_chapter is None:
             return None
 
+        # 标题以缓冲中尚未写入的保存为准
+        chapter_save_buffer.overlay([next_chapter])
         return {
-            "title": next_chapter.title,
+            "title": next_chapter["title"],
         }
 
     @staticmethod
-    async def _get_structured_characters(project_id: int) -> list[dict[str, Any]]:
+    async def _get_structured_characters(
+        project_id: int,
+        mention_texts: list[str | None] | None = None,
+    ) -> list[dict[str, Any]]:
         """
         获取并结构化角色信息
 
+        传入 mention_texts 时通过角色提及索引筛选：只保留文本中提及的角色
+        及其一度关系角色；未提及任何角色时回退为项目全部角色。
+
         增强的角色信息结构：
         {
             "name": str,
@@ -283,6 +331,17 @@ class ContextBuilder:
         }
         """
         characters = await Character.filter(project_id=project_id).all()
+
+        if mention_texts is not None:
+            relevant_ids = await mention_index_service.select_relevant(
+                project_id, mention_texts,
+            )
+            if relevant_ids is not None:
+                characters = [c for c in characters if c.id in relevant_ids]
+
+        relations_map = await ContextBuilder._get_relations_map(
+            [c.id for c in characters],
+        )
         structured_chars = []
 
         for char in characters:
@@ -314,9 +373,7 @@ class ContextBuilder:
             char_data["speech_style"] = ContextBuilder._derive_speech_style(traits)
 
             # 获取角色关系
-            char_data["relationships"] = await ContextBuilder._get_character_relations(
-                char.id,
-            )
+            char_data["relationships"] = relations_map.get(char.id, [])
 
             # 其他备注
             char_data["notes"] = char.notes or ""
@@ -373,21 +430,25 @@ class ContextBuilder:
         return "语言风格自然"
 
     @staticmethod
-    async def _get_character_relations(character_id: int) -> list[dict[str, Any]]:
-        """获取角色关系"""
+    async def _get_relations_map(
+        character_ids: list[int],
+    ) -> dict[int, list[dict[str, Any]]]:
+        """批量获取角色关系（按源角色分组）"""
+        if not character_ids:
+            return {}
+
         relations = await CharacterRelation.filter(
-            source_character_id=character_id,
+            source_character_id__in=character_ids,
         ).prefetch_related("target_character")
 
-        relation_list = []
+        relations_map: dict[int, list[dict[str, Any]]] = {}
         for rel in relations:
-            target = await rel.target_character
-            relation_list.append(
+            relations_map.setdefault(rel.source_character_id, []).append(
                 {
-                    "name": target.name,
+                    "name": rel.target_character.name,
                     "relation": rel.relation_type,
                     "description": rel.description or "",
                 },
             )
 
-        return relation_list
+        return relations_map
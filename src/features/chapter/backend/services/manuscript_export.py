@@ -0,0 +1,309 @@
+"""
+全书导出
+按 chapter_number 顺序分批读取章节（每批只在内存中保留少量章节），边读边写出：
+- txt: 纯文本，卷名、章节标题各占一行
+- md: Markdown，卷名来自大纲的卷节点
+- epub: EPUB 3，由流式 zip 写出，每写完一个条目即输出，目录和清单在最后写入
+
+内存占用只与单个章节的大小有关，与全书大小无关
+"""
+
+import html
+import io
+import zipfile
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from tortoise.expressions import Q
+
+from src.features.chapter.backend.models import Chapter
+from src.features.chapter.backend.services.save_buffer import chapter_save_buffer
+from src.features.novel_outline.backend.models import OutlineNode
+
+# 每批读取的章节数
+EXPORT_BATCH_SIZE = 20
+
+EXPORT_FORMATS = {
+    "txt": ("text/plain; charset=utf-8", "txt"),
+    "md": ("text/markdown; charset=utf-8", "md"),
+    "epub": ("application/epub+zip", "epub"),
+}
+
+
+@dataclass
+class ExportChapter:
+    """导出中的一章（volume 为所属卷名，不属于任何卷时为 None）"""
+
+    number: int
+    title: str
+    content: str
+    volume_id: int | None
+    volume: str | None
+
+
+async def iter_chapters(project_id: int) -> AsyncIterator[ExportChapter]:
+    """
+    按章节顺序分批读取项目的章节
+
+    Args:
+        project_id: 项目ID
+
+    Yields:
+        ExportChapter: 章节（含所属卷名）
+    """
+    # 先写入缓冲中的保存，导出内容与编辑器一致
+    await chapter_save_buffer.flush()
+
+    # 卷名及章节节点所属的卷（只有ID和标题，与正文大小无关）
+    volumes = dict(
+        await OutlineNode.filter(project_id=project_id, node_type="volume").values_list("id", "title"),
+    )
+    node_volumes = {
+        node_id: parent_id
+        for node_id, parent_id in await OutlineNode.filter(
+            project_id=project_id, node_type="chapter",
+        ).values_list("id", "parent_id")
+        if parent_id in volumes
+    }
+
+    last_number, last_id = 0, 0
+    while True:
+        rows = (
+            await Chapter.filter(project_id=project_id)
+            .filter(Q(chapter_number__gt=last_number) | Q(chapter_number=last_number, id__gt=last_id))
+            .order_by("chapter_number", "id")
+            .limit(EXPORT_BATCH_SIZE)
+            .values("id", "chapter_number", "title", "content", "outline_node_id")
+        )
+        if not rows:
+            return
+        for row in rows:
+            volume_id = node_volumes.get(row["outline_node_id"])
+            yield ExportChapter(
+                number=row["chapter_number"],
+                title=row["title"],
+                content=row["content"] or "",
+                volume_id=volume_id,
+                volume=volumes.get(volume_id),
+            )
+        last_number, last_id = rows[-1]["chapter_number"], rows[-1]["id"]
+
+
+async def export_txt(title: str, chapters: AsyncIterator[ExportChapter]) -> AsyncIterator[bytes]:
+    """导出为纯文本"""
+    yield f"{title}\n\n".encode("utf-8")
+    volume_id = None
+    async for chapter in chapters:
+        if chapter.volume_id is not None and chapter.volume_id != volume_id:
+            yield f"\n{chapter.volume}\n\n".encode("utf-8")
+        volume_id = chapter.volume_id
+        yield f"{chapter.title}\n\n{chapter.content.strip()}\n\n\n".encode("utf-8")
+
+
+async def export_markdown(title: str, chapters: AsyncIterator[ExportChapter]) -> AsyncIterator[bytes]:
+    """导出为 Markdown（卷为二级标题，章节为三级标题；没有卷的章节为二级标题）"""
+    yield f"# {title}\n\n".encode("utf-8")
+    volume_id = None
+    async for chapter in chapters:
+        if chapter.volume_id is not None and chapter.volume_id != volume_id:
+            yield f"## {chapter.volume}\n\n".encode("utf-8")
+        volume_id = chapter.volume_id
+        level = "###" if volume_id is not None else "##"
+        yield f"{level} {chapter.title}\n\n{chapter.content.strip()}\n\n".encode("utf-8")
+
+
+# ==================== EPUB ====================
+
+class _ZipStream(io.RawIOBase):
+    """zip 输出缓冲
+
+    ZipFile 写完一个条目后会回到条目开头回写文件头（大小、CRC），
+    因此只在条目之间取走已完成的数据；已取走的部分不再允许回写
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._buffer = bytearray()
+        self._start = 0
+        self._pos = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._start + len(self._buffer)
+        if offset < self._start:
+            raise OSError("已输出的数据不能回写")
+        self._pos = offset
+        return offset
+
+    def write(self, data) -> int:
+        index = self._pos - self._start
+        size = len(data)
+        self._buffer[index:index + size] = data
+        self._pos += size
+        return size
+
+    def drain(self) -> bytes:
+        """取走已写入的数据"""
+        data = bytes(self._buffer)
+        self._start += len(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+_CONTAINER_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>
+"""
+
+_XHTML = """<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE html>
+<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops" xml:lang="zh-CN" lang="zh-CN">
+<head><meta charset="UTF-8"/><title>{title}</title></head>
+<body>
+{body}
+</body>
+</html>
+"""
+
+
+@dataclass
+class _EpubItem:
+    """EPUB 中的一个页面（卷页或章节页）"""
+
+    id: str
+    href: str
+    title: str
+    children: list["_EpubItem"] = field(default_factory=list)
+
+
+def _xhtml(title: str, body: str) -> bytes:
+    return _XHTML.format(title=html.escape(title), body=body).encode("utf-8")
+
+
+def _chapter_body(chapter: ExportChapter) -> str:
+    """章节正文转为 XHTML 段落（每个非空行一段）"""
+    paragraphs = "\n".join(
+        f"<p>{html.escape(line.strip())}</p>"
+        for line in chapter.content.splitlines()
+        if line.strip()
+    )
+    return f"<h2>{html.escape(chapter.title)}</h2>\n{paragraphs}"
+
+
+def _nav_list(items: list[_EpubItem]) -> str:
+    entries = []
+    for item in items:
+        nested = f"\n<ol>\n{_nav_list(item.children)}\n</ol>" if item.children else ""
+        entries.append(f'<li><a href="{item.href}">{html.escape(item.title)}</a>{nested}</li>')
+    return "\n".join(entries)
+
+
+def _package_opf(project_id: int, title: str, items: list[_EpubItem]) -> bytes:
+    pages = [page for item in items for page in (item, *item.children)]
+    manifest = "\n    ".join(
+        f'<item id="{page.id}" href="{page.href}" media-type="application/xhtml+xml"/>' for page in pages
+    )
+    spine = "\n    ".join(f'<itemref idref="{page.id}"/>' for page in pages)
+    modified = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="book-id" xml:lang="zh-CN">
+  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+    <dc:identifier id="book-id">urn:lingma:project:{project_id}</dc:identifier>
+    <dc:title>{html.escape(title)}</dc:title>
+    <dc:language>zh-CN</dc:language>
+    <meta property="dcterms:modified">{modified}</meta>
+  </metadata>
+  <manifest>
+    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
+    {manifest}
+  </manifest>
+  <spine>
+    {spine}
+  </spine>
+</package>
+""".encode("utf-8")
+
+
+def _write_entry(archive: zipfile.ZipFile, stream: _ZipStream, name: str, data: bytes) -> Iterator[bytes]:
+    """写入一个条目并取走已完成的数据"""
+    archive.writestr(name, data, compress_type=zipfile.ZIP_DEFLATED)
+    chunk = stream.drain()
+    if chunk:
+        yield chunk
+
+
+async def export_epub(
+    project_id: int, title: str, chapters: AsyncIterator[ExportChapter],
+) -> AsyncIterator[bytes]:
+    """导出为 EPUB 3（mimetype 为首个不压缩的条目，章节页之后写入导航和清单）"""
+    stream = _ZipStream()
+    archive = zipfile.ZipFile(stream, "w")
+    archive.writestr("mimetype", "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+    for chunk in _write_entry(archive, stream, "META-INF/container.xml", _CONTAINER_XML.encode("utf-8")):
+        yield chunk
+
+    # 只保留页面的标题和路径，用于最后生成目录
+    items: list[_EpubItem] = []
+    volume_id = None
+    index = 0
+    async for chapter in chapters:
+        index += 1
+        if chapter.volume_id is not None and chapter.volume_id != volume_id:
+            volume = _EpubItem(f"volume-{index}", f"volume-{index}.xhtml", chapter.volume or "")
+            items.append(volume)
+            page = _xhtml(volume.title, f"<h1>{html.escape(volume.title)}</h1>")
+            for chunk in _write_entry(archive, stream, f"OEBPS/{volume.href}", page):
+                yield chunk
+        volume_id = chapter.volume_id
+
+        item = _EpubItem(f"chapter-{index}", f"chapter-{index}.xhtml", chapter.title)
+        if volume_id is not None:
+            items[-1].children.append(item)
+        else:
+            items.append(item)
+        for chunk in _write_entry(archive, stream, f"OEBPS/{item.href}", _xhtml(chapter.title, _chapter_body(chapter))):
+            yield chunk
+
+    nav = _xhtml(title, f'<nav epub:type="toc" id="toc">\n<h1>目录</h1>\n<ol>\n{_nav_list(items)}\n</ol>\n</nav>')
+    for chunk in _write_entry(archive, stream, "OEBPS/nav.xhtml", nav):
+        yield chunk
+    for chunk in _write_entry(archive, stream, "OEBPS/content.opf", _package_opf(project_id, title, items)):
+        yield chunk
+
+    archive.close()
+    yield stream.drain()
+
+
+def export_manuscript(project_id: int, title: str, fmt: str) -> AsyncIterator[bytes]:
+    """
+    流式导出全书
+
+    Args:
+        project_id: 项目ID
+        title: 书名
+        fmt: 导出格式（EXPORT_FORMATS 的键）
+
+    Returns:
+        AsyncIterator[bytes]: 文件内容分块
+    """
+    chapters = iter_chapters(project_id)
+    if fmt == "epub":
+        return export_epub(project_id, title, chapters)
+    if fmt == "md":
+        return export_markdown(title, chapters)
+    return export_txt(title, chapters)
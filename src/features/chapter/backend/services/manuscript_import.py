@@ -0,0 +1,434 @@
+"""
+导入已有小说（TXT / Markdown）
+上传文件先流式写入临时文件，再逐行读取（不把整个文件读入内存）：
+- 第一遍只扫描 Markdown 标题的层级，确定哪一级是卷、哪一级是章
+- 第二遍按卷/章标题切分正文，卷、章生成大纲节点和章节，每满一批用 bulk_create 写入，
+  并记录各章的出场角色
+- 两遍的读取和标题识别都在线程中进行（第二遍按批取回），不阻塞事件循环
+
+导入在后台任务中执行，全部写入在同一个事务内完成（失败时整体回滚），
+进度经队列转为 SSE 事件，事务期间不等待客户端读取；
+导入的卷排在已有大纲之后，章节编号接在已有章节之后
+"""
+
+import asyncio
+import codecs
+import contextlib
+import io
+import itertools
+import json
+import re
+import tempfile
+import uuid
+from collections.abc import AsyncIterator, Iterator
+from dataclasses import dataclass, field
+from typing import IO, Any
+
+from fastapi import UploadFile
+from tortoise import BaseDBAsyncClient
+from tortoise.transactions import in_transaction
+
+from src.backend.config.settings import settings
+from src.backend.core.exceptions import ValidationError
+from src.backend.core.logger import logger
+from src.features.chapter.backend.models import Chapter
+from src.features.chapter.backend.services.word_count import (
+    apply_word_count_delta,
+    count_words,
+)
+from src.features.character.backend.services.mention_index import mention_index_service
+from src.features.novel_outline.backend.models import OutlineNode
+from src.features.search.backend.services.search_service import search_service
+
+# 每批写入的章节数
+IMPORT_BATCH_SIZE = 50
+
+# 第二遍每批在线程中读取并识别的行数（批间让出事件循环）
+CLASSIFY_BATCH_LINES = 2000
+
+# 标题行的最大长度（更长的行视为正文）
+HEADING_MAX_LENGTH = 40
+
+# 没有卷标题时，章节归入的默认卷
+DEFAULT_VOLUME_TITLE = "正文"
+
+# 第一个标题之前的多行内容作为单独一章（只有一行时视为书名，不导入）
+PREFACE_TITLE = "前言"
+
+_READ_SIZE = 64 * 1024
+
+_NUMERALS = "0-9０-９零〇一二三四五六七八九十百千万两壹贰叁肆伍陆柒捌玖拾佰仟"
+_VOLUME_RE = re.compile(rf"^第[{_NUMERALS}]+[卷部集篇]")
+_CHAPTER_RE = re.compile(rf"^(第[{_NUMERALS}]+[章回节]|序章|楔子|引子|序言|尾声|后记|番外)")
+_MARKDOWN_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*$")
+
+KIND_VOLUME = "volume"
+KIND_CHAPTER = "chapter"
+KIND_TITLE = "title"
+
+
+def _event(event_type: str, **data: Any) -> str:
+    return f"data: {json.dumps({'type': event_type, **data}, ensure_ascii=False)}\n\n"
+
+
+async def spool_upload(upload: UploadFile, max_bytes: int) -> tuple[IO[bytes], int]:
+    """
+    将上传文件分块复制到临时文件（请求结束后上传文件即被关闭，导入在响应流中进行）
+
+    Args:
+        upload: 上传的文件
+        max_bytes: 文件大小上限
+
+    Returns:
+        tuple: (临时文件, 文件大小)，临时文件由调用方关闭
+
+    Raises:
+        ValidationError: 文件超过大小上限
+    """
+    with contextlib.ExitStack() as stack:
+        spooled = stack.enter_context(tempfile.TemporaryFile())
+        size = 0
+        while chunk := await upload.read(_READ_SIZE):
+            size += len(chunk)
+            if size > max_bytes:
+                raise ValidationError(f"文件不能超过 {max_bytes // 1024 // 1024}MB")
+            await asyncio.to_thread(spooled.write, chunk)
+        spooled.seek(0)
+        # 复制完成，临时文件交给调用方
+        stack.pop_all()
+    return spooled, size
+
+
+def _detect_encoding(source: IO[bytes]) -> str:
+    """按文件开头判断编码：能按 UTF-8 解码（末尾可能截断在多字节字符中间）时为 UTF-8，否则按 GB18030"""
+    head = source.read(_READ_SIZE)
+    source.seek(0)
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return "gb18030"
+    return "utf-8-sig"
+
+
+def _iter_lines(source: IO[bytes], encoding: str) -> Iterator[str]:
+    """逐行读取（统一换行符，无法解码的字节替换为占位符）"""
+    source.seek(0)
+    reader = io.TextIOWrapper(source, encoding=encoding, errors="replace", newline=None)
+    try:
+        for line in reader:
+            yield line.rstrip("\n")
+    finally:
+        # 只解除包装，临时文件由调用方关闭
+        reader.detach()
+
+
+class HeadingRules:
+    """标题识别规则
+
+    - 以“第X卷/部/集/篇”开头的短行为卷，“第X章/回/节”、序章、楔子等为章（Markdown 标题同样适用）
+    - 其他 Markdown 标题按层级：文件开头唯一的一级标题为书名；其余层级中最浅的为卷、次浅的为章
+      （只有一个层级时为章），更深的标题保留在正文中
+    """
+
+    def __init__(self, volume_level: int | None = None, chapter_level: int | None = None, title_level: int | None = None):
+        self.volume_level = volume_level
+        self.chapter_level = chapter_level
+        self.title_level = title_level
+
+    @staticmethod
+    def _match_text(text: str) -> str | None:
+        if _VOLUME_RE.match(text):
+            return KIND_VOLUME
+        if _CHAPTER_RE.match(text):
+            return KIND_CHAPTER
+        return None
+
+    def classify(self, line: str) -> tuple[str, str] | None:
+        """
+        识别标题行
+
+        Args:
+            line: 一行文本
+
+        Returns:
+            tuple | None: (KIND_VOLUME / KIND_CHAPTER / KIND_TITLE, 标题)；不是标题时返回None
+        """
+        text = line.strip()
+        if not text:
+            return None
+        match = _MARKDOWN_HEADING_RE.match(text)
+        if match:
+            level, text = len(match.group(1)), match.group(2)
+            if len(text) > HEADING_MAX_LENGTH:
+                return None
+            kind = self._match_text(text)
+            if kind is None:
+                kind = {
+                    self.title_level: KIND_TITLE,
+                    self.volume_level: KIND_VOLUME,
+                    self.chapter_level: KIND_CHAPTER,
+                }.get(level)
+            return (kind, text) if kind else None
+        if len(text) > HEADING_MAX_LENGTH:
+            return None
+        kind = self._match_text(text)
+        return (kind, text) if kind else None
+
+    @classmethod
+    def scan(cls, lines: Iterator[str]) -> "HeadingRules":
+        """第一遍扫描：统计未按文字识别的 Markdown 标题层级"""
+        counts: dict[int, int] = {}
+        first_level = None
+        seen_content = False
+        for line in lines:
+            text = line.strip()
+            if not text:
+                continue
+            match = _MARKDOWN_HEADING_RE.match(text)
+            if match and len(match.group(2)) <= HEADING_MAX_LENGTH and cls._match_text(match.group(2)) is None:
+                level = len(match.group(1))
+                counts[level] = counts.get(level, 0) + 1
+                if not seen_content:
+                    first_level = level
+            seen_content = True
+
+        title_level = None
+        if first_level == 1 and counts.get(1) == 1:
+            title_level = 1
+            del counts[1]
+        levels = sorted(counts)
+        if len(levels) >= 2:
+            return cls(levels[0], levels[1], title_level)
+        return cls(None, levels[0] if levels else None, title_level)
+
+
+def _classify_batch(lines: Iterator[str], rules: HeadingRules, count: int) -> list[tuple[str, tuple[str, str] | None]]:
+    """读取并识别一批行（在线程中运行；读到文件末尾时返回空列表）"""
+    return [(line, rules.classify(line)) for line in itertools.islice(lines, count)]
+
+
+@dataclass
+class _ImportState:
+    """导入进度及待写入的行
+
+    主键由数据库分配（bulk_create 不回填主键），写入后按自然键读回：
+    新卷的 position 排在已有根节点之后、新章节节点只挂在新卷下、章节编号接在已有章节之后，
+    因此 (父节点, position) 和 chapter_number 在本次导入中唯一
+    """
+
+    project_id: int
+    next_volume_position: int
+    next_chapter_number: int
+    volume: OutlineNode | None = None
+    volume_children: int = 0
+    chapter_title: str | None = None
+    lines: list[str] = field(default_factory=list)
+    volumes: list[OutlineNode] = field(default_factory=list)
+    chapters: list[tuple[OutlineNode, OutlineNode, Chapter]] = field(default_factory=list)
+    volume_count: int = 0
+    chapter_count: int = 0
+    words: int = 0
+
+    def add_volume(self, title: str) -> None:
+        self.volume = OutlineNode(
+            project_id=self.project_id, parent_id=None, node_type="volume",
+            title=title[:200], position=self.next_volume_position, is_expanded=True,
+        )
+        self.volumes.append(self.volume)
+        self.next_volume_position += 1
+        self.volume_children = 0
+        self.volume_count += 1
+
+    def add_chapter(self, title: str, content: str) -> None:
+        if self.volume is None:
+            self.add_volume(DEFAULT_VOLUME_TITLE)
+        node = OutlineNode(
+            project_id=self.project_id, node_type="chapter",
+            title=title[:200], position=self.volume_children, is_expanded=False,
+        )
+        self.volume_children += 1
+
+        words = count_words(content)
+        chapter = Chapter(
+            uuid=uuid.uuid4(), project_id=self.project_id, title=title[:200],
+            chapter_number=self.next_chapter_number, content=content, word_count=words, status="draft",
+        )
+        self.chapters.append((self.volume, node, chapter))
+        self.next_chapter_number += 1
+        self.chapter_count += 1
+        self.words += words
+
+    def take_content(self) -> str:
+        """取出已读取的正文行（去掉首尾空行）"""
+        content = "\n".join(self.lines).strip("\n")
+        self.lines.clear()
+        return content
+
+    def finish_chapter(self) -> None:
+        """结束当前章节；第一个标题之前的内容按前言处理"""
+        if self.chapter_title is not None:
+            self.add_chapter(self.chapter_title, self.take_content())
+            return
+        content = self.take_content()
+        if sum(1 for line in content.splitlines() if line.strip()) >= 2:
+            self.add_chapter(PREFACE_TITLE, content)
+
+    async def flush(self, using_db: BaseDBAsyncClient) -> None:
+        """依次写入卷、章节节点、章节，每步读回主键供下一步引用"""
+        if self.volumes:
+            await OutlineNode.bulk_create(self.volumes, using_db=using_db)
+            ids = dict(
+                await OutlineNode.filter(
+                    project_id=self.project_id, parent_id__isnull=True,
+                    position__in=[volume.position for volume in self.volumes],
+                ).using_db(using_db).values_list("position", "id"),
+            )
+            for volume in self.volumes:
+                volume.id = ids[volume.position]
+            self.volumes.clear()
+        if not self.chapters:
+            return
+
+        nodes = []
+        for volume, node, _ in self.chapters:
+            node.parent_id = volume.id
+            nodes.append(node)
+        await OutlineNode.bulk_create(nodes, using_db=using_db)
+        node_ids = {
+            (parent_id, position): node_id
+            for parent_id, position, node_id in await OutlineNode.filter(
+                parent_id__in=list({node.parent_id for node in nodes}),
+                position__in=list({node.position for node in nodes}),
+            ).using_db(using_db).values_list("parent_id", "position", "id")
+        }
+
+        chapters = []
+        for _, node, chapter in self.chapters:
+            chapter.outline_node_id = node_ids[(node.parent_id, node.position)]
+            chapters.append(chapter)
+        await Chapter.bulk_create(chapters, using_db=using_db)
+        chapter_ids = dict(
+            await Chapter.filter(
+                project_id=self.project_id,
+                chapter_number__in=[chapter.chapter_number for chapter in chapters],
+            ).using_db(using_db).values_list("chapter_number", "id"),
+        )
+        for chapter in chapters:
+            chapter_id = chapter_ids[chapter.chapter_number]
+            if settings.TEXT_COMPRESSION_ENABLED:
+                # 压缩存储的正文不会被插入触发器索引，单独写入全文索引
+                await search_service.index_chapter(chapter_id, chapter.content, using_db)
+            await mention_index_service.record_appearances(
+                self.project_id, chapter_id, chapter.content, using_db,
+            )
+        self.chapters.clear()
+
+
+async def _max_value(model: Any, column: str, using_db: BaseDBAsyncClient, **filters: Any) -> int | None:
+    """列的最大值（无数据时为None）"""
+    return (
+        await model.filter(**filters).using_db(using_db)
+        .order_by(f"-{column}").first().values_list(column, flat=True)
+    )
+
+
+async def _run_import(
+    project_id: int, source: IO[bytes], total_bytes: int, fallback_title: str, events: asyncio.Queue,
+) -> None:
+    """执行导入，进度事件写入队列（队列不限长度，写入不等待客户端读取；结束时写入 None）"""
+    try:
+        events.put_nowait(_event("status", message="分析文件结构..."))
+        encoding = _detect_encoding(source)
+        rules = await asyncio.to_thread(HeadingRules.scan, _iter_lines(source, encoding))
+
+        events.put_nowait(_event("status", message="导入章节..."))
+        async with in_transaction() as conn:
+            max_position = await _max_value(
+                OutlineNode, "position", conn, project_id=project_id, parent_id__isnull=True,
+            )
+            state = _ImportState(
+                project_id=project_id,
+                # 导入的卷排在已有的根节点之后
+                next_volume_position=0 if max_position is None else max_position + 1,
+                next_chapter_number=(
+                    await _max_value(Chapter, "chapter_number", conn, project_id=project_id) or 0
+                ) + 1,
+            )
+
+            has_heading = False
+            lines = _iter_lines(source, encoding)
+            # 读取和识别与第一遍一样在线程中进行，按批取回，事件循环只处理识别结果
+            while batch := await asyncio.to_thread(_classify_batch, lines, rules, CLASSIFY_BATCH_LINES):
+                for line, heading in batch:
+                    if heading is None:
+                        state.lines.append(line)
+                        continue
+
+                    kind, title = heading
+                    if kind == KIND_TITLE:
+                        continue
+                    state.finish_chapter()
+                    has_heading = True
+                    if kind == KIND_VOLUME:
+                        state.add_volume(title)
+                        state.chapter_title = None
+                    else:
+                        state.chapter_title = title
+
+                    if len(state.chapters) >= IMPORT_BATCH_SIZE:
+                        await state.flush(conn)
+                        events.put_nowait(_event(
+                            "progress",
+                            bytes_read=min(source.tell(), total_bytes), total_bytes=total_bytes,
+                            volumes=state.volume_count, chapters=state.chapter_count,
+                        ))
+
+            if has_heading:
+                state.finish_chapter()
+            else:
+                # 没有任何标题：全文作为一章
+                content = state.take_content()
+                if content.strip():
+                    state.add_chapter(fallback_title, content)
+            await state.flush(conn)
+            await apply_word_count_delta(project_id, state.words, conn)
+
+        logger.info(
+            f"导入小说: 项目 {project_id}, {state.volume_count} 卷, {state.chapter_count} 章, {state.words} 字",
+        )
+        events.put_nowait(_event(
+            "complete", volumes=state.volume_count, chapters=state.chapter_count, words=state.words,
+        ))
+    except Exception as e:
+        logger.error(f"导入小说失败: {e}")
+        events.put_nowait(_event("error", message=f"导入失败: {e!s}"))
+    finally:
+        source.close()
+        events.put_nowait(None)
+
+
+async def import_manuscript(
+    project_id: int, source: IO[bytes], total_bytes: int, fallback_title: str,
+) -> AsyncIterator[str]:
+    """
+    在后台任务中导入小说，并以 SSE 事件返回进度
+
+    客户端断开时取消导入（事务回滚，不留下部分导入的内容）
+
+    Args:
+        project_id: 项目ID
+        source: spool_upload() 生成的临时文件（导入结束后关闭）
+        total_bytes: 文件大小
+        fallback_title: 文件中没有任何标题时使用的章节标题（通常为文件名）
+
+    Yields:
+        str: SSE 事件（status / progress / complete / error）
+    """
+    events: asyncio.Queue = asyncio.Queue()
+    task = asyncio.create_task(_run_import(project_id, source, total_bytes, fallback_title, events))
+    try:
+        while (event := await events.get()) is not None:
+            yield event
+    finally:
+        if not task.done():
+            task.cancel()
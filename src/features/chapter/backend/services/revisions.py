@@ -0,0 +1,247 @@
+"""
+章节修订历史
+每次正文变更在同一事务内记录修订：最新一条为完整快照，旧的最新快照改写为
+“由新正文还原出旧正文”的反向差异（按行比较），每隔若干条或差异过大时保留完整快照；
+同一时间窗口内的连续保存合并为一条修订，每章修订数有上限，存储量约为正文大小的常数倍
+"""
+
+import difflib
+import json
+from datetime import timedelta
+from typing import Any
+
+from tortoise import BaseDBAsyncClient
+from tortoise import timezone as tz
+
+from src.backend.config.settings import settings
+from src.backend.core.compression import compress, decompress
+from src.features.chapter.backend.models import Chapter, ChapterRevision
+from src.features.chapter.backend.services.word_count import count_words
+
+KIND_SNAPSHOT = "snapshot"
+KIND_DELTA = "delta"
+
+REVISION_FIELDS = ("version", "kind", "word_count", "created_at", "updated_at")
+
+
+def make_delta(source: str, target: str) -> list[list[Any]]:
+    """
+    计算把 source 变为 target 的编辑操作（按行比较）
+
+    Args:
+        source: 原文本
+        target: 目标文本
+
+    Returns:
+        list: [[start, end, text], ...]，偏移相对于 source（按字符计），区间不重叠且递增
+    """
+    a = source.splitlines(keepends=True)
+    b = target.splitlines(keepends=True)
+    offsets = [0]
+    for line in a:
+        offsets.append(offsets[-1] + len(line))
+
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    return [
+        [offsets[i1], offsets[i2], "".join(b[j1:j2])]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def apply_delta(text: str, delta: list[list[Any]]) -> str:
+    """
+    应用 make_delta() 生成的编辑操作
+
+    Args:
+        text: 原文本
+        delta: 编辑操作
+
+    Returns:
+        str: 目标文本
+    """
+    parts: list[str] = []
+    cursor = 0
+    for start, end, replacement in delta:
+        parts.append(text[cursor:start])
+        parts.append(replacement)
+        cursor = end
+    parts.append(text[cursor:])
+    return "".join(parts)
+
+
+def _encode_text(text: str) -> tuple[str, bytes]:
+    return compress(text.encode("utf-8"))
+
+
+def _encode_delta(delta: list[list[Any]]) -> tuple[str, bytes]:
+    return compress(json.dumps(delta, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def _decode(revision: ChapterRevision) -> Any:
+    """解压修订内容：快照返回正文，差异返回编辑操作"""
+    raw = decompress(revision.codec, bytes(revision.data)).decode("utf-8")
+    return raw if revision.kind == KIND_SNAPSHOT else json.loads(raw)
+
+
+class ChapterRevisionService:
+    """章节修订历史服务
+
+    特性:
+    - record() 在章节写入事务内调用，与正文变更原子提交
+    - 窗口内合并：覆盖最新快照，并把前一条差异改为相对于新正文，还原链始终有效
+    - 还原某个版本时从其上方最近的快照开始，依次应用反向差异
+    - 超出上限时删除最早的修订（反向差异只依赖更新的修订，删除最早的不影响其他修订）
+    """
+
+    async def record(
+        self,
+        chapter: Chapter,
+        previous: str,
+        previous_version: int,
+        using_db: BaseDBAsyncClient,
+    ) -> None:
+        """
+        记录一次正文变更
+
+        Args:
+            chapter: 已写入新正文和新版本号的章节
+            previous: 变更前的正文
+            previous_version: 变更前的版本号
+            using_db: 事务连接（与章节写入同一事务）
+        """
+        revisions = (
+            await ChapterRevision.filter(chapter_id=chapter.id)
+            .using_db(using_db)
+            .order_by("-version")
+            .limit(2)
+        )
+        head = revisions[0] if revisions else None
+
+        if head is not None and head.version == previous_version:
+            window = timedelta(seconds=settings.CHAPTER_REVISION_COALESCE_SECONDS)
+            if tz.now() - head.created_at < window:
+                # 合并到当前修订：前一条差异原本相对于旧正文，需改为相对于新正文
+                prior = revisions[1] if len(revisions) > 1 else None
+                if prior is not None and prior.kind == KIND_DELTA:
+                    prior_text = apply_delta(previous, _decode(prior))
+                    prior.codec, prior.data = _encode_delta(make_delta(chapter.content, prior_text))
+                    await prior.save(update_fields=["codec", "data", "updated_at"], using_db=using_db)
+                head.version = chapter.version
+                head.codec, head.data = _encode_text(chapter.content)
+                head.word_count = chapter.word_count
+                await head.save(
+                    update_fields=["version", "codec", "data", "word_count", "updated_at"],
+                    using_db=using_db,
+                )
+                return
+
+            await self._demote(head, chapter.content, previous, using_db)
+        elif head is None and previous:
+            # 首次记录：保存变更前的正文作为基线
+            codec, data = _encode_text(previous)
+            await ChapterRevision.create(
+                chapter_id=chapter.id, version=previous_version, kind=KIND_SNAPSHOT,
+                codec=codec, data=data, word_count=count_words(previous), using_db=using_db,
+            )
+
+        # 写入新的最新快照（原最新修订与本次变更不连续时，如绕过修订的写入，保留其完整快照）
+        codec, data = _encode_text(chapter.content)
+        await ChapterRevision.create(
+            chapter_id=chapter.id, version=chapter.version, kind=KIND_SNAPSHOT,
+            codec=codec, data=data, word_count=chapter.word_count, using_db=using_db,
+        )
+        await self._prune(chapter.id, using_db)
+
+    async def _demote(
+        self, head: ChapterRevision, content: str, previous: str, using_db: BaseDBAsyncClient,
+    ) -> None:
+        """将原最新快照改写为相对于新正文的反向差异（到达快照间隔或差异过大时保留快照）"""
+        last_snapshot = (
+            await ChapterRevision.filter(
+                chapter_id=head.chapter_id, kind=KIND_SNAPSHOT, version__lt=head.version,
+            )
+            .using_db(using_db)
+            .order_by("-version")
+            .first()
+            .values_list("version", flat=True)
+        )
+        chain = await ChapterRevision.filter(
+            chapter_id=head.chapter_id, version__lt=head.version, version__gt=last_snapshot or 0,
+        ).using_db(using_db).count()
+        if chain + 1 >= settings.CHAPTER_REVISION_SNAPSHOT_EVERY:
+            return
+
+        codec, data = _encode_delta(make_delta(content, previous))
+        if len(data) * 2 >= len(head.data):
+            return
+        head.kind, head.codec, head.data = KIND_DELTA, codec, data
+        await head.save(update_fields=["kind", "codec", "data", "updated_at"], using_db=using_db)
+
+    async def _prune(self, chapter_id: int, using_db: BaseDBAsyncClient) -> None:
+        """删除超出保留上限的最早修订"""
+        excess = (
+            await ChapterRevision.filter(chapter_id=chapter_id)
+            .using_db(using_db)
+            .order_by("-version")
+            .offset(settings.CHAPTER_REVISION_MAX_COUNT)
+            .values_list("id", flat=True)
+        )
+        if excess:
+            await ChapterRevision.filter(id__in=excess).using_db(using_db).delete()
+
+    async def list_revisions(self, chapter_id: int) -> list[dict[str, Any]]:
+        """
+        列出章节的修订（不含内容）
+
+        Args:
+            chapter_id: 章节ID
+
+        Returns:
+            list[dict]: 修订元数据（按版本倒序）
+        """
+        return (
+            await ChapterRevision.filter(chapter_id=chapter_id)
+            .order_by("-version")
+            .values(*REVISION_FIELDS)
+        )
+
+    async def get_text(self, chapter_id: int, version: int) -> str | None:
+        """
+        还原某个版本的正文
+
+        Args:
+            chapter_id: 章节ID
+            version: 版本号
+
+        Returns:
+            str | None: 正文；该版本没有修订记录时返回None
+        """
+        snapshot = (
+            await ChapterRevision.filter(
+                chapter_id=chapter_id, kind=KIND_SNAPSHOT, version__gte=version,
+            )
+            .order_by("version")
+            .first()
+        )
+        if snapshot is None:
+            return None
+        text = _decode(snapshot)
+        if snapshot.version == version:
+            return text
+
+        deltas = (
+            await ChapterRevision.filter(
+                chapter_id=chapter_id, version__gte=version, version__lt=snapshot.version,
+            )
+            .order_by("-version")
+        )
+        if not deltas or deltas[-1].version != version:
+            return None
+        for revision in deltas:
+            text = apply_delta(text, _decode(revision))
+        return text
+
+
+# 创建全局章节修订服务实例
+chapter_revision_service = ChapterRevisionService()
@@ -0,0 +1,213 @@
+"""
+章节保存缓冲
+编辑器自动保存时同一章节每分钟可能保存多次：保存只更新内存中的待写入状态并立即返回新版本号，
+后台任务按固定间隔把每章的最新状态写入数据库（关闭时写完剩余的），多次保存合并为一次写入；
+读取章节时优先返回缓冲中的状态，保证读到自己的写入
+
+缓冲在进程内，仅适用于单进程部署
+"""
+
+import asyncio
+import contextlib
+import copy
+
+from tortoise import timezone as tz
+from tortoise.transactions import in_transaction
+
+from src.backend.config.settings import settings
+from src.backend.core.logger import logger
+from src.features.chapter.backend.models import Chapter
+from src.features.chapter.backend.services.revisions import chapter_revision_service
+from src.features.chapter.backend.services.word_count import apply_word_count_delta
+from src.features.character.backend.services.mention_index import mention_index_service
+from src.features.search.backend.services.search_service import search_service
+
+# 可缓冲的字段（content 变更时同时写入 version、word_count）
+BUFFERED_FIELDS = ("title", "content", "status")
+
+
+class ChapterSaveBuffer:
+    """章节保存缓冲
+
+    特性:
+    - load() 有待写入状态时返回缓冲中的章节对象，否则从数据库读取；peek() 只查缓冲
+    - save() 记录变更字段；CHAPTER_SAVE_FLUSH_INTERVAL 为 0 时直接写入
+    - 写入时在同一事务内按差值更新项目字数、记录修订、更新全文索引和出场角色；写入期间的新保存保留到下一轮
+    - 写入失败的章节保留在缓冲中重试
+    """
+
+    def __init__(self):
+        self._pending: dict[int, Chapter] = {}
+        self._dirty: dict[int, set[str]] = {}
+        self._task: asyncio.Task | None = None
+        self._stop = asyncio.Event()
+        self._lock = asyncio.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """是否缓冲写入"""
+        return settings.CHAPTER_SAVE_FLUSH_INTERVAL > 0
+
+    async def load(self, chapter_id: int) -> Chapter | None:
+        """
+        读取章节（包含尚未写入数据库的保存）
+
+        Args:
+            chapter_id: 章节ID
+
+        Returns:
+            Chapter | None: 章节对象（修改后须调用 save()）
+        """
+        chapter = self._pending.get(chapter_id)
+        if chapter is None:
+            chapter = await Chapter.get_or_none(id=chapter_id)
+            # 等待数据库期间其他请求可能已保存该章节，以缓冲中的状态为准
+            chapter = self._pending.get(chapter_id, chapter)
+        return chapter
+
+    def peek(self, chapter_id: int) -> Chapter | None:
+        """
+        获取缓冲中尚未写入数据库的章节对象（不读取数据库）
+
+        Args:
+            chapter_id: 章节ID
+
+        Returns:
+            Chapter | None: 没有待写入状态时返回 None（只读，不可修改）
+        """
+        return self._pending.get(chapter_id)
+
+    def overlay(self, rows: list[dict]) -> list[dict]:
+        """
+        用缓冲中的状态覆盖章节列表行（列表只包含元数据列）
+
+        Args:
+            rows: 章节字段字典
+
+        Returns:
+            list[dict]: 原列表
+        """
+        for row in rows:
+            chapter = self._pending.get(row["id"])
+            if chapter is not None:
+                for name in ("title", "status", "version", "word_count", "updated_at"):
+                    if name in row:
+                        row[name] = getattr(chapter, name)
+        return rows
+
+    async def save(self, chapter: Chapter, fields: set[str]) -> None:
+        """
+        保存章节变更（调用前已修改章节对象的字段）
+
+        Args:
+            chapter: load() 返回的章节对象
+            fields: 变更的字段（BUFFERED_FIELDS 的子集）
+        """
+        if not fields:
+            return
+        chapter.updated_at = tz.now()
+        self._pending[chapter.id] = chapter
+        self._dirty.setdefault(chapter.id, set()).update(fields)
+        if not self.enabled:
+            await self._flush_chapter(chapter.id)
+
+    def sync_title(self, outline_node_id: int, title: str) -> None:
+        """大纲节点改名时同步缓冲中的章节标题（数据库由同步服务直接更新）"""
+        for chapter in self._pending.values():
+            if chapter.outline_node_id == outline_node_id:
+                chapter.title = title
+
+    def discard(self, chapter_id: int) -> None:
+        """丢弃章节的待写入状态（删除章节时调用）"""
+        self._pending.pop(chapter_id, None)
+        self._dirty.pop(chapter_id, None)
+
+    async def _flush_chapter(self, chapter_id: int) -> None:
+        """写入单个章节的最新状态"""
+        chapter = self._pending.get(chapter_id)
+        fields = self._dirty.pop(chapter_id, set())
+        if chapter is None or not fields:
+            return
+
+        # 写入期间可能有新的保存修改章节对象，按调用时的状态写入
+        snapshot = copy.copy(chapter)
+        try:
+            async with in_transaction() as conn:
+                stored = (
+                    await Chapter.filter(id=chapter_id)
+                    .using_db(conn)
+                    .first()
+                    .values("project_id", "content", "version", "word_count")
+                )
+                if stored is not None:
+                    values = {name: getattr(snapshot, name) for name in fields if name != "content"}
+                    if "content" in fields:
+                        # 正文改回原样时版本号仍已递增，须写入以与客户端保持一致
+                        values["version"] = snapshot.version
+                    if "content" in fields and snapshot.content != stored["content"]:
+                        values.update(content=snapshot.content, word_count=snapshot.word_count)
+                        await apply_word_count_delta(
+                            stored["project_id"], snapshot.word_count - stored["word_count"], conn,
+                        )
+                        await chapter_revision_service.record(
+                            snapshot, stored["content"], stored["version"], conn,
+                        )
+                        await search_service.index_chapter(chapter_id, snapshot.content, conn)
+                        await mention_index_service.record_appearances(
+                            stored["project_id"], chapter_id, snapshot.content, conn,
+                        )
+                    await Chapter.filter(id=chapter_id).using_db(conn).update(
+                        **values, updated_at=snapshot.updated_at,
+                    )
+        except Exception:
+            self._dirty.setdefault(chapter_id, set()).update(fields)
+            raise
+
+        # 写入期间没有新的保存时移出缓冲
+        if chapter_id not in self._dirty and self._pending.get(chapter_id) is chapter:
+            del self._pending[chapter_id]
+
+    async def flush(self) -> int:
+        """
+        写入所有待写入的章节
+
+        Returns:
+            int: 写入的章节数
+        """
+        async with self._lock:
+            flushed = 0
+            for chapter_id in list(self._dirty):
+                try:
+                    await self._flush_chapter(chapter_id)
+                    flushed += 1
+                except Exception as e:
+                    logger.error(f"写入章节 {chapter_id} 失败: {e}")
+            return flushed
+
+    # ==================== 后台任务 ====================
+
+    async def _run(self, interval: float) -> None:
+        while not self._stop.is_set():
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stop.wait(), timeout=interval)
+            await self.flush()
+
+    def start(self) -> None:
+        """启动定时写入任务（需在事件循环中调用）"""
+        interval = settings.CHAPTER_SAVE_FLUSH_INTERVAL
+        if interval <= 0 or self._task is not None:
+            return
+        self._stop.clear()
+        self._task = asyncio.create_task(self._run(interval), name="chapter-save-buffer")
+
+    async def stop(self) -> None:
+        """停止定时写入任务并写完剩余的保存"""
+        if self._task is not None:
+            self._stop.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+
+# 创建全局章节保存缓冲实例
+chapter_save_buffer = ChapterSaveBuffer()
@@ -6,9 +6,12 @@
 import uuid
 
 from loguru import logger
+from tortoise import timezone
 from tortoise.exceptions import DoesNotExist
+from tortoise.transactions import in_transaction
 
 from src.features.chapter.backend.models import Chapter
+from src.features.chapter.backend.services.save_buffer import chapter_save_buffer
 from src.features.novel_outline.backend.models import OutlineNode
 
 
@@ -71,11 +74,13 @@ class ChapterSyncService:
             return
 
         try:
-            chapter = await Chapter.get_or_none(outline_node_id=outline_node.id)
-            if chapter:
-                chapter.title = outline_node.title
-                await chapter.save()
-                logger.info(f"同步更新章节: {chapter.id} - {chapter.title}")
+            # 只更新标题列，不读取/回写正文
+            updated = await Chapter.filter(outline_node_id=outline_node.id).update(
+                title=outline_node.title, updated_at=timezone.now(),
+            )
+            chapter_save_buffer.sync_title(outline_node.id, outline_node.title)
+            if updated:
+                logger.info(f"同步更新章节标题: 大纲节点 {outline_node.id} - {outline_node.title}")
 
         except Exception as e:
             logger.error(f"同步更新章节失败: {e}")
@@ -106,29 +111,32 @@ class ChapterSyncService:
             project_id: 项目ID
         """
         try:
-            # 获取所有chapter类型的大纲节点
-            chapter_nodes = (
-                await OutlineNode.filter(project_id=project_id, node_type="chapter")
-                .prefetch_related("parent")
-                .all()
-            )
-            
+            # 获取所有chapter类型的大纲节点（只取排序所需的列）
+            chapter_nodes = await OutlineNode.filter(
+                project_id=project_id, node_type="chapter",
+            ).values("id", "position", "parent__position")
+
             # 手动排序：先按父节点的position，再按自己的position
             # 这样可以确保跨卷的章节顺序正确
             sorted_nodes = sorted(
                 chapter_nodes,
-                key=lambda node: (
-                    node.parent.position if node.parent else 0,
-                    node.position,
-                ),
+                key=lambda node: (node["parent__position"] or 0, node["position"]),
             )
 
-            # 按顺序更新关联的章节编号
-            for idx, node in enumerate(sorted_nodes, start=1):
-                chapter = await Chapter.get_or_none(outline_node_id=node.id)
-                if chapter:
-                    chapter.chapter_number = idx
-                    await chapter.save(update_fields=["chapter_number"])
+            # 现有章节编号（不加载正文）
+            current_numbers = {
+                node_id: (chapter_id, number)
+                for chapter_id, node_id, number in await Chapter.filter(
+                    project_id=project_id, outline_node_id__isnull=False,
+                ).values_list("id", "outline_node_id", "chapter_number")
+            }
+
+            # 按顺序更新关联的章节编号（只写入编号有变化的章节）
+            async with in_transaction() as conn:
+                for idx, node in enumerate(sorted_nodes, start=1):
+                    current = current_numbers.get(node["id"])
+                    if current and current[1] != idx:
+                        await Chapter.filter(id=current[0]).using_db(conn).update(chapter_number=idx)
 
             logger.info(f"重新计算章节编号完成: 项目 {project_id}, 共 {len(sorted_nodes)} 个章节")
 
@@ -0,0 +1,222 @@
+"""
+章节正文引用与差异解析
+客户端只提交章节版本号和（可选的）本地修改，服务端从数据库取出正文后还原出完整文本；
+修改可以是字符区间编辑操作，也可以是统一差异格式（unified diff）补丁
+"""
+
+import difflib
+import re
+from typing import Any
+
+from pydantic import TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+
+from src.backend.core.exceptions import ValidationError, VersionConflictError
+from src.features.chapter.backend.models import Chapter
+from src.features.chapter.backend.schemas import ChapterPatch, TextOp
+
+_text_ops_adapter = TypeAdapter(list[TextOp])
+_version_adapter = TypeAdapter(int)
+
+_HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+\d+(?:,\d+)? @@")
+
+
+def apply_text_ops(base: str, ops: list[TextOp]) -> str:
+    """
+    将编辑操作应用到基准文本
+
+    所有操作的偏移都相对于基准文本，区间不得重叠。
+
+    Args:
+        base: 基准文本
+        ops: 编辑操作列表
+
+    Returns:
+        str: 应用后的文本
+
+    Raises:
+        ValueError: 偏移越界或区间重叠
+    """
+    parts: list[str] = []
+    cursor = 0
+    for op in sorted(ops, key=lambda o: (o.start, o.end)):
+        if op.start > op.end or op.end > len(base):
+            raise ValueError(f"编辑区间越界: [{op.start}, {op.end})，正文长度 {len(base)}")
+        if op.start < cursor:
+            raise ValueError(f"编辑区间重叠: [{op.start}, {op.end})")
+        parts.append(base[cursor:op.start])
+        parts.append(op.text)
+        cursor = op.end
+    parts.append(base[cursor:])
+    return "".join(parts)
+
+
+def _split_lines(text: str) -> list[str]:
+    """按换行符拆分并保留行尾（只识别 \\n，与 diff 工具一致）"""
+    lines = [line + "\n" for line in text.split("\n")]
+    lines[-1] = lines[-1][:-1]
+    return lines if lines[-1] else lines[:-1]
+
+
+def _parse_hunks(diff: str) -> list[tuple[int, int, list[tuple[str, str]]]]:
+    """解析统一差异为 (旧起始行, 旧行数, [(标记, 行文本)]) 列表，忽略 ---/+++ 等文件头"""
+    hunks: list[tuple[int, int, list[tuple[str, str]]]] = []
+    for line in _split_lines(diff):
+        match = _HUNK_HEADER.match(line)
+        if match:
+            hunks.append((int(match.group(1)), int(match.group(2) or 1), []))
+            continue
+        if not hunks:
+            continue
+        lines = hunks[-1][2]
+        if line.startswith("\\"):
+            # "\ No newline at end of file"：上一行没有行尾换行
+            if lines:
+                tag, text = lines[-1]
+                lines[-1] = (tag, text.removesuffix("\n"))
+        elif line == "\n":
+            # 部分工具会去掉空上下文行的前导空格
+            lines.append((" ", "\n"))
+        elif line[0] in " -+":
+            lines.append((line[0], line[1:]))
+        else:
+            raise ValueError(f"无法识别的差异行: {line[:40]!r}")
+    return hunks
+
+
+def apply_unified_diff(base: str, diff: str) -> str:
+    """
+    将统一差异格式（unified diff）补丁应用到基准文本
+
+    按行匹配，上下文行和删除行必须与基准文本一致；不做模糊匹配。
+
+    Args:
+        base: 基准文本
+        diff: 统一差异补丁（如 diff -u / git diff 的输出）
+
+    Returns:
+        str: 应用后的文本
+
+    Raises:
+        ValueError: 补丁格式错误或与基准文本不匹配
+    """
+    hunks = _parse_hunks(diff)
+    if not hunks:
+        raise ValueError("补丁中没有差异块")
+
+    lines = _split_lines(base)
+    result: list[str] = []
+    cursor = 0
+    for old_start, old_count, hunk_lines in hunks:
+        # 旧行数为 0 时起始行号指向插入位置之前的一行
+        index = old_start - 1 if old_count else old_start
+        if index < cursor or index > len(lines):
+            raise ValueError(f"差异块位置越界: 第 {old_start} 行")
+        result.extend(lines[cursor:index])
+        cursor = index
+        for tag, text in hunk_lines:
+            if tag == "+":
+                result.append(text)
+                continue
+            if cursor >= len(lines) or lines[cursor] != text:
+                raise ValueError(f"第 {cursor + 1} 行与补丁上下文不一致")
+            if tag == " ":
+                result.append(text)
+            cursor += 1
+    result.extend(lines[cursor:])
+    return "".join(result)
+
+
+def unified_diff(old: str, new: str, old_label: str, new_label: str) -> str:
+    """
+    生成统一差异格式补丁（可由 apply_unified_diff() 应用）
+
+    Args:
+        old: 旧文本
+        new: 新文本
+        old_label: 旧文本标签（--- 行）
+        new_label: 新文本标签（+++ 行）
+
+    Returns:
+        str: 补丁文本（无差异时为空字符串）
+    """
+    lines = []
+    for line in difflib.unified_diff(_split_lines(old), _split_lines(new), old_label, new_label):
+        lines.append(line)
+        if not line.endswith("\n"):
+            lines.append("\n\\ No newline at end of file\n")
+    return "".join(lines)
+
+
+def patch_chapter_content(chapter: Chapter, patch: ChapterPatch) -> str:
+    """
+    按 PATCH 请求计算新正文
+
+    Args:
+        chapter: 章节对象（数据库中的当前版本）
+        patch: 增量更新请求
+
+    Returns:
+        str: 新正文（未提交 ops/diff 时为当前正文）
+
+    Raises:
+        VersionConflictError: base_version 与当前版本不一致
+        ValidationError: 编辑操作或补丁无法应用
+    """
+    if patch.base_version != chapter.version:
+        raise VersionConflictError(current_version=chapter.version)
+    try:
+        if patch.ops is not None:
+            return apply_text_ops(chapter.content, patch.ops)
+        if patch.diff is not None:
+            return apply_unified_diff(chapter.content, patch.diff)
+    except ValueError as e:
+        raise ValidationError(message="正文差异无法应用", details={"error": str(e)}) from e
+    return chapter.content
+
+
+def resolve_chapter_content(
+    chapter: Chapter, data: dict[str, Any], legacy_key: str,
+) -> str:
+    """
+    解析请求引用的章节正文
+
+    支持两种请求方式：
+    - 引用方式：{"base_version": 3, "diff": [{start, end, text}, ...]}，
+      服务端以数据库中的正文为基准应用 diff（可省略），版本不一致时拒绝
+    - 兼容方式：直接提交完整文本（legacy_key 字段）；两者都未提供时使用数据库正文
+
+    Args:
+        chapter: 章节对象
+        data: 请求体
+        legacy_key: 兼容方式下的全文字段名（如 "content"、"current_content"）
+
+    Returns:
+        str: 解析后的完整正文
+
+    Raises:
+        VersionConflictError: base_version 与当前版本不一致
+        ValidationError: diff 格式错误或无法应用
+    """
+    if data.get("base_version") is not None:
+        try:
+            base_version = _version_adapter.validate_python(data["base_version"])
+        except PydanticValidationError as e:
+            raise ValidationError(
+                message="base_version 必须是整数", details={"base_version": data["base_version"]},
+            ) from e
+        if base_version != chapter.version:
+            raise VersionConflictError(current_version=chapter.version)
+
+        diff = data.get("diff")
+        if not diff:
+            return chapter.content
+        try:
+            ops = _text_ops_adapter.validate_python(diff)
+            return apply_text_ops(chapter.content, ops)
+        except (PydanticValidationError, ValueError) as e:
+            raise ValidationError(message="正文差异无法应用", details={"error": str(e)}) from e
+
+    if data.get(legacy_key) is not None:
+        return data[legacy_key]
+    return chapter.content
@@ -0,0 +1,116 @@
+"""
+项目字数维护
+章节保存/删除时在同一事务内按差值（新字数 - 旧字数）原子更新 NovelProject.word_count，
+请求路径不再读取全部章节；后台任务定期按章节字数之和对账修正偏差
+"""
+
+import asyncio
+import contextlib
+
+from tortoise import BaseDBAsyncClient
+from tortoise.expressions import F
+from tortoise.transactions import in_transaction
+
+from src.backend.config.settings import settings
+from src.backend.core.logger import logger
+from src.features.novel_project.backend.models import NovelProject
+
+# 有章节的项目中，字数与章节字数之和不一致的项目
+_DRIFTED_SQL = """
+SELECT p."id" AS "id", c."words" AS "words"
+FROM "novel_projects" p
+JOIN (
+    SELECT "project_id", SUM("word_count") AS "words" FROM "chapters" GROUP BY "project_id"
+) c ON c."project_id" = p."id"
+WHERE p."word_count" IS NOT c."words"
+"""
+
+_SET_SQL = 'UPDATE "novel_projects" SET "word_count" = ? WHERE "id" = ?'
+
+
+def count_words(text: str) -> int:
+    """
+    统计正文字数（去除换行符和空格后的长度）
+
+    Args:
+        text: 正文
+
+    Returns:
+        int: 字数
+    """
+    return len(text.replace("\n", "").replace("\r", "").replace(" ", ""))
+
+
+async def apply_word_count_delta(
+    project_id: int, delta: int, using_db: BaseDBAsyncClient | None = None,
+) -> None:
+    """
+    按差值原子更新项目字数
+
+    Args:
+        project_id: 项目ID
+        delta: 字数变化量
+        using_db: 事务连接（应与章节写入在同一事务内）
+    """
+    if delta:
+        await NovelProject.filter(id=project_id).using_db(using_db).update(
+            word_count=F("word_count") + delta,
+        )
+
+
+class ProjectWordCountReconciler:
+    """项目字数对账任务
+
+    只处理有章节的项目（无章节的项目字数来自项目正文，不参与对账）
+    """
+
+    def __init__(self):
+        self._task: asyncio.Task | None = None
+        self._stop = asyncio.Event()
+
+    async def reconcile(self) -> int:
+        """
+        按章节字数之和修正项目字数
+
+        Returns:
+            int: 被修正的项目数
+        """
+        async with in_transaction() as conn:
+            _, rows = await conn.execute_query(_DRIFTED_SQL)
+            if rows:
+                await conn.execute_many(_SET_SQL, [[row["words"], row["id"]] for row in rows])
+
+        if rows:
+            logger.warning(f"项目字数对账: 修正 {len(rows)} 个项目的字数")
+        return len(rows)
+
+    # ==================== 后台任务 ====================
+
+    async def _run(self, interval: float) -> None:
+        while not self._stop.is_set():
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.error(f"项目字数对账失败: {e}")
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stop.wait(), timeout=interval)
+
+    def start(self) -> None:
+        """启动定时对账任务（需在事件循环中调用）"""
+        interval = settings.CHAPTER_WORD_COUNT_RECONCILE_INTERVAL
+        if interval <= 0 or self._task is not None:
+            return
+        self._stop.clear()
+        self._task = asyncio.create_task(self._run(interval), name="project-word-count")
+
+    async def stop(self) -> None:
+        """停止定时对账任务"""
+        if self._task is None:
+            return
+        self._stop.set()
+        await self._task
+        self._task = None
+
+
+# 创建全局项目字数对账实例
+project_word_count_reconciler = ProjectWordCountReconciler()
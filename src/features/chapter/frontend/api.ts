@@ -10,7 +10,10 @@ type ChapterResponse = components['schemas']['ChapterResponse']
 type ChapterListItem = components['schemas']['ChapterListItem']
 type ChapterCreate = components['schemas']['ChapterCreate']
 type ChapterUpdate = components['schemas']['ChapterUpdate']
+type ChapterPatch = components['schemas']['ChapterPatch']
 type ChapterWithHints = components['schemas']['ChapterWithHints']
+type ChapterRevisionItem = components['schemas']['ChapterRevisionItem']
+type ChapterRevisionDiff = components['schemas']['ChapterRevisionDiff']
 
 export const chapterAPI = {
   /**
@@ -71,6 +74,59 @@ export const chapterAPI = {
     return data
   },
 
+  /**
+   * 增量更新章节（基于版本号提交编辑操作，版本冲突时返回 409）
+   * 只返回章节元数据（不含正文）
+   */
+  async patchChapter(
+    chapterId: number,
+    patch: ChapterPatch
+  ): Promise<ChapterListItem> {
+    const { data } = await httpClient.patch<ChapterListItem>(
+      `/novels/chapters/${chapterId}`,
+      patch
+    )
+    return data
+  },
+
+  /**
+   * 获取章节修订历史
+   */
+  async listRevisions(chapterId: number): Promise<ChapterRevisionItem[]> {
+    const { data } = await httpClient.get<ChapterRevisionItem[]>(
+      `/novels/chapters/${chapterId}/revisions`
+    )
+    return data
+  },
+
+  /**
+   * 获取修订与另一版本（默认当前正文）的差异
+   */
+  async diffRevision(
+    chapterId: number,
+    version: number,
+    against?: number
+  ): Promise<ChapterRevisionDiff> {
+    const { data } = await httpClient.get<ChapterRevisionDiff>(
+      `/novels/chapters/${chapterId}/revisions/${version}/diff`,
+      { params: { against } }
+    )
+    return data
+  },
+
+  /**
+   * 恢复到某个修订
+   */
+  async restoreRevision(
+    chapterId: number,
+    version: number
+  ): Promise<ChapterResponse> {
+    const { data } = await httpClient.post<ChapterResponse>(
+      `/novels/chapters/${chapterId}/revisions/${version}/restore`
+    )
+    return data
+  },
+
   /**
    * 删除章节
    */
@@ -459,4 +515,78 @@ export const chapterAPI = {
 
     return () => controller.abort()
   },
+
+  /**
+   * 导出全书（由浏览器直接下载流式响应，不在页面内缓存整个文件）
+   */
+  downloadManuscript(projectId: number, format: 'txt' | 'md' | 'epub' = 'txt'): void {
+    const a = document.createElement('a')
+    a.href = `/api/novels/chapters/projects/${projectId}/export?format=${format}`
+    a.download = `manuscript_${projectId}.${format}`
+    a.click()
+  },
+
+  /**
+   * 导入已有小说（TXT / Markdown，按卷、章标题自动切分，通过SSE返回进度）
+   */
+  async importManuscript(
+    projectId: number,
+    file: File,
+    onMessage: (data: any) => void,
+    onError?: (error: Error) => void,
+    onComplete?: () => void
+  ): Promise<void> {
+    const token = localStorage.getItem('token')
+    const formData = new FormData()
+    formData.append('file', file)
+
+    try {
+      const response = await fetch(
+        `${httpClient.defaults.baseURL}/novels/chapters/projects/${projectId}/import`,
+        {
+          method: 'POST',
+          headers: token ? { Authorization: `Bearer ${token}` } : undefined,
+          body: formData,
+        }
+      )
+
+      if (!response.ok) {
+        throw new Error(`HTTP error! status: ${response.status}`)
+      }
+
+      const reader = response.body?.getReader()
+      const decoder = new TextDecoder()
+
+      if (!reader) {
+        throw new Error('无法读取响应流')
+      }
+
+      // 事件可能跨数据块，保留未完整的最后一行
+      let buffer = ''
+      while (true) {
+        const { done, value } = await reader.read()
+        if (done) {
+          onComplete?.()
+          break
+        }
+
+        buffer += decoder.decode(value, { stream: true })
+        const lines = buffer.split('\n')
+        buffer = lines.pop() ?? ''
+
+        for (const line of lines) {
+          if (line.startsWith('data: ')) {
+            try {
+              onMessage(JSON.parse(line.slice(6)))
+            } catch (e) {
+              console.error('Failed to parse SSE data:', e)
+            }
+          }
+        }
+      }
+    } catch (error) {
+      onError?.(error as Error)
+      throw error
+    }
+  },
 }
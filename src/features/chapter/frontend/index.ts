@@ -6,5 +6,6 @@ export * from './api'
 export * from './types'
 export { useAutoSave } from './hooks/useAutoSave'
 export { useTextStats } from './hooks/useTextStats'
+export { computeTextOps } from './utils/textOps'
 export { default as SaveStatusIndicator } from './components/SaveStatusIndicator'
 export { default as EditorStatusBar } from './components/EditorStatusBar'
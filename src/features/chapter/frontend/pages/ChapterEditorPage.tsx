@@ -51,6 +51,7 @@ import { chapterAPI } from '../api'
 import type { ChapterResponse } from '../types'
 import { useAutoSave } from '../hooks/useAutoSave'
 import { useTextStats } from '../hooks/useTextStats'
+import { computeTextOps } from '../utils/textOps'
 import SaveStatusIndicator from '../components/SaveStatusIndicator'
 import EditorStatusBar from '../components/EditorStatusBar'
 
@@ -66,6 +67,9 @@ export default function ChapterEditorPage() {
   const [status, setStatus] = useState('draft')
   const [loading, setLoading] = useState(true)
   
+  // 服务端最后确认的正文和版本号（增量保存的基准）
+  const savedRef = useRef<{ content: string; version: number } | null>(null)
+  
   // Textarea ref（用于字数统计中的选中监听）
   const textareaRef = useRef<HTMLTextAreaElement>(null)
   
@@ -107,14 +111,18 @@ export default function ChapterEditorPage() {
   })
 
   // 自动保存逻辑（使用新的 Hook）
+  // 只上传相对于服务端版本的修改；版本冲突（其他标签页已保存）时后端返回 409，不会静默覆盖
   const handleSaveData = useCallback(async () => {
-    if (!chapterId) return
+    if (!chapterId || !savedRef.current) return
     
-    await chapterAPI.updateChapter(Number(chapterId), {
+    const saved = savedRef.current
+    const result = await chapterAPI.patchChapter(Number(chapterId), {
+      base_version: saved.version,
+      ops: computeTextOps(saved.content, content),
       title: title.trim(),
-      content: content,
       status: status,
     })
+    savedRef.current = { content, version: result.version }
   }, [chapterId, title, content, status])
 
   const autoSave = useAutoSave({
@@ -223,6 +231,7 @@ export default function ChapterEditorPage() {
       setLoading(true)
       const data = await chapterAPI.getChapter(Number(chapterId))
       setChapter(data)
+      savedRef.current = { content: data.content, version: data.version }
       setTitle(data.title)
       setContent(data.content)
       setStatus(data.status)
@@ -9,7 +9,10 @@ export type ChapterResponse = components['schemas']['ChapterResponse']
 export type ChapterListItem = components['schemas']['ChapterListItem']
 export type ChapterCreate = components['schemas']['ChapterCreate']
 export type ChapterUpdate = components['schemas']['ChapterUpdate']
+export type ChapterPatch = components['schemas']['ChapterPatch']
 export type ChapterWithHints = components['schemas']['ChapterWithHints']
+export type ChapterRevisionItem = components['schemas']['ChapterRevisionItem']
+export type ChapterRevisionDiff = components['schemas']['ChapterRevisionDiff']
 
 // 章节状态
 export type ChapterStatus = 'draft' | 'completed' | 'ai_generated'
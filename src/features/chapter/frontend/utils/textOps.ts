@@ -0,0 +1,44 @@
+/**
+ * 正文增量编辑工具
+ * 计算两段文本之间的编辑操作，用于 PATCH 只上传修改的部分
+ */
+
+/** 文本编辑操作：将基准文本 [start, end) 区间替换为 text（偏移按 Unicode 码点计，与后端一致） */
+export interface TextOp {
+  start: number
+  end: number
+  text: string
+}
+
+/**
+ * 计算从 base 到 next 的编辑操作（去掉公共前缀和后缀后的单个替换区间）
+ * 文本相同时返回空数组
+ */
+export function computeTextOps(base: string, next: string): TextOp[] {
+  if (base === next) return []
+
+  // 按码点拆分，避免代理对（如 emoji）被截断，且偏移与后端的字符偏移一致
+  const a = Array.from(base)
+  const b = Array.from(next)
+
+  let prefix = 0
+  const maxPrefix = Math.min(a.length, b.length)
+  while (prefix < maxPrefix && a[prefix] === b[prefix]) prefix++
+
+  let suffix = 0
+  const maxSuffix = maxPrefix - prefix
+  while (
+    suffix < maxSuffix &&
+    a[a.length - 1 - suffix] === b[b.length - 1 - suffix]
+  ) {
+    suffix++
+  }
+
+  return [
+    {
+      start: prefix,
+      end: a.length - suffix,
+      text: b.slice(prefix, b.length - suffix).join(''),
+    },
+  ]
+}
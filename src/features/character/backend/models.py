@@ -130,3 +130,37 @@ class CharacterRelation(models.Model):
 
     def __str__(self):
         return f"Relation({self.source_character_id} -> {self.target_character_id}: {self.relation_type})"
+
+
+class CharacterAppearance(models.Model):
+    """
+    章节出场角色模型
+    记录每个章节中被提及的角色及提及次数,章节正文写入时在同一事务内刷新
+    """
+
+    id = fields.IntField(pk=True, description="主键")
+
+    chapter = fields.ForeignKeyField(
+        "models.Chapter",
+        related_name="character_appearances",
+        on_delete=fields.CASCADE,
+        description="所属章节",
+    )
+    character = fields.ForeignKeyField(
+        "models.Character",
+        related_name="appearances",
+        on_delete=fields.CASCADE,
+        description="出场角色",
+    )
+
+    mention_count = fields.IntField(default=0, description="提及次数")
+
+    created_at = fields.DatetimeField(auto_now_add=True, description="创建时间")
+
+    class Meta:
+        table = "character_appearances"
+        indexes = [("character_id",)]
+        unique_together = (("chapter_id", "character_id"),)
+
+    def __str__(self):
+        return f"Appearance(chapter={self.chapter_id}, character={self.character_id})"
@@ -28,7 +28,11 @@ from src.features.character.backend.schemas import (
     CharacterUpdate,
     RelationGraphData,
 )
-from src.features.character.backend.services import CharacterService, RelationService
+from src.features.character.backend.services import (
+    CharacterService,
+    RelationService,
+    mention_index_service,
+)
 
 router = APIRouter(prefix="/characters", tags=["人物设定"])
 
@@ -123,6 +127,7 @@ async def create_character(data: CharacterCreate):
     else:
         # 创建空白角色
         character = await Character.create(**data.model_dump(exclude={"template_id"}))
+        mention_index_service.invalidate(character.project_id)
 
     return character
 
@@ -157,11 +162,16 @@ async def update_character(character_id: int, data: CharacterUpdate):
         raise_resource_not_found("角色", f"角色ID {character_id} 不存在")
 
     # 更新非空字段
+    old_project_id = character.project_id
     update_data = data.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(character, key, value)
 
     await character.save()
+
+    # 名称/别名/所属项目变化后需要重建提及索引
+    mention_index_service.invalidate(old_project_id)
+    mention_index_service.invalidate(character.project_id)
     return character
 
 
@@ -3,6 +3,15 @@
 """
 
 from src.features.character.backend.services.character_service import CharacterService
+from src.features.character.backend.services.mention_index import (
+    MentionIndexService,
+    mention_index_service,
+)
 from src.features.character.backend.services.relation_service import RelationService
 
-__all__ = ["CharacterService", "RelationService"]
+__all__ = [
+    "CharacterService",
+    "MentionIndexService",
+    "RelationService",
+    "mention_index_service",
+]
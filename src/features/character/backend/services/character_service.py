@@ -9,8 +9,9 @@ from typing import Any, Optional
 from src.backend.ai import ai_service
 from src.backend.core.exceptions import BusinessError, ResourceNotFoundError
 from src.backend.core.logger import logger
-from src.backend.core.template import TemplateManager
+from src.backend.core.template import template_manager
 from src.features.character.backend.models import Character, CharacterTemplate
+from src.features.character.backend.services.mention_index import mention_index_service
 from src.features.novel_project.backend.models import NovelProject
 
 
@@ -57,7 +58,6 @@ class CharacterService:
                 raise ResourceNotFoundError("项目", f"项目ID {project_id} 不存在")
 
         # 构建提示词
-        template_manager = TemplateManager()
         try:
             user_prompt = template_manager.render(
                 "character_generate.jinja2",
@@ -133,6 +133,7 @@ class CharacterService:
                 abilities=character_data.get("abilities", {}),
                 notes=character_data.get("notes", ""),
             )
+            mention_index_service.invalidate(project_id)
             logger.info(f"AI生成角色成功: {character.name} (ID: {character.id})")
         except Exception as e:
             logger.error(f"创建角色失败: {e}")
@@ -174,7 +175,7 @@ class CharacterService:
                 raise ResourceNotFoundError("项目", f"项目ID {project_id} 不存在")
 
         # 创建角色副本,复制模板的所有JSON字段
-        return await Character.create(
+        character = await Character.create(
             name=name,
             project_id=project_id,
             template_id=template_id,
@@ -183,6 +184,8 @@ class CharacterService:
             personality=template.personality.copy() if template.personality else {},
             abilities=template.abilities.copy() if template.abilities else {},
         )
+        mention_index_service.invalidate(project_id)
+        return character
 
 
     @staticmethod
@@ -301,3 +304,4 @@ class CharacterService:
 
         # 删除角色(关系会自动级联删除)
         await character.delete()
+        mention_index_service.invalidate(character.project_id)
@@ -0,0 +1,271 @@
+"""
+角色提及索引
+基于 Aho-Corasick 自动机对角色名称与别名做多模式匹配，
+用于找出章节大纲、提纲和正文中实际出现的角色
+"""
+
+import asyncio
+from collections import Counter, deque
+from collections.abc import Iterable
+
+from tortoise import BaseDBAsyncClient
+
+from src.backend.core.logger import logger
+from src.features.character.backend.models import (
+    Character,
+    CharacterAppearance,
+    CharacterRelation,
+)
+
+# basic_info 中可能存放别名的字段
+ALIAS_KEYS = ("aliases", "alias", "nickname", "nicknames", "别名", "外号")
+
+# 别名最小长度，过短的别名（如单字）容易误匹配
+MIN_ALIAS_LENGTH = 2
+
+
+class AhoCorasickAutomaton:
+    """
+    Aho-Corasick 多模式匹配自动机
+
+    一次扫描文本即可找出所有模式串的出现位置，
+    复杂度与文本长度和匹配数量线性相关，与模式串数量无关
+    """
+
+    def __init__(self, patterns: dict[str, int]):
+        """
+        Args:
+            patterns: 模式串 -> 角色ID 的映射
+        """
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._output: list[set[int]] = [set()]
+
+        for word, character_id in patterns.items():
+            self._add(word, character_id)
+        self._build()
+
+    def _add(self, word: str, character_id: int) -> None:
+        """向字典树中插入一个模式串"""
+        state = 0
+        for ch in word:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            state = nxt
+        self._output[state].add(character_id)
+
+    def _build(self) -> None:
+        """BFS 构建失配指针，并合并后缀状态的输出"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._output[nxt] |= self._output[self._fail[nxt]]
+
+    def count(self, text: str) -> Counter[int]:
+        """
+        统计文本中各角色的提及次数
+
+        Args:
+            text: 待扫描文本
+
+        Returns:
+            角色ID -> 提及次数
+        """
+        counts: Counter[int] = Counter()
+        state = 0
+        for ch in text:
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            if self._output[state]:
+                counts.update(self._output[state])
+        return counts
+
+
+class MentionIndexService:
+    """
+    项目级角色提及索引服务
+
+    每个项目缓存一个自动机，角色增删改后通过 invalidate 使其失效，
+    下次使用时按最新角色表重建
+    """
+
+    def __init__(self):
+        self._indexes: dict[int, AhoCorasickAutomaton] = {}
+        self._lock = asyncio.Lock()
+
+    def invalidate(self, project_id: int | None) -> None:
+        """
+        使项目的提及索引失效（角色表变化时调用）
+
+        Args:
+            project_id: 项目ID（全局角色为None，无需处理）
+        """
+        if project_id is not None and self._indexes.pop(project_id, None) is not None:
+            logger.debug(f"项目 {project_id} 的角色提及索引已失效")
+
+    @staticmethod
+    def extract_keywords(character: Character) -> list[str]:
+        """
+        提取角色的名称与别名
+
+        Args:
+            character: 角色对象
+
+        Returns:
+            去重后的关键词列表
+        """
+        keywords = [character.name.strip()] if character.name else []
+        basic_info = character.basic_info or {}
+        for key in ALIAS_KEYS:
+            value = basic_info.get(key)
+            if not value:
+                continue
+            if isinstance(value, str):
+                value = value.replace("，", ",").replace("、", ",").split(",")
+            if isinstance(value, list):
+                keywords.extend(
+                    alias.strip()
+                    for alias in value
+                    if isinstance(alias, str) and len(alias.strip()) >= MIN_ALIAS_LENGTH
+                )
+        return list(dict.fromkeys(k for k in keywords if k))
+
+    async def _get_automaton(self, project_id: int) -> AhoCorasickAutomaton:
+        """获取（必要时构建）项目的自动机"""
+        automaton = self._indexes.get(project_id)
+        if automaton is not None:
+            return automaton
+
+        async with self._lock:
+            automaton = self._indexes.get(project_id)
+            if automaton is None:
+                characters = await Character.filter(project_id=project_id).only(
+                    "id", "name", "basic_info",
+                )
+                patterns = {}
+                for char in characters:
+                    for keyword in self.extract_keywords(char):
+                        patterns.setdefault(keyword, char.id)
+                automaton = AhoCorasickAutomaton(patterns)
+                self._indexes[project_id] = automaton
+                logger.debug(
+                    f"构建项目 {project_id} 的角色提及索引: {len(characters)} 个角色, {len(patterns)} 个关键词",
+                )
+        return automaton
+
+    async def find_mentions(
+        self, project_id: int, texts: Iterable[str | None],
+    ) -> Counter[int]:
+        """
+        查找文本中提及的角色
+
+        Args:
+            project_id: 项目ID
+            texts: 待扫描的文本片段（None会被忽略）
+
+        Returns:
+            角色ID -> 提及次数
+        """
+        automaton = await self._get_automaton(project_id)
+        counts: Counter[int] = Counter()
+        for text in texts:
+            if text:
+                counts.update(automaton.count(text))
+        return counts
+
+    @staticmethod
+    async def expand_with_relations(character_ids: set[int]) -> set[int]:
+        """
+        扩展为提及角色及其一度关系角色
+
+        Args:
+            character_ids: 直接提及的角色ID集合
+
+        Returns:
+            包含一度关系角色的ID集合
+        """
+        if not character_ids:
+            return set()
+
+        ids = list(character_ids)
+        pairs = await CharacterRelation.filter(
+            source_character_id__in=ids,
+        ).values_list("source_character_id", "target_character_id")
+        pairs += await CharacterRelation.filter(
+            target_character_id__in=ids,
+        ).values_list("source_character_id", "target_character_id")
+
+        expanded = set(character_ids)
+        for source_id, target_id in pairs:
+            expanded.add(source_id)
+            expanded.add(target_id)
+        return expanded
+
+    async def select_relevant(
+        self,
+        project_id: int,
+        texts: Iterable[str | None],
+    ) -> set[int] | None:
+        """
+        选出与当前文本相关的角色（提及角色 + 一度关系角色）
+
+        Args:
+            project_id: 项目ID
+            texts: 待扫描的文本片段
+
+        Returns:
+            相关角色ID集合；未提及任何角色时返回None，调用方应回退为全部角色
+        """
+        mentions = await self.find_mentions(project_id, texts)
+        if not mentions:
+            return None
+        return await self.expand_with_relations(set(mentions))
+
+    async def record_appearances(
+        self,
+        project_id: int,
+        chapter_id: int,
+        content: str | None,
+        using_db: BaseDBAsyncClient,
+    ) -> None:
+        """
+        按章节正文记录出场角色列表（覆盖旧记录）
+
+        由章节写入路径在写入正文的同一事务内调用
+
+        Args:
+            project_id: 项目ID
+            chapter_id: 章节ID
+            content: 章节正文
+            using_db: 事务连接
+        """
+        mentions = await self.find_mentions(project_id, [content])
+        await CharacterAppearance.filter(chapter_id=chapter_id).using_db(using_db).delete()
+        if mentions:
+            await CharacterAppearance.bulk_create(
+                [
+                    CharacterAppearance(
+                        chapter_id=chapter_id,
+                        character_id=character_id,
+                        mention_count=count,
+                    )
+                    for character_id, count in mentions.items()
+                ],
+                using_db=using_db,
+            )
+
+
+# 全局单例
+mention_index_service = MentionIndexService()
@@ -0,0 +1,27 @@
+"""
+仪表盘数据模型
+"""
+
+from tortoise import fields, models
+
+
+class UserStatsCounter(models.Model):
+    """
+    用户创作统计计数器
+    由数据库触发器在项目/章节/大纲节点写入时同一事务内增量维护，
+    后台任务定期对账（见 services/counter_service.py）
+    """
+
+    user_id = fields.BigIntField(pk=True, generated=False, description="用户ID")
+    project_count = fields.IntField(default=0, description="项目数")
+    chapter_count = fields.IntField(default=0, description="章节数")
+    outline_node_count = fields.IntField(default=0, description="大纲节点数")
+    total_words = fields.BigIntField(default=0, description="总字数（项目字数 + 章节字数）")
+    updated_at = fields.DatetimeField(auto_now=True, description="更新时间")
+
+    class Meta:
+        table = "user_stats_counters"
+        table_description = "用户创作统计计数器表"
+
+    def __str__(self):
+        return f"UserStatsCounter(user_id={self.user_id}, projects={self.project_count}, words={self.total_words})"
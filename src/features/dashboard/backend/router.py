@@ -5,6 +5,7 @@
 
 import platform
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 import psutil
@@ -12,6 +13,8 @@ from fastapi import APIRouter, Request
 from tortoise import Tortoise
 
 from src.backend.core.dependencies import CurrentUserId
+from src.backend.core.template import template_manager
+from src.backend.core.write_behind import get_write_behind_stats
 
 from .schemas import (
     AppOverviewResponse,
@@ -21,11 +24,30 @@ from .schemas import (
     SystemInfoResponse,
     SystemInfoSummary,
     SystemResource,
+    TemplateRenderStat,
+    TemplateStatsResponse,
+    WriteBehindQueueStat,
 )
+from .services.counter_service import dashboard_counter_service
 
 router = APIRouter()
 
 
+@lru_cache(maxsize=1)
+def _count_features() -> int:
+    """统计功能模块数量（目录结构运行期不变，只扫描一次）"""
+    features_dir = Path("src/features")
+    if not features_dir.exists():
+        return 0
+    return len(
+        [
+            d
+            for d in features_dir.iterdir()
+            if d.is_dir() and not d.name.startswith("__")
+        ],
+    )
+
+
 def get_size_str(bytes_value: int) -> str:
     """将字节转换为可读字符串"""
     num = float(bytes_value)
@@ -50,17 +72,8 @@ async def get_app_overview(_user_id: CurrentUserId, request: Request):
     ]
     api_count = len(routes)
 
-    # 2. 获取 Features 数量
-    features_dir = Path("src/features")
-    feature_count = 0
-    if features_dir.exists():
-        feature_count = len(
-            [
-                d
-                for d in features_dir.iterdir()
-                if d.is_dir() and not d.name.startswith("__")
-            ],
-        )
+    # 2. 获取 Features 数量（目录只扫描一次）
+    feature_count = _count_features()
 
     # 3. 检查数据库连接
     try:
@@ -74,26 +87,8 @@ async def get_app_overview(_user_id: CurrentUserId, request: Request):
     # 简单判断 debug 模式
     env = "Development"  # 可以从配置中读取，这里作为模板默认显示 Dev
 
-    # 5. 获取小说项目统计数据
-    from src.features.chapter.backend.models import Chapter
-    from src.features.novel_outline.backend.models import OutlineNode
-    from src.features.novel_project.backend.models import NovelProject
-
-    project_count = await NovelProject.all().count()
-    chapter_count = await Chapter.all().count()
-    outline_node_count = await OutlineNode.all().count()
-
-    # 计算总字数：项目内容 + 章节内容
-    projects = await NovelProject.all()
-    chapters = await Chapter.all()
-    total_words = sum(p.word_count for p in projects) + sum(c.word_count for c in chapters)
-
-    novel_stats = NovelStatistics(
-        project_count=project_count,
-        chapter_count=chapter_count,
-        outline_node_count=outline_node_count,
-        total_words=total_words,
-    )
+    # 5. 获取小说项目统计数据（计数器汇总，短时缓存）
+    novel_stats = NovelStatistics(**await dashboard_counter_service.get_totals())
 
     return AppOverviewResponse(
         api_count=api_count,
@@ -168,17 +163,17 @@ async def get_recent_projects(user_id: CurrentUserId):
     """
     获取最近更新的项目列表（按更新时间倒序）
     """
-    from src.features.chapter.backend.models import Chapter
     from src.features.novel_project.backend.models import NovelProject
+    from src.features.novel_project.backend.services.project_stats import (
+        with_project_stats,
+    )
 
-    # 查询用户的项目，按更新时间倒序，限制6条
-    projects = (
-        await NovelProject.filter(user_id=user_id)
-        .order_by("-updated_at")
-        .limit(6)
+    # 查询用户的项目，按更新时间倒序，限制6条（章节数、章节字数随项目一并取回）
+    projects = await with_project_stats(
+        NovelProject.filter(user_id=user_id).order_by("-updated_at").limit(6),
     )
 
-    total_count = await NovelProject.filter(user_id=user_id).count()
+    total_count = (await dashboard_counter_service.get_user_counters(user_id))["project_count"]
 
     # 生成封面颜色（基于项目ID的简单哈希）
     color_palette = [
@@ -192,13 +187,8 @@ async def get_recent_projects(user_id: CurrentUserId):
 
     items = []
     for project in projects:
-        # 统计章节数量
-        chapter_count = await Chapter.filter(project_id=project.id).count()
-
-        # 计算总字数：项目内容字数 + 章节字数总和
-        chapters = await Chapter.filter(project_id=project.id)
-        chapter_words = sum(c.word_count for c in chapters)
-        total_word_count = project.word_count + chapter_words
+        # 总字数：项目内容字数 + 章节字数总和
+        total_word_count = project.word_count + project.chapter_words
 
         # 选择封面颜色
         cover_color = color_palette[project.id % len(color_palette)]
@@ -209,7 +199,7 @@ async def get_recent_projects(user_id: CurrentUserId):
                 title=project.title,
                 status=project.status,
                 word_count=total_word_count,
-                chapter_count=chapter_count,
+                chapter_count=project.chapter_count,
                 updated_at=project.updated_at,
                 cover_color=cover_color,
             ),
@@ -223,30 +213,7 @@ async def get_statistics(user_id: CurrentUserId):
     """
     获取小说创作统计数据
     """
-    from src.features.chapter.backend.models import Chapter
-    from src.features.novel_outline.backend.models import OutlineNode
-    from src.features.novel_project.backend.models import NovelProject
-
-    project_count = await NovelProject.filter(user_id=user_id).count()
-    
-    # 章节统计：通过project外键关联
-    projects = await NovelProject.filter(user_id=user_id)
-    project_ids = [p.id for p in projects]
-    chapter_count = await Chapter.filter(project_id__in=project_ids).count() if project_ids else 0
-    
-    # 大纲节点统计：通过project外键关联
-    outline_node_count = await OutlineNode.filter(project_id__in=project_ids).count() if project_ids else 0
-
-    # 计算总字数：项目内容 + 章节内容
-    chapters = await Chapter.filter(project_id__in=project_ids) if project_ids else []
-    total_words = sum(p.word_count for p in projects) + sum(c.word_count for c in chapters)
-
-    return NovelStatistics(
-        project_count=project_count,
-        chapter_count=chapter_count,
-        outline_node_count=outline_node_count,
-        total_words=total_words,
-    )
+    return NovelStatistics(**await dashboard_counter_service.get_user_counters(user_id))
 
 
 @router.get("/system-summary", response_model=SystemInfoSummary)
@@ -269,3 +236,28 @@ async def get_system_summary(_user_id: CurrentUserId):
         environment="Development",
         db_status=db_status,
     )
+
+
+@router.get("/template-stats", response_model=TemplateStatsResponse)
+async def get_template_stats(_user_id: CurrentUserId):
+    """
+    获取提示词模板渲染统计（按平均耗时倒序）
+    """
+    stats = template_manager.get_render_stats()
+    templates = [
+        TemplateRenderStat(template=name, **stat) for name, stat in stats.items()
+    ]
+    templates.sort(key=lambda t: t.avg_ms, reverse=True)
+    return TemplateStatsResponse(
+        auto_reload=template_manager.auto_reload,
+        templates=templates,
+        fragment_cache=template_manager.get_fragment_cache_stats(),
+    )
+
+
+@router.get("/write-behind-stats", response_model=list[WriteBehindQueueStat])
+async def get_write_behind_queue_stats(_user_id: CurrentUserId):
+    """
+    获取遥测批量写入队列统计（队列深度、丢弃数等）
+    """
+    return [WriteBehindQueueStat(**stat) for stat in get_write_behind_stats()]
@@ -76,3 +76,36 @@ class SystemInfoSummary(BaseModel):
     version: str
     environment: str
     db_status: str
+
+
+class TemplateRenderStat(BaseModel):
+    """单个模板的渲染统计"""
+
+    template: str
+    count: int
+    avg_ms: float
+    max_ms: float
+    avg_chars: int
+    last_chars: int
+
+
+class TemplateStatsResponse(BaseModel):
+    """模板渲染统计响应"""
+
+    auto_reload: bool
+    templates: list[TemplateRenderStat]
+    fragment_cache: dict[str, int]  # 片段缓存: size/maxsize/hits/misses
+
+
+class WriteBehindQueueStat(BaseModel):
+    """批量写后队列统计"""
+
+    name: str
+    queue_depth: int
+    max_size: int
+    enqueued: int
+    written: int
+    dropped: int
+    failed: int
+    batches: int
+    journal_bytes: int  # 发件箱中尚未导入的字节数
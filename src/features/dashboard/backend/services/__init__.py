@@ -0,0 +1 @@
+"""仪表盘服务模块"""
@@ -0,0 +1,280 @@
+"""仪表盘计数器服务
+每个用户的项目数、章节数、大纲节点数、总字数保存在 user_stats_counters 表中，
+由 SQLite 触发器在 novel_projects / chapters / outline_nodes 写入时同一事务内增量更新，
+覆盖所有写入路径（包括批量删除和级联删除）；后台任务定期按全量聚合对账修正偏差
+
+触发器和 UPSERT 语句仅适用于 SQLite，其他数据库不维护计数器表，统计按基础表实时聚合
+"""
+
+import asyncio
+import contextlib
+
+from cachetools import TTLCache
+from tortoise import Tortoise
+from tortoise.expressions import Subquery
+from tortoise.functions import Count, Sum
+from tortoise.transactions import in_transaction
+
+from src.backend.config.database import is_sqlite
+from src.backend.config.settings import settings
+from src.backend.core.logger import logger
+from src.features.chapter.backend.models import Chapter
+from src.features.novel_outline.backend.models import OutlineNode
+from src.features.novel_project.backend.models import NovelProject
+
+from ..models import UserStatsCounter
+
+COUNTER_FIELDS = ("project_count", "chapter_count", "outline_node_count", "total_words")
+
+_COLUMNS = '"user_id", "project_count", "chapter_count", "outline_node_count", "total_words", "updated_at"'
+_ON_CONFLICT = """ON CONFLICT ("user_id") DO UPDATE SET
+        "project_count" = "project_count" + excluded."project_count",
+        "chapter_count" = "chapter_count" + excluded."chapter_count",
+        "outline_node_count" = "outline_node_count" + excluded."outline_node_count",
+        "total_words" = "total_words" + excluded."total_words",
+        "updated_at" = CURRENT_TIMESTAMP"""
+
+
+def _bump_user(user_id: str, projects: str, chapters: str, nodes: str, words: str) -> str:
+    """按用户ID累加计数"""
+    return f"""INSERT INTO "user_stats_counters" ({_COLUMNS})
+    VALUES ({user_id}, {projects}, {chapters}, {nodes}, {words}, CURRENT_TIMESTAMP)
+    {_ON_CONFLICT};"""
+
+
+def _bump_project(project_id: str, chapters: str, nodes: str, words: str) -> str:
+    """按项目ID找到所属用户并累加计数（项目已删除时不更新，级联删除由项目触发器统一扣减）"""
+    return f"""INSERT INTO "user_stats_counters" ({_COLUMNS})
+    SELECT "user_id", 0, {chapters}, {nodes}, {words}, CURRENT_TIMESTAMP
+    FROM "novel_projects" WHERE "id" = {project_id}
+    {_ON_CONFLICT};"""
+
+
+_PROJECT_CHAPTERS = 'SELECT COUNT(*) FROM "chapters" WHERE "project_id" = OLD."id"'
+_PROJECT_CHAPTER_WORDS = 'SELECT COALESCE(SUM("word_count"), 0) FROM "chapters" WHERE "project_id" = OLD."id"'
+_PROJECT_NODES = 'SELECT COUNT(*) FROM "outline_nodes" WHERE "project_id" = OLD."id"'
+
+# 删除项目时一次扣减项目及其全部章节、大纲节点（级联删除子行时项目行已不存在，子表触发器不会重复扣减）
+_PROJECT_DELETE = _bump_user(
+    'OLD."user_id"', "-1", f"-({_PROJECT_CHAPTERS})", f"-({_PROJECT_NODES})",
+    f'-(OLD."word_count" + ({_PROJECT_CHAPTER_WORDS}))',
+)
+
+# 计数器触发器（由迁移创建；开发环境 generate_schemas 之后由 init_db 补建）
+SCHEMA_SQL = f"""
+CREATE TRIGGER IF NOT EXISTS "trg_counter_project_insert" AFTER INSERT ON "novel_projects"
+BEGIN
+    {_bump_user('NEW."user_id"', "1", "0", "0", 'NEW."word_count"')}
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_counter_project_delete" BEFORE DELETE ON "novel_projects"
+BEGIN
+    {_PROJECT_DELETE}
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_counter_project_words" AFTER UPDATE OF "word_count" ON "novel_projects"
+WHEN OLD."word_count" IS NOT NEW."word_count"
+BEGIN
+    {_bump_user('NEW."user_id"', "0", "0", "0", 'NEW."word_count" - OLD."word_count"')}
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_counter_chapter_insert" AFTER INSERT ON "chapters"
+BEGIN
+    {_bump_project('NEW."project_id"', "1", "0", 'NEW."word_count"')}
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_counter_chapter_delete" AFTER DELETE ON "chapters"
+BEGIN
+    {_bump_project('OLD."project_id"', "-1", "0", '-OLD."word_count"')}
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_counter_chapter_update" AFTER UPDATE OF "word_count", "project_id" ON "chapters"
+WHEN OLD."word_count" IS NOT NEW."word_count" OR OLD."project_id" IS NOT NEW."project_id"
+BEGIN
+    {_bump_project('OLD."project_id"', "-1", "0", '-OLD."word_count"')}
+    {_bump_project('NEW."project_id"', "1", "0", 'NEW."word_count"')}
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_counter_outline_insert" AFTER INSERT ON "outline_nodes"
+BEGIN
+    {_bump_project('NEW."project_id"', "0", "1", "0")}
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_counter_outline_delete" AFTER DELETE ON "outline_nodes"
+BEGIN
+    {_bump_project('OLD."project_id"', "0", "-1", "0")}
+END;
+"""
+
+# 按基础表全量聚合的期望计数
+_EXPECTED_SQL = """
+SELECT p."user_id" AS "user_id",
+       COUNT(*) AS "project_count",
+       COALESCE(SUM(c."cnt"), 0) AS "chapter_count",
+       COALESCE(SUM(o."cnt"), 0) AS "outline_node_count",
+       SUM(p."word_count") + COALESCE(SUM(c."words"), 0) AS "total_words"
+FROM "novel_projects" p
+LEFT JOIN (
+    SELECT "project_id", COUNT(*) AS "cnt", SUM("word_count") AS "words" FROM "chapters" GROUP BY "project_id"
+) c ON c."project_id" = p."id"
+LEFT JOIN (
+    SELECT "project_id", COUNT(*) AS "cnt" FROM "outline_nodes" GROUP BY "project_id"
+) o ON o."project_id" = p."id"
+GROUP BY p."user_id"
+"""
+
+_SET_SQL = f"""
+INSERT INTO "user_stats_counters" ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+ON CONFLICT ("user_id") DO UPDATE SET
+    "project_count" = excluded."project_count",
+    "chapter_count" = excluded."chapter_count",
+    "outline_node_count" = excluded."outline_node_count",
+    "total_words" = excluded."total_words",
+    "updated_at" = CURRENT_TIMESTAMP
+"""
+
+_TOTALS_SQL = f"""
+SELECT {", ".join(f'COALESCE(SUM("{name}"), 0) AS "{name}"' for name in COUNTER_FIELDS)}
+FROM "user_stats_counters"
+"""
+
+_EMPTY = dict.fromkeys(COUNTER_FIELDS, 0)
+
+
+class DashboardCounterService:
+    """仪表盘计数器服务
+
+    特性:
+    - 单用户统计为按主键的一次查询
+    - 全站汇总只扫描计数器表（每用户一行），结果短时缓存
+    - reconcile() 在事务内比较全量聚合与计数器，只修正有偏差的用户
+    - 非 SQLite 数据库没有计数器触发器，统计按基础表实时聚合，不做对账
+    """
+
+    def __init__(self):
+        self._totals: TTLCache = TTLCache(maxsize=1, ttl=settings.DASHBOARD_OVERVIEW_CACHE_TTL)
+        self._task: asyncio.Task | None = None
+        self._stop = asyncio.Event()
+
+    async def get_user_counters(self, user_id: int) -> dict[str, int]:
+        """
+        获取用户的创作统计
+
+        Args:
+            user_id: 用户ID
+
+        Returns:
+            dict: {project_count, chapter_count, outline_node_count, total_words}
+        """
+        if not is_sqlite():
+            return await self._aggregate({"user_id": user_id})
+        row = await UserStatsCounter.filter(user_id=user_id).values(*COUNTER_FIELDS)
+        return row[0] if row else dict(_EMPTY)
+
+    async def get_totals(self) -> dict[str, int]:
+        """
+        获取全站创作统计（短时缓存）
+
+        Returns:
+            dict: {project_count, chapter_count, outline_node_count, total_words}
+        """
+        totals = self._totals.get("totals")
+        if totals is None:
+            if is_sqlite():
+                _, rows = await Tortoise.get_connection("default").execute_query(_TOTALS_SQL)
+                totals = {name: rows[0][name] for name in COUNTER_FIELDS}
+            else:
+                totals = await self._aggregate({})
+            self._totals["totals"] = totals
+        return totals
+
+    @staticmethod
+    async def _aggregate(scope: dict[str, int]) -> dict[str, int]:
+        """
+        按基础表实时聚合统计（没有计数器触发器的数据库使用，口径与对账一致）
+
+        Args:
+            scope: 项目过滤条件（如 {"user_id": 1}，空字典表示全站）
+
+        Returns:
+            dict: {project_count, chapter_count, outline_node_count, total_words}
+        """
+        # 子表按项目ID子查询过滤（关联过滤会使聚合按行分组）
+        child_scope = {"project_id__in": Subquery(NovelProject.filter(**scope).values("id"))}
+        projects = (
+            await NovelProject.filter(**scope)
+            .annotate(count=Count("id"), words=Sum("word_count"))
+            .first()
+            .values("count", "words")
+        )
+        chapters = (
+            await Chapter.filter(**child_scope)
+            .annotate(count=Count("id"), words=Sum("word_count"))
+            .first()
+            .values("count", "words")
+        )
+        return {
+            "project_count": projects["count"],
+            "chapter_count": chapters["count"],
+            "outline_node_count": await OutlineNode.filter(**child_scope).count(),
+            "total_words": (projects["words"] or 0) + (chapters["words"] or 0),
+        }
+
+    async def reconcile(self) -> int:
+        """
+        按基础表重新计算计数器并修正偏差
+
+        Returns:
+            int: 被修正的用户数（非 SQLite 数据库不维护计数器，始终为 0）
+        """
+        if not is_sqlite():
+            return 0
+        async with in_transaction() as conn:
+            _, expected_rows = await conn.execute_query(_EXPECTED_SQL)
+            expected = {row["user_id"]: [row[name] for name in COUNTER_FIELDS] for row in expected_rows}
+            current = {
+                row["user_id"]: [row[name] for name in COUNTER_FIELDS]
+                for row in await UserStatsCounter.all().using_db(conn).values("user_id", *COUNTER_FIELDS)
+            }
+
+            drifted = [
+                [user_id, *values]
+                for user_id, values in expected.items()
+                if current.get(user_id) != values
+            ]
+            stale = [user_id for user_id in current if user_id not in expected]
+
+            if drifted:
+                await conn.execute_many(_SET_SQL, drifted)
+            if stale:
+                await UserStatsCounter.filter(user_id__in=stale).using_db(conn).delete()
+
+        fixed = len(drifted) + len(stale)
+        if fixed:
+            self._totals.clear()
+            logger.warning(f"仪表盘计数器对账: 修正 {fixed} 个用户的统计")
+        return fixed
+
+    # ==================== 后台任务 ====================
+
+    async def _run(self, interval: float) -> None:
+        while not self._stop.is_set():
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logger.error(f"仪表盘计数器对账失败: {e}")
+            with contextlib.suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stop.wait(), timeout=interval)
+
+    def start(self) -> None:
+        """启动定时对账任务（需在事件循环中调用）"""
+        interval = settings.DASHBOARD_COUNTER_RECONCILE_INTERVAL
+        if interval <= 0 or self._task is not None or not is_sqlite():
+            return
+        self._stop.clear()
+        self._task = asyncio.create_task(self._run(interval), name="dashboard-counters")
+
+    async def stop(self) -> None:
+        """停止定时对账任务"""
+        if self._task is None:
+            return
+        self._stop.set()
+        await self._task
+        self._task = None
+
+
+# 创建全局计数器服务实例
+dashboard_counter_service = DashboardCounterService()
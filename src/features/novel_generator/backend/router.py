@@ -11,6 +11,7 @@ from src.backend.core.dependencies import CurrentUserId
 from src.backend.core.exceptions import AuthenticationError
 from src.backend.core.logger import logger
 from src.backend.core.security import decode_access_token
+from src.backend.services.quota import quota_service
 from src.features.novel_generator.backend.services import ai_service
 
 # 创建一个简单的路由器
@@ -54,6 +55,9 @@ async def generate_novel_stream(
     
     logger.info(f"用户 {user_id} 请求流式生成小说: {title}")
     
+    # 构建提示词前检查配额
+    quota = await quota_service.check(int(user_id))
+
     async def content_stream():
         try:
             # 发送一个初始心跳包，确保连接建立
@@ -89,6 +93,7 @@ async def generate_novel_stream(
         content_stream(), 
         media_type="text/plain",
         headers={
+            **quota.headers(),
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
             "Access-Control-Allow-Origin": "*",
@@ -2,12 +2,13 @@
 大纲系统API路由
 """
 
-from fastapi import APIRouter, HTTPException, Path, Query
+from fastapi import APIRouter, Header, HTTPException, Path, Query, Response
 from fastapi.responses import StreamingResponse
 from loguru import logger
 
 from src.backend.core.exceptions import APIError
 from src.backend.core.response import MessageResponse, message_response
+from src.backend.services.quota import quota_service
 
 # 导入同步服务
 from src.features.chapter.backend.services.sync_service import ChapterSyncService
@@ -26,11 +27,13 @@ from src.features.novel_outline.backend.schemas import (
 # 导入AI大纲服务
 from src.features.novel_outline.backend.services.ai_outline_service import (
     AIOutlineService,
-    OutlineExportService,
 )
 from src.features.novel_outline.backend.services.outline_continue_service import (
     OutlineContinueService,
 )
+from src.features.novel_outline.backend.services.outline_export import (
+    OutlineExportService,
+)
 from src.features.novel_project.backend.models import NovelProject
 
 router = APIRouter(prefix="/outline", tags=["大纲系统"])
@@ -352,6 +355,9 @@ async def generate_outline_with_ai(
     清空现有大纲并根据项目设定生成新的大纲结构
     注意：会自动使用项目的description、genre、style字段
     """
+    # 构建提示词前检查配额
+    quota = await quota_service.check(user_id, project_id)
+
     return StreamingResponse(
         AIOutlineService.generate_outline_stream(
             project_id=project_id,
@@ -363,6 +369,7 @@ async def generate_outline_with_ai(
         ),
         media_type="text/event-stream",
         headers={
+            **quota.headers(),
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
         },
@@ -414,41 +421,50 @@ async def get_outline_meta(
     
 
 
+async def _export_outline(project_id: int, fmt: str, if_none_match: str | None) -> Response:
+    """按 ETag 返回 304，或流式导出大纲"""
+    headers = {"Cache-Control": "private, no-cache"}
+    if OutlineExportService.versioned():
+        etag = await OutlineExportService.get_etag(project_id, fmt)
+        if etag is None:
+            raise APIError(code="NOT_FOUND", message="项目不存在", status_code=404)
+
+        # 浏览器每次重新验证，大纲未变化时不再生成导出内容
+        headers["ETag"] = etag
+        if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+            return Response(status_code=304, headers=headers)
+    elif not await NovelProject.exists(id=project_id):
+        # 没有大纲版本号时无法判断大纲是否变化，不返回 ETag，每次重新导出
+        raise APIError(code="NOT_FOUND", message="项目不存在", status_code=404)
+
+    if fmt == "json":
+        content, media_type = OutlineExportService.export_json(project_id), "application/json"
+    else:
+        content, media_type = OutlineExportService.export_markdown(project_id), "text/markdown"
+        headers["Content-Disposition"] = f"attachment; filename=outline_{project_id}.md"
+    return StreamingResponse(content, media_type=media_type, headers=headers)
+
+
 @router.get("/projects/{project_id}/export/markdown")
 async def export_outline_markdown(
     project_id: int = Path(..., description="项目ID"),
+    if_none_match: str | None = Header(None),
 ):
     """
-    导出大纲为Markdown格式
+    导出大纲为Markdown格式（支持 ETag / If-None-Match）
     """
-    try:
-        markdown_content = await OutlineExportService.export_to_markdown(project_id)
-        return StreamingResponse(
-            iter([markdown_content]),
-            media_type="text/markdown",
-            headers={
-                "Content-Disposition": f"attachment; filename=outline_{project_id}.md",
-            },
-        )
-    except Exception as e:
-        logger.error(f"导出Markdown失败: {e}")
-        raise APIError(code="EXPORT_FAILED", message="导出失败", status_code=500) from e
+    return await _export_outline(project_id, "md", if_none_match)
 
 
 @router.get("/projects/{project_id}/export/json")
 async def export_outline_json(
     project_id: int = Path(..., description="项目ID"),
+    if_none_match: str | None = Header(None),
 ):
     """
-    导出大纲为JSON格式
+    导出大纲为JSON格式（支持 ETag / If-None-Match）
     """
-    try:
-        json_data = await OutlineExportService.export_to_json(project_id)
-        
-    except Exception as e:
-        logger.error(f"导出JSON失败: {e}")
-        raise APIError(code="EXPORT_FAILED", message="导出失败", status_code=500) from e
-    return json_data
+    return await _export_outline(project_id, "json", if_none_match)
 
 
 @router.post("/projects/{project_id}/continue")
@@ -462,6 +478,9 @@ async def continue_outline_with_ai(
     基于已有大纲内容，智能生成后续章节大纲
     注意：会自动提取现有大纲作为上下文，并为chapter节点创建Chapter记录
     """
+    # 构建提示词前检查配额
+    quota = await quota_service.check(user_id, project_id)
+
     return StreamingResponse(
         OutlineContinueService.continue_outline_stream(
             project_id=project_id,
@@ -471,6 +490,7 @@ async def continue_outline_with_ai(
         ),
         media_type="text/event-stream",
         headers={
+            **quota.headers(),
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
         },
@@ -4,11 +4,11 @@
 
 import asyncio
 import json
-from typing import Any, AsyncGenerator, Dict, List
+from typing import Any, AsyncGenerator, Dict
 
 from src.backend.ai import ai_service
 from src.backend.core.logger import logger
-from src.backend.core.template import TemplateManager
+from src.backend.core.template import template_manager
 from src.features.chapter.backend.services.sync_service import ChapterSyncService
 from src.features.character.backend.models import Character
 from src.features.novel_outline.backend.models import OutlineNode
@@ -18,9 +18,6 @@ from src.features.novel_project.backend.models import NovelProject
 class AIOutlineService:
     """AI大纸生成服务"""
 
-    # 类级别模板管理器，所有实例共享
-    template_manager = TemplateManager()
-
     @staticmethod
     async def generate_outline_stream(
         project_id: int,
@@ -117,7 +114,7 @@ class AIOutlineService:
         # 尝试使用模板渲染
         try:
             logger.info("使用模板生成大纸提示词成功")
-            return AIOutlineService.template_manager.render(
+            return template_manager.render(
                 "outline.jinja2",
                 topic=topic,
                 genre=genre,
@@ -472,76 +469,3 @@ class AIOutlineService:
             
         except Exception as e:
             logger.error(f"保存大纲meta信息失败: {e}")
-
-
-class OutlineExportService:
-    """大纲导出服务"""
-
-    @staticmethod
-    async def export_to_markdown(project_id: int) -> str:
-        """导出为Markdown格式"""
-        nodes = await OutlineNode.filter(project_id=project_id).order_by("position").all()
-        
-        # 构建树结构
-        tree = OutlineExportService._build_tree(nodes)
-        
-        # 生成Markdown
-        md_lines = ["# 小说大纲\n"]
-        
-        for volume in tree:
-            md_lines.append(f"\n## {volume['title']}\n")
-            if volume.get("description"):
-                md_lines.append(f"*{volume['description']}*\n")
-            
-            for chapter in volume.get("children", []):
-                md_lines.append(f"\n### {chapter['title']}\n")
-                if chapter.get("description"):
-                    md_lines.append(f"{chapter['description']}\n")
-                
-                for section in chapter.get("children", []):
-                    md_lines.append(f"\n#### {section['title']}\n")
-                    if section.get("description"):
-                        md_lines.append(f"{section['description']}\n")
-        
-        return "\n".join(md_lines)
-
-    @staticmethod
-    async def export_to_json(project_id: int) -> Dict[str, Any]:
-        """导出为JSON格式"""
-        nodes = await OutlineNode.filter(project_id=project_id).order_by("position").all()
-        
-        # 构建树结构
-        tree = OutlineExportService._build_tree(nodes)
-        
-        return {
-            "project_id": project_id,
-            "outline": tree,
-        }
-
-    @staticmethod
-    def _build_tree(nodes: List[OutlineNode]) -> List[Dict[str, Any]]:
-        """构建树状结构"""
-        node_map = {}
-        
-        # 创建节点映射
-        for node in nodes:
-            node_map[node.id] = {
-                "id": node.id,
-                "title": node.title,
-                "description": node.description,
-                "node_type": node.node_type,
-                "children": [],
-            }
-        
-        # 构建树
-        roots = []
-        for node in nodes:
-            node_dict = node_map[node.id]
-            if node.parent_id is None:
-                roots.append(node_dict)
-            else:
-                parent = node_map.get(node.parent_id)
-                if parent:
-                    parent["children"].append(node_dict)
-        
-        return roots
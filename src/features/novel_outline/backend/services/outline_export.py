@@ -0,0 +1,147 @@
+"""大纲导出服务
+导出由一次按树形顺序（父节点在前、同级按 position）排列的查询生成，逐个节点写出，
+不构建节点树，也不拼接完整的导出内容
+
+项目的 outline_version 由数据库触发器在大纲节点新增、修改、删除时自增，
+导出的 ETag 由其生成，大纲未变化时重复下载返回 304；
+触发器和树形查询仅适用于 SQLite，其他数据库不生成 ETag，节点由 ORM 读取后排序
+"""
+
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from tortoise import Tortoise
+
+from src.backend.config.database import is_sqlite
+from src.features.novel_outline.backend.models import OutlineNode
+from src.features.novel_project.backend.models import NovelProject
+
+# 导出格式变化时递增，使旧的 ETag 失效
+_EXPORT_REVISION = 1
+
+# 影响导出内容的列（展开状态等界面字段的变化不改变版本号）
+_VERSIONED_COLUMNS = '"parent_id", "node_type", "title", "description", "position", "project_id"'
+
+
+def _bump(project_id: str) -> str:
+    return f'UPDATE "novel_projects" SET "outline_version" = "outline_version" + 1 WHERE "id" = {project_id};'
+
+
+# 大纲版本触发器（由迁移创建；开发环境 generate_schemas 之后由 init_db 补建）
+SCHEMA_SQL = f"""
+CREATE TRIGGER IF NOT EXISTS "trg_outline_version_insert" AFTER INSERT ON "outline_nodes"
+BEGIN
+    {_bump('NEW."project_id"')}
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_outline_version_update" AFTER UPDATE OF {_VERSIONED_COLUMNS} ON "outline_nodes"
+BEGIN
+    {_bump('OLD."project_id"')}
+    {_bump('NEW."project_id"')}
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_outline_version_delete" AFTER DELETE ON "outline_nodes"
+BEGIN
+    {_bump('OLD."project_id"')}
+END;
+"""
+
+# 按树形顺序列出项目的全部节点：排序键为从根到节点的 (position, id) 路径
+_TREE_SQL = """
+WITH RECURSIVE "tree" ("id", "depth", "sort_key") AS (
+    SELECT "id", 0, printf('%010d.%010d', "position", "id")
+    FROM "outline_nodes" WHERE "project_id" = ? AND "parent_id" IS NULL
+    UNION ALL
+    SELECT n."id", t."depth" + 1, t."sort_key" || '/' || printf('%010d.%010d', n."position", n."id")
+    FROM "outline_nodes" n JOIN "tree" t ON n."parent_id" = t."id"
+)
+SELECT n."id" AS "id", n."title" AS "title", n."description" AS "description",
+       n."node_type" AS "node_type", t."depth" AS "depth"
+FROM "tree" t JOIN "outline_nodes" n ON n."id" = t."id"
+ORDER BY t."sort_key"
+"""
+
+
+class OutlineExportService:
+    """大纲导出服务"""
+
+    @staticmethod
+    def versioned() -> bool:
+        """是否维护大纲版本号（版本触发器仅在 SQLite 上创建，其他数据库版本号始终不变）"""
+        return is_sqlite()
+
+    @staticmethod
+    async def get_etag(project_id: int, fmt: str) -> str | None:
+        """
+        计算大纲导出的 ETag（只查询项目行；仅在 versioned() 时可用）
+
+        Args:
+            project_id: 项目ID
+            fmt: 导出格式
+
+        Returns:
+            str | None: ETag；项目不存在时返回None
+        """
+        project = (
+            await NovelProject.filter(id=project_id)
+            .first()
+            .values("outline_version", "created_at")
+        )
+        if project is None:
+            return None
+        created = int(project["created_at"].timestamp())
+        return f'"outline-{project_id}-{created}-{project["outline_version"]}-{fmt}-{_EXPORT_REVISION}"'
+
+    @staticmethod
+    async def _list_nodes(project_id: int) -> list[dict[str, Any]]:
+        """按树形顺序读取节点（只读取导出需要的列）"""
+        if is_sqlite():
+            _, rows = await Tortoise.get_connection("default").execute_query(_TREE_SQL, [project_id])
+            return rows
+
+        # 其他数据库：按 (position, id) 读取全部节点后深度优先展开
+        nodes = (
+            await OutlineNode.filter(project_id=project_id)
+            .order_by("position", "id")
+            .values("id", "parent_id", "title", "description", "node_type")
+        )
+        children: dict[int | None, list[dict[str, Any]]] = {}
+        for node in nodes:
+            children.setdefault(node.pop("parent_id"), []).append(node)
+
+        rows: list[dict[str, Any]] = []
+        stack = [(node, 0) for node in reversed(children.get(None, []))]
+        while stack:
+            node, depth = stack.pop()
+            rows.append({**node, "depth": depth})
+            stack.extend((child, depth + 1) for child in reversed(children.get(node["id"], [])))
+        return rows
+
+    @staticmethod
+    async def export_markdown(project_id: int) -> AsyncIterator[str]:
+        """导出为Markdown格式（卷为二级标题，逐级递增）"""
+        yield "# 小说大纲\n"
+        for node in await OutlineExportService._list_nodes(project_id):
+            depth = node["depth"]
+            yield f"\n\n{'#' * min(depth + 2, 6)} {node['title']}\n"
+            if node["description"]:
+                # 卷描述以斜体显示
+                description = f"*{node['description']}*" if depth == 0 else node["description"]
+                yield f"\n{description}\n"
+
+    @staticmethod
+    async def export_json(project_id: int) -> AsyncIterator[str]:
+        """导出为JSON格式（{project_id, outline: 节点树}，按深度变化开闭 children 数组）"""
+        yield f'{{"project_id": {project_id}, "outline": ['
+        depth = -1
+        for node in await OutlineExportService._list_nodes(project_id):
+            # 不是上一个节点的子节点时，先关闭上一个节点及已结束的上层节点
+            if node["depth"] <= depth:
+                yield "]}" * (depth - node["depth"] + 1) + ", "
+            depth = node["depth"]
+            fields = json.dumps(
+                {key: node[key] for key in ("id", "title", "description", "node_type")},
+                ensure_ascii=False,
+            )
+            yield f'{fields[:-1]}, "children": ['
+        yield "]}" * (depth + 1)
+        yield "]}"
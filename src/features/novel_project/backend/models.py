@@ -5,6 +5,8 @@
 from tortoise import fields, models
 from tortoise.exceptions import ValidationError
 
+from src.backend.core.fields import CompressedTextField
+
 
 class NovelProject(models.Model):
     """小说项目模型"""
@@ -18,7 +20,7 @@ class NovelProject(models.Model):
     updated_at = fields.DatetimeField(auto_now=True, description="更新时间")
     
     # 添加小说内容字段
-    content = fields.TextField(null=True, blank=True, description="小说内容")
+    content = CompressedTextField(null=True, blank=True, description="小说内容")
     word_count = fields.IntField(default=0, description="字数统计")
     target_word_count = fields.IntField(null=True, blank=True, description="目标字数")
     
@@ -28,6 +30,9 @@ class NovelProject(models.Model):
     
     # 元数据字段（用于存储大纲meta等扩展信息）
     metadata = fields.JSONField(default=dict, description="元数据（JSON格式）")
+
+    # 大纲版本号（大纲节点变更时由数据库触发器自增，用于大纲导出的 ETag）
+    outline_version = fields.IntField(default=0, description="大纲版本号")
     
     # 关联用户
     user_id = fields.BigIntField(description="创建用户ID")
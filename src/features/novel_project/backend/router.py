@@ -12,6 +12,7 @@ from src.backend.core.dependencies import CurrentUserId
 from src.backend.core.exceptions import APIError
 from src.backend.core.logger import logger
 from src.backend.core.response import MessageResponse, message_response
+from src.backend.services.quota import quota_service
 
 from .models import NovelProject
 from .schemas import (
@@ -21,6 +22,7 @@ from .schemas import (
     NovelProjectUpdate,
 )
 from .services.ai_service import project_ai_service
+from .services.project_stats import with_project_stats
 
 router = APIRouter()
 
@@ -30,24 +32,15 @@ async def _enrich_project_response(project: NovelProject) -> NovelProjectRespons
     丰富项目响应数据，添加章节和角色数量统计
     
     Args:
-        project: 项目实例
+        project: 项目实例（经 with_project_stats 查询得到时直接使用附加的统计字段）
         
     Returns:
         NovelProjectResponse: 丰富后的项目响应数据
     """
-    from src.features.chapter.backend.models import Chapter
-    from src.features.character.backend.models import Character
+    if not hasattr(project, "chapter_count"):
+        project = await with_project_stats(NovelProject.filter(id=project.id)).get()
     
-    chapter_count = await Chapter.filter(project_id=project.id).count()
-    character_count = await Character.filter(project_id=project.id).count()
-    
-    project_dict = {
-        **project.__dict__,
-        "chapter_count": chapter_count,
-        "character_count": character_count,
-    }
-    
-    return NovelProjectResponse(**project_dict)
+    return NovelProjectResponse(**project.__dict__)
 
 
 @router.post("/", response_model=NovelProjectResponse, summary="创建小说项目")
@@ -116,10 +109,10 @@ async def list_novel_projects(
     
     # 分页查询
     offset = (page - 1) * size
-    projects = await NovelProject.filter(**filters).offset(offset).limit(size).all()
+    projects = await with_project_stats(NovelProject.filter(**filters)).offset(offset).limit(size)
     total = await NovelProject.filter(**filters).count()
     
-    # 统计每个项目的章节和角色数量
+    # 章节和角色数量已随项目查询一并取回
     project_list = [await _enrich_project_response(project) for project in projects]
     
     logger.info(f"获取到 {len(projects)} 个项目，总共 {total} 个")
@@ -144,7 +137,7 @@ async def get_novel_project(
     logger.info(f"用户 {user_id} 获取小说项目详情: {project_id}")
     
     try:
-        project = await NovelProject.get(id=project_id, user_id=user_id)
+        project = await with_project_stats(NovelProject.filter(id=project_id, user_id=user_id)).get()
         return await _enrich_project_response(project)
     except DoesNotExist as e:
         logger.warning(f"小说项目不存在: {project_id}")
@@ -283,6 +276,9 @@ async def ai_generate_project_stream(
 
     requirement = data.get("requirement", "")
 
+    # 构建提示词前检查配额
+    quota = await quota_service.check(int(user_id), project_id)
+
     try:
         async def content_stream():
             try:
@@ -303,6 +299,7 @@ async def ai_generate_project_stream(
             content_stream(),
             media_type="text/plain",
             headers={
+                **quota.headers(),
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
                 "Access-Control-Allow-Origin": "*",
@@ -334,6 +331,9 @@ async def ai_continue_project_stream(
     current_content = data.get("current_content", project.content or "")
     requirement = data.get("requirement", "")
 
+    # 构建提示词前检查配额
+    quota = await quota_service.check(int(user_id), project_id)
+
     try:
         async def content_stream():
             try:
@@ -355,6 +355,7 @@ async def ai_continue_project_stream(
             content_stream(),
             media_type="text/plain",
             headers={
+                **quota.headers(),
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
                 "Access-Control-Allow-Origin": "*",
@@ -386,6 +387,9 @@ async def ai_optimize_project_stream(
     content = data.get("content", "")
     optimization_type = data.get("type", "general")  # general, grammar, style
 
+    # 构建提示词前检查配额
+    quota = await quota_service.check(int(user_id), project_id)
+
     try:
         async def content_stream():
             try:
@@ -407,6 +411,7 @@ async def ai_optimize_project_stream(
             content_stream(),
             media_type="text/plain",
             headers={
+                **quota.headers(),
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
                 "Access-Control-Allow-Origin": "*",
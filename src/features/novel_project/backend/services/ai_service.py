@@ -7,7 +7,7 @@ from typing import AsyncGenerator
 from loguru import logger
 
 from src.backend.ai import ai_service
-from src.backend.core.template import TemplateManager
+from src.backend.core.template import template_manager
 from src.features.character.backend.models import Character
 from src.features.novel_project.backend.models import NovelProject
 
@@ -15,8 +15,6 @@ from src.features.novel_project.backend.models import NovelProject
 class ProjectAIService:
     """小说项目AI辅助写作服务"""
     
-    # 类级别模板管理器（复用实例）
-    template_manager = TemplateManager()
 
     @staticmethod
     async def generate_project_content(
@@ -56,7 +54,7 @@ class ProjectAIService:
             
             # 尝试使用模板渲染提示词
             try:
-                full_requirement = ProjectAIService.template_manager.render(
+                full_requirement = template_manager.render(
                     "project_generate.jinja2",
                     **context,
                 )
@@ -182,7 +180,7 @@ class ProjectAIService:
             
             # 尝试使用模板渲染提示词
             try:
-                full_requirement = ProjectAIService.template_manager.render(
+                full_requirement = template_manager.render(
                     "project_continue.jinja2",
                     **context,
                 )
@@ -282,7 +280,7 @@ class ProjectAIService:
             
             # 尝试使用模板渲染提示词
             try:
-                prompt = ProjectAIService.template_manager.render(
+                prompt = template_manager.render(
                     "project_optimize.jinja2",
                     **context,
                 )
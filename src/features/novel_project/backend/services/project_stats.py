@@ -0,0 +1,41 @@
+"""
+小说项目统计
+以相关子查询的形式把章节数、角色数、章节字数附加到项目查询上，
+一页项目的统计与项目本身在同一条 SQL 中取回，不再逐个项目查询
+"""
+
+from tortoise.expressions import RawSQL
+from tortoise.queryset import QuerySet
+
+from src.features.novel_project.backend.models import NovelProject
+
+# 子查询均命中 chapters(project_id, …) / characters(project_id) 索引
+_CHAPTER_COUNT = RawSQL(
+    '(SELECT COUNT(*) FROM "chapters" WHERE "chapters"."project_id" = "novel_projects"."id")',
+)
+_CHAPTER_WORDS = RawSQL(
+    '(SELECT COALESCE(SUM("word_count"), 0) FROM "chapters" '
+    'WHERE "chapters"."project_id" = "novel_projects"."id")',
+)
+_CHARACTER_COUNT = RawSQL(
+    '(SELECT COUNT(*) FROM "characters" WHERE "characters"."project_id" = "novel_projects"."id")',
+)
+
+
+def with_project_stats(query: QuerySet[NovelProject]) -> QuerySet[NovelProject]:
+    """
+    为项目查询附加统计字段
+
+    结果实例上额外带有 chapter_count、character_count、chapter_words 属性
+
+    Args:
+        query: 项目查询
+
+    Returns:
+        QuerySet: 附加统计字段后的查询
+    """
+    return query.annotate(
+        chapter_count=_CHAPTER_COUNT,
+        character_count=_CHARACTER_COUNT,
+        chapter_words=_CHAPTER_WORDS,
+    )
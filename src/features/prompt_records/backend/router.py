@@ -1,65 +1,204 @@
 """提示词记录管理API路由"""
 
+from datetime import date
+from typing import Literal
+
 from fastapi import APIRouter, Query
+from tortoise.queryset import QuerySet
 
 from src.backend.core.dependencies import CurrentUserId
+from src.backend.core.pagination import (
+    after_cursor,
+    count_estimate,
+    encode_cursor,
+    paginate,
+    paginate_sorted,
+)
 from src.backend.services.models import PromptRecord
+from src.backend.services.prompt_archive import prompt_archive_service
+from src.backend.services.prompt_blobs import MIN_SEARCH_LENGTH, prompt_blob_service
 
 from .schemas import PromptRecordListResponse, PromptRecordResponse
 
 router = APIRouter(prefix="/prompt-records", tags=["提示词记录"])
 
+# 全文检索时每批扫描的记录数
+SEARCH_SCAN_BATCH = 500
+
+
+async def _search_record_ids(query: QuerySet[PromptRecord], keyword: str, limit: int | None) -> list[int]:
+    """
+    按 (created_at, id) 倒序分批扫描记录，返回提示词正文包含检索词的记录ID
+
+    每批只在本批记录引用的正文中检索，命中数凑满 limit 即停止；
+    旧记录（正文未转存为 blob）不参与检索
+
+    Args:
+        query: 已应用过滤条件（及游标）的查询
+        keyword: 检索词
+        limit: 最多返回的记录数（None 表示扫描全部）
+
+    Returns:
+        list[int]: 命中的记录ID（按时间倒序）
+    """
+    ids: list[int] = []
+    cursor = None
+    while limit is None or len(ids) < limit:
+        rows = (
+            await after_cursor(query, cursor)
+            .order_by("-created_at", "-id")
+            .limit(SEARCH_SCAN_BATCH)
+            .values("id", "created_at", "system_prompt_hash", "user_prompt_hash")
+        )
+        hashes = [
+            text_hash
+            for row in rows
+            for text_hash in (row["system_prompt_hash"], row["user_prompt_hash"])
+            if text_hash
+        ]
+        hits = await prompt_blob_service.match(keyword, hashes)
+        ids.extend(
+            row["id"] for row in rows
+            if row["system_prompt_hash"] in hits or row["user_prompt_hash"] in hits
+        )
+        if len(rows) < SEARCH_SCAN_BATCH:
+            break
+        cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+    return ids if limit is None else ids[:limit]
+
 
 @router.get("/", response_model=PromptRecordListResponse)
 async def list_prompt_records(
     user_id: CurrentUserId,
-    page: int = Query(1, ge=1, description="页码"),
+    cursor: str | None = Query(None, description="分页游标（上一页返回的 next_cursor）"),
     page_size: int = Query(20, ge=1, le=100, description="每页大小"),
     project_id: int | None = Query(None, description="项目ID过滤"),
-    endpoint: str | None = Query(None, description="端点过滤"),
+    endpoint: str | None = Query(None, description="端点过滤（精确匹配）"),
+    q: str | None = Query(
+        None, min_length=MIN_SEARCH_LENGTH, description="全文检索提示词内容（至少3个字符）",
+    ),
+    total: Literal["none", "estimate", "exact"] | None = Query(
+        None,
+        description="总数: none 不计算 / estimate 有上限的估算 / exact 精确计数（默认检索时 none，否则 estimate）",
+    ),
 ):
     """
-    获取用户的提示词记录列表（分页）
+    获取用户的提示词记录列表（按创建时间倒序的游标分页）
 
     Args:
         user_id: 当前用户ID
-        page: 页码（从1开始）
+        cursor: 分页游标，为空时返回第一页
         page_size: 每页大小（1-100）
         project_id: 可选的项目ID过滤
         endpoint: 可选的端点过滤
+        q: 可选的全文检索词
+        total: 总数计算方式（检索时 estimate 取本页扫描结果：有下一页时为下限，不再额外扫描）
 
     Returns:
-        PromptRecordListResponse: 分页的记录列表
+        PromptRecordListResponse: 一页记录及下一页游标
     """
-    # 构建查询条件
+    # 构建查询条件（均可命中 (user_id, …, created_at) 索引）
     query = PromptRecord.filter(user_id=user_id)
 
     if project_id is not None:
         query = query.filter(project_id=project_id)
 
     if endpoint:
-        query = query.filter(endpoint__icontains=endpoint)
-
-    # 获取总数
-    total = await query.count()
-
-    # 分页查询
-    offset = (page - 1) * page_size
-    records = (
-        await query.order_by("-created_at")
-        .offset(offset)
-        .limit(page_size)
-        .all()
-    )
+        query = query.filter(endpoint=endpoint)
+
+    if q:
+        # 只在该用户（及过滤条件内）的记录所引用的正文中检索，可翻到任意深度
+        page_ids = await _search_record_ids(after_cursor(query, cursor), q, page_size + 1)
+        records, next_cursor = await paginate(query.filter(id__in=page_ids), page_size, cursor)
+    else:
+        records, next_cursor = await paginate(query, page_size, cursor)
+    await prompt_blob_service.hydrate(records)
+
+    if total is None:
+        total = "none" if q else "estimate"
+
+    count, exact = None, True
+    if q and total == "exact":
+        count = len(await _search_record_ids(query, q, None))
+    elif q and total == "estimate":
+        # 检索需逐批扫描，估算直接取本页的扫描结果，不再为计数扫描第二遍
+        count, exact = len(records), next_cursor is None
+    elif total == "exact":
+        count = await query.count()
+    elif total == "estimate":
+        count, exact = await count_estimate(query)
 
     return PromptRecordListResponse(
-        total=total,
-        page=page,
+        total=count,
+        total_exact=exact,
         page_size=page_size,
+        next_cursor=next_cursor,
         records=[PromptRecordResponse.model_validate(record) for record in records],
     )
 
 
+@router.get("/endpoints", response_model=list[str])
+async def list_prompt_record_endpoints(user_id: CurrentUserId):
+    """
+    列出用户提示词记录中出现过的端点（用于端点过滤）
+
+    Args:
+        user_id: 当前用户ID
+
+    Returns:
+        list[str]: 端点列表
+    """
+    endpoints = await PromptRecord.filter(user_id=user_id).distinct().values_list("endpoint", flat=True)
+    return sorted(endpoints)
+
+
+@router.get("/archive/dates", response_model=list[str])
+async def list_archive_dates(_user_id: CurrentUserId):
+    """
+    列出存在归档记录的日期
+
+    Returns:
+        list[str]: 日期列表（YYYY-MM-DD，UTC，倒序）
+    """
+    return prompt_archive_service.list_dates()
+
+
+@router.get("/archive", response_model=PromptRecordListResponse)
+async def list_archived_prompt_records(
+    user_id: CurrentUserId,
+    day: date = Query(..., alias="date", description="归档日期（UTC）"),
+    cursor: str | None = Query(None, description="分页游标（上一页返回的 next_cursor）"),
+    page_size: int = Query(20, ge=1, le=100, description="每页大小"),
+    project_id: int | None = Query(None, description="项目ID过滤"),
+    endpoint: str | None = Query(None, description="端点过滤"),
+):
+    """
+    获取某天已归档（移出数据库）的提示词记录（游标分页）
+
+    Args:
+        user_id: 当前用户ID
+        day: 归档日期
+        cursor: 分页游标，为空时返回第一页
+        page_size: 每页大小（1-100）
+        project_id: 可选的项目ID过滤
+        endpoint: 可选的端点过滤
+
+    Returns:
+        PromptRecordListResponse: 一页记录及下一页游标
+    """
+    records = await prompt_archive_service.query(
+        user_id, day, project_id=project_id, endpoint=endpoint,
+    )
+    page, next_cursor = paginate_sorted(records, page_size, cursor)
+
+    return PromptRecordListResponse(
+        total=len(records),
+        page_size=page_size,
+        next_cursor=next_cursor,
+        records=[PromptRecordResponse.model_validate(record) for record in page],
+    )
+
+
 @router.get("/{record_id}", response_model=PromptRecordResponse)
 async def get_prompt_record(
     record_id: int,
@@ -86,4 +225,5 @@ async def get_prompt_record(
             status_code=404,
         )
 
+    await prompt_blob_service.hydrate([record])
     return PromptRecordResponse.model_validate(record)
@@ -30,9 +30,10 @@ class PromptRecordResponse(BaseModel):
 
 
 class PromptRecordListResponse(BaseModel):
-    """提示词记录分页列表响应"""
+    """提示词记录分页列表响应（游标分页）"""
 
-    total: int = Field(description="总记录数")
-    page: int = Field(description="当前页码")
+    total: Optional[int] = Field(None, description="总记录数（未请求时为空）")
+    total_exact: bool = Field(True, description="总数是否精确（估算超过上限或检索结果还有下一页时为 false，total 为下限）")
     page_size: int = Field(description="每页大小")
+    next_cursor: Optional[str] = Field(None, description="下一页游标（没有更多时为空）")
     records: list[PromptRecordResponse] = Field(description="记录列表")
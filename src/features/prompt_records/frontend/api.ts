@@ -11,7 +11,7 @@ import type {
 
 export const promptRecordsAPI = {
   /**
-   * 获取提示词记录列表（分页）
+   * 获取提示词记录列表（游标分页）
    */
   async list(params?: PromptRecordQueryParams): Promise<PromptRecordListResponse> {
     const { data } = await httpClient.get<PromptRecordListResponse>('/prompt-records/', {
@@ -20,6 +20,14 @@ export const promptRecordsAPI = {
     return data
   },
 
+  /**
+   * 获取记录中出现过的端点（用于过滤）
+   */
+  async listEndpoints(): Promise<string[]> {
+    const { data } = await httpClient.get<string[]>('/prompt-records/endpoints')
+    return data
+  },
+
   /**
    * 获取单个提示词记录详情
    */
@@ -16,6 +16,7 @@ import {
   DialogContent,
   IconButton,
   TextField,
+  MenuItem,
   Collapse,
   Divider,
 } from '@mui/material'
@@ -404,23 +405,38 @@ export default function PromptRecordsPage() {
   const [loading, setLoading] = useState(true)
   const [records, setRecords] = useState<PromptRecordResponse[]>([])
   const [total, setTotal] = useState(0)
+  const [totalExact, setTotalExact] = useState(true)
   const [page, setPage] = useState(1)
   const [pageSize] = useState(12)
+  // 游标分页：cursors[i] 为第 i+1 页的游标，只能翻到已访问过的页或下一页
+  const [cursors, setCursors] = useState<(string | null)[]>([null])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
   const [selectedRecord, setSelectedRecord] = useState<PromptRecordResponse | null>(null)
   const [detailOpen, setDetailOpen] = useState(false)
+  const [endpoints, setEndpoints] = useState<string[]>([])
   const [endpointFilter, setEndpointFilter] = useState('')
+  const [keyword, setKeyword] = useState('')
+
+  // 全文检索至少需要 3 个字符
+  const searchQuery = keyword.trim().length >= 3 ? keyword.trim() : ''
 
   // 加载数据
   const loadRecords = async () => {
     try {
       setLoading(true)
       const response = await promptRecordsAPI.list({
-        page,
+        cursor: cursors[page - 1],
         page_size: pageSize,
         endpoint: endpointFilter || null,
+        q: searchQuery || null,
+        total: page === 1 ? 'estimate' : 'none',
       })
       setRecords(response.records)
-      setTotal(response.total)
+      setNextCursor(response.next_cursor)
+      if (response.total !== null) {
+        setTotal(response.total)
+        setTotalExact(response.total_exact)
+      }
     } catch (error) {
       console.error('加载提示词记录失败:', error)
     } finally {
@@ -428,9 +444,22 @@ export default function PromptRecordsPage() {
     }
   }
 
+  useEffect(() => {
+    promptRecordsAPI
+      .listEndpoints()
+      .then(setEndpoints)
+      .catch((error) => console.error('加载端点列表失败:', error))
+  }, [])
+
   useEffect(() => {
     loadRecords()
-  }, [page, endpointFilter])
+  }, [page, endpointFilter, searchQuery])
+
+  // 过滤条件变化时回到第一页
+  const resetPaging = () => {
+    setCursors([null])
+    setPage(1)
+  }
 
   // 处理详情查看
   const handleViewDetail = (record: PromptRecordResponse) => {
@@ -440,11 +469,14 @@ export default function PromptRecordsPage() {
 
   // 处理分页
   const handlePageChange = (_event: React.ChangeEvent<unknown>, value: number) => {
+    if (value === page + 1 && nextCursor) {
+      setCursors((prev) => [...prev.slice(0, page), nextCursor])
+    }
     setPage(value)
     window.scrollTo({ top: 0, behavior: 'smooth' })
   }
 
-  const totalPages = Math.ceil(total / pageSize)
+  const totalPages = Math.max(cursors.length, nextCursor ? page + 1 : page)
 
   return (
     <Box
@@ -478,15 +510,19 @@ export default function PromptRecordsPage() {
       </Box>
 
       {/* 过滤器 */}
-      <Box component={motion.div} variants={itemVariants} sx={{ mb: 3 }}>
+      <Box
+        component={motion.div}
+        variants={itemVariants}
+        sx={{ mb: 3, display: 'flex', gap: 2, flexWrap: 'wrap' }}
+      >
         <TextField
           fullWidth
           size="small"
-          placeholder="按端点过滤..."
-          value={endpointFilter}
+          placeholder="搜索提示词内容（至少3个字）..."
+          value={keyword}
           onChange={(e) => {
-            setEndpointFilter(e.target.value)
-            setPage(1) // 重置到第一页
+            setKeyword(e.target.value)
+            resetPaging() // 重置到第一页
           }}
           InputProps={{
             startAdornment: <SearchIcon sx={{ mr: 1, color: 'text.secondary' }} />,
@@ -498,6 +534,29 @@ export default function PromptRecordsPage() {
             },
           }}
         />
+        <TextField
+          select
+          size="small"
+          label="端点"
+          value={endpointFilter}
+          onChange={(e) => {
+            setEndpointFilter(e.target.value)
+            resetPaging()
+          }}
+          sx={{
+            minWidth: 220,
+            '& .MuiOutlinedInput-root': {
+              borderRadius: 2,
+            },
+          }}
+        >
+          <MenuItem value="">全部端点</MenuItem>
+          {endpoints.map((endpoint) => (
+            <MenuItem key={endpoint} value={endpoint}>
+              {endpoint}
+            </MenuItem>
+          ))}
+        </TextField>
       </Box>
 
       {/* 记录列表 */}
@@ -776,7 +835,7 @@ export default function PromptRecordsPage() {
       {!loading && (
         <Box component={motion.div} variants={itemVariants} sx={{ mt: 2 }}>
           <Typography variant="caption" color="text.secondary" align="center" display="block">
-            共 {total} 条记录
+            共 {total}{totalExact ? '' : '+'} 条记录
           </Typography>
         </Box>
       )}
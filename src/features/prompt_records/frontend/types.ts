@@ -15,15 +15,18 @@ export interface PromptRecordResponse {
 }
 
 export interface PromptRecordListResponse {
-  total: number
-  page: number
+  total: number | null
+  total_exact: boolean
   page_size: number
+  next_cursor: string | null
   records: PromptRecordResponse[]
 }
 
 export interface PromptRecordQueryParams {
-  page?: number
+  cursor?: string | null
   page_size?: number
   project_id?: number | null
   endpoint?: string | null
+  q?: string | null
+  total?: 'none' | 'estimate' | 'exact'
 }
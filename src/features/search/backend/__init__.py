@@ -0,0 +1 @@
+"""全文检索功能模块"""
@@ -0,0 +1,44 @@
+"""全文检索API路由"""
+
+from fastapi import APIRouter, Query
+
+from src.backend.core.dependencies import CurrentUserId
+from src.backend.core.exceptions import ResourceNotFoundError, ValidationError
+from src.features.novel_project.backend.models import NovelProject
+
+from .schemas import SearchHit, SearchKind, SearchResponse
+from .services.search_service import search_service, split_terms
+
+router = APIRouter(prefix="/search", tags=["全文检索"])
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    user_id: CurrentUserId,
+    project_id: int = Query(..., description="项目ID"),
+    q: str = Query(..., min_length=1, max_length=200, description="检索词（空格分隔的多个词须同时出现）"),
+    kinds: list[SearchKind] | None = Query(None, description="检索的类型，默认全部"),
+    limit: int = Query(20, ge=1, le=100, description="最多返回的结果数"),
+):
+    """
+    在项目的章节、大纲节点、人物中全文检索
+
+    Args:
+        user_id: 当前用户ID
+        project_id: 项目ID
+        q: 检索词（少于3个字符的词按子串扫描项目内容）
+        kinds: 检索的类型
+        limit: 最多返回的结果数
+
+    Returns:
+        SearchResponse: 按相关度排序的结果（含高亮片段）
+    """
+    if not await NovelProject.filter(id=project_id, user_id=user_id).exists():
+        raise ResourceNotFoundError("项目")
+
+    terms = split_terms(q)
+    if not terms:
+        raise ValidationError("检索词不能为空")
+
+    hits = await search_service.search(project_id, terms, kinds, limit)
+    return SearchResponse(query=q, hits=[SearchHit(**hit) for hit in hits])
@@ -0,0 +1,27 @@
+"""
+全文检索相关的Pydantic模型
+定义请求和响应的数据结构
+"""
+
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+SearchKind = Literal["chapter", "outline_node", "character"]
+
+
+class SearchHit(BaseModel):
+    """检索结果"""
+
+    kind: SearchKind = Field(..., description="类型: chapter 章节 / outline_node 大纲节点 / character 人物")
+    id: int = Field(..., description="章节/大纲节点/人物ID")
+    title: str = Field(..., description="标题（已转义 HTML，命中部分以 <mark> 标记）")
+    snippet: str = Field(..., description="正文片段（已转义 HTML，命中部分以 <mark> 标记）")
+    rank: float = Field(..., description="相关度得分（bm25，越小越相关）")
+
+
+class SearchResponse(BaseModel):
+    """检索响应"""
+
+    query: str
+    hits: list[SearchHit]
@@ -0,0 +1 @@
+"""全文检索服务模块"""
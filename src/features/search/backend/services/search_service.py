@@ -0,0 +1,329 @@
+"""全文检索服务
+章节、大纲节点、人物各有一个 FTS5 trigram 索引表（rowid 与原表主键对应，title / body 两列）：
+- 大纲节点（标题/描述）、人物（名称/备注）由 SQLite 触发器在写入时同一事务内同步
+- 章节标题、新建和删除由触发器同步；正文可能压缩存储（CompressedTextField），
+  由章节写入路径调用 index_chapter() 在同一事务内更新
+索引表自带正文副本，检索结果可直接由 snippet() / highlight() 生成高亮片段
+
+trigram 索引无法检索少于 3 个字符的词（如两个字的人名、地名），这类词在项目范围内
+按子串扫描索引表的标题和正文（有较长的词时先由索引缩小范围）
+"""
+
+import html
+import re
+from typing import Any
+
+from tortoise import BaseDBAsyncClient, Tortoise
+
+from src.backend.core.logger import logger
+from src.features.chapter.backend.models import Chapter
+
+KIND_CHAPTER = "chapter"
+KIND_OUTLINE_NODE = "outline_node"
+KIND_CHARACTER = "character"
+
+# trigram 分词要求检索词至少 3 个字符才能使用索引（更短的词按子串扫描）
+MIN_TERM_LENGTH = 3
+
+# 片段长度（trigram 分词下约等于字符数）
+SNIPPET_TOKENS = 32
+
+# 标题命中的权重（bm25 列权重：title, body）
+_BM25 = "bm25({table}, 10.0, 1.0)"
+
+# 高亮标记（先用控制字符标记，转义 HTML 后再替换为 <mark>）
+_MARK_START = "\x02"
+_MARK_END = "\x03"
+
+# 各类型的索引表、原表及原表中的标题列
+_INDEXES = {
+    KIND_CHAPTER: ("chapter_fts", "chapters", "title"),
+    KIND_OUTLINE_NODE: ("outline_node_fts", "outline_nodes", "title"),
+    KIND_CHARACTER: ("character_fts", "characters", "name"),
+}
+
+# 原表中作为正文索引的列（章节正文由 index_chapter() 写入）
+_BODY_SQL = {
+    KIND_OUTLINE_NODE: 'COALESCE({row}."description", \'\')',
+    KIND_CHARACTER: 'COALESCE({row}."notes", \'\')',
+}
+
+
+def _sync_triggers(kind: str) -> str:
+    """大纲节点、人物的索引同步触发器"""
+    fts, table, title = _INDEXES[kind]
+    new_body = _BODY_SQL[kind].format(row="NEW")
+    body_column = "description" if kind == KIND_OUTLINE_NODE else "notes"
+    return f"""
+CREATE TRIGGER IF NOT EXISTS "trg_search_{kind}_insert" AFTER INSERT ON "{table}"
+BEGIN
+    INSERT INTO "{fts}" ("rowid", "title", "body") VALUES (NEW."id", NEW."{title}", {new_body});
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_search_{kind}_update" AFTER UPDATE OF "{title}", "{body_column}" ON "{table}"
+BEGIN
+    UPDATE "{fts}" SET "title" = NEW."{title}", "body" = {new_body} WHERE "rowid" = NEW."id";
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_search_{kind}_delete" AFTER DELETE ON "{table}"
+BEGIN
+    DELETE FROM "{fts}" WHERE "rowid" = OLD."id";
+END;"""
+
+
+# 索引表和触发器（由迁移创建；开发环境 generate_schemas 之后由 init_db 补建）
+# 新建章节时正文为明文则一并索引，压缩存储的正文由 index_chapter() 补写
+SCHEMA_SQL = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS "chapter_fts" USING fts5("title", "body", tokenize='trigram');
+CREATE VIRTUAL TABLE IF NOT EXISTS "outline_node_fts" USING fts5("title", "body", tokenize='trigram');
+CREATE VIRTUAL TABLE IF NOT EXISTS "character_fts" USING fts5("title", "body", tokenize='trigram');
+CREATE TRIGGER IF NOT EXISTS "trg_search_chapter_insert" AFTER INSERT ON "chapters"
+BEGIN
+    INSERT INTO "chapter_fts" ("rowid", "title", "body")
+    VALUES (NEW."id", NEW."title", CASE WHEN typeof(NEW."content") = 'text' THEN NEW."content" ELSE '' END);
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_search_chapter_title" AFTER UPDATE OF "title" ON "chapters"
+BEGIN
+    UPDATE "chapter_fts" SET "title" = NEW."title" WHERE "rowid" = NEW."id";
+END;
+CREATE TRIGGER IF NOT EXISTS "trg_search_chapter_delete" AFTER DELETE ON "chapters"
+BEGIN
+    DELETE FROM "chapter_fts" WHERE "rowid" = OLD."id";
+END;
+{_sync_triggers(KIND_OUTLINE_NODE)}
+{_sync_triggers(KIND_CHARACTER)}
+"""
+
+
+def split_terms(keyword: str) -> list[str]:
+    """
+    将检索词按空白拆分为短语（各短语须同时出现）
+
+    Args:
+        keyword: 用户输入的检索词
+
+    Returns:
+        list[str]: 检索短语（少于 MIN_TERM_LENGTH 个字符的短语无法使用 trigram 索引，检索时按子串扫描）
+    """
+    return keyword.split()
+
+
+def _to_match(terms: list[str]) -> str:
+    """转换为 FTS5 MATCH 表达式（每个短语加引号，避免被解析为查询语法）"""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def _render_highlight(text: str) -> str:
+    """转义片段中的 HTML，并将高亮标记替换为 <mark>（相邻的高亮合并）"""
+    text = html.escape(text.replace(_MARK_END + _MARK_START, ""))
+    return text.replace(_MARK_START, "<mark>").replace(_MARK_END, "</mark>")
+
+
+def _search_sql(kind: str) -> str:
+    fts, table, _ = _INDEXES[kind]
+    rank = _BM25.format(table=f'"{fts}"')
+    return f"""
+SELECT f."rowid" AS "id",
+       highlight("{fts}", 0, ?, ?) AS "title",
+       snippet("{fts}", 1, ?, ?, '…', {SNIPPET_TOKENS}) AS "snippet",
+       {rank} AS "rank"
+FROM "{fts}" f JOIN "{table}" t ON t."id" = f."rowid"
+WHERE "{fts}" MATCH ? AND t."project_id" = ?
+ORDER BY {rank}
+LIMIT ?
+"""
+
+
+def _scan_sql(kind: str, short_terms: int, match: bool) -> str:
+    """
+    含短词的检索：在项目的索引行中按子串过滤（不区分 ASCII 大小写），片段取首个检索词附近的正文
+
+    参数顺序：片段定位词 ×2、[标题排序词 | 无]、[MATCH 表达式 | 无]、项目ID、每个短词 ×2、limit
+    （有较长的词时由 MATCH 缩小范围并按 bm25 排序，否则标题命中的排在前面）
+    """
+    fts, table, _ = _INDEXES[kind]
+    start = f'max(instr(lower(f."body"), ?) - {SNIPPET_TOKENS // 4}, 1)'
+    if match:
+        rank = _BM25.format(table=f'"{fts}"')
+        where = f'"{fts}" MATCH ? AND t."project_id" = ?'
+    else:
+        rank = 'CASE WHEN instr(lower(f."title"), ?) > 0 THEN -10.0 ELSE -1.0 END'
+        where = 't."project_id" = ?'
+    where += ' AND (instr(lower(f."title"), ?) > 0 OR instr(lower(f."body"), ?) > 0)' * short_terms
+    return f"""
+SELECT f."rowid" AS "id", f."title" AS "title",
+       substr(f."body", {start}, {SNIPPET_TOKENS}) AS "snippet",
+       {start} AS "start", length(f."body") AS "length",
+       {rank} AS "rank"
+FROM "{table}" t JOIN "{fts}" f ON f."rowid" = t."id"
+WHERE {where}
+ORDER BY "rank"
+LIMIT ?
+"""
+
+
+def _mark_terms(text: str, terms: list[str]) -> str:
+    """用高亮标记包围文本中出现的检索词"""
+    pattern = re.compile(
+        "|".join(re.escape(term) for term in sorted(set(terms), key=len, reverse=True)), re.IGNORECASE,
+    )
+    return pattern.sub(lambda m: _MARK_START + m.group(0) + _MARK_END, text)
+
+
+class SearchService:
+    """全文检索服务
+
+    特性:
+    - 每种类型按 bm25 排序（标题命中权重更高）取前 limit 条，合并后按得分排序
+    - 先由全文索引匹配，再按项目过滤，不扫描原表
+    - 返回的标题、片段已转义 HTML，命中部分以 <mark> 标记
+    """
+
+    async def index_chapter(
+        self, chapter_id: int, content: str, using_db: BaseDBAsyncClient,
+    ) -> None:
+        """
+        更新章节正文的索引（在章节写入事务内调用）
+
+        Args:
+            chapter_id: 章节ID
+            content: 正文（明文）
+            using_db: 事务连接
+        """
+        await using_db.execute_query(
+            'UPDATE "chapter_fts" SET "body" = ? WHERE "rowid" = ?', [content, chapter_id],
+        )
+
+    async def search(
+        self,
+        project_id: int,
+        terms: list[str],
+        kinds: list[str] | None = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """
+        在项目内全文检索
+
+        Args:
+            project_id: 项目ID
+            terms: split_terms() 拆分出的检索短语
+            kinds: 检索的类型（默认全部）
+            limit: 最多返回的结果数
+
+        Returns:
+            list[dict]: {kind, id, title, snippet, rank}，按相关度排序
+        """
+        short_terms = [term for term in terms if len(term) < MIN_TERM_LENGTH]
+        if short_terms:
+            return await self._search_scan(project_id, terms, short_terms, kinds, limit)
+
+        conn = Tortoise.get_connection("default")
+        match = _to_match(terms)
+        marks = [_MARK_START, _MARK_END, _MARK_START, _MARK_END]
+
+        hits: list[dict[str, Any]] = []
+        for kind in kinds or list(_INDEXES):
+            _, rows = await conn.execute_query(_search_sql(kind), [*marks, match, project_id, limit])
+            hits.extend(
+                {
+                    "kind": kind,
+                    "id": row["id"],
+                    "title": _render_highlight(row["title"] or ""),
+                    "snippet": _render_highlight(row["snippet"] or ""),
+                    "rank": row["rank"],
+                }
+                for row in rows
+            )
+
+        hits.sort(key=lambda hit: hit["rank"])
+        return hits[:limit]
+
+    async def _search_scan(
+        self,
+        project_id: int,
+        terms: list[str],
+        short_terms: list[str],
+        kinds: list[str] | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """含短词的检索（见 _scan_sql），片段和高亮在此生成"""
+        conn = Tortoise.get_connection("default")
+        long_terms = [term for term in terms if len(term) >= MIN_TERM_LENGTH]
+        lowered = [term.lower() for term in short_terms]
+        first = terms[0].lower()
+
+        params: list[Any] = [first, first]
+        params += [_to_match(long_terms)] if long_terms else [first]
+        params += [project_id, *(term for term in lowered for _ in range(2)), limit]
+
+        hits: list[dict[str, Any]] = []
+        for kind in kinds or list(_INDEXES):
+            _, rows = await conn.execute_query(
+                _scan_sql(kind, len(short_terms), match=bool(long_terms)), params,
+            )
+            for row in rows:
+                snippet = row["snippet"] or ""
+                if snippet and row["start"] > 1:
+                    snippet = "…" + snippet
+                if row["start"] + SNIPPET_TOKENS <= (row["length"] or 0):
+                    snippet += "…"
+                hits.append({
+                    "kind": kind,
+                    "id": row["id"],
+                    "title": _render_highlight(_mark_terms(row["title"] or "", terms)),
+                    "snippet": _render_highlight(_mark_terms(snippet, terms)),
+                    "rank": row["rank"],
+                })
+
+        hits.sort(key=lambda hit: hit["rank"])
+        return hits[:limit]
+
+    async def rebuild(self, batch_size: int = 200) -> dict[str, int]:
+        """
+        重建全部索引（启用检索前已存在的数据、压缩存储的章节正文由此补建）
+
+        Args:
+            batch_size: 每批处理的章节数
+
+        Returns:
+            dict: 各类型已索引的行数
+        """
+        conn = Tortoise.get_connection("default")
+        counts: dict[str, int] = {}
+
+        for kind in (KIND_OUTLINE_NODE, KIND_CHARACTER):
+            fts, table, title = _INDEXES[kind]
+            await conn.execute_script(
+                f"""DELETE FROM "{fts}";
+                INSERT INTO "{fts}" ("rowid", "title", "body")
+                SELECT t."id", t."{title}", {_BODY_SQL[kind].format(row="t")} FROM "{table}" t;""",
+            )
+            _, rows = await conn.execute_query(f'SELECT COUNT(*) AS "count" FROM "{fts}"')
+            counts[kind] = rows[0]["count"]
+
+        # 章节正文可能压缩存储，经模型字段读取后写入
+        await conn.execute_query('DELETE FROM "chapter_fts"')
+        counts[KIND_CHAPTER] = 0
+        last_id = 0
+        while True:
+            rows = (
+                await Chapter.filter(id__gt=last_id)
+                .order_by("id")
+                .limit(batch_size)
+                .values_list("id", "title", "content")
+            )
+            if not rows:
+                break
+            await conn.execute_many(
+                'INSERT INTO "chapter_fts" ("rowid", "title", "body") VALUES (?, ?, ?)',
+                [list(row) for row in rows],
+            )
+            counts[KIND_CHAPTER] += len(rows)
+            last_id = rows[-1][0]
+
+        for fts, _, _ in _INDEXES.values():
+            await conn.execute_query(f'INSERT INTO "{fts}" ("{fts}") VALUES (\'optimize\')')
+        logger.info(f"全文索引重建完成: {counts}")
+        return counts
+
+
+# 创建全局全文检索服务实例
+search_service = SearchService()
@@ -2,7 +2,7 @@
  * Token统计相关API
  */
 import { httpClient } from '@/frontend/core/http'
-import type { UserTokenSummary, ProjectTokenSummary, TokenUsageRecord } from './types'
+import type { UserTokenSummary, ProjectTokenSummary, TokenUsageRecordPage } from './types'
 
 export const tokenStatisticsAPI = {
   /**
@@ -17,12 +17,16 @@ export const tokenStatisticsAPI = {
   },
 
   /**
-   * 获取用户最近的Token使用记录
-   * @param limit 返回记录数，默认50
+   * 获取用户最近的Token使用记录（游标分页）
+   * @param limit 每页记录数，默认50
+   * @param cursor 上一页返回的 next_cursor，为空时取第一页
    */
-  async getUserRecentRecords(limit: number = 50): Promise<TokenUsageRecord[]> {
-    const { data } = await httpClient.get<TokenUsageRecord[]>('/statistics/user/recent', {
-      params: { limit },
+  async getUserRecentRecords(
+    limit: number = 50,
+    cursor?: string | null,
+  ): Promise<TokenUsageRecordPage> {
+    const { data } = await httpClient.get<TokenUsageRecordPage>('/statistics/user/recent', {
+      params: { limit, cursor: cursor || undefined },
     })
     return data
   },
@@ -254,7 +254,7 @@ export default function TokenStatisticsPage() {
         tokenStatisticsAPI.getUserRecentRecords(recordLimit),
       ])
       setSummary(summaryData)
-      setRecords(recordsData)
+      setRecords(recordsData.records)
     } catch (error) {
       console.error('加载Token统计数据失败:', error)
     } finally {
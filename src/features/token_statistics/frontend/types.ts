@@ -10,21 +10,33 @@ export interface TokenUsageRecord {
   user_id: number
   project_id: number | null
   prompt_tokens: number
+  cached_tokens: number
   completion_tokens: number
   total_tokens: number
+  cost: number
   model: string
   endpoint: string
   created_at: string
 }
 
 /**
- * 模型统计数据
+ * Token使用记录分页（游标分页）
+ */
+export interface TokenUsageRecordPage {
+  records: TokenUsageRecord[]
+  next_cursor: string | null
+}
+
+/**
+ * 分组统计数据（按模型或按端点）
  */
 export interface ModelStats {
   total_tokens: number
   prompt_tokens: number
+  cached_tokens: number
   completion_tokens: number
   request_count: number
+  cost: number
 }
 
 /**
@@ -34,9 +46,12 @@ export interface UserTokenSummary {
   user_id: number
   total_tokens: number
   prompt_tokens: number
+  cached_tokens: number
   completion_tokens: number
   request_count: number
+  total_cost: number
   model_stats: Record<string, ModelStats>
+  endpoint_stats: Record<string, ModelStats>
   start_date: string | null
   end_date: string | null
 }
@@ -48,9 +63,12 @@ export interface ProjectTokenSummary {
   project_id: number
   total_tokens: number
   prompt_tokens: number
+  cached_tokens: number
   completion_tokens: number
   request_count: number
+  total_cost: number
   model_stats: Record<string, ModelStats>
+  endpoint_stats: Record<string, ModelStats>
   start_date: string | null
   end_date: string | null
 }
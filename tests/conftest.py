@@ -0,0 +1,16 @@
+"""
+测试环境
+使用 Tortoise 的测试初始化器在内存 SQLite 上建表，测试结束后销毁
+"""
+
+import pytest
+from tortoise.contrib.test import finalizer, initializer
+
+from src.backend.config.database import TORTOISE_ORM
+
+
+@pytest.fixture(scope="session", autouse=True)
+def initialize_db():
+    initializer(TORTOISE_ORM["apps"]["models"]["models"], db_url="sqlite://:memory:")
+    yield
+    finalizer()
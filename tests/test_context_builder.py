@@ -0,0 +1,72 @@
+"""
+前后章节上下文回归测试
+SQLite 上由 SQL 截取结尾，其他数据库读取正文后截取，两种方式都只返回最后一段；
+保存缓冲中尚未写入的标题和正文优先于数据库
+"""
+
+import uuid
+from unittest.mock import patch
+
+from tortoise.contrib.test import TestCase
+
+from src.features.chapter.backend.models import Chapter
+from src.features.chapter.backend.services import context_builder
+from src.features.chapter.backend.services.context_builder import (
+    PREVIOUS_SUMMARY_LENGTH,
+    ContextBuilder,
+)
+from src.features.chapter.backend.services.save_buffer import chapter_save_buffer
+from src.features.novel_project.backend.models import NovelProject
+from src.features.user.backend.models import User
+
+
+class TestPreviousChapterSummary(TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        user = await User.create(username="writer", email="writer@example.com", hashed_password="x")
+        project = await NovelProject.create(title="项目", user_id=user.id)
+        self.body = "开" * 500 + "尾" * PREVIOUS_SUMMARY_LENGTH
+        await Chapter.create(
+            project=project, uuid=uuid.uuid4(), title="第1章", chapter_number=1, content=self.body,
+        )
+        self.chapter = await Chapter.create(
+            project=project, uuid=uuid.uuid4(), title="第2章", chapter_number=2, content="",
+        )
+        await Chapter.create(
+            project=project, uuid=uuid.uuid4(), title="第3章", chapter_number=3, content="",
+        )
+
+    async def _summary(self, sqlite: bool) -> dict:
+        with patch.object(context_builder, "is_sqlite", return_value=sqlite):
+            context = await ContextBuilder.build_generation_context(self.chapter)
+        return context["previous_chapter"]
+
+    async def test_sqlite_tail(self):
+        previous = await self._summary(sqlite=True)
+        self.assertEqual(previous["title"], "第1章")
+        self.assertEqual(previous["summary"], self.body[-PREVIOUS_SUMMARY_LENGTH:])
+
+    async def test_other_database_tail(self):
+        previous = await self._summary(sqlite=False)
+        self.assertEqual(previous["title"], "第1章")
+        self.assertEqual(previous["summary"], self.body[-PREVIOUS_SUMMARY_LENGTH:])
+
+    async def test_first_chapter(self):
+        first = await Chapter.get(chapter_number=1)
+        context = await ContextBuilder.build_generation_context(first)
+        self.assertIsNone(context["previous_chapter"])
+
+    async def test_pending_save(self):
+        for number, title in ((1, "新第1章"), (3, "新第3章")):
+            neighbour = await chapter_save_buffer.load((await Chapter.get(chapter_number=number)).id)
+            neighbour.title = title
+            neighbour.content = "改" * PREVIOUS_SUMMARY_LENGTH
+            await chapter_save_buffer.save(neighbour, {"title", "content"})
+        try:
+            context = await ContextBuilder.build_generation_context(self.chapter)
+        finally:
+            for number in (1, 3):
+                chapter_save_buffer.discard((await Chapter.get(chapter_number=number)).id)
+        self.assertEqual(context["previous_chapter"]["title"], "新第1章")
+        self.assertEqual(context["previous_chapter"]["summary"], "改" * PREVIOUS_SUMMARY_LENGTH)
+        self.assertEqual(context["next_chapter"]["title"], "新第3章")
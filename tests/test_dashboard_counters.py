@@ -0,0 +1,60 @@
+"""
+仪表盘统计回归测试（非 SQLite 数据库）
+没有计数器触发器时按基础表实时聚合，对账不写入计数器表
+"""
+
+import uuid
+from unittest.mock import patch
+
+from tortoise.contrib.test import TestCase
+
+from src.features.chapter.backend.models import Chapter
+from src.features.dashboard.backend.models import UserStatsCounter
+from src.features.dashboard.backend.services import counter_service
+from src.features.dashboard.backend.services.counter_service import (
+    DashboardCounterService,
+)
+from src.features.novel_outline.backend.models import OutlineNode
+from src.features.novel_project.backend.models import NovelProject
+from src.features.user.backend.models import User
+
+
+class TestCountersWithoutTriggers(TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.user = await User.create(username="writer", email="writer@example.com", hashed_password="x")
+        other = await User.create(username="other", email="other@example.com", hashed_password="x")
+        for owner in (self.user, self.user, other):
+            project = await NovelProject.create(title="项目", user_id=owner.id, word_count=10)
+            for number in (1, 2):
+                await Chapter.create(
+                    project=project, uuid=uuid.uuid4(), title=f"第{number}章",
+                    chapter_number=number, word_count=100,
+                )
+            await OutlineNode.create(project=project, node_type="volume", title="卷")
+        patcher = patch.object(counter_service, "is_sqlite", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = DashboardCounterService()
+
+    async def test_user_counters(self):
+        counters = await self.service.get_user_counters(self.user.id)
+        self.assertEqual(
+            counters,
+            {"project_count": 2, "chapter_count": 4, "outline_node_count": 2, "total_words": 420},
+        )
+
+    async def test_empty_user(self):
+        counters = await self.service.get_user_counters(self.user.id + 100)
+        self.assertEqual(set(counters.values()), {0})
+
+    async def test_totals(self):
+        totals = await self.service.get_totals()
+        self.assertEqual(
+            totals,
+            {"project_count": 3, "chapter_count": 6, "outline_node_count": 3, "total_words": 630},
+        )
+
+    async def test_reconcile_skipped(self):
+        self.assertEqual(await self.service.reconcile(), 0)
+        self.assertFalse(await UserStatsCounter.exists())
@@ -0,0 +1,57 @@
+"""
+大纲导出回归测试（非 SQLite 数据库）
+没有版本触发器时节点由 ORM 读取后按树形顺序展开，且不返回 ETag，也不返回 304
+"""
+
+import json
+from unittest.mock import patch
+
+from tortoise.contrib.test import TestCase
+
+from src.features.novel_outline.backend.models import OutlineNode
+from src.features.novel_outline.backend.router import (
+    export_outline_json,
+    export_outline_markdown,
+)
+from src.features.novel_outline.backend.services import outline_export
+from src.features.novel_project.backend.models import NovelProject
+from src.features.user.backend.models import User
+
+
+class TestOutlineExportWithoutTriggers(TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        user = await User.create(username="writer", email="writer@example.com", hashed_password="x")
+        self.project = await NovelProject.create(title="项目", user_id=user.id)
+        # 创建顺序与 position 相反，检查按 position 排序
+        for volume_position in (1, 0):
+            volume = await OutlineNode.create(
+                project=self.project, node_type="volume", title=f"卷{volume_position}", position=volume_position,
+            )
+            for chapter_position in (1, 0):
+                await OutlineNode.create(
+                    project=self.project, parent=volume, node_type="chapter",
+                    title=f"卷{volume_position}章{chapter_position}", position=chapter_position,
+                )
+        patcher = patch.object(outline_export, "is_sqlite", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @staticmethod
+    async def _body(response) -> str:
+        return "".join([chunk async for chunk in response.body_iterator])
+
+    async def test_tree_order(self):
+        response = await export_outline_json(self.project.id, None)
+        outline = json.loads(await self._body(response))["outline"]
+        self.assertEqual([volume["title"] for volume in outline], ["卷0", "卷1"])
+        self.assertEqual([chapter["title"] for chapter in outline[1]["children"]], ["卷1章0", "卷1章1"])
+
+        response = await export_outline_markdown(self.project.id, None)
+        headings = [line for line in (await self._body(response)).splitlines() if line.startswith("#")]
+        self.assertEqual(headings, ["# 小说大纲", "## 卷0", "### 卷0章0", "### 卷0章1", "## 卷1", "### 卷1章0", "### 卷1章1"])
+
+    async def test_no_etag(self):
+        response = await export_outline_json(self.project.id, f'"outline-{self.project.id}-0-0-json-1"')
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("etag", response.headers)
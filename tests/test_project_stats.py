@@ -0,0 +1,83 @@
+"""
+项目列表查询次数回归测试
+项目统计随项目查询一并取回，一页项目的查询次数不应随项目数量增长
+"""
+
+import logging
+import uuid
+
+from tortoise.contrib.test import TestCase
+from tortoise.log import db_client_logger
+
+from src.features.chapter.backend.models import Chapter
+from src.features.character.backend.models import Character
+from src.features.dashboard.backend.router import get_recent_projects
+from src.features.novel_project.backend.models import NovelProject
+from src.features.novel_project.backend.router import list_novel_projects
+from src.features.user.backend.models import User
+
+
+class _QueryCounter(logging.Handler):
+    """统计 Tortoise 数据库客户端日志中的 SQL 条数（不含连接建立/关闭日志）"""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.count = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if not record.msg.startswith(("Created connection", "Closed connection")):
+            self.count += 1
+
+    def __enter__(self):
+        self._level = db_client_logger.level
+        db_client_logger.setLevel(logging.DEBUG)
+        db_client_logger.addHandler(self)
+        return self
+
+    def __exit__(self, *exc):
+        db_client_logger.removeHandler(self)
+        db_client_logger.setLevel(self._level)
+
+
+class TestProjectListQueryCount(TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.user = await User.create(username="writer", email="writer@example.com", hashed_password="x")
+
+    async def _create_projects(self, count: int) -> None:
+        for _ in range(count):
+            project = await NovelProject.create(title="项目", user_id=self.user.id, word_count=100)
+            for number in (1, 2):
+                await Chapter.create(
+                    project=project, uuid=uuid.uuid4(), title=f"第{number}章",
+                    chapter_number=number, word_count=50,
+                )
+            await Character.create(project=project, name="主角")
+
+    async def _list_queries(self) -> int:
+        with _QueryCounter() as counter:
+            response = await list_novel_projects(self.user.id, page=1, size=10, status=None)
+        for project in response.items:
+            self.assertEqual(project.chapter_count, 2)
+            self.assertEqual(project.character_count, 1)
+        return counter.count
+
+    async def _recent_queries(self) -> int:
+        with _QueryCounter() as counter:
+            response = await get_recent_projects(self.user.id)
+        for project in response.items:
+            self.assertEqual(project.chapter_count, 2)
+            self.assertEqual(project.word_count, 200)
+        return counter.count
+
+    async def test_list_novel_projects_query_count_is_constant(self):
+        await self._create_projects(1)
+        single = await self._list_queries()
+        await self._create_projects(5)
+        self.assertEqual(await self._list_queries(), single)
+
+    async def test_get_recent_projects_query_count_is_constant(self):
+        await self._create_projects(1)
+        single = await self._recent_queries()
+        await self._create_projects(5)
+        self.assertEqual(await self._recent_queries(), single)
@@ -0,0 +1,40 @@
+"""
+Token统计回归测试
+SQLite 上写入记录时累加汇总表；其他数据库不维护汇总表，统计直接聚合原始记录，两者结果一致
+"""
+
+from unittest.mock import patch
+
+from tortoise.contrib.test import TestCase
+
+from src.backend.services import token_rollup
+from src.backend.services.models import TokenUsageRollup
+from src.backend.services.token_statistics import token_statistics_service
+from src.features.user.backend.models import User
+
+
+class TestTokenStatistics(TestCase):
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.user = await User.create(username="writer", email="writer@example.com", hashed_password="x")
+
+    async def _record_and_summarize(self, sqlite: bool) -> dict:
+        with patch.object(token_rollup, "is_sqlite", return_value=sqlite):
+            for prompt_tokens in (100, 200):
+                await token_statistics_service.record_usage(
+                    self.user.id, prompt_tokens, 50, model="gpt", endpoint="generate",
+                )
+            return await token_statistics_service.get_user_statistics(self.user.id)
+
+    async def test_sqlite_rollup(self):
+        stats = await self._record_and_summarize(sqlite=True)
+        self.assertTrue(await TokenUsageRollup.filter(user_id=self.user.id).exists())
+        self.assertEqual(stats["request_count"], 2)
+        self.assertEqual(stats["total_tokens"], 400)
+
+    async def test_other_database_raw(self):
+        stats = await self._record_and_summarize(sqlite=False)
+        self.assertFalse(await TokenUsageRollup.filter(user_id=self.user.id).exists())
+        self.assertEqual(stats["request_count"], 2)
+        self.assertEqual(stats["total_tokens"], 400)
+        self.assertEqual(stats["model_stats"]["gpt"]["prompt_tokens"], 300)